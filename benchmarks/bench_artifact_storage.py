@@ -0,0 +1,92 @@
+"""Benchmark: task records with inline artifact contents vs. blob references.
+
+Creates ``--tasks`` completed tasks, each with ``--artifacts`` text
+artifacts of ``--artifact-kb`` KB. A share of the files is identical
+across tasks, as with shared config or lock files. The tasks are stored
+two ways:
+
+- inline: each artifact's content is embedded in the task's YAML.
+- blobs: the content goes to `.ralph/blobs/` and the YAML only holds
+  sha256 keys (``TaskQueue`` default).
+
+For each it reports the size of the task records and the blob store, and
+the time a fresh process needs to open the queue and answer ``list()`` and
+``stats()`` (what the ``/tasks`` API does on startup or after another
+process touched every task).
+
+Usage:
+    python -m benchmarks.bench_artifact_storage [--tasks 50] [--artifacts 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from ralph_agi.tasks.queue import QueuedTask, TaskArtifact, TaskOutput, TaskQueue, TaskStatus
+from ralph_agi.tasks.storage import dump_task_yaml
+
+
+def _content(task: int, artifact: int, kb: int) -> str:
+    # Every third artifact is the same file in every task
+    owner = "shared" if artifact % 3 == 0 else f"task{task}"
+    line = f"# {owner} file {artifact}: some generated source code line\n"
+    return line * (kb * 1024 // len(line))
+
+
+def _populate(root: Path, tasks: int, artifacts: int, kb: int, inline: bool) -> None:
+    queue = TaskQueue(project_root=root)
+    for t in range(tasks):
+        task = QueuedTask(id=f"task-{t:04d}", description=f"Task {t}", status=TaskStatus.COMPLETE)
+        task.output = TaskOutput(
+            summary="done",
+            artifacts=[
+                TaskArtifact(path=f"src/file{a}.py", size=kb * 1024, content=_content(t, a, kb))
+                for a in range(artifacts)
+            ],
+        )
+        if inline:
+            dump_task_yaml(queue.tasks_dir / f"{task.id}.yaml", task.to_dict())
+        else:
+            queue._save_task(task)
+
+
+def _dir_size(path: Path) -> int:
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file()) if path.exists() else 0
+
+
+def _cold_list(root: Path) -> float:
+    start = time.perf_counter()
+    queue = TaskQueue(project_root=root)
+    queue.list(include_terminal=True)
+    queue.stats()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=50)
+    parser.add_argument("--artifacts", type=int, default=10)
+    parser.add_argument("--artifact-kb", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"\n{args.tasks} tasks x {args.artifacts} artifacts x {args.artifact_kb} KB")
+    print(f"  {'storage':<8} {'task records MB':>16} {'blobs MB':>9} {'cold list+stats ms':>19}")
+    for name, inline in (("inline", True), ("blobs", False)):
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            _populate(root, args.tasks, args.artifacts, args.artifact_kb, inline)
+            times = [_cold_list(root) * 1000 for _ in range(args.repeat)]
+            records = _dir_size(root / TaskQueue.TASKS_DIR) / 1e6
+            blobs = _dir_size(root / TaskQueue.BLOBS_DIR) / 1e6
+            print(f"  {name:<8} {records:16.1f} {blobs:9.1f} {statistics.median(times):19.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""Benchmark: how quickly BatchExecutor sees worker progress.
+
+Starts ``--workers`` processes that each report a tool call every
+``--interval`` seconds for ``--duration`` seconds, like a busy Builder:
+
+- files: each event rewrites the worker's progress JSON file (temp file
+  + rename) and the parent reads every file each ``--poll`` seconds, as
+  ``BatchExecutor`` did. This is the best case for files: the old
+  workers only wrote at start and end.
+- pipe: each event is sent over the worker's progress pipe and the
+  parent applies it with ``BatchExecutor._update_progress``, which
+  wakes as soon as an event arrives.
+
+Reports how many events the parent saw (a file only holds the latest
+snapshot) and the delay from each event to the first progress update
+that includes it.
+
+Usage:
+    python -m benchmarks.bench_batch_progress [--workers 4] [--duration 6] [--interval 0.05] [--poll 2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from ralph_agi.tasks.batch import (
+    BatchConfig,
+    BatchExecutor,
+    BatchProgress,
+    WorkerProgress,
+    WorkerStatus,
+)
+
+
+def _file_worker(path: str, duration: float, interval: float) -> None:
+    end = time.time() + duration
+    calls = 0
+    with open(f"{path}.sent", "w") as sent:
+        while time.time() < end:
+            calls += 1
+            sent.write(f"{time.time()}\n")
+            tmp = f"{path}.tmp"
+            with open(tmp, "w") as f:
+                json.dump({"tool_calls": calls}, f)
+            os.replace(tmp, path)
+            time.sleep(interval)
+
+
+def _pipe_worker(conn, worker_id: str, duration: float, interval: float) -> None:
+    end = time.time() + duration
+    while time.time() < end:
+        conn.send((worker_id, "tool", {"iteration": 1, "tool": "read_file", "sent_at": time.time()}))
+        time.sleep(interval)
+    conn.close()
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct))]
+
+
+def run_files(
+    root: Path, workers: int, duration: float, interval: float, poll: float,
+) -> tuple[int, int, list[float]]:
+    paths = [root / f"w{i}.progress.json" for i in range(workers)]
+    procs = [
+        multiprocessing.Process(target=_file_worker, args=(str(p), duration, interval))
+        for p in paths
+    ]
+    for p in procs:
+        p.start()
+    # Per worker: (time read, tool calls shown) for each snapshot read
+    reads: dict[Path, list[tuple[float, int]]] = {path: [] for path in paths}
+    while any(p.is_alive() for p in procs):
+        time.sleep(poll)
+        for path in paths:
+            try:
+                reads[path].append((time.time(), json.loads(path.read_text())["tool_calls"]))
+            except (OSError, ValueError):
+                continue
+    for p in procs:
+        p.join()
+
+    sent = seen = 0
+    lags: list[float] = []
+    for path in paths:
+        sent_at = [float(line) for line in Path(f"{path}.sent").read_text().split()]
+        sent += len(sent_at)
+        seen += len({calls for _, calls in reads[path]})
+        # An event shows once a read reaches its count; the rest never do
+        for number, at in enumerate(sent_at, 1):
+            shown = next((t for t, calls in reads[path] if calls >= number), None)
+            if shown is not None:
+                lags.append(shown - at)
+    return sent, seen, lags
+
+
+def run_pipe(
+    root: Path, workers: int, duration: float, interval: float, poll: float,
+) -> tuple[int, int, list[float]]:
+    executor = BatchExecutor(
+        prd_path=root / "PRD.json",
+        config_path=root / "config.yaml",
+        batch_config=BatchConfig(progress_dir=root),
+    )
+    executor._batch_progress = BatchProgress(batch_id="bench", total_tasks=workers)
+    lags: list[float] = []
+    apply_event = executor._apply_event
+
+    def timed(worker_id, event, data):
+        lags.append(time.time() - data["sent_at"])
+        apply_event(worker_id, event, data)
+
+    executor._apply_event = timed
+    for i in range(workers):
+        worker_id = f"w{i}"
+        executor._batch_progress.workers[worker_id] = WorkerProgress(
+            task_id=worker_id, worker_id=worker_id, status=WorkerStatus.RUNNING,
+        )
+        reader, writer = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(target=_pipe_worker, args=(writer, worker_id, duration, interval))
+        process.start()
+        writer.close()
+        executor._workers[worker_id] = process
+        executor._channels[worker_id] = reader
+
+    while executor._channels:
+        executor._update_progress(timeout=poll)
+        for worker_id, process in list(executor._workers.items()):
+            if not process.is_alive() and worker_id not in executor._channels:
+                executor._workers.pop(worker_id).join()
+    for process in executor._workers.values():
+        process.join()
+    return executor._batch_progress.tool_calls, len(lags), lags
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--duration", type=float, default=6.0)
+    parser.add_argument("--interval", type=float, default=0.05)
+    parser.add_argument("--poll", type=float, default=2.0)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(
+        f"\n{args.workers} workers, one event every {args.interval * 1000:.0f} ms for "
+        f"{args.duration:.0f} s, poll {args.poll:.1f} s"
+    )
+    print(f"  {'approach':<8} {'events':>7} {'seen':>7} {'p50 ms':>9} {'p95 ms':>9}")
+    for name, bench in (("files", run_files), ("pipe", run_pipe)):
+        with tempfile.TemporaryDirectory() as tmp:
+            sent, seen, lags = bench(Path(tmp), args.workers, args.duration, args.interval, args.poll)
+        print(
+            f"  {name:<8} {sent:7d} {seen:7d} {statistics.median(lags) * 1000:9.1f} "
+            f"{_percentile(lags, 0.95) * 1000:9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
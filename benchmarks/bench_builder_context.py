@@ -0,0 +1,107 @@
+"""Benchmark: Builder prompt size per LLM call over a long tool loop.
+
+Drives BuilderAgent through a scripted refactoring session (read a
+module, edit it, run the tests, repeat) against a fake client that
+reports the estimated prompt size as its input tokens. Compares the
+full-history Builder (``context_window_tokens=0``) with the rolling
+ConversationWindow at several budgets, using the per-call figures
+recorded in TokenUsage.
+
+Usage:
+    python -m benchmarks.bench_builder_context [--iterations 60] [--budgets 15000 30000 60000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import random
+from typing import Any
+
+from ralph_agi.llm.agents import BuilderAgent
+from ralph_agi.llm.client import LLMResponse, StopReason, ToolCall
+from ralph_agi.llm.context_window import message_tokens
+from ralph_agi.llm.orchestrator import TokenUsage
+
+
+class ScriptedClient:
+    """Fake LLM client: read -> edit -> test cycles over many modules."""
+
+    def __init__(self) -> None:
+        self.prompt_sizes: list[int] = []
+
+    async def complete(self, messages: list[dict[str, Any]], **kwargs: Any) -> LLMResponse:
+        prompt = sum(message_tokens(m) for m in messages)
+        self.prompt_sizes.append(prompt)
+        step = len(self.prompt_sizes)
+        module = f"src/pkg/module_{step // 3}.py"
+        if step % 3 == 0:
+            call = ToolCall(id=f"c{step}", name="read_file", arguments={"path": module})
+        elif step % 3 == 1:
+            call = ToolCall(
+                id=f"c{step}",
+                name="edit_file",
+                arguments={"path": module, "old_string": "old()", "new_string": "new()"},
+            )
+        else:
+            call = ToolCall(id=f"c{step}", name="run_command", arguments={"command": "pytest -q"})
+        return LLMResponse(
+            content=f"Step {step}: working on {module}.",
+            tool_calls=[call],
+            stop_reason=StopReason.TOOL_USE,
+            usage={"input_tokens": prompt, "output_tokens": 80},
+        )
+
+
+class FakeExecutor:
+    """Returns file contents, edit confirmations and pytest output."""
+
+    def __init__(self, seed: int = 3) -> None:
+        self._rng = random.Random(seed)
+
+    async def execute(self, tool_name: str, arguments: dict[str, Any]) -> str:
+        if tool_name == "read_file":
+            lines = self._rng.randint(150, 450)
+            return "\n".join(f"    value_{i} = transform(record['{i}'])  # step {i}" for i in range(lines))
+        if tool_name == "edit_file":
+            return f"Edited {arguments['path']}"
+        tests = self._rng.randint(80, 200)
+        return "\n".join(f"tests/test_mod.py::test_{i} PASSED" for i in range(tests)) + f"\n{tests} passed"
+
+
+async def run(iterations: int, budget: int) -> tuple[TokenUsage, list[int]]:
+    client = ScriptedClient()
+    builder = BuilderAgent(
+        client, FakeExecutor(), max_iterations=iterations, context_window_tokens=budget
+    )
+    result = await builder.execute({"title": "Migrate transform() callers", "description": "..."})
+    usage = TokenUsage()
+    usage.add_builder_usage(result.input_tokens, result.output_tokens)
+    usage.add_builder_window_usage(result)
+    return usage, client.prompt_sizes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=60)
+    parser.add_argument("--budgets", type=int, nargs="+", default=[15000, 30000, 60000])
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    checkpoints = [c for c in (10, 20, 40, args.iterations) if c <= args.iterations]
+    print(f"\n{args.iterations} Builder calls (read/edit/test cycles)")
+    header = " ".join(f"{'call ' + str(c):>10}" for c in checkpoints)
+    print(f"  {'window':<14} {header} {'peak':>9} {'total input':>12} {'elided':>10}")
+    for budget in [0, *sorted(args.budgets)]:
+        usage, sizes = asyncio.run(run(args.iterations, budget))
+        at = " ".join(f"{sizes[c - 1]:10,}" for c in checkpoints)
+        label = "full history" if budget == 0 else f"{budget:,} budget"
+        print(
+            f"  {label:<14} {at} {usage.builder_peak_prompt:9,} "
+            f"{usage.builder_prompt_tokens:12,} {usage.builder_context_saved:10,}"
+        )
+
+
+if __name__ == "__main__":
+    main()
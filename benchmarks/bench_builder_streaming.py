@@ -0,0 +1,122 @@
+"""Benchmark: Builder turn latency with streamed vs. blocking LLM calls.
+
+Simulates a model that writes some reasoning, then several read_file
+calls, then more text, at a fixed generation speed. Tools take a fixed
+time to run. A blocking Builder waits for the whole response before
+starting any tool. A streaming Builder starts each read as soon as its
+tool-use block is complete.
+
+Delays are scaled down (``--token-ms`` per generated token,
+``--tool-ms`` per tool) so the run is quick. Compare the ratios, not the
+absolute times.
+
+Usage:
+    python -m benchmarks.bench_builder_streaming [--turns 10] [--reads 1 3 6]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import time
+from typing import Any
+
+from ralph_agi.llm.agents import BuilderAgent
+from ralph_agi.llm.client import LLMResponse, StopReason, StreamEvent, StreamEventType, ToolCall
+
+
+class GeneratingClient:
+    """Fake client that produces each response at a fixed token rate."""
+
+    def __init__(self, turns: int, reads: int, token_delay: float):
+        self.turns = turns
+        self.reads = reads
+        self.token_delay = token_delay
+        self.calls = 0
+
+    def _script(self) -> list[tuple[str, Any, int]]:
+        """(kind, value, tokens to generate) for the next response."""
+        self.calls += 1
+        if self.calls > self.turns:
+            return [("text", "<task_complete>DONE</task_complete>", 10)]
+        script: list[tuple[str, Any, int]] = [("text", "Looking at the modules involved.\n", 60)]
+        for i in range(self.reads):
+            call = ToolCall(
+                id=f"c{self.calls}_{i}", name="read_file",
+                arguments={"path": f"src/mod_{self.calls}_{i}.py"},
+            )
+            script.append(("tool", call, 25))
+        script.append(("text", "I'll compare them once they're loaded.", 40))
+        return script
+
+    def _response(self, script: list[tuple[str, Any, int]]) -> LLMResponse:
+        calls = [value for kind, value, _ in script if kind == "tool"]
+        return LLMResponse(
+            content="".join(value for kind, value, _ in script if kind == "text"),
+            tool_calls=calls,
+            stop_reason=StopReason.TOOL_USE if calls else StopReason.END_TURN,
+            usage={"input_tokens": 1000, "output_tokens": sum(t for _, _, t in script)},
+        )
+
+    async def complete(self, messages: list[dict[str, Any]], **kwargs: Any) -> LLMResponse:
+        script = self._script()
+        await asyncio.sleep(sum(t for _, _, t in script) * self.token_delay)
+        return self._response(script)
+
+    async def stream_complete(self, messages: list[dict[str, Any]], **kwargs: Any):
+        script = self._script()
+        for kind, value, tokens in script:
+            await asyncio.sleep(tokens * self.token_delay)
+            if kind == "text":
+                yield StreamEvent(StreamEventType.TEXT, text=value)
+            else:
+                yield StreamEvent(StreamEventType.TOOL_CALL, tool_call=value)
+        yield StreamEvent(StreamEventType.DONE, response=self._response(script))
+
+
+class SlowExecutor:
+    def __init__(self, delay: float):
+        self.delay = delay
+
+    async def execute(self, tool_name: str, arguments: dict[str, Any]) -> str:
+        await asyncio.sleep(self.delay)
+        return f"# {arguments['path']}\n" + "x = 1\n" * 50
+
+
+async def measure(streaming: bool, turns: int, reads: int, token_delay: float, tool_delay: float) -> tuple:
+    client = GeneratingClient(turns, reads, token_delay)
+    thoughts: list[str] = []
+    builder = BuilderAgent(
+        client, SlowExecutor(tool_delay), max_iterations=turns + 2,
+        streaming=streaming, on_thinking=thoughts.append,
+    )
+    start = time.perf_counter()
+    result = await builder.execute({"title": "Compare modules", "description": "..."})
+    return time.perf_counter() - start, result.early_tool_calls, len(thoughts)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--reads", type=int, nargs="+", default=[1, 3, 6])
+    parser.add_argument("--token-ms", type=float, default=0.2, help="ms per generated token")
+    parser.add_argument("--tool-ms", type=float, default=15.0, help="ms per tool call")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"\n{args.turns} Builder turns, {args.token_ms} ms/token, {args.tool_ms:.0f} ms/tool")
+    print(f"  {'reads/turn':<11} {'mode':<10} {'wall s':>7} {'ms/turn':>8} {'early':>6} {'thoughts':>9}")
+    for reads in args.reads:
+        for streaming in (False, True):
+            elapsed, early, thoughts = asyncio.run(measure(
+                streaming, args.turns, reads, args.token_ms / 1000, args.tool_ms / 1000
+            ))
+            print(
+                f"  {reads:<11} {'stream' if streaming else 'blocking':<10} {elapsed:7.3f} "
+                f"{elapsed / (args.turns + 1) * 1000:8.1f} {early:6} {thoughts:9}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Benchmark: finding a task's changed files in a large worktree.
+
+Builds a git repository with ``--files`` committed files, changes a few of
+them the way a task would (new files, edits, a deletion) and compares:
+
+- snapshot: the previous approach. It takes a full ``os.walk`` before and
+  after, diffs the path sets and reads each new file (up to 100 KB) inline.
+  Edited and deleted files are not detected.
+- git: ``ChangeTracker`` using ``git diff``/``git status``. Contents are not
+  read.
+- scan: ``ChangeTracker``'s (inode, size, mtime) fallback for non-git roots.
+
+Usage:
+    python -m benchmarks.bench_change_detection [--files 20000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from ralph_agi.tasks.changes import EXCLUDE_DIRS, ChangeTracker
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def _file(root: Path, i: int) -> Path:
+    return root / f"pkg{i % 50}" / f"mod{i // 50}" / f"file{i}.py"
+
+
+def _build_repo(root: Path, files: int) -> None:
+    for i in range(files):
+        path = _file(root, i)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"VALUE = {i}\n" * 20)
+    _git(root, "init", "-q")
+    _git(root, "add", ".")
+    _git(root, "-c", "user.email=b@example.com", "-c", "user.name=bench", "commit", "-q", "-m", "base")
+
+
+def _task_edits(root: Path, run: int) -> None:
+    for i in range(5):
+        (root / f"pkg{i}" / f"new_{run}_{i}.py").write_text("NEW = True\n" * 200)
+    _file(root, 51).write_text(f"EDITED = {run}\n")
+    _file(root, 100 + run).unlink()
+
+
+def _walk(root: Path) -> set[str]:
+    files = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in EXCLUDE_DIRS]
+        for filename in filenames:
+            files.add(os.path.relpath(os.path.join(dirpath, filename), root))
+    return files
+
+
+def snapshot_approach(root: Path, run: int) -> tuple[float, int]:
+    start = time.perf_counter()
+    before = _walk(root)
+    _task_edits(root, run)
+    new = _walk(root) - before
+    for path in new:
+        abs_path = root / path
+        if abs_path.stat().st_size < 100_000:
+            abs_path.read_text(encoding="utf-8")
+    return time.perf_counter() - start, len(new)
+
+
+def tracker_approach(root: Path, run: int, use_git: bool) -> tuple[float, int]:
+    start = time.perf_counter()
+    tracker = ChangeTracker(root)
+    if not use_git:
+        tracker._git = False
+    tracker.snapshot()
+    _task_edits(root, run)
+    changes = tracker.changes()
+    return time.perf_counter() - start, len(changes)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        _build_repo(root, args.files)
+        _git(root, "status", "--porcelain")  # Warm the index stat cache like a reused worktree
+
+        print(f"\n{args.files} files, 5 added + 1 modified + 1 deleted per run")
+        print(f"  {'approach':<10} {'median ms':>10} {'changes found':>14}")
+        approaches = [
+            ("snapshot", lambda run: snapshot_approach(root, run)),
+            ("git", lambda run: tracker_approach(root, run, use_git=True)),
+            ("scan", lambda run: tracker_approach(root, run, use_git=False)),
+        ]
+        run = 0
+        for name, approach in approaches:
+            times, found = [], 0
+            for _ in range(args.repeat):
+                run += 1
+                elapsed, found = approach(run)
+                times.append(elapsed * 1000)
+            print(f"  {name:<10} {statistics.median(times):10.1f} {found:14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark: task completion -> dependent task start latency.
+
+Runs a chain of dependent tasks (t0 <- t1 <- ... <- tN) through
+ParallelExecutor in a throwaway git repository and measures, for each
+link, the time between the dependency's callback returning and the
+dependent's on_task_start firing.
+
+Two modes are compared:
+- event: the event-driven dispatcher (ReadySet + wakeup)
+- poll:  the same executor with wakeups disabled and a 0.5s rescan,
+         which reproduces the previous fixed-interval polling loop
+
+Usage:
+    python -m benchmarks.bench_dispatch_latency [--chain 10]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from ralph_agi.tasks.parallel import ParallelExecutor, TaskResult
+
+
+class PollingExecutor(ParallelExecutor):
+    """Executor that only notices changes on its rescan timer."""
+
+    def _wake(self) -> None:
+        pass
+
+
+def _init_repo(root: Path) -> None:
+    subprocess.run(["git", "init", "-q"], cwd=root, check=True)
+    (root / "README.md").write_text("bench\n")
+    subprocess.run(["git", "add", "."], cwd=root, check=True)
+    subprocess.run(
+        ["git", "-c", "user.name=bench", "-c", "user.email=bench@example.com",
+         "commit", "-q", "-m", "init"],
+        cwd=root,
+        check=True,
+    )
+
+
+def run_chain(mode: str, chain: int) -> list[float]:
+    """Run one dependency chain and return per-link latencies in seconds."""
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "repo"
+        root.mkdir()
+        _init_repo(root)
+
+        finished_at: dict[str, float] = {}
+        started_at: dict[str, float] = {}
+
+        def task_callback(task, path):
+            finished_at[task.id] = time.perf_counter()
+            return TaskResult(task_id=task.id, success=True, worktree_path=path)
+
+        def on_task_start(task):
+            started_at[task.id] = time.perf_counter()
+
+        cls = PollingExecutor if mode == "poll" else ParallelExecutor
+        executor = cls(
+            project_root=root,
+            max_concurrent=2,
+            task_callback=task_callback,
+            on_task_start=on_task_start,
+            rescan_interval=0.5 if mode == "poll" else 30.0,
+        )
+
+        queue = executor._queue
+        previous = None
+        for i in range(chain + 1):
+            task_id = f"t{i}"
+            queue.add(f"Task {i}", task_id=task_id, dependencies=[previous] if previous else None)
+            queue.update_status(task_id, "ready")
+            previous = task_id
+
+        asyncio.run(executor.run())
+        executor.cleanup(force=True)
+
+        return [
+            started_at[f"t{i}"] - finished_at[f"t{i - 1}"]
+            for i in range(1, chain + 1)
+        ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chain", type=int, default=10, help="Dependent links per run")
+    args = parser.parse_args()
+
+    print(f"{'mode':<8}{'links':>7}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for mode in ("poll", "event"):
+        latencies = sorted(run_chain(mode, args.chain))
+        p50 = statistics.median(latencies) * 1000
+        p95 = latencies[int(0.95 * (len(latencies) - 1))] * 1000
+        print(f"{mode:<8}{len(latencies):>7}{p50:>10.1f}{p95:>10.1f}{latencies[-1] * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
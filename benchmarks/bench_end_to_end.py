@@ -0,0 +1,395 @@
+"""Benchmark: end-to-end loop overhead with recorded LLM sessions replayed.
+
+Builds fixture repositories (git repo, PRD.json, config.yaml) and drives
+three entry points over them:
+
+- loop:     RalphLoop.from_config(...).run() over the PRD
+- parallel: ParallelExecutor with the API's Builder task callback
+- batch:    BatchExecutor with one worktree process per task
+
+Each scenario runs twice. The record pass uses a scripted model with a
+fixed response delay (``--model-ms``) wrapped in a recording
+ReplayLLMClient. The replay pass uses ``llm.replay_mode: replay`` in
+config.yaml, so the real factories build replay clients. Replayed calls
+return immediately (or after the recorded delay times
+``--latency-scale``), so replay wall time is RALPH's own overhead.
+
+Fixtures live at fixed paths under ``--root``. The prompts embed the
+working directory, so the same paths let requests hash the same way on
+every run.
+
+Each pass runs in a forked child, which keeps its peak RSS separate.
+Use ``--json`` to save results and ``--baseline`` to exit non-zero when a
+scenario's replay p95 regresses by more than ``--tolerance``.
+
+Usage:
+    python -m benchmarks.bench_end_to_end [--tasks 4] [--scenarios loop parallel batch]
+    python -m benchmarks.bench_end_to_end --json results.json --baseline main.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import yaml
+
+from ralph_agi.llm.client import LLMResponse, StopReason, ToolCall
+from ralph_agi.llm.prompts import CRITIC_SYSTEM_PROMPT
+from ralph_agi.llm.replay import ReplayLLMClient
+
+SCENARIOS = ("loop", "parallel", "batch")
+
+
+class ScriptedModel:
+    """Deterministic stand-in for a provider.
+
+    The Builder lists the repo, reads the README, writes one module per
+    task, then signals completion; the Critic approves.
+    """
+
+    def __init__(self, model: str, delay: float):
+        self.model = model
+        self.delay = delay
+
+    async def complete(self, messages: list[dict[str, Any]], system: Optional[str] = None, **kwargs: Any) -> LLMResponse:
+        await asyncio.sleep(self.delay)
+        if system == CRITIC_SYSTEM_PROMPT:
+            return self._response("The change is complete and minimal.\n\nVERDICT: APPROVED")
+
+        slug = hashlib.sha256(str(messages[0]["content"]).encode()).hexdigest()[:8]
+        turn = sum(1 for m in messages if m["role"] == "assistant")
+        if turn == 0:
+            return self._response("Looking at the repository layout.", [
+                ToolCall(id=f"{slug}-ls", name="list_directory", arguments={"path": "."}),
+                ToolCall(id=f"{slug}-readme", name="read_file", arguments={"path": "README.md"}),
+            ])
+        if turn == 1:
+            return self._response("Adding the feature module.", [
+                ToolCall(id=f"{slug}-write", name="write_file", arguments={
+                    "path": f"src/feature_{slug}.py",
+                    "content": f'"""Feature {slug}."""\n\n\ndef run() -> str:\n    return "{slug}"\n',
+                }),
+            ])
+        return self._response("Implemented.\n<task_complete>DONE</task_complete>")
+
+    def _response(self, content: str, tool_calls: Optional[list[ToolCall]] = None) -> LLMResponse:
+        return LLMResponse(
+            content=content,
+            stop_reason=StopReason.TOOL_USE if tool_calls else StopReason.END_TURN,
+            tool_calls=tool_calls or [],
+            usage={"input_tokens": 1500, "output_tokens": 120},
+            model=self.model,
+        )
+
+
+class Recorder:
+    """Collects per-iteration and per-LLM-call timings across processes.
+
+    Samples are appended as JSON lines to one file, so forked batch
+    workers report into the same place as the parent.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._llm = threading.local()
+
+    def llm_seconds(self) -> float:
+        return getattr(self._llm, "seconds", 0.0)
+
+    def add_llm(self, seconds: float, outcome: str) -> None:
+        self._llm.seconds = self.llm_seconds() + seconds
+        self._write({"kind": "llm", "outcome": outcome})
+
+    def timed(self, fn: Callable[..., Any]) -> Callable[..., Any]:
+        """Wrap one unit of work (an iteration or a task callback)."""
+
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            llm_before = self.llm_seconds()
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                wall = time.perf_counter() - start
+                llm = self.llm_seconds() - llm_before
+                self._write({"kind": "iteration", "wall": wall, "overhead": wall - llm})
+
+        return wrapper
+
+    def samples(self) -> list[dict[str, Any]]:
+        if not self.path.exists():
+            return []
+        return [json.loads(line) for line in self.path.read_text().splitlines() if line]
+
+    def _write(self, sample: dict[str, Any]) -> None:
+        with open(self.path, "a") as f:
+            f.write(json.dumps(sample) + "\n")
+
+
+def _git(root: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=bench", "-c", "user.email=bench@example.com", *args],
+        cwd=root, check=True, capture_output=True,
+    )
+
+
+def make_fixture(root: Path, tasks: int, replay_mode: str, transcript: Path) -> Path:
+    """Create a fresh fixture repository and return its path."""
+    shutil.rmtree(root.parent, ignore_errors=True)
+    root.mkdir(parents=True)
+    (root / "src").mkdir()
+    (root / "src" / "__init__.py").write_text("")
+    (root / "README.md").write_text("# Bench project\n\nFixture for the end-to-end benchmark.\n")
+    prd = {
+        "project": {"name": "Bench", "description": "End-to-end benchmark fixture"},
+        "features": [
+            {
+                "id": f"task-{i}",
+                "description": f"Add feature module number {i} under src",
+                "priority": 2,
+                "steps": [f"Create the module for feature {i}"],
+                "acceptance_criteria": [f"Feature {i} is implemented"],
+                "passes": False,
+            }
+            for i in range(tasks)
+        ],
+    }
+    (root / "PRD.json").write_text(json.dumps(prd, indent=2))
+    config = {
+        "max_iterations": tasks + 2,
+        "max_retries": 1,
+        "retry_delays": [0],
+        "memory": {"enabled": False},
+        "hooks": {"enabled": False},
+        "llm": {
+            "max_tool_iterations": 6,
+            "critic_enabled": True,
+            "streaming": True,
+            "replay_mode": replay_mode,
+            "replay_path": str(transcript),
+        },
+    }
+    (root / "config.yaml").write_text(yaml.safe_dump(config))
+    (root / ".gitignore").write_text(".ralph/\n")
+    _git(root, "init", "-q")
+    _git(root, "add", ".")
+    _git(root, "commit", "-q", "-m", "fixture")
+    return root
+
+
+def run_loop(root: Path, recorder: Recorder, tasks: int) -> None:
+    from ralph_agi.core.config import load_config
+    from ralph_agi.core.loop import RalphLoop
+
+    loop = RalphLoop.from_config(load_config(root / "config.yaml"), prd_path=str(root / "PRD.json"))
+    loop._execute_iteration = recorder.timed(loop._execute_iteration)
+    try:
+        loop.run(handle_signals=False)
+    finally:
+        loop.close()
+
+
+def run_parallel(root: Path, recorder: Recorder, tasks: int) -> None:
+    from ralph_agi.api.dependencies import _create_task_callback
+    from ralph_agi.tasks.parallel import ParallelExecutor
+
+    executor = ParallelExecutor(
+        project_root=root,
+        max_concurrent=min(tasks, 4),
+        task_callback=recorder.timed(_create_task_callback()),
+    )
+    for i in range(tasks):
+        executor._queue.add(f"Add feature module number {i} under src", task_id=f"task-{i}")
+        executor._queue.update_status(f"task-{i}", "ready")
+    executor.run_sync()
+    executor.cleanup(force=True)
+
+
+def run_batch(root: Path, recorder: Recorder, tasks: int) -> None:
+    from ralph_agi.core.loop import RalphLoop
+    from ralph_agi.tasks.batch import BatchConfig, BatchExecutor
+
+    # Forked workers inherit the wrapper
+    RalphLoop._execute_iteration = recorder.timed(RalphLoop._execute_iteration)
+    BatchExecutor(
+        root / "PRD.json",
+        root / "config.yaml",
+        BatchConfig(parallel_limit=min(tasks, 4), worktree_base=root.parent / "worktrees"),
+    ).run(task_ids=[f"task-{i}" for i in range(tasks)], poll_interval=0.05)
+
+
+RUNNERS = {"loop": run_loop, "parallel": run_parallel, "batch": run_batch}
+
+
+def _instrument(recorder: Recorder, mode: str, model_delay: float, latency_scale: float) -> None:
+    """Route LLM clients through the recorder for this pass."""
+    from ralph_agi.core.loop import RalphLoop
+
+    replay = ReplayLLMClient._replay
+
+    async def timed_replay(self: ReplayLLMClient, keys: tuple) -> LLMResponse:
+        self.latency_scale = latency_scale
+        exact = self.exact_hits
+        start = time.perf_counter()
+        try:
+            response = await replay(self, keys)
+        except Exception:
+            recorder.add_llm(time.perf_counter() - start, "miss")
+            raise
+        recorder.add_llm(time.perf_counter() - start, "exact" if self.exact_hits > exact else "turn")
+        return response
+
+    ReplayLLMClient._replay = timed_replay
+    if mode == "record":
+        complete = ScriptedModel.complete
+
+        async def timed_complete(self: ScriptedModel, *args: Any, **kwargs: Any) -> LLMResponse:
+            start = time.perf_counter()
+            try:
+                return await complete(self, *args, **kwargs)
+            finally:
+                recorder.add_llm(time.perf_counter() - start, "model")
+
+        ScriptedModel.complete = timed_complete
+        RalphLoop._create_llm_client = staticmethod(
+            lambda provider, model, replay_path=None, **kwargs: ReplayLLMClient(
+                replay_path, mode="record", client=ScriptedModel(model, model_delay)
+            )
+        )
+
+
+def _run_pass(scenario: str, mode: str, root: Path, tasks: int, args: argparse.Namespace, results: Any) -> None:
+    """Body of the forked child for one scenario pass."""
+    logging.disable(logging.CRITICAL)
+    repo = root / scenario / "repo"
+    transcript = root / "transcripts" / f"{scenario}.jsonl"
+    if mode == "record":
+        transcript.unlink(missing_ok=True)
+    make_fixture(repo, tasks, mode, transcript)
+    recorder = Recorder(Path(tempfile.mkdtemp()) / "samples.jsonl")
+    _instrument(recorder, mode, args.model_ms / 1000, args.latency_scale)
+
+    os.chdir(repo)
+    start = time.perf_counter()
+    RUNNERS[scenario](repo, recorder, tasks)
+    wall = time.perf_counter() - start
+
+    samples = recorder.samples()
+    iterations = [s for s in samples if s["kind"] == "iteration"]
+    outcomes = [s["outcome"] for s in samples if s["kind"] == "llm"]
+    rss_kb = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    results.put({
+        "scenario": scenario,
+        "mode": mode,
+        "wall_s": round(wall, 3),
+        "iterations": len(iterations),
+        "iteration_ms": _percentiles([s["wall"] for s in iterations]),
+        "overhead_ms": _percentiles([s["overhead"] for s in iterations]),
+        "llm_calls": len(outcomes),
+        "exact_hits": outcomes.count("exact"),
+        "turn_hits": outcomes.count("turn"),
+        "misses": outcomes.count("miss"),
+        "peak_rss_mb": round(rss_kb / 1024, 1),
+    })
+
+
+def _percentiles(seconds: list[float]) -> dict[str, float]:
+    if not seconds:
+        return {"p50": 0.0, "p95": 0.0, "mean": 0.0}
+    ms = sorted(s * 1000 for s in seconds)
+    return {
+        "p50": round(statistics.median(ms), 2),
+        "p95": round(ms[min(len(ms) - 1, int(0.95 * len(ms)))], 2),
+        "mean": round(statistics.fmean(ms), 2),
+    }
+
+
+def run_pass(scenario: str, mode: str, root: Path, tasks: int, args: argparse.Namespace) -> dict[str, Any]:
+    ctx = multiprocessing.get_context("fork")
+    results = ctx.Queue()
+    child = ctx.Process(target=_run_pass, args=(scenario, mode, root, tasks, args, results))
+    child.start()
+    result = results.get(timeout=args.timeout)
+    child.join()
+    return result
+
+
+def check_baseline(results: list[dict[str, Any]], baseline_path: Path, tolerance: float) -> list[str]:
+    """Scenarios whose replay p95 overhead regressed past the tolerance."""
+    baseline = {
+        r["scenario"]: r for r in json.loads(baseline_path.read_text()) if r["mode"] == "replay"
+    }
+    regressions = []
+    for r in results:
+        before = baseline.get(r["scenario"])
+        if r["mode"] != "replay" or before is None:
+            continue
+        limit = before["overhead_ms"]["p95"] * (1 + tolerance)
+        if r["overhead_ms"]["p95"] > limit:
+            regressions.append(
+                f"{r['scenario']}: p95 overhead {r['overhead_ms']['p95']:.1f} ms > {limit:.1f} ms"
+            )
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenarios", nargs="+", choices=SCENARIOS, default=list(SCENARIOS))
+    parser.add_argument("--tasks", type=int, default=4)
+    parser.add_argument("--root", type=Path, default=Path(tempfile.gettempdir()) / "ralph-bench-e2e")
+    parser.add_argument("--model-ms", type=float, default=40.0, help="scripted model delay per call when recording")
+    parser.add_argument("--latency-scale", type=float, default=0.0, help="replay recorded delays times this")
+    parser.add_argument("--timeout", type=float, default=600.0, help="seconds per pass")
+    parser.add_argument("--json", type=Path, help="write results to this file")
+    parser.add_argument("--baseline", type=Path, help="results file to compare replay p95 against")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed p95 regression (fraction)")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+
+    results = []
+    print(f"\n{args.tasks} tasks per scenario, fixtures under {args.root}")
+    print(
+        f"  {'scenario':<9} {'pass':<7} {'wall s':>7} {'iters':>6} {'p50 ms':>7} {'p95 ms':>7} "
+        f"{'ovh p50':>8} {'ovh p95':>8} {'llm':>5} {'exact':>6} {'turn':>5} {'miss':>5} {'rss MB':>7}"
+    )
+    for scenario in args.scenarios:
+        for mode in ("record", "replay"):
+            r = run_pass(scenario, mode, args.root.resolve(), args.tasks, args)
+            results.append(r)
+            print(
+                f"  {scenario:<9} {mode:<7} {r['wall_s']:7.2f} {r['iterations']:6} "
+                f"{r['iteration_ms']['p50']:7.1f} {r['iteration_ms']['p95']:7.1f} "
+                f"{r['overhead_ms']['p50']:8.1f} {r['overhead_ms']['p95']:8.1f} {r['llm_calls']:5} "
+                f"{r['exact_hits']:6} {r['turn_hits']:5} {r['misses']:5} {r['peak_rss_mb']:7.1f}"
+            )
+
+    if args.json:
+        args.json.write_text(json.dumps(results, indent=2))
+    if args.baseline:
+        regressions = check_baseline(results, args.baseline, args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
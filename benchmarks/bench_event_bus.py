@@ -0,0 +1,121 @@
+"""Benchmark: EventBus responsiveness under parallel-run event load.
+
+Worker threads emit the event mix of a parallel run. Most of the mix is
+metrics, token, cost and progress updates, sent after every LLM call and
+tool call. Task and log events are mixed in. Handlers take a fixed time
+per call (``--handler-ms``), standing in for a TUI widget refresh or a
+WebSocket send.
+
+For each configuration the benchmark reports:
+
+- handler calls made
+- p50/p95 delay from emit to dispatch for log events (what the user
+  waits to see)
+- events dropped and coalesced
+
+Usage:
+    python -m benchmarks.bench_event_bus [--threads 8] [--events 2000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import statistics
+import threading
+import time
+
+from ralph_agi.tui.events import Event, EventBus, EventType
+
+HIGH_FREQUENCY = (
+    EventType.METRICS_UPDATED,
+    EventType.TOKENS_USED,
+    EventType.COST_UPDATED,
+    EventType.PROGRESS_UPDATED,
+)
+
+
+def _producer(bus: EventBus, worker: int, events: int, rate: float) -> None:
+    for i in range(events):
+        if i % 10 == 0:
+            event = Event(type=EventType.LOG_MESSAGE, data={"sent": time.perf_counter(), "worker": worker})
+        else:
+            event_type = HIGH_FREQUENCY[i % len(HIGH_FREQUENCY)]
+            event = Event(type=event_type, data={"task_name": f"task-{worker}", "progress": i, "prompt_tokens": 1})
+        bus.emit(event)
+        if rate:
+            time.sleep(1 / rate)
+
+
+async def measure(threads: int, events: int, rate: float, handler_delay: float, **bus_kwargs) -> dict:
+    bus = EventBus(**bus_kwargs)
+    calls = 0
+    log_delays: list[float] = []
+
+    def handler(event: Event) -> None:
+        nonlocal calls
+        calls += 1
+        if event.type == EventType.LOG_MESSAGE:
+            log_delays.append(time.perf_counter() - event.data["sent"])
+        time.sleep(handler_delay)  # Holds the loop, like a widget refresh
+
+    bus.subscribe_all(handler)
+    await bus.start()
+    workers = [
+        threading.Thread(target=_producer, args=(bus, w, events, rate)) for w in range(threads)
+    ]
+    start = time.perf_counter()
+    for w in workers:
+        w.start()
+    while any(w.is_alive() for w in workers) or bus.stats().queue_depth:
+        await asyncio.sleep(0.005)
+    await asyncio.sleep(0.05)
+    elapsed = time.perf_counter() - start
+    stats = bus.stats()
+    bus.stop()
+
+    delays = sorted(d * 1000 for d in log_delays) or [0.0]
+    return {
+        "elapsed": elapsed,
+        "calls": calls,
+        "p50": statistics.median(delays),
+        "p95": delays[min(len(delays) - 1, int(0.95 * len(delays)))],
+        "logs": len(log_delays),
+        "dropped": stats.dropped,
+        "coalesced": stats.coalesced,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--events", type=int, default=2000, help="events per thread")
+    parser.add_argument("--rate", type=float, default=2000.0, help="events/s per thread (0 = flat out)")
+    parser.add_argument("--handler-ms", type=float, default=0.2)
+    parser.add_argument("--queue-size", type=int, default=EventBus.DEFAULT_MAX_QUEUE_SIZE)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    configs = [
+        ("no coalescing", {"coalesce": False, "tick_interval": 0}),
+        ("coalesce", {"coalesce": True, "tick_interval": 0}),
+        ("coalesce+tick", {"coalesce": True}),
+    ]
+    total = args.threads * args.events
+    print(f"\n{args.threads} threads x {args.events} events, handler {args.handler_ms} ms, queue {args.queue_size}")
+    print(f"  {'config':<15} {'wall s':>7} {'handler calls':>14} {'log p50 ms':>11} {'log p95 ms':>11} {'logs':>6} {'dropped':>8} {'coalesced':>10}")
+    for name, kwargs in configs:
+        r = asyncio.run(measure(
+            args.threads, args.events, args.rate, args.handler_ms / 1000,
+            max_queue_size=args.queue_size, **kwargs,
+        ))
+        print(
+            f"  {name:<15} {r['elapsed']:7.2f} {r['calls']:14} {r['p50']:11.1f} {r['p95']:11.1f} "
+            f"{r['logs']:6} {r['dropped']:8} {r['coalesced']:10}"
+        )
+    print(f"  ({total} events emitted per config)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""Benchmark: import verification of a multi-file change.
+
+Generates a change of N Python files with M top-level imports each
+(a mix of stdlib, installed and sibling modules) and times
+verify_files against the previous approach of one
+``python -c "import X"`` subprocess per module per file.
+
+Usage:
+    python -m benchmarks.bench_import_verification [--files 30] [--imports 15]
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from ralph_agi.llm.import_resolver import ImportResolver
+from ralph_agi.llm.verification import verify_python_imports
+
+STDLIB = [
+    "os", "sys", "json", "re", "ast", "time", "pathlib", "typing", "logging",
+    "dataclasses", "collections", "itertools", "functools", "subprocess",
+    "asyncio", "hashlib", "threading", "tempfile", "shutil", "argparse",
+]
+INSTALLED = ["yaml", "pytest"]
+
+
+def make_change(root: Path, files: int, imports: int) -> list[Path]:
+    """Write a synthetic change set and return its file paths."""
+    (root / "shared.py").write_text("VALUE = 1\n")
+    pool = STDLIB + INSTALLED + ["shared"]
+    paths = []
+    for i in range(files):
+        names = [pool[(i + j) % len(pool)] for j in range(imports)]
+        path = root / f"module_{i}.py"
+        path.write_text("".join(f"import {name}\n" for name in names))
+        paths.append(path)
+    return paths
+
+
+def verify_with_subprocesses(path: Path) -> bool:
+    """Previous implementation: one interpreter start per import."""
+    tree = ast.parse(path.read_text())
+    modules = {
+        alias.name.split(".")[0]
+        for node in ast.walk(tree) if isinstance(node, ast.Import)
+        for alias in node.names
+    }
+    for module in modules:
+        result = subprocess.run(
+            [sys.executable, "-c", f"import {module}"],
+            capture_output=True,
+            timeout=30,
+            cwd=path.parent,
+        )
+        if result.returncode != 0:
+            return False
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=30)
+    parser.add_argument("--imports", type=int, default=15)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = make_change(Path(tmp), args.files, args.imports)
+
+        start = time.perf_counter()
+        assert all(verify_with_subprocesses(p) for p in paths)
+        subprocess_s = time.perf_counter() - start
+
+        resolver = ImportResolver()
+        start = time.perf_counter()
+        assert all(verify_python_imports(p, resolver)[0] for p in paths)
+        cold_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        assert all(verify_python_imports(p, resolver)[0] for p in paths)
+        warm_s = time.perf_counter() - start
+
+        isolated = ImportResolver(isolated=True)
+        start = time.perf_counter()
+        assert all(verify_python_imports(p, isolated)[0] for p in paths)
+        isolated_s = time.perf_counter() - start
+        isolated.close()
+
+    print(f"{args.files} files x {args.imports} imports")
+    print(f"  subprocess per import : {subprocess_s * 1000:9.1f} ms")
+    print(f"  resolver (cold)       : {cold_s * 1000:9.1f} ms")
+    print(f"  resolver (warm)       : {warm_s * 1000:9.1f} ms")
+    print(f"  resolver (isolated)   : {isolated_s * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""Benchmark: JSONL memory fallback reads at 100k and 1M frames.
+
+Writes a synthetic backup file, then times the read paths MemoryStore
+uses when memvid is unavailable, comparing the indexed
+JSONLBackupStore against the previous full-file scans.
+
+Usage:
+    python -m benchmarks.bench_jsonl_memory [--sizes 100000 1000000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable
+
+from ralph_agi.memory.jsonl_backup import JSONLBackupStore
+
+FRAME_TYPES = ["iteration_result", "error", "learning", "decision", "git_commit"]
+
+
+def write_frames(path: Path, count: int) -> None:
+    """Write ``count`` frames directly (bypassing per-frame fsync)."""
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(count):
+            day = 1 + (i * 28) // count
+            f.write(json.dumps({
+                "id": f"frame-{i}",
+                "content": f"Iteration {i} finished task-{i % 97} with result {i % 13}",
+                "frame_type": FRAME_TYPES[i % len(FRAME_TYPES)],
+                "metadata": {"iteration": i},
+                "timestamp": f"2026-02-{day:02d}T{i % 24:02d}:00:00+00:00",
+                "session_id": f"session-{i // 1000}",
+                "tags": [FRAME_TYPES[i % len(FRAME_TYPES)]],
+            }) + "\n")
+
+
+# Previous implementations, kept for comparison
+
+def legacy_search(path: Path, query: str, frame_type=None, limit=10, session_id=None):
+    matches = []
+    pattern = re.compile(re.escape(query), re.IGNORECASE)
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            frame = json.loads(line)
+            if frame_type and frame.get("frame_type") != frame_type:
+                continue
+            if session_id and frame.get("session_id") != session_id:
+                continue
+            if query == "*" or pattern.search(frame.get("content", "")):
+                matches.append(frame)
+    matches.reverse()
+    return matches[:limit]
+
+
+def legacy_recent(path: Path, n: int = 10):
+    lines: deque[str] = deque(maxlen=n * 2)
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                lines.append(line)
+    return [json.loads(line) for line in reversed(lines)][:n]
+
+
+def legacy_count(path: Path) -> int:
+    with open(path, "r", encoding="utf-8") as f:
+        return sum(1 for line in f if json.loads(line))
+
+
+def timed(fn: Callable[[], object]) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def run(size: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "ralph_memory.jsonl"
+        write_frames(path, size)
+        session = f"session-{size // 2000}"
+
+        store = JSONLBackupStore(path)
+        build_ms = timed(store.count)  # Cold: builds the sidecar index
+
+        reopened = JSONLBackupStore(path)
+        load_ms = timed(reopened.count)  # Cold: loads the existing index
+
+        cases = [
+            ("count()", lambda: legacy_count(path), store.count),
+            ("get_recent(10)", lambda: legacy_recent(path), lambda: store.get_recent(10)),
+            ("search type=error", lambda: legacy_search(path, "*", "error"),
+             lambda: store.search("*", frame_type="error")),
+            ("search session", lambda: legacy_search(path, "*", session_id=session),
+             lambda: store.search("*", session_id=session)),
+            ("search date range", None,
+             lambda: store.search("*", start_date="2026-02-14", end_date="2026-02-14")),
+            ("search keyword", lambda: legacy_search(path, "task-42"),
+             lambda: store.search("task-42")),
+        ]
+
+        print(f"\n{size:,} frames ({path.stat().st_size / 1e6:.0f} MB)")
+        print(f"  index build (first open) : {build_ms:9.1f} ms")
+        print(f"  index load (reopen)      : {load_ms:9.1f} ms")
+        print(f"  {'operation':<22} {'full scan':>12} {'indexed':>12}")
+        for name, legacy, indexed in cases:
+            legacy_ms = f"{timed(legacy):9.1f} ms" if legacy else "         -   "
+            print(f"  {name:<22} {legacy_ms:>12} {timed(indexed):9.1f} ms")
+
+        append_ms = timed(lambda: store.append({"id": "new", "content": "x", "frame_type": "error"}))
+        print(f"  append + index update    : {append_ms:9.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    args = parser.parse_args()
+    for size in args.sizes:
+        run(size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""Benchmark: JSONL memory backup append throughput per fsync policy.
+
+Appends frames the way bursty writers (iteration hooks, knowledge
+records, git commit frames) do, from one thread and from several, and
+compares the previous open/lock/fsync/close-per-frame append with the
+``always``, ``batch`` and ``os`` durability policies. Every run ends
+with an explicit flush so all policies finish with the same frames on
+disk.
+
+Usage:
+    python -m benchmarks.bench_memory_append [--frames 2000] [--threads 4]
+"""
+
+from __future__ import annotations
+
+import argparse
+import fcntl
+import json
+import os
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+from ralph_agi.memory.jsonl_backup import JSONLBackupStore
+
+
+def legacy_append(path: Path, frame_data: dict) -> None:
+    """The previous append: open, flock, write, fsync, close per frame."""
+    frame_data = {**frame_data, "_backup_timestamp": datetime.now(timezone.utc).isoformat()}
+    line = json.dumps(frame_data, default=str) + "\n"
+    with open(path, "a", encoding="utf-8") as f:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def frame(n: int) -> dict:
+    return {
+        "id": f"frame-{n}",
+        "content": f"Iteration {n} completed: updated module_{n % 40}.py",
+        "frame_type": "iteration_result",
+        "session_id": "bench-session",
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "metadata": {"iteration": n, "success": True},
+    }
+
+
+def run_writers(append: Callable[[dict], object], frames: int, threads: int) -> float:
+    """Append ``frames`` frames split over ``threads`` writers; return seconds."""
+    per_thread = frames // threads
+
+    def writer(base: int) -> None:
+        for i in range(per_thread):
+            append(frame(base + i))
+
+    workers = [threading.Thread(target=writer, args=(t * per_thread,)) for t in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def measure(name: str, frames: int, threads: int) -> tuple[float, int]:
+    """Time one policy; returns (frames/sec, frames on disk)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "ralph_memory.jsonl"
+        if name == "legacy":
+            elapsed = run_writers(lambda data: legacy_append(path, data), frames, threads)
+        else:
+            store = JSONLBackupStore(path, fsync=name)
+            elapsed = run_writers(store.append, frames, threads)
+            start = time.perf_counter()
+            store.close()  # Final flush counts towards the run
+            elapsed += time.perf_counter() - start
+        with open(path, "rb") as f:
+            written = sum(1 for _ in f)
+    return frames / elapsed, written
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=2000)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+
+    for threads in sorted({1, args.threads}):
+        frames = args.frames - args.frames % threads
+        print(f"\n{frames:,} frames, {threads} writer thread(s)")
+        print(f"  {'policy':<16} {'frames/s':>12} {'us/frame':>10} {'on disk':>8}")
+        for name in ("legacy", "always", "batch", "os"):
+            rate, written = measure(name, frames, threads)
+            label = "open+fsync/frame" if name == "legacy" else f"fsync={name}"
+            print(f"  {label:<16} {rate:12,.0f} {1e6 / rate:10.1f} {written:8,}")
+
+
+if __name__ == "__main__":
+    main()
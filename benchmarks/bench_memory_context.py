@@ -0,0 +1,150 @@
+"""Benchmark: memory context size and hit rate per Builder call.
+
+Fills a JSONL-backed MemoryStore (the memvid-less fallback) with a long
+history: routine iteration results from the current session plus
+learnings, errors and decisions about specific topics from earlier
+sessions. For a set of tasks, each about one topic, compares the
+previous context (5 most recent session frames, 200 chars each) with
+MemoryContextBuilder at several token budgets.
+
+Hit rate: share of tasks whose context includes at least one frame
+about the task's topic.
+
+Usage:
+    python -m benchmarks.bench_memory_context [--frames 3000] [--budgets 300 600 1500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from ralph_agi.memory.context import MemoryContextBuilder
+from ralph_agi.memory.jsonl_backup import JSONLBackupStore
+from ralph_agi.memory.store import MemoryStore
+
+SESSION = "current-session"
+
+TOPICS = {
+    "oauth": "OAuth callback state validation in auth/callback.py",
+    "migrations": "Alembic migration ordering for the orders table",
+    "websocket": "WebSocket reconnect backoff in the dashboard client",
+    "pagination": "cursor pagination for the /tasks API endpoint",
+    "caching": "Redis cache invalidation when a project is renamed",
+    "uploads": "multipart upload size limits in the files service",
+    "i18n": "translation catalog loading for the settings page",
+    "billing": "Stripe webhook signature verification in billing/webhooks.py",
+    "search": "full-text search ranking weights for task titles",
+    "logging": "structured JSON logging with request ids in middleware",
+}
+
+TASKS = {
+    "oauth": "Reject OAuth callbacks whose state parameter does not match the session",
+    "migrations": "Add a migration adding a status column to the orders table",
+    "websocket": "Make the dashboard WebSocket client reconnect with exponential backoff",
+    "pagination": "Switch the /tasks API endpoint from offset to cursor pagination",
+    "caching": "Invalidate cached project data in Redis on rename",
+    "uploads": "Enforce a maximum upload size in the files service",
+    "i18n": "Load translation catalogs lazily on the settings page",
+    "billing": "Verify Stripe webhook signatures before processing events",
+    "search": "Tune full-text search ranking so title matches rank first",
+    "logging": "Attach request ids to structured JSON logs in middleware",
+}
+
+
+def populate(path: Path, frames: int, seed: int = 7) -> None:
+    """Write a synthetic memory history to the JSONL backup."""
+    rng = random.Random(seed)
+    backup = JSONLBackupStore(path, fsync="os")
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    topics = list(TOPICS)
+    for i in range(frames):
+        timestamp = (start + timedelta(minutes=i)).isoformat()
+        if i % 12 == 0:
+            topic = topics[(i // 12) % len(topics)]
+            frame_type = rng.choice(["learning", "error", "decision"])
+            content = (
+                f"{frame_type.title()} about {TOPICS[topic]}: "
+                f"{rng.choice(['watch out for', 'fixed by handling', 'decided to keep'])} "
+                f"edge case {i} ({topic})"
+            )
+            session = f"old-session-{i % 7}"
+        else:
+            frame_type = "iteration_result"
+            content = (
+                f"Iteration {i} completed successfully\n\nOutput: ran formatter and "
+                f"pytest, {rng.randint(100, 400)} passed, updated docs/page_{i % 50}.md. "
+                + "No functional changes. " * rng.randint(2, 20)
+            )
+            session = SESSION
+        backup.append(
+            {
+                "id": f"f{i}",
+                "content": content,
+                "frame_type": frame_type,
+                "metadata": {"frame_type": frame_type, "timestamp": timestamp},
+                "timestamp": timestamp,
+                "session_id": session,
+                "tags": [frame_type],
+            }
+        )
+    backup.close()
+
+
+def legacy_context(store: MemoryStore) -> tuple[str, list]:
+    """The previous _build_memory_context: 5 session frames, 200 chars each."""
+    frames = store.get_by_session(SESSION, limit=5)
+    parts = ["## Recent Context"]
+    for frame in frames:
+        content = frame.content
+        if len(content) > 200:
+            content = content[:200] + "..."
+        parts.append(f"- {content}")
+    return "\n".join(parts), frames
+
+
+def report(name: str, results: list[tuple[str, list, str]], elapsed: float) -> None:
+    tokens = [len(text) // 4 + 1 for text, _, _ in results]
+    hits = sum(any(f"({topic})" in f.content for f in frames) for _, frames, topic in results)
+    print(
+        f"  {name:<22} {sum(tokens) / len(tokens):8.0f} {hits}/{len(results):<7} "
+        f"{elapsed * 1000 / len(results):8.1f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=3000)
+    parser.add_argument("--budgets", type=int, nargs="+", default=[300, 600, 1500])
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)  # memvid-sdk missing / fallback notices
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store_path = Path(tmp) / "ralph_memory.mv2"
+        populate(store_path.with_suffix(".jsonl"), args.frames)
+        store = MemoryStore(store_path)
+
+        print(f"\n{args.frames:,} frames, {len(TASKS)} tasks")
+        print(f"  {'context':<22} {'tokens':>8} {'hits':<9} {'ms/call':>8}")
+
+        start = time.perf_counter()
+        results = [(*legacy_context(store), topic) for topic in TASKS]
+        report("5 recent x 200 chars", results, time.perf_counter() - start)
+
+        for budget in args.budgets:
+            builder = MemoryContextBuilder(store, max_tokens=budget)
+            start = time.perf_counter()
+            results = []
+            for topic, task in TASKS.items():
+                context = builder.build(task, session_id=SESSION)
+                results.append((context.text, context.frames, topic))
+            report(f"ranked, {budget} budget", results, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""Benchmark: parallel workers against a rate-limited provider.
+
+Simulates a provider that allows ``--rpm`` requests per minute (a token
+bucket, scaled so a minute lasts ``--minute`` seconds) and rejects the
+rest with 429 + retry-after. Workers each make a fixed number of calls,
+retrying rejected ones with RetryPolicy backoff, the way
+BuilderAgent does.
+
+Workers run as threads with their own event loops (like
+ParallelExecutor) or as forked processes (like BatchExecutor). They
+either call the provider directly, or go through a RateGovernor set to
+the same limit: one in-process instance for threads, a shared state
+file for processes.
+
+Usage:
+    python -m benchmarks.bench_rate_governor [--workers 6] [--calls 20] [--rpm 60]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from ralph_agi.llm.client import RateLimitError
+from ralph_agi.llm.rate_limit import RateGovernor, RateLimits, governed_call
+from ralph_agi.llm.retry import RetryPolicy
+
+LATENCY = 0.02
+
+
+class Provider:
+    """Provider-side quota: a file-backed bucket so processes share it."""
+
+    def __init__(self, state_path: Path, rpm: int, minute: float):
+        # Reuse the governor's bucket as the provider's quota, on a scaled clock
+        start = time.time()
+        self._scale = 60.0 / minute
+        self._bucket = RateGovernor(
+            RateLimits(requests_per_minute=rpm),
+            state_path=state_path,
+            clock=lambda: start + (time.time() - start) * self._scale,
+        )
+
+    async def call(self) -> None:
+        await asyncio.sleep(LATENCY)
+        reservation, wait = self._bucket.try_acquire("provider", "model", 1)
+        if reservation is None:
+            raise RateLimitError("429 Too Many Requests", retry_after=wait / self._scale)
+
+
+async def worker(
+    provider: Provider, governor: Optional[RateGovernor], calls: int, stats: dict
+) -> None:
+    policy = RetryPolicy(max_retries=20, base_delay=0.05)
+    for _ in range(calls):
+        attempt = 0
+        while True:
+            try:
+                async with governed_call(governor, "provider", "model", 1):
+                    await provider.call()
+                stats["ok"] += 1
+                break
+            except RateLimitError as e:
+                stats["429"] += 1
+                if attempt >= policy.max_retries:
+                    stats["failed"] += 1
+                    break
+                await asyncio.sleep(policy.delay(attempt, e.retry_after))
+                attempt += 1
+
+
+def _process_worker(provider_path, governor_path, rpm, minute, calls, queue) -> None:
+    logging.disable(logging.CRITICAL)
+    provider = Provider(provider_path, rpm, minute)
+    governor = None
+    if governor_path:
+        scale = 60.0 / minute
+        start = time.time()
+        governor = RateGovernor(
+            RateLimits(requests_per_minute=rpm),
+            state_path=governor_path,
+            clock=lambda: start + (time.time() - start) * scale,
+        )
+    stats = {"ok": 0, "429": 0, "failed": 0}
+    asyncio.run(worker(provider, governor, calls, stats))
+    queue.put(stats)
+
+
+def run(mode: str, governed: bool, args: argparse.Namespace) -> tuple[float, dict]:
+    with tempfile.TemporaryDirectory() as tmp:
+        provider_path = Path(tmp) / "provider.json"
+        governor_path = Path(tmp) / "governor.json" if governed else None
+        total = {"ok": 0, "429": 0, "failed": 0}
+        start = time.perf_counter()
+
+        if mode == "threads":
+            provider = Provider(provider_path, args.rpm, args.minute)
+            governor = None
+            if governed:
+                scale = 60.0 / args.minute
+                t0 = time.time()
+                governor = RateGovernor(
+                    RateLimits(requests_per_minute=args.rpm),
+                    clock=lambda: t0 + (time.time() - t0) * scale,
+                )
+            lock = threading.Lock()
+
+            def thread_main() -> None:
+                stats = {"ok": 0, "429": 0, "failed": 0}
+                asyncio.run(worker(provider, governor, args.calls, stats))
+                with lock:
+                    for k in total:
+                        total[k] += stats[k]
+
+            threads = [threading.Thread(target=thread_main) for _ in range(args.workers)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        else:
+            ctx = multiprocessing.get_context("fork")
+            queue = ctx.Queue()
+            procs = [
+                ctx.Process(
+                    target=_process_worker,
+                    args=(provider_path, governor_path, args.rpm, args.minute, args.calls, queue),
+                )
+                for _ in range(args.workers)
+            ]
+            for p in procs:
+                p.start()
+            for _ in procs:
+                stats = queue.get()
+                for k in total:
+                    total[k] += stats[k]
+            for p in procs:
+                p.join()
+
+        return time.perf_counter() - start, total
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=6)
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--rpm", type=int, default=60)
+    parser.add_argument("--minute", type=float, default=2.0, help="seconds per simulated minute")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)  # Expected 429 warnings
+
+    print(
+        f"\n{args.workers} workers x {args.calls} calls, provider limit {args.rpm} rpm "
+        f"(1 min = {args.minute:g}s)"
+    )
+    print(f"  {'workers':<10} {'governor':<9} {'wall s':>7} {'ok':>5} {'429s':>6} {'failed':>7}")
+    for mode in ("threads", "processes"):
+        for governed in (False, True):
+            elapsed, stats = run(mode, governed, args)
+            print(
+                f"  {mode:<10} {'yes' if governed else 'no':<9} {elapsed:7.2f} "
+                f"{stats['ok']:5} {stats['429']:6} {stats['failed']:7}"
+            )
+
+
+if __name__ == "__main__":
+    main()
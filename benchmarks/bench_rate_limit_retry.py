@@ -0,0 +1,139 @@
+"""Benchmark: Builder wall time and token spend under rate limiting.
+
+Runs Builder tasks of a fixed length against a fake client that fails
+each call with a 429 at a given probability. Compares the previous
+behaviour, where a rate limit ended the Builder run and the whole task
+was re-executed from scratch after a backoff, with per-call retries
+that keep the conversation and tool progress.
+
+Latencies are scaled down (``--latency`` ms per call) so the run is
+quick; ratios, not absolute times, are the point.
+
+Usage:
+    python -m benchmarks.bench_rate_limit_retry [--tasks 20] [--steps 15] [--rates 0.05 0.1 0.2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import random
+import time
+from typing import Any
+
+from ralph_agi.llm.agents import AgentStatus, BuilderAgent
+from ralph_agi.llm.client import LLMResponse, RateLimitError, StopReason, ToolCall
+from ralph_agi.llm.context_window import message_tokens
+from ralph_agi.llm.retry import RetryPolicy
+
+RETRY_AFTER = 0.01
+
+
+class ThrottledClient:
+    """Fake client: ``steps`` tool calls then DONE, with random 429s."""
+
+    def __init__(self, steps: int, rate: float, latency: float, rng: random.Random):
+        self.steps = steps
+        self.rate = rate
+        self.latency = latency
+        self.rng = rng
+        self.calls = 0
+        self.tokens = 0
+
+    async def complete(self, messages: list[dict[str, Any]], **kwargs: Any) -> LLMResponse:
+        self.calls += 1
+        await asyncio.sleep(self.latency)
+        if self.rng.random() < self.rate:
+            raise RateLimitError("429 Too Many Requests", retry_after=RETRY_AFTER)
+        prompt = sum(message_tokens(m) for m in messages)
+        self.tokens += prompt + 60
+        step = sum(1 for m in messages if m["role"] == "assistant")
+        if step >= self.steps:
+            return LLMResponse(
+                content="<task_complete>DONE</task_complete>",
+                stop_reason=StopReason.END_TURN,
+                usage={"input_tokens": prompt, "output_tokens": 60},
+            )
+        return LLMResponse(
+            content="",
+            tool_calls=[ToolCall(id=f"c{step}", name="read_file", arguments={"path": f"m{step}.py"})],
+            stop_reason=StopReason.TOOL_USE,
+            usage={"input_tokens": prompt, "output_tokens": 60},
+        )
+
+
+class Executor:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def execute(self, tool_name: str, arguments: dict[str, Any]) -> str:
+        self.calls += 1
+        return "def handler(event):\n    return process(event)\n" * 40
+
+
+async def run_task(mode: str, client: ThrottledClient, executor: Executor, steps: int) -> bool:
+    task = {"title": "Update handlers", "description": "..."}
+    if mode == "call":
+        builder = BuilderAgent(
+            client, executor, max_iterations=steps + 2,
+            retry_policy=RetryPolicy(max_retries=8, base_delay=RETRY_AFTER),
+        )
+        result = await builder.execute(task)
+        return result.status == AgentStatus.COMPLETED
+
+    # Previous behaviour: a 429 ends the run; back off and start over
+    builder = BuilderAgent(
+        client, executor, max_iterations=steps + 2, retry_policy=RetryPolicy(max_retries=0)
+    )
+    policy = RetryPolicy(max_retries=8, base_delay=RETRY_AFTER)
+    for attempt in range(policy.max_retries + 1):
+        result = await builder.execute(task)
+        if result.status != AgentStatus.RATE_LIMITED:
+            return result.status == AgentStatus.COMPLETED
+        await asyncio.sleep(policy.delay(attempt, RETRY_AFTER))
+    return False
+
+
+async def measure(mode: str, tasks: int, steps: int, rate: float, latency: float) -> tuple:
+    rng = random.Random(11)
+    clients = [ThrottledClient(steps, rate, latency, rng) for _ in range(tasks)]
+    executors = [Executor() for _ in range(tasks)]
+    start = time.perf_counter()
+    done = await asyncio.gather(
+        *(run_task(mode, c, e, steps) for c, e in zip(clients, executors))
+    )
+    elapsed = time.perf_counter() - start
+    return (
+        elapsed,
+        sum(c.calls for c in clients),
+        sum(c.tokens for c in clients),
+        sum(e.calls for e in executors),
+        sum(done),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=20)
+    parser.add_argument("--steps", type=int, default=15)
+    parser.add_argument("--rates", type=float, nargs="+", default=[0.05, 0.1, 0.2])
+    parser.add_argument("--latency", type=float, default=5.0, help="ms per LLM call")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)  # Rate limit warnings and errors are expected
+
+    print(f"\n{args.tasks} concurrent tasks x {args.steps} tool steps, {args.latency:.0f} ms/call")
+    print(f"  {'429 rate':<9} {'retry':<8} {'wall s':>7} {'calls':>7} {'tokens':>11} {'tools':>7} {'done':>6}")
+    for rate in args.rates:
+        for mode, label in (("restart", "task"), ("call", "call")):
+            elapsed, calls, tokens, tools, done = asyncio.run(
+                measure(mode, args.tasks, args.steps, rate, args.latency / 1000)
+            )
+            print(
+                f"  {rate:<9.2f} {label:<8} {elapsed:7.2f} {calls:7,} {tokens:11,} "
+                f"{tools:7,} {done:3}/{args.tasks}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Benchmark: sparse worktrees with shared dependency directories.
+
+Builds a monorepo with ``--packages`` packages of ``--files`` tracked
+files each, plus an ignored ``node_modules`` of ``--deps`` files in the
+main checkout. Each task mentions one package. Compares how a task
+worktree gets its sources and dependencies:
+
+- full+copy: full ``git worktree add``, ``node_modules`` copied (a
+  stand-in for reinstalling it).
+- full+share: full checkout, ``node_modules`` shared via
+  ``share_dependency_dirs`` (reflink, else hard links).
+- sparse+share: sparse checkout of the task's package plus shared
+  ``node_modules``.
+
+Reports checkout and dependency time, files materialized and bytes the
+worktree does not share with the main checkout (hard-linked files are
+free; reflinked blocks are shared too but can't be told apart here, so
+reflinks count as full size).
+
+Usage:
+    python -m benchmarks.bench_sparse_worktree [--packages 40] [--files 250] [--deps 5000] [--tasks 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from ralph_agi.tasks.checkout import derive_sparse_paths, share_dependency_dirs
+from ralph_agi.tools.git import GitTools
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def make_repo(root: Path, packages: int, files: int, deps: int) -> Path:
+    repo = root / "repo"
+    for p in range(packages):
+        package = repo / "packages" / f"pkg{p}" / "src"
+        package.mkdir(parents=True)
+        for f in range(files):
+            (package / f"module_{f}.ts").write_text(f"export const v{f} = {f};\n" + "// padding\n" * 40)
+    (repo / ".gitignore").write_text("node_modules/\n")
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "config", "user.email", "bench@example.com")
+    _git(repo, "config", "user.name", "Bench")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "initial")
+
+    for d in range(deps):
+        dep = repo / "node_modules" / f"dep{d // 50}"
+        dep.mkdir(parents=True, exist_ok=True)
+        (dep / f"file_{d}.js").write_text("module.exports = {};\n" + "// vendored\n" * 80)
+    return repo
+
+
+def _usage(path: Path) -> tuple[int, int]:
+    """(files, bytes not hard-linked to another checkout)."""
+    files = unshared = 0
+    for dirpath, dirnames, filenames in os.walk(path):
+        if ".git" in dirnames:
+            dirnames.remove(".git")
+        for name in filenames:
+            st = os.lstat(os.path.join(dirpath, name))
+            files += 1
+            if st.st_nlink == 1:
+                unshared += st.st_blocks * 512
+    return files, unshared
+
+
+def run(
+    repo: Path, root: Path, approach: str, tasks: int, packages: int,
+) -> tuple[list[float], list[float], int, int]:
+    git = GitTools(repo_path=repo)
+    checkout: list[float] = []
+    deps: list[float] = []
+    files = unshared = 0
+    for i in range(tasks):
+        path = root / approach / f"task-{i}"
+        hint = f"Fix the parser in packages/pkg{i % packages}/src/module_1.ts"
+        start = time.perf_counter()
+        sparse = derive_sparse_paths(repo, [hint]) if approach.startswith("sparse") else None
+        git.worktree_add(str(path), f"{approach}/task-{i}", sparse_paths=sparse)
+        checkout.append(time.perf_counter() - start)
+        start = time.perf_counter()
+        mode = "copy" if approach.endswith("copy") else "auto"
+        share_dependency_dirs(repo, path, ["node_modules"], mode=mode)
+        deps.append(time.perf_counter() - start)
+        files, unshared = _usage(path)
+        git.worktree_remove(str(path), force=True)
+    return checkout, deps, files, unshared
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--packages", type=int, default=40)
+    parser.add_argument("--files", type=int, default=250)
+    parser.add_argument("--deps", type=int, default=5000)
+    parser.add_argument("--tasks", type=int, default=3)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        repo = make_repo(root, args.packages, args.files, args.deps)
+
+        print(
+            f"\n{args.packages} packages x {args.files} files, {args.deps} dependency files, "
+            f"{args.tasks} tasks"
+        )
+        print(
+            f"  {'approach':<13} {'checkout ms':>12} {'deps ms':>8} {'files':>8} {'unshared MB':>12}"
+        )
+        for approach in ("full+copy", "full+share", "sparse+share"):
+            checkout, deps, files, unshared = run(repo, root, approach, args.tasks, args.packages)
+            print(
+                f"  {approach:<13} {statistics.median(checkout) * 1000:12.0f} "
+                f"{statistics.median(deps) * 1000:8.0f} {files:8d} {unshared / 1e6:12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
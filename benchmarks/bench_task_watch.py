@@ -0,0 +1,134 @@
+"""Benchmark: noticing task files written by another process.
+
+Fills a task directory with ``--tasks`` task files, then adds, updates
+and removes tasks one at a time while a watcher runs on a background
+thread. Compares:
+
+- glob: the previous ``TaskQueue.watch`` loop. It globs ``*.yaml`` every
+  second and only reports new files.
+- polling: ``TaskWatcher`` with the scandir signature fallback.
+- inotify: ``TaskWatcher`` on Linux inotify.
+
+Reports the share of changes noticed, write → callback latency and the
+CPU time the watcher uses while the directory is idle.
+
+Usage:
+    python -m benchmarks.bench_task_watch [--tasks 1000] [--changes 30] [--idle 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Callable
+
+from ralph_agi.tasks.storage import dump_task_yaml
+from ralph_agi.tasks.watcher import TaskWatcher, inotify_available
+
+POLL_INTERVAL = 1.0
+
+
+def _write(tasks_dir: Path, task_id: str, status: str = "pending") -> None:
+    dump_task_yaml(
+        tasks_dir / f"{task_id}.yaml",
+        {"id": task_id, "description": f"Benchmark task {task_id}", "status": status},
+    )
+
+
+class GlobWatcher:
+    """The previous watch loop: glob for new file names every second."""
+
+    def __init__(self, tasks_dir: Path):
+        self._tasks_dir = tasks_dir
+        self._stop = threading.Event()
+
+    def start(self, callback: Callable[[str], None]) -> None:
+        def loop() -> None:
+            seen = {p.name for p in self._tasks_dir.glob("*.yaml")}
+            while not self._stop.wait(POLL_INTERVAL):
+                current = {p.name for p in self._tasks_dir.glob("*.yaml")}
+                for name in current - seen:
+                    callback(name[: -len(".yaml")])
+                seen = current
+
+        threading.Thread(target=loop, daemon=True).start()
+
+    def close(self) -> None:
+        self._stop.set()
+
+
+def run(tasks_dir: Path, name: str, changes: int, idle: float) -> tuple[int, list[float], float]:
+    """Make ``changes`` edits and return (noticed, latencies, idle CPU seconds)."""
+    written: dict[str, float] = {}
+    latencies: list[float] = []
+    noticed = threading.Event()
+
+    def on_change(task_id: str) -> None:
+        start = written.pop(task_id, None)
+        if start is not None:
+            latencies.append(time.perf_counter() - start)
+        noticed.set()
+
+    if name == "glob":
+        watcher = GlobWatcher(tasks_dir)
+        watcher.start(on_change)
+    else:
+        watcher = TaskWatcher(tasks_dir, poll_interval=POLL_INTERVAL, backend=name)
+        watcher.start(lambda event: on_change(event.task_id))
+
+    try:
+        time.sleep(0.2)
+        cpu_start = time.process_time()
+        time.sleep(idle)
+        idle_cpu = time.process_time() - cpu_start
+
+        for i in range(changes):
+            task_id = f"{name}-{i // 3}"
+            noticed.clear()
+            written[task_id] = time.perf_counter()
+            if i % 3 == 0:
+                _write(tasks_dir, task_id)
+            elif i % 3 == 1:
+                _write(tasks_dir, task_id, status="ready")
+            else:
+                (tasks_dir / f"{task_id}.yaml").unlink()
+            noticed.wait(POLL_INTERVAL * 2.5)
+            written.pop(task_id, None)
+    finally:
+        watcher.close()
+    return len(latencies), latencies, idle_cpu
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--changes", type=int, default=30)
+    parser.add_argument("--idle", type=float, default=5.0)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    approaches = ["glob", "polling"] + (["inotify"] if inotify_available() else [])
+    with tempfile.TemporaryDirectory() as tmp:
+        tasks_dir = Path(tmp)
+        for i in range(args.tasks):
+            _write(tasks_dir, f"existing-{i}")
+
+        print(f"\n{args.tasks} tasks, {args.changes} changes (add/update/remove), {args.idle:.0f}s idle")
+        print(f"  {'approach':<10} {'noticed':>9} {'median ms':>10} {'max ms':>8} {'idle CPU ms':>12}")
+        for name in approaches:
+            noticed, latencies, idle_cpu = run(tasks_dir, name, args.changes, args.idle)
+            median = statistics.median(latencies) * 1000 if latencies else float("nan")
+            worst = max(latencies) * 1000 if latencies else float("nan")
+            print(
+                f"  {name:<10} {noticed:>4}/{args.changes:<4} {median:10.1f} {worst:8.1f} "
+                f"{idle_cpu * 1000:12.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
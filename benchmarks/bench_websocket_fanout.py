@@ -0,0 +1,129 @@
+"""Benchmark: WebSocket fan-out with one slow client.
+
+Several dashboard clients are connected. One of them (a backgrounded
+tab or a client on a bad link) takes ``--slow-ms`` per send. A burst of
+events is broadcast, mostly metrics and progress updates, with some
+task events mixed in.
+
+Compares the previous broadcast, which awaited every client in turn
+under a global lock, with ``ConnectionManager``'s per-client send
+queues. For each it reports:
+
+- how long ``broadcast`` held the caller (the EventBus dispatcher)
+- p50/p95 delay from broadcast to delivery for the fast clients
+- messages the slow client had been sent, and had coalesced or dropped,
+  by the time the fast clients were done
+
+Usage:
+    python -m benchmarks.bench_websocket_fanout [--clients 8] [--messages 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import time
+
+from ralph_agi.api.websocket import ConnectionManager
+
+MESSAGE_TYPES = ("metrics_updated", "progress_updated", "tokens_used", "tool_called")
+
+
+class SimulatedClient:
+    """WebSocket stand-in that takes a fixed time per send."""
+
+    def __init__(self, send_delay: float):
+        self.send_delay = send_delay
+        self.delays: list[float] = []
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, text: str) -> None:
+        await asyncio.sleep(self.send_delay)
+        self.delays.append(time.perf_counter() - json.loads(text)["data"]["sent"])
+
+    async def close(self, code: int = 1000) -> None:
+        pass
+
+
+class LockedBroadcast:
+    """The previous fan-out: send to each client in turn under one lock."""
+
+    def __init__(self, clients: list[SimulatedClient]):
+        self.clients = clients
+        self._lock = asyncio.Lock()
+
+    async def broadcast(self, message: dict) -> None:
+        data = json.dumps(message, default=str)
+        async with self._lock:
+            for client in self.clients:
+                await client.send_text(data)
+
+
+def _message(i: int) -> dict:
+    return {
+        "type": MESSAGE_TYPES[i % len(MESSAGE_TYPES)],
+        "timestamp": "",
+        "data": {"task_id": f"task-{i % 4}", "n": i, "sent": time.perf_counter()},
+    }
+
+
+async def measure(queued: bool, clients: int, messages: int, slow_delay: float, interval: float) -> dict:
+    slow = SimulatedClient(slow_delay)
+    fast = [SimulatedClient(0.0) for _ in range(clients - 1)]
+    if queued:
+        fanout = ConnectionManager(send_timeout=60.0)
+        for client in [slow, *fast]:
+            await fanout.connect(client)
+    else:
+        fanout = LockedBroadcast([slow, *fast])
+
+    blocked = 0.0
+    start = time.perf_counter()
+    for i in range(messages):
+        before = time.perf_counter()
+        await fanout.broadcast(_message(i))
+        blocked += time.perf_counter() - before
+        await asyncio.sleep(interval)
+    while sum(len(c.delays) for c in fast) < messages * len(fast):
+        await asyncio.sleep(0.001)
+    elapsed = time.perf_counter() - start
+
+    stats = fanout.stats()[slow] if queued else None
+    delays = sorted(d * 1000 for c in fast for d in c.delays)
+    return {
+        "elapsed": elapsed,
+        "blocked": blocked,
+        "p50": statistics.median(delays),
+        "p95": delays[int(0.95 * (len(delays) - 1))],
+        "slow_sent": len(slow.delays),
+        "coalesced": stats.coalesced if stats else 0,
+        "dropped": stats.dropped if stats else 0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--slow-ms", type=float, default=20.0)
+    parser.add_argument("--interval-ms", type=float, default=1.0, help="time between broadcasts")
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(f"\n{args.clients} clients (1 slow, {args.slow_ms} ms/send), {args.messages} messages every {args.interval_ms} ms")
+    print(f"  {'fan-out':<12} {'wall s':>7} {'blocked s':>10} {'fast p50 ms':>12} {'fast p95 ms':>12} {'slow sent':>10} {'coalesced':>10} {'dropped':>8}")
+    for name, queued in (("locked", False), ("queued", True)):
+        r = asyncio.run(measure(queued, args.clients, args.messages, args.slow_ms / 1000, args.interval_ms / 1000))
+        print(
+            f"  {name:<12} {r['elapsed']:7.2f} {r['blocked']:10.2f} {r['p50']:12.1f} {r['p95']:12.1f} "
+            f"{r['slow_sent']:10} {r['coalesced']:10} {r['dropped']:8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
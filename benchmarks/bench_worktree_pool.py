@@ -0,0 +1,122 @@
+"""Benchmark: getting a task worktree from the pool vs. creating one.
+
+Builds a repository with ``--files`` tracked files, then hands out
+``--tasks`` task worktrees one after another, each on its own branch,
+and gives each back when its task is done:
+
+- fresh: ``git worktree add -b`` for every task, then
+  ``git worktree remove`` (what ``WorktreeManager`` did before the pool).
+- pooled: ``WorktreePool.acquire()`` checks the branch out in a warm
+  idle worktree. ``release()`` resets it, runs ``git clean`` and detaches
+  it so the next task can reuse it.
+
+Reports the median and worst time to get a worktree, the time to give
+one back, and the total time.
+
+Usage:
+    python -m benchmarks.bench_worktree_pool [--files 5000] [--tasks 10] [--pool 2]
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from ralph_agi.tasks.worktree import WorktreePool
+from ralph_agi.tools.git import GitTools
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def make_repo(root: Path, files: int) -> Path:
+    repo = root / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "config", "user.email", "bench@example.com")
+    _git(repo, "config", "user.name", "Bench")
+    for i in range(files):
+        package = repo / "src" / f"pkg{i // 100}"
+        package.mkdir(parents=True, exist_ok=True)
+        (package / f"module_{i}.py").write_text(f"VALUE = {i}\n" + "# padding\n" * 40)
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "initial")
+    return repo
+
+
+def _work(path: Path, task: int) -> None:
+    """Simulate a task: leave an untracked file and a build artifact."""
+    (path / f"task_{task}.txt").write_text("done\n")
+    (path / "src" / "pkg0" / "__pycache__").mkdir(exist_ok=True)
+
+
+def run_fresh(repo: Path, root: Path, tasks: int) -> tuple[list[float], list[float]]:
+    git = GitTools(repo_path=repo)
+    acquire, release = [], []
+    for i in range(tasks):
+        path = root / "fresh" / f"task-{i}"
+        start = time.perf_counter()
+        git.worktree_add(str(path), f"fresh/task-{i}", create_branch=True, base_ref="HEAD")
+        acquire.append(time.perf_counter() - start)
+        _work(path, i)
+        start = time.perf_counter()
+        git.worktree_remove(str(path), force=True)
+        release.append(time.perf_counter() - start)
+    return acquire, release
+
+
+def run_pooled(repo: Path, root: Path, tasks: int, size: int) -> tuple[list[float], list[float], dict]:
+    pool = WorktreePool(GitTools(repo_path=repo), root / "pool", size=size)
+    pool.warm()
+    acquire, release = [], []
+    try:
+        for i in range(tasks):
+            start = time.perf_counter()
+            path = pool.acquire(f"pooled/task-{i}")
+            acquire.append(time.perf_counter() - start)
+            _work(path, i)
+            start = time.perf_counter()
+            pool.release(path, force=True)
+            release.append(time.perf_counter() - start)
+        return acquire, release, pool.stats()
+    finally:
+        pool.drain()
+
+
+def _row(name: str, acquire: list[float], release: list[float]) -> str:
+    return (
+        f"  {name:<8} {statistics.median(acquire) * 1000:12.0f} {max(acquire) * 1000:10.0f} "
+        f"{statistics.median(release) * 1000:12.0f} {sum(acquire + release):9.2f}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--files", type=int, default=5000)
+    parser.add_argument("--tasks", type=int, default=10)
+    parser.add_argument("--pool", type=int, default=2)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        repo = make_repo(root, args.files)
+
+        fresh_acquire, fresh_release = run_fresh(repo, root, args.tasks)
+        pooled_acquire, pooled_release, stats = run_pooled(repo, root, args.tasks, args.pool)
+
+        print(f"\n{args.files} files, {args.tasks} tasks, pool size {args.pool}")
+        print(f"  {'approach':<8} {'acquire ms':>12} {'max ms':>10} {'release ms':>12} {'total s':>9}")
+        print(_row("fresh", fresh_acquire, fresh_release))
+        print(_row("pooled", pooled_acquire, pooled_release))
+        print(f"  pool: {stats['hits']} hits, {stats['misses']} misses, {stats['recycled']} recycled")
+
+
+if __name__ == "__main__":
+    main()
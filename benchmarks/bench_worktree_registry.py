@@ -0,0 +1,123 @@
+"""Benchmark: concurrent worktree status updates from worker processes.
+
+Starts ``--workers`` processes, as ``BatchExecutor`` does. Each one
+registers its worktree and then updates its status ``--updates`` times,
+with ``--existing`` other worktrees already recorded:
+
+- json: the old ``.ralph/worktrees.json`` state file. Every update loads
+  the whole file, changes one record and rewrites it with a temp file and
+  rename. There is no lock between processes.
+- registry: ``WorktreeRegistry`` (SQLite in WAL mode). Every update is one
+  transaction with a single-row ``UPDATE`` and a read-back of that row.
+
+Reports updates per second and how many workers' final updates were
+lost, i.e. missing from the file after all workers finished.
+
+Usage:
+    python -m benchmarks.bench_worktree_registry [--workers 8] [--updates 200] [--existing 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import multiprocessing
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from ralph_agi.tasks.registry import ActiveWorktree, WorktreeRegistry
+
+
+def _worktree(task_id: str) -> ActiveWorktree:
+    return ActiveWorktree(task_id, f"/trees/{task_id}", f"ralph/{task_id}")
+
+
+def _json_worker(state: str, worker: int, updates: int) -> None:
+    task_id = f"worker-{worker}"
+    for i in range(updates + 1):
+        try:
+            with open(state) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            continue  # Caught another process mid-replace
+        record = data["worktrees"].setdefault(task_id, _worktree(task_id).to_dict())
+        record["commit"] = str(i)
+        tmp = f"{state}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp, state)
+
+
+def _registry_worker(db: str, worker: int, updates: int) -> None:
+    registry = WorktreeRegistry(db)
+    task_id = f"worker-{worker}"
+    registry.add(_worktree(task_id))
+    for i in range(1, updates + 1):
+        registry.update(task_id, commit=str(i))
+    registry.close()
+
+
+def _run(target, path: str, workers: int, updates: int) -> float:
+    ctx = multiprocessing.get_context("spawn")
+    procs = [ctx.Process(target=target, args=(path, w, updates)) for w in range(workers)]
+    start = time.perf_counter()
+    for p in procs:
+        p.start()
+    for p in procs:
+        p.join()
+    return time.perf_counter() - start
+
+
+def bench_json(root: Path, workers: int, updates: int, existing: int) -> tuple[float, int]:
+    state = root / "worktrees.json"
+    records = {f"old-{i}": _worktree(f"old-{i}").to_dict() for i in range(existing)}
+    state.write_text(json.dumps({"worktrees": records}))
+    elapsed = _run(_json_worker, str(state), workers, updates)
+    final = json.loads(state.read_text())["worktrees"]
+    lost = sum(
+        final.get(f"worker-{w}", {}).get("commit") != str(updates) for w in range(workers)
+    )
+    return elapsed, lost
+
+
+def bench_registry(root: Path, workers: int, updates: int, existing: int) -> tuple[float, int]:
+    db = root / "worktrees.db"
+    registry = WorktreeRegistry(db)
+    for i in range(existing):
+        registry.add(_worktree(f"old-{i}"))
+    registry.close()
+    elapsed = _run(_registry_worker, str(db), workers, updates)
+    registry = WorktreeRegistry(db)
+    lost = sum(
+        getattr(registry.get(f"worker-{w}"), "commit", None) != str(updates)
+        for w in range(workers)
+    )
+    registry.close()
+    return elapsed, lost
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--updates", type=int, default=200)
+    parser.add_argument("--existing", type=int, default=500)
+    args = parser.parse_args()
+    logging.disable(logging.WARNING)
+
+    print(
+        f"\n{args.workers} workers x {args.updates} updates, "
+        f"{args.existing} other worktrees recorded"
+    )
+    print(f"  {'approach':<9} {'updates/s':>10} {'lost workers':>13}")
+    for name, bench in (("json", bench_json), ("registry", bench_registry)):
+        with tempfile.TemporaryDirectory() as tmp:
+            elapsed, lost = bench(Path(tmp), args.workers, args.updates, args.existing)
+        rate = args.workers * args.updates / elapsed
+        print(f"  {name:<9} {rate:10.0f} {lost:>6d}/{args.workers:<6d}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,87 +9,26 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
-from datetime import datetime
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional, Set
+from typing import AsyncIterator, Optional
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 
-from ralph_agi.api.dependencies import set_project_root
+from ralph_agi.api.dependencies import get_task_queue, publish_task_events, set_project_root
 from ralph_agi.api.routes import tasks_router, queue_router, execution_router, config_router, metrics_router
-from ralph_agi.tui.events import Event, EventBus, EventType
+from ralph_agi.api.websocket import ConnectionManager, Subscription
+from ralph_agi.tasks.queue import TaskNotFoundError
+from ralph_agi.tui.events import EventBus
 
 logger = logging.getLogger(__name__)
 
 
-class ConnectionManager:
-    """Manages WebSocket connections for real-time updates."""
-
-    def __init__(self):
-        self.active_connections: Set[WebSocket] = set()
-        self._lock = asyncio.Lock()
-
-    async def connect(self, websocket: WebSocket) -> None:
-        """Accept and register a new WebSocket connection."""
-        await websocket.accept()
-        async with self._lock:
-            self.active_connections.add(websocket)
-        logger.info(f"WebSocket connected. Total connections: {len(self.active_connections)}")
-
-    async def disconnect(self, websocket: WebSocket) -> None:
-        """Remove a WebSocket connection."""
-        async with self._lock:
-            self.active_connections.discard(websocket)
-        logger.info(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
-
-    async def broadcast(self, message: dict) -> None:
-        """Send a message to all connected clients."""
-        if not self.active_connections:
-            return
-
-        # Serialize message
-        data = json.dumps(message, default=str)
-
-        # Send to all connections
-        async with self._lock:
-            disconnected = set()
-            for connection in self.active_connections:
-                try:
-                    await connection.send_text(data)
-                except Exception as e:
-                    logger.warning(f"Failed to send to WebSocket: {e}")
-                    disconnected.add(connection)
-
-            # Remove failed connections
-            self.active_connections -= disconnected
-
-
 # Global connection manager
 manager = ConnectionManager()
 
 
-def create_event_handler(manager: ConnectionManager):
-    """Create an event handler that broadcasts to WebSockets.
-
-    Args:
-        manager: WebSocket connection manager.
-
-    Returns:
-        Event handler function.
-    """
-    async def handler(event: Event) -> None:
-        """Handle an event from EventBus and broadcast to WebSockets."""
-        message = {
-            "type": event.type.value,
-            "timestamp": event.timestamp.isoformat() if event.timestamp else datetime.now().isoformat(),
-            "data": event.data,
-        }
-        await manager.broadcast(message)
-
-    return handler
-
-
 def create_app(
     project_root: Optional[Path | str] = None,
     cors_origins: list[str] | None = None,
@@ -107,6 +46,21 @@ def create_app(
     if project_root:
         set_project_root(project_root)
 
+    @asynccontextmanager
+    async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+        """Run the EventBus and the task queue watcher with the server."""
+        event_bus = EventBus.get_instance()
+        manager.attach(event_bus)
+        await event_bus.start()
+        with get_task_queue().watcher() as watcher:
+            publisher = asyncio.create_task(publish_task_events(watcher))
+            try:
+                yield
+            finally:
+                publisher.cancel()
+                await asyncio.gather(publisher, return_exceptions=True)
+        event_bus.stop()
+
     # Create app
     app = FastAPI(
         title="RALPH-AGI API",
@@ -115,6 +69,7 @@ def create_app(
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
+        lifespan=lifespan,
     )
 
     # Configure CORS
@@ -143,24 +98,33 @@ def create_app(
 
     # WebSocket endpoint
     @app.websocket("/ws")
-    async def websocket_endpoint(websocket: WebSocket) -> None:
+    async def websocket_endpoint(
+        websocket: WebSocket,
+        events: Optional[str] = None,
+        tasks: Optional[str] = None,
+    ) -> None:
         """WebSocket endpoint for real-time updates.
 
         Clients connect here to receive live updates about:
         - Task status changes
         - Execution progress
         - Loop events
+
+        Optional ``events`` and ``tasks`` query parameters (comma-separated
+        event types / task IDs) limit what the client receives; a
+        ``{"type": "subscribe", "events": [...], "tasks": [...]}`` message
+        changes it later.
         """
-        await manager.connect(websocket)
+        await manager.connect(websocket, Subscription.parse(events, tasks))
 
-        # Subscribe to EventBus
+        # Forward EventBus events, dispatching on the server's loop
         event_bus = EventBus.get_instance()
-        handler = create_event_handler(manager)
-        event_bus.subscribe_all(handler)
+        manager.attach(event_bus)
+        await event_bus.start()
 
         try:
             # Keep connection alive and listen for client messages
-            while True:
+            while websocket in manager.active_connections:
                 try:
                     # Wait for messages from client (ping/pong, commands)
                     data = await asyncio.wait_for(
@@ -171,26 +135,82 @@ def create_app(
                     # Handle client messages
                     try:
                         message = json.loads(data)
-                        if message.get("type") == "ping":
-                            await websocket.send_text(json.dumps({"type": "pong"}))
                     except json.JSONDecodeError:
-                        pass
+                        continue
+                    if not isinstance(message, dict):
+                        continue
+                    if message.get("type") == "ping":
+                        manager.send(websocket, {"type": "pong"})
+                    elif message.get("type") == "subscribe":
+                        manager.subscribe(
+                            websocket,
+                            Subscription.parse(message.get("events"), message.get("tasks")),
+                        )
 
                 except asyncio.TimeoutError:
                     # Send ping to keep connection alive
-                    try:
-                        await websocket.send_text(json.dumps({"type": "ping"}))
-                    except Exception:
-                        break
+                    manager.send(websocket, {"type": "ping"})
 
         except WebSocketDisconnect:
             pass
         except Exception as e:
             logger.error(f"WebSocket error: {e}")
         finally:
-            event_bus.unsubscribe_all(handler)
             await manager.disconnect(websocket)
 
+    @app.websocket("/ws/tasks/{task_id}/logs")
+    async def task_logs_endpoint(websocket: WebSocket, task_id: str, since: int = 0) -> None:
+        """Stream a task's execution log as it is written.
+
+        Starts at byte offset ``since`` (0 for the whole log) and sends
+        ``{"type": "task_logs", "entries": [...], "offset": N, ...}``
+        messages. A client that reconnects with ``since=N`` resumes where
+        it left off. When the task has finished and everything has been
+        sent, a ``task_logs_complete`` message is sent and the socket is
+        closed.
+        """
+        queue = get_task_queue()
+        try:
+            queue.get(task_id)
+        except TaskNotFoundError:
+            await websocket.close(code=4404)
+            return
+
+        await websocket.accept()
+
+        def finished() -> bool:
+            try:
+                return queue.get(task_id).is_terminal
+            except TaskNotFoundError:
+                return True
+
+        async def stream() -> None:
+            offset = since
+            async for chunk in queue.task_log(task_id).follow(since, stop=finished):
+                offset = chunk.offset
+                await websocket.send_json({"type": "task_logs", "task_id": task_id, **chunk.to_dict()})
+            await websocket.send_json({"type": "task_logs_complete", "task_id": task_id, "offset": offset})
+            await websocket.close()
+
+        async def until_disconnect() -> None:
+            while (await websocket.receive())["type"] != "websocket.disconnect":
+                pass
+
+        # Stop tailing as soon as the client goes away, even while idle
+        sender = asyncio.create_task(stream())
+        receiver = asyncio.create_task(until_disconnect())
+        try:
+            done, _ = await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+            if sender in done:
+                sender.result()
+        except WebSocketDisconnect:
+            pass
+        except Exception as e:
+            logger.error(f"Task log stream error: {e}")
+        finally:
+            sender.cancel()
+            receiver.cancel()
+
     # Health check endpoint
     @app.get("/health")
     async def health_check() -> dict:
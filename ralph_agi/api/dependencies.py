@@ -8,10 +8,10 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import os
+from collections import deque
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Callable, Optional
 
 from ralph_agi.tasks.queue import (
     TaskQueue,
@@ -20,10 +20,16 @@ from ralph_agi.tasks.queue import (
     TaskArtifact,
     ExecutionLog,
 )
+from ralph_agi.tasks.changes import ChangeTracker
 from ralph_agi.tasks.parallel import ParallelExecutor, TaskResult
+from ralph_agi.tasks.watcher import TaskEvent, TaskEventType, TaskWatcher
+from ralph_agi.tui.events import Event, EventBus, EventType
 
 logger = logging.getLogger(__name__)
 
+# Log entries kept in the task record; the rest are in the task's log file
+LOG_TAIL_ENTRIES = 50
+
 # Singleton instances
 _task_queue: Optional[TaskQueue] = None
 _executor: Optional[ParallelExecutor] = None
@@ -62,10 +68,57 @@ def get_task_queue() -> TaskQueue:
     """
     global _task_queue
     if _task_queue is None:
-        _task_queue = TaskQueue(project_root=get_project_root())
+        _task_queue = TaskQueue(
+            project_root=get_project_root(),
+            on_task_added=_notify_executor,
+            on_task_updated=_notify_executor,
+        )
     return _task_queue
 
 
+def _notify_executor(task: QueuedTask) -> None:
+    """Forward API queue mutations to the executor's ready set.
+
+    Approving a task through the API dispatches it immediately instead
+    of waiting for the executor's next rescan.
+    """
+    if _executor is not None:
+        _executor.notify_task_changed(task)
+
+
+_WATCH_EVENT_TYPES = {
+    TaskEventType.ADDED: EventType.TASK_ADDED,
+    TaskEventType.UPDATED: EventType.TASK_UPDATED,
+    TaskEventType.REMOVED: EventType.TASK_REMOVED,
+}
+
+
+def _publish_task_event(event: TaskEvent) -> None:
+    """Forward a task file change to the executor and the EventBus."""
+    data: dict[str, Any] = {"task_id": event.task_id}
+    if event.task is not None:
+        data["status"] = event.task.status.value
+        _notify_executor(event.task)
+    elif _executor is not None:
+        _executor.notify_task_removed(event.task_id)
+    EventBus.get_instance().emit(Event(type=_WATCH_EVENT_TYPES[event.type], data=data))
+
+
+async def publish_task_events(watcher: TaskWatcher) -> None:
+    """Publish task file changes until the watcher is closed.
+
+    Tasks added or edited outside the server (the CLI, another process,
+    an editor) reach the dashboard and the executor as soon as they are
+    written, instead of on the next refresh or rescan.
+
+    Args:
+        watcher: Watcher on the task queue's directory.
+    """
+    logger.info(f"Watching {watcher.tasks_dir} ({watcher.backend})")
+    async for event in watcher:
+        _publish_task_event(event)
+
+
 def _create_task_callback():
     """Create a task callback that runs the Builder agent.
 
@@ -84,38 +137,44 @@ def _create_task_callback():
             TaskResult with execution output
         """
         started_at = datetime.now(timezone.utc)
-        logs: list[ExecutionLog] = []
+        # The full log is streamed to disk; the task record keeps the tail
+        task_log = get_task_queue().task_log(task.id)
+        log_file = str(Path(TaskQueue.LOGS_DIR) / task_log.path.name)
+        logs: deque[ExecutionLog] = deque(maxlen=LOG_TAIL_ENTRIES)
         artifacts: list[TaskArtifact] = []
 
         def log(level: str, message: str):
-            logs.append(ExecutionLog(
-                timestamp=datetime.now(timezone.utc).isoformat(),
-                level=level,
-                message=message,
-            ))
+            logs.append(task_log.append(level, message))
             logger.info(f"[{task.id}] {level.upper()}: {message}")
 
         log("info", f"Starting task execution in {worktree_path}")
 
         try:
-            # Get files before execution for change tracking
-            files_before = _get_project_files(worktree_path)
+            # Snapshot the worktree for change tracking
+            tracker = ChangeTracker(worktree_path)
+            tracker.snapshot()
 
             # Import here to avoid circular imports
             from ralph_agi.core.config import load_config
             from ralph_agi.llm.agents import BuilderAgent
+            from ralph_agi.llm.retry import RetryPolicy
+            from ralph_agi.tui.events import emit_agent_thinking
             from ralph_agi.core.loop import ToolExecutorAdapter, RalphLoop
 
             # Load config
             config = load_config()
 
             # Create tool executor for the worktree
-            tool_executor = ToolExecutorAdapter(work_dir=worktree_path)
+            tool_executor = _LoggingToolExecutor(ToolExecutorAdapter(work_dir=worktree_path), log)
 
             # Create LLM client
             client = RalphLoop._create_llm_client(
                 provider=config.llm_builder_provider,
                 model=config.llm_builder_model,
+                prompt_caching=config.llm_prompt_caching,
+                governor=RalphLoop._create_rate_governor(config),
+                replay_mode=config.llm_replay_mode,
+                replay_path=config.llm_replay_path,
             )
 
             # Create Builder agent
@@ -124,6 +183,10 @@ def _create_task_callback():
                 tool_executor=tool_executor,
                 max_iterations=config.llm_max_tool_iterations,
                 max_tokens=config.llm_max_tokens,
+                context_window_tokens=config.llm_context_window_tokens,
+                retry_policy=RetryPolicy(max_retries=config.llm_rate_limit_retries),
+                streaming=config.llm_streaming,
+                on_thinking=emit_agent_thinking,
             )
 
             # Build task dict for agent
@@ -151,25 +214,20 @@ def _create_task_callback():
 
             log("info", f"Builder completed with status: {result.status.value}")
 
-            # Get files after execution
-            files_after = _get_project_files(worktree_path)
-            new_files = files_after - files_before
-            modified_files = set(result.files_changed) if result.files_changed else set()
-            all_changed = new_files | modified_files
-
-            # Track artifacts
-            for file_path in all_changed:
-                artifact = _create_artifact(worktree_path, file_path)
-                if artifact:
-                    artifacts.append(artifact)
-                    log("info", f"Created/modified: {file_path}")
-
-            # Convert tool calls to logs
-            for tc in result.tool_calls:
-                log(
-                    "info" if tc.success else "error",
-                    f"Tool {tc.tool_name}: {tc.result[:200] if tc.result else 'OK'}{'...' if tc.result and len(tc.result) > 200 else ''}"
-                )
+            from ralph_agi.api.routes.metrics import update_tokens
+
+            update_tokens(
+                result.input_tokens,
+                result.output_tokens,
+                cache_read_tokens=result.cache_read_tokens,
+                cache_write_tokens=result.cache_write_tokens,
+            )
+
+            # Track artifacts; contents go to the blob store, not the task record
+            blobs = get_task_queue().blobs
+            for change in tracker.changes():
+                artifacts.append(change.to_artifact(blobs=blobs))
+                log("info", f"{change.change_type.value.capitalize()}: {change.path}")
 
             completed_at = datetime.now(timezone.utc)
 
@@ -179,9 +237,11 @@ def _create_task_callback():
                 text=result.final_response,
                 markdown=result.final_response if "```" in result.final_response or "#" in result.final_response else None,
                 artifacts=artifacts,
-                logs=logs,
+                logs=list(logs),
                 tokens_used=result.total_tokens,
                 api_calls=result.iterations,
+                log_file=log_file,
+                log_count=task_log.count,
             )
 
             success = result.is_complete
@@ -210,7 +270,9 @@ def _create_task_callback():
                 summary=f"Task failed: {str(e)}",
                 text=str(e),
                 artifacts=artifacts,
-                logs=logs,
+                logs=list(logs),
+                log_file=log_file,
+                log_count=task_log.count,
             )
 
             return TaskResult(
@@ -224,67 +286,36 @@ def _create_task_callback():
                 output=output,
             )
 
-    return execute_task_with_agent
-
-
-def _get_project_files(root: Path) -> set[str]:
-    """Get set of all project files (excluding common ignored dirs).
-
-    Args:
-        root: Root directory to scan
-
-    Returns:
-        Set of relative file paths
-    """
-    exclude_dirs = {".git", "node_modules", "__pycache__", ".venv", "venv", ".ralph", "dist", "build"}
-    files = set()
-
-    for dirpath, dirnames, filenames in os.walk(root):
-        # Skip excluded directories
-        dirnames[:] = [d for d in dirnames if d not in exclude_dirs]
+        finally:
+            task_log.close()
 
-        for filename in filenames:
-            rel_path = os.path.relpath(os.path.join(dirpath, filename), root)
-            files.add(rel_path)
-
-    return files
-
-
-def _create_artifact(root: Path, rel_path: str) -> Optional[TaskArtifact]:
-    """Create a TaskArtifact from a file path.
+    return execute_task_with_agent
 
-    Args:
-        root: Root directory
-        rel_path: Relative path to file
 
-    Returns:
-        TaskArtifact or None if file doesn't exist
-    """
-    abs_path = root / rel_path
-    if not abs_path.exists():
-        return None
+class _LoggingToolExecutor:
+    """Writes each tool call to the task log as it happens."""
 
-    try:
-        size = abs_path.stat().st_size
-        file_type = abs_path.suffix.lstrip(".") if abs_path.suffix else None
+    def __init__(self, executor, log: Callable[[str, str], None]):
+        self._executor = executor
+        self._log = log
 
-        # Read content for small text files
-        content = None
-        if size < 100_000:  # 100KB limit
-            try:
-                content = abs_path.read_text(encoding="utf-8")
-            except (UnicodeDecodeError, PermissionError):
-                pass  # Binary or unreadable
-
-        return TaskArtifact(
-            path=rel_path,
-            absolute_path=str(abs_path),
-            file_type=file_type,
-            size=size,
-            content=content,
+    async def execute(self, tool_name: str, arguments: Optional[dict[str, Any]] = None) -> Any:
+        try:
+            result = await self._executor.execute(tool_name, arguments)
+        except Exception as e:
+            self._log("error", f"Tool {tool_name}: {e}")
+            raise
+        # Same ToolResult handling as BuilderAgent
+        if hasattr(result, "get_text"):
+            text = result.get_text()
+            success = result.is_success() if hasattr(result, "is_success") else True
+        else:
+            text, success = str(result), True
+        self._log(
+            "info" if success else "error",
+            f"Tool {tool_name}: {text[:200] if text else 'OK'}{'...' if text and len(text) > 200 else ''}",
         )
-    except Exception:
-        return None
+        return result
 
 
 def get_executor() -> ParallelExecutor:
@@ -298,6 +329,8 @@ def get_executor() -> ParallelExecutor:
         _executor = ParallelExecutor(
             project_root=get_project_root(),
             task_callback=_create_task_callback(),
+            # The server's queue watcher forwards file changes instead
+            watch_queue=False,
         )
     return _executor
 
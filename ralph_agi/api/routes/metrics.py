@@ -15,7 +15,7 @@ from ralph_agi.api.dependencies import get_executor, get_task_queue
 from ralph_agi.api.schemas import MetricsResponse
 from ralph_agi.tasks.parallel import ParallelExecutor, ExecutionState
 from ralph_agi.tasks.queue import TaskQueue
-from ralph_agi.tui.events import emit_metrics_updated, emit_tokens_used, emit_cost_updated
+from ralph_agi.tui.events import EventBus, emit_metrics_updated, emit_tokens_used, emit_cost_updated
 
 router = APIRouter(prefix="/metrics", tags=["metrics"])
 
@@ -26,6 +26,8 @@ _metrics_store = {
     "cost": 0.0,
     "input_tokens": 0,
     "output_tokens": 0,
+    "cache_read_tokens": 0,
+    "cache_write_tokens": 0,
     "errors": 0,
     "start_time": None,
     "current_task": None,
@@ -46,25 +48,38 @@ def reset_metrics() -> None:
         "cost": 0.0,
         "input_tokens": 0,
         "output_tokens": 0,
+        "cache_read_tokens": 0,
+        "cache_write_tokens": 0,
         "errors": 0,
         "start_time": datetime.now(),
         "current_task": None,
     }
 
 
-def update_tokens(input_tokens: int, output_tokens: int) -> None:
+def update_tokens(
+    input_tokens: int,
+    output_tokens: int,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
+) -> None:
     """Add token usage to metrics.
 
     Args:
-        input_tokens: Number of input tokens used.
+        input_tokens: Number of uncached input tokens used.
         output_tokens: Number of output tokens used.
+        cache_read_tokens: Prompt tokens read from the prompt cache.
+        cache_write_tokens: Prompt tokens written to the prompt cache.
     """
     _metrics_store["input_tokens"] += input_tokens
     _metrics_store["output_tokens"] += output_tokens
-    # Calculate cost using Claude pricing: $3/1M input, $15/1M output
+    _metrics_store["cache_read_tokens"] += cache_read_tokens
+    _metrics_store["cache_write_tokens"] += cache_write_tokens
+    # Calculate cost using Claude pricing: $3/1M input, $15/1M output,
+    # cache reads at 0.1x and cache writes at 1.25x the input price
     input_cost = (input_tokens / 1_000_000) * 3.0
     output_cost = (output_tokens / 1_000_000) * 15.0
-    _metrics_store["cost"] += input_cost + output_cost
+    cache_cost = (cache_read_tokens / 1_000_000) * 0.30 + (cache_write_tokens / 1_000_000) * 3.75
+    _metrics_store["cost"] += input_cost + output_cost + cache_cost
 
     # Emit events for real-time updates
     emit_tokens_used(input_tokens, output_tokens)
@@ -101,6 +116,13 @@ def increment_errors() -> None:
     _emit_metrics_event()
 
 
+def _cache_hit_ratio() -> float:
+    """Share of prompt tokens served from the prompt cache."""
+    read = _metrics_store["cache_read_tokens"]
+    prompt = _metrics_store["input_tokens"] + read + _metrics_store["cache_write_tokens"]
+    return round(read / prompt, 4) if prompt else 0.0
+
+
 def _emit_metrics_event() -> None:
     """Emit a metrics updated event with current metrics."""
     elapsed_seconds = 0.0
@@ -116,6 +138,9 @@ def _emit_metrics_event() -> None:
         "input_tokens": _metrics_store["input_tokens"],
         "output_tokens": _metrics_store["output_tokens"],
         "total_tokens": total_tokens,
+        "cache_read_tokens": _metrics_store["cache_read_tokens"],
+        "cache_write_tokens": _metrics_store["cache_write_tokens"],
+        "cache_hit_ratio": _cache_hit_ratio(),
         "elapsed_seconds": round(elapsed_seconds, 1),
         "elapsed_formatted": _format_elapsed(elapsed_seconds),
         "errors": _metrics_store["errors"],
@@ -181,6 +206,9 @@ async def get_metrics(
         input_tokens=_metrics_store["input_tokens"],
         output_tokens=_metrics_store["output_tokens"],
         total_tokens=total_tokens,
+        cache_read_tokens=_metrics_store["cache_read_tokens"],
+        cache_write_tokens=_metrics_store["cache_write_tokens"],
+        cache_hit_ratio=_cache_hit_ratio(),
         elapsed_seconds=round(elapsed_seconds, 1),
         elapsed_formatted=_format_elapsed(elapsed_seconds),
         errors=_metrics_store["errors"],
@@ -207,6 +235,8 @@ async def reset_metrics_endpoint() -> dict:
 async def add_tokens(
     input_tokens: int = 0,
     output_tokens: int = 0,
+    cache_read_tokens: int = 0,
+    cache_write_tokens: int = 0,
     executor: ParallelExecutor = Depends(get_executor),
     queue: TaskQueue = Depends(get_task_queue),
 ) -> MetricsResponse:
@@ -218,14 +248,43 @@ async def add_tokens(
     Args:
         input_tokens: Number of input tokens to add.
         output_tokens: Number of output tokens to add.
+        cache_read_tokens: Prompt tokens read from the prompt cache.
+        cache_write_tokens: Prompt tokens written to the prompt cache.
 
     Returns:
         Updated metrics.
     """
-    update_tokens(input_tokens, output_tokens)
+    update_tokens(input_tokens, output_tokens, cache_read_tokens, cache_write_tokens)
     return await get_metrics(executor, queue)
 
 
+@router.get("/events")
+async def get_event_bus_metrics() -> dict:
+    """Get event bus throughput and per-handler dispatch timing.
+
+    Returns:
+        Queue counters (emitted, dispatched, coalesced, dropped, depth)
+        and, per handler, call count, errors and mean/max milliseconds.
+    """
+    stats = EventBus.get_instance().stats()
+    return {
+        "emitted": stats.emitted,
+        "dispatched": stats.dispatched,
+        "coalesced": stats.coalesced,
+        "dropped": stats.dropped,
+        "queue_depth": stats.queue_depth,
+        "handlers": {
+            name: {
+                "calls": h.calls,
+                "errors": h.errors,
+                "mean_ms": round(h.mean_seconds * 1000, 3),
+                "max_ms": round(h.max_seconds * 1000, 3),
+            }
+            for name, h in stats.handlers.items()
+        },
+    }
+
+
 @router.get("/cumulative")
 async def get_cumulative_metrics(
     queue: TaskQueue = Depends(get_task_queue),
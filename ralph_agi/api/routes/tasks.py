@@ -5,13 +5,18 @@ Provides endpoints for creating, reading, updating, and deleting tasks.
 
 from __future__ import annotations
 
+import asyncio
+from pathlib import Path
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import PlainTextResponse, StreamingResponse
 
 from ralph_agi.api.dependencies import get_task_queue
 from ralph_agi.api.schemas import (
+    ExecutionLogSchema,
     TaskCreate,
+    TaskLogsResponse,
     TaskUpdate,
     TaskResponse,
     TaskListResponse,
@@ -19,6 +24,8 @@ from ralph_agi.api.schemas import (
     TaskPriority,
     task_to_response,
 )
+from ralph_agi.tasks.blobs import BlobStore
+from ralph_agi.tasks.changes import MAX_INLINE_CONTENT_BYTES, read_text_content
 from ralph_agi.tasks.queue import (
     TaskQueue,
     TaskNotFoundError,
@@ -125,6 +132,128 @@ async def get_task(
         raise HTTPException(status_code=500, detail=f"Failed to get task: {e}")
 
 
+@router.get("/{task_id}/artifacts/content")
+async def get_artifact_content(
+    request: Request,
+    task_id: str,
+    path: str = Query(..., description="Artifact path relative to the worktree"),
+    queue: TaskQueue = Depends(get_task_queue),
+) -> Response:
+    """Get the content of a file a task created or modified.
+
+    Artifacts only carry paths, sizes and blob keys; the UI loads
+    content with this endpoint when a file is opened. Stored blobs are
+    streamed with their sha256 as a strong ETag (``If-None-Match`` gets a
+    304), and compressed blobs are sent as-is to clients that accept
+    gzip. Artifacts without a blob fall back to the worktree file.
+
+    Args:
+        request: Incoming request (for conditional and encoding headers).
+        task_id: Task identifier.
+        path: Artifact path, as listed in the task output.
+        queue: TaskQueue dependency.
+
+    Returns:
+        The file content.
+
+    Raises:
+        HTTPException: If the task, artifact or file is not found, or
+            a worktree file is too large or not text.
+    """
+    try:
+        task = queue.get(task_id)
+    except TaskNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Task not found: {task_id}")
+
+    artifacts = task.output.artifacts if task.output else []
+    artifact = next((a for a in artifacts if a.path == path), None)
+    if artifact is None:
+        raise HTTPException(status_code=404, detail=f"Artifact not found: {path}")
+
+    if artifact.blob and queue.blobs.exists(artifact.blob):
+        return _blob_response(request, queue.blobs, artifact.blob)
+
+    if artifact.content is not None:
+        return PlainTextResponse(artifact.content)
+
+    if not artifact.absolute_path:
+        raise HTTPException(status_code=404, detail=f"Artifact has no content: {path}")
+    file_path = Path(artifact.absolute_path)
+    if not file_path.is_file():
+        raise HTTPException(status_code=404, detail=f"File no longer exists: {path}")
+    if file_path.stat().st_size > MAX_INLINE_CONTENT_BYTES:
+        raise HTTPException(status_code=413, detail=f"File too large to display: {path}")
+
+    content = read_text_content(file_path)
+    if content is None:
+        raise HTTPException(status_code=415, detail=f"Not a text file: {path}")
+    return PlainTextResponse(content)
+
+
+def _blob_response(request: Request, blobs: BlobStore, digest: str) -> Response:
+    """Stream a blob, honouring If-None-Match and Accept-Encoding."""
+    send_gzip = blobs.is_compressed(digest) and "gzip" in request.headers.get("accept-encoding", "")
+    etag = f'"{digest}-gzip"' if send_gzip else f'"{digest}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "private, max-age=31536000, immutable",
+        "Vary": "Accept-Encoding",
+    }
+
+    if_none_match = request.headers.get("if-none-match", "")
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    if "*" in candidates or etag in candidates:
+        return Response(status_code=304, headers=headers)
+
+    # Same heuristic as git: a NUL byte near the start means binary
+    with blobs.open(digest) as f:
+        binary = b"\0" in f.read(8000)
+    media_type = "application/octet-stream" if binary else "text/plain; charset=utf-8"
+    if send_gzip:
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(blobs.iter_chunks(digest, raw=send_gzip), media_type=media_type, headers=headers)
+
+
+@router.get("/{task_id}/logs", response_model=TaskLogsResponse)
+async def get_task_logs(
+    task_id: str,
+    since: int = Query(0, ge=0, description="Offset returned by the previous call"),
+    limit: int = Query(1000, ge=1, le=10000, description="Maximum entries to return"),
+    queue: TaskQueue = Depends(get_task_queue),
+) -> TaskLogsResponse:
+    """Read a task's execution log from an offset.
+
+    The log is written while the task runs, so polling with the
+    returned ``offset`` as ``since`` follows it without re-downloading.
+    ``/ws/tasks/{task_id}/logs`` pushes the same entries instead.
+
+    Args:
+        task_id: Task identifier.
+        since: Offset to read from (0 for the start).
+        limit: Maximum entries to return.
+        queue: TaskQueue dependency.
+
+    Returns:
+        The entries and the offset to continue from.
+
+    Raises:
+        HTTPException: If task not found.
+    """
+    try:
+        task = queue.get(task_id)
+    except TaskNotFoundError:
+        raise HTTPException(status_code=404, detail=f"Task not found: {task_id}")
+
+    chunk = await asyncio.to_thread(queue.task_log(task_id).read, since, limit)
+    return TaskLogsResponse(
+        entries=[ExecutionLogSchema(**entry.to_dict()) for entry in chunk.entries],
+        offset=chunk.offset,
+        start=chunk.start,
+        end=chunk.end,
+        complete=task.is_terminal and chunk.caught_up,
+    )
+
+
 @router.patch("/{task_id}", response_model=TaskResponse)
 async def update_task(
     task_id: str,
@@ -80,6 +80,8 @@ class TaskArtifactSchema(BaseModel):
     file_type: Optional[str] = None
     size: Optional[int] = None
     content: Optional[str] = None
+    change_type: Optional[str] = None  # added, modified, deleted
+    blob: Optional[str] = None  # sha256 key; content via /tasks/{id}/artifacts/content
 
 
 class TaskOutputSchema(BaseModel):
@@ -92,6 +94,8 @@ class TaskOutputSchema(BaseModel):
     logs: list[ExecutionLogSchema] = Field(default_factory=list)
     tokens_used: Optional[int] = None
     api_calls: Optional[int] = None
+    log_file: Optional[str] = None
+    log_count: Optional[int] = None
 
 
 class TaskUpdate(BaseModel):
@@ -151,6 +155,16 @@ class TaskResponse(BaseModel):
         from_attributes = True
 
 
+class TaskLogsResponse(BaseModel):
+    """A range of a task's execution log."""
+
+    entries: list[ExecutionLogSchema]
+    offset: int = Field(..., description="Pass as `since` to get the entries after these")
+    start: int = Field(..., description="Oldest offset still available")
+    end: int = Field(..., description="Offset at the end of the log")
+    complete: bool = Field(..., description="Task finished and the whole log has been read")
+
+
 class TaskListResponse(BaseModel):
     """Response model for task list."""
 
@@ -293,6 +307,11 @@ class MetricsResponse(BaseModel):
     input_tokens: int = Field(0, description="Total input tokens used")
     output_tokens: int = Field(0, description="Total output tokens used")
     total_tokens: int = Field(0, description="Combined token count")
+    cache_read_tokens: int = Field(0, description="Prompt tokens read from the prompt cache")
+    cache_write_tokens: int = Field(0, description="Prompt tokens written to the prompt cache")
+    cache_hit_ratio: float = Field(
+        0.0, description="Share of prompt tokens served from the prompt cache"
+    )
     elapsed_seconds: float = Field(0.0, description="Elapsed time in seconds")
     elapsed_formatted: str = Field("00:00:00", description="Human-readable elapsed time")
     errors: int = Field(0, description="Number of errors encountered")
@@ -319,6 +338,8 @@ def _convert_output(output) -> Optional[TaskOutputSchema]:
                 file_type=a.file_type,
                 size=a.size,
                 content=a.content,
+                change_type=a.change_type,
+                blob=a.blob,
             )
             for a in output.artifacts
         ],
@@ -332,6 +353,8 @@ def _convert_output(output) -> Optional[TaskOutputSchema]:
         ],
         tokens_used=output.tokens_used,
         api_calls=output.api_calls,
+        log_file=output.log_file,
+        log_count=output.log_count,
     )
 
 
@@ -0,0 +1,336 @@
+"""WebSocket fan-out for real-time updates.
+
+Each event is serialized once and handed to every interested client's
+own bounded send queue. Each client has a sender task that drains its
+queue, so one slow browser tab can't hold up the others or the EventBus.
+
+- Metrics, cost, token and progress messages share one queue slot per
+  key. A slow client gets the latest value, not a backlog of stale ones.
+- When a client's queue is full, its oldest coalescable message is
+  dropped. If nothing can be dropped, or a single send takes longer than
+  ``send_timeout``, the client is disconnected and can reconnect.
+- Clients may subscribe to event types and/or task IDs, either with
+  ``/ws?events=task_completed,tool_called&tasks=abc123`` or with a
+  ``{"type": "subscribe", "events": [...], "tasks": [...]}`` message.
+  Messages without a task ID reach every client that accepts their type.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Iterable, Optional
+
+from fastapi import WebSocket
+
+from ralph_agi.tui.events import COALESCED_EVENT_TYPES, Event, EventBus
+
+logger = logging.getLogger(__name__)
+
+COALESCED_MESSAGE_TYPES = frozenset(t.value for t in COALESCED_EVENT_TYPES)
+
+# Close code sent to clients that fall too far behind ("try again later")
+SLOW_CLIENT_CLOSE_CODE = 1013
+
+
+@dataclass(frozen=True)
+class Subscription:
+    """Topics a client receives. Empty sets mean everything.
+
+    Attributes:
+        event_types: Message types (EventType values) to receive.
+        task_ids: Task IDs to receive task-scoped messages for.
+    """
+
+    event_types: frozenset[str] = frozenset()
+    task_ids: frozenset[str] = frozenset()
+
+    @classmethod
+    def parse(
+        cls,
+        event_types: Optional[Iterable[str] | str] = None,
+        task_ids: Optional[Iterable[str] | str] = None,
+    ) -> Subscription:
+        """Build a subscription from lists or comma-separated strings."""
+        return cls(event_types=_topic_set(event_types), task_ids=_topic_set(task_ids))
+
+    def matches(self, message_type: str, task_id: Optional[str] = None) -> bool:
+        """Check whether a message belongs to this subscription."""
+        if self.event_types and message_type not in self.event_types:
+            return False
+        if self.task_ids and task_id is not None and task_id not in self.task_ids:
+            return False
+        return True
+
+
+def _topic_set(topics: Optional[Iterable[str] | str]) -> frozenset[str]:
+    if not topics:
+        return frozenset()
+    if isinstance(topics, str):
+        topics = topics.split(",")
+    return frozenset(t.strip() for t in topics if t and t.strip())
+
+
+@dataclass
+class ClientStats:
+    """Delivery counters for one WebSocket client.
+
+    Attributes:
+        sent: Messages sent.
+        coalesced: Messages replaced by a newer one before being sent.
+        dropped: Messages dropped because the queue was full.
+    """
+
+    sent: int = 0
+    coalesced: int = 0
+    dropped: int = 0
+
+
+class ClientConnection:
+    """One WebSocket client with its own send queue and sender task."""
+
+    def __init__(
+        self,
+        websocket: WebSocket,
+        subscription: Optional[Subscription] = None,
+        max_queue: int = 256,
+        send_timeout: float = 10.0,
+    ):
+        """Initialize the client.
+
+        Args:
+            websocket: Accepted WebSocket.
+            subscription: Topics the client receives (default: all).
+            max_queue: Maximum queued messages before overflow handling.
+            send_timeout: Seconds a single send may take before the
+                client is considered stuck.
+        """
+        self.websocket = websocket
+        self.subscription = subscription or Subscription()
+        self.stats = ClientStats()
+        self._max_queue = max_queue
+        self._send_timeout = send_timeout
+        # Entries are [text, key] lists so a coalesced slot can be updated in place
+        self._queue: deque[list[Any]] = deque()
+        self._slots: dict[tuple[str, Optional[str]], list[Any]] = {}
+        self._ready = asyncio.Event()
+        self._sender: Optional[asyncio.Task[None]] = None
+        self._closed = False
+        self.on_close: Optional[Callable[[ClientConnection], None]] = None
+
+    @property
+    def closed(self) -> bool:
+        """Whether the client has been disconnected."""
+        return self._closed
+
+    @property
+    def queued(self) -> int:
+        """Messages waiting to be sent."""
+        return len(self._queue)
+
+    def start(self) -> None:
+        """Start the sender task on the running loop."""
+        if self._sender is None:
+            self._sender = asyncio.create_task(self._send_loop())
+
+    def enqueue(self, text: str, message_type: str = "", task_id: Optional[str] = None) -> bool:
+        """Queue a serialized message without waiting.
+
+        Args:
+            text: Serialized message.
+            message_type: Message type, used for coalescing.
+            task_id: Task the message belongs to, if any.
+
+        Returns:
+            False if the client is closed or was disconnected for
+            falling behind.
+        """
+        if self._closed:
+            return False
+
+        key = (message_type, task_id) if message_type in COALESCED_MESSAGE_TYPES else None
+        if key is not None and key in self._slots:
+            self._slots[key][0] = text
+            self.stats.coalesced += 1
+            return True
+
+        if len(self._queue) >= self._max_queue and not self._drop_stale():
+            logger.warning(
+                f"WebSocket client fell {len(self._queue)} messages behind; disconnecting"
+            )
+            self._close_later()
+            return False
+
+        entry = [text, key]
+        self._queue.append(entry)
+        if key is not None:
+            self._slots[key] = entry
+        self._ready.set()
+        return True
+
+    def _drop_stale(self) -> bool:
+        """Drop the oldest coalescable message to make room."""
+        for entry in self._queue:
+            if entry[1] is not None:
+                self._queue.remove(entry)
+                del self._slots[entry[1]]
+                self.stats.dropped += 1
+                return True
+        return False
+
+    async def _send_loop(self) -> None:
+        try:
+            while not self._closed:
+                await self._ready.wait()
+                while self._queue:
+                    text, key = self._queue.popleft()
+                    if key is not None:
+                        del self._slots[key]
+                    async with asyncio.timeout(self._send_timeout):
+                        await self.websocket.send_text(text)
+                    self.stats.sent += 1
+                self._ready.clear()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to send to WebSocket: {e}")
+            self._close_later()
+
+    def _close_later(self) -> None:
+        if not self._closed:
+            asyncio.ensure_future(self.close(SLOW_CLIENT_CLOSE_CODE))
+
+    async def close(self, code: Optional[int] = None) -> None:
+        """Stop the sender and, if a code is given, close the socket."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.clear()
+        self._slots.clear()
+        if self._sender is not None and self._sender is not asyncio.current_task():
+            self._sender.cancel()
+        if code is not None:
+            try:
+                await self.websocket.close(code=code)
+            except Exception:
+                pass  # Already gone
+        if self.on_close is not None:
+            self.on_close(self)
+
+
+class ConnectionManager:
+    """Manages WebSocket connections for real-time updates."""
+
+    def __init__(self, max_queue: int = 256, send_timeout: float = 10.0):
+        """Initialize the manager.
+
+        Args:
+            max_queue: Per-client send queue size.
+            send_timeout: Seconds a single send may take.
+        """
+        self._clients: dict[WebSocket, ClientConnection] = {}
+        self._max_queue = max_queue
+        self._send_timeout = send_timeout
+        self._bus: Optional[EventBus] = None
+
+    @property
+    def active_connections(self) -> set[WebSocket]:
+        """WebSockets currently connected."""
+        return set(self._clients)
+
+    async def connect(
+        self,
+        websocket: WebSocket,
+        subscription: Optional[Subscription] = None,
+    ) -> ClientConnection:
+        """Accept and register a new WebSocket connection."""
+        await websocket.accept()
+        client = ClientConnection(websocket, subscription, self._max_queue, self._send_timeout)
+        client.on_close = self._forget
+        self._clients[websocket] = client
+        client.start()
+        logger.info(f"WebSocket connected. Total connections: {len(self._clients)}")
+        return client
+
+    async def disconnect(self, websocket: WebSocket) -> None:
+        """Remove a WebSocket connection."""
+        client = self._clients.pop(websocket, None)
+        if client is not None:
+            await client.close()
+        logger.info(f"WebSocket disconnected. Total connections: {len(self._clients)}")
+
+    def subscribe(self, websocket: WebSocket, subscription: Subscription) -> None:
+        """Replace a client's topic subscription."""
+        client = self._clients.get(websocket)
+        if client is not None:
+            client.subscription = subscription
+
+    def send(self, websocket: WebSocket, message: dict) -> None:
+        """Queue a message for one client (e.g. a pong)."""
+        client = self._clients.get(websocket)
+        if client is not None:
+            client.enqueue(json.dumps(message, default=str))
+
+    async def broadcast(self, message: dict) -> None:
+        """Queue a message for every subscribed client.
+
+        The message is serialized once; nothing here waits on a client.
+        """
+        if not self._clients:
+            return
+
+        message_type = message.get("type", "")
+        data = message.get("data")
+        task_id = data.get("task_id") if isinstance(data, dict) else None
+        text: Optional[str] = None
+        for client in list(self._clients.values()):
+            if not client.subscription.matches(message_type, task_id):
+                continue
+            if text is None:
+                text = json.dumps(message, default=str)
+            client.enqueue(text, message_type, task_id)
+
+    def attach(self, bus: EventBus) -> None:
+        """Forward EventBus events to clients (once per manager)."""
+        if self._bus is bus:
+            return
+        self._bus = bus
+        bus.subscribe_all(create_event_handler(self))
+
+    def stats(self) -> dict[WebSocket, ClientStats]:
+        """Delivery counters by connection."""
+        return {ws: client.stats for ws, client in self._clients.items()}
+
+    def _forget(self, client: ClientConnection) -> None:
+        if self._clients.get(client.websocket) is client:
+            del self._clients[client.websocket]
+            logger.info(f"WebSocket dropped. Total connections: {len(self._clients)}")
+
+
+def event_to_message(event: Event) -> dict:
+    """Convert an EventBus event to a WebSocket message."""
+    return {
+        "type": event.type.value,
+        "timestamp": event.timestamp.isoformat() if event.timestamp else datetime.now().isoformat(),
+        "data": event.data,
+    }
+
+
+def create_event_handler(manager: ConnectionManager):
+    """Create an event handler that broadcasts to WebSockets.
+
+    Args:
+        manager: WebSocket connection manager.
+
+    Returns:
+        Event handler function.
+    """
+    async def handler(event: Event) -> None:
+        """Handle an event from EventBus and broadcast to WebSockets."""
+        await manager.broadcast(event_to_message(event))
+
+    return handler
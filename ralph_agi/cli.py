@@ -126,6 +126,28 @@ Exit Codes:
         help="Maximum parallel workers in batch mode (default: 3)",
     )
 
+    run_parser.add_argument(
+        "--worktree-pool",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Keep N clean worktrees ready for batch workers and recycle finished ones (default: 0)",
+    )
+
+    run_parser.add_argument(
+        "--sparse",
+        action="store_true",
+        help="Check out only the directories each batch feature mentions",
+    )
+
+    run_parser.add_argument(
+        "--share-dir",
+        action="append",
+        default=[],
+        metavar="DIR",
+        help="Copy a dependency directory (e.g. node_modules) into each worktree; repeatable",
+    )
+
     # Daemon command for AFK mode
     daemon_parser = subparsers.add_parser(
         "daemon",
@@ -347,6 +369,25 @@ Exit Codes:
         metavar="N",
         help="Maximum total tasks to process (default: all pending)",
     )
+    start_parser.add_argument(
+        "--worktree-pool",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Keep N clean worktrees ready and recycle finished ones (default: 0)",
+    )
+    start_parser.add_argument(
+        "--sparse",
+        action="store_true",
+        help="Check out only the directories each task mentions (widened on demand)",
+    )
+    start_parser.add_argument(
+        "--share-dir",
+        action="append",
+        default=[],
+        metavar="DIR",
+        help="Copy a dependency directory (e.g. node_modules) into each worktree; repeatable",
+    )
     start_parser.add_argument(
         "--verbose",
         "-v",
@@ -515,6 +556,9 @@ def run_batch(
         parallel_limit=args.parallel_limit,
         cleanup_on_complete=True,
         cleanup_on_failure=False,
+        worktree_pool_size=getattr(args, "worktree_pool", 0),
+        sparse_checkout=getattr(args, "sparse", False),
+        shared_dirs=tuple(getattr(args, "share_dir", None) or ()),
     )
 
     formatter.message("=" * 60)
@@ -1210,6 +1254,9 @@ def run_start(args: argparse.Namespace) -> int:
     try:
         executor = ParallelExecutor(
             max_concurrent=args.parallel,
+            worktree_pool_size=getattr(args, "worktree_pool", 0),
+            sparse_checkout=getattr(args, "sparse", False),
+            shared_dirs=getattr(args, "share_dir", None) or (),
             on_progress=on_progress,
             on_task_start=on_task_start,
             on_task_complete=on_task_complete,
@@ -42,6 +42,15 @@ class RalphConfig:
         memory_store_path: Path to the Memvid .mv2 file. Default: "ralph_memory.mv2"
         memory_embedding_model: Embedding model for semantic search.
             Default: "all-MiniLM-L6-v2"
+        memory_fsync: Durability of the JSONL memory backup. Default: "always"
+            - always: fsync every frame
+            - batch: group-commit frames with one fsync per batch
+            - os: no fsync; flushed on checkpoint and shutdown
+        memory_batch_size: Frames per group commit (fsync=batch). Default: 64
+        memory_batch_interval: Max seconds a frame waits for its group
+            (fsync=batch). Default: 0.05
+        memory_context_tokens: Token budget for relevance-ranked memory
+            context in each Builder prompt. Default: 300
         hooks_enabled: Whether to enable lifecycle hooks. Default: True
         hooks_on_iteration_start: Hook: load context at iteration start. Default: True
         hooks_on_iteration_end: Hook: store results at iteration end. Default: True
@@ -58,6 +67,25 @@ class RalphConfig:
         llm_max_tool_iterations: Maximum tool loop iterations. Default: 10
         llm_temperature: Sampling temperature (0.0 = deterministic). Default: 0.0
         llm_rate_limit_retries: Max retries on rate limit. Default: 3
+        llm_prompt_caching: Mark system prompt, tools and conversation prefix
+            as cacheable (Anthropic prompt caching). Default: False
+        llm_context_window_tokens: Estimated Builder prompt budget before
+            stale tool results are elided (0 = unbounded). Default: 60000
+        llm_streaming: Stream Builder calls, starting read-only tools
+            before the response is complete. Default: False
+        llm_requests_per_minute: Shared request budget per provider/model
+            across all clients and workers (0 = unlimited). Default: 0
+        llm_tokens_per_minute: Shared token budget per provider/model
+            (0 = unlimited). Default: 0
+        llm_max_concurrent_requests: Max LLM requests in flight at once
+            per provider/model (0 = unlimited). Default: 0
+        llm_rate_state_path: File holding the shared rate limit state, so
+            separate processes share one budget. Batch workers default to
+            a file in the batch progress directory. Default: None
+        llm_replay_mode: Record LLM exchanges to, or replay them from,
+            llm_replay_path ("record", "replay", or None). Default: None
+        llm_replay_path: JSONL transcript used by llm_replay_mode.
+            Default: None
         git_workflow: Git workflow mode (direct, branch, pr). Default: "branch"
             - direct: Commit anywhere (risky, for solo dev)
             - branch: Create feature branches, push branches
@@ -78,6 +106,10 @@ class RalphConfig:
     memory_enabled: bool = True
     memory_store_path: str = "ralph_memory.mv2"
     memory_embedding_model: str = "all-MiniLM-L6-v2"
+    memory_fsync: str = "always"
+    memory_batch_size: int = 64
+    memory_batch_interval: float = 0.05
+    memory_context_tokens: int = 300
     hooks_enabled: bool = True
     hooks_on_iteration_start: bool = True
     hooks_on_iteration_end: bool = True
@@ -94,6 +126,15 @@ class RalphConfig:
     llm_max_tool_iterations: int = 10
     llm_temperature: float = 0.0
     llm_rate_limit_retries: int = 3
+    llm_prompt_caching: bool = False
+    llm_context_window_tokens: int = 60000
+    llm_streaming: bool = False
+    llm_requests_per_minute: int = 0
+    llm_tokens_per_minute: int = 0
+    llm_max_concurrent_requests: int = 0
+    llm_rate_state_path: Optional[str] = None
+    llm_replay_mode: Optional[str] = None
+    llm_replay_path: Optional[str] = None
     # Git Configuration
     git_workflow: str = "branch"
     git_protected_branches: list[str] = field(default_factory=lambda: ["main", "master"])
@@ -125,6 +166,36 @@ class RalphConfig:
         if not self.completion_promise:
             raise ConfigValidationError("completion_promise must not be empty")
 
+        valid_fsync = ("always", "batch", "os")
+        if self.memory_fsync not in valid_fsync:
+            raise ConfigValidationError(
+                f"memory_fsync must be one of {valid_fsync}, got '{self.memory_fsync}'"
+            )
+
+        if self.memory_batch_size < 1:
+            raise ConfigValidationError("memory_batch_size must be at least 1")
+
+        if self.memory_batch_interval <= 0:
+            raise ConfigValidationError("memory_batch_interval must be positive")
+
+        if self.memory_context_tokens < 0:
+            raise ConfigValidationError("memory_context_tokens must be non-negative")
+
+        if self.llm_context_window_tokens < 0:
+            raise ConfigValidationError("llm_context_window_tokens must be non-negative")
+
+        for name in ("llm_requests_per_minute", "llm_tokens_per_minute", "llm_max_concurrent_requests"):
+            if getattr(self, name) < 0:
+                raise ConfigValidationError(f"{name} must be non-negative")
+
+        if self.llm_replay_mode is not None:
+            if self.llm_replay_mode not in ("record", "replay"):
+                raise ConfigValidationError(
+                    f"llm_replay_mode must be 'record' or 'replay', got '{self.llm_replay_mode}'"
+                )
+            if not self.llm_replay_path:
+                raise ConfigValidationError("llm_replay_path is required when llm_replay_mode is set")
+
         valid_workflows = ("direct", "branch", "pr")
         if self.git_workflow not in valid_workflows:
             raise ConfigValidationError(
@@ -183,6 +254,10 @@ def load_config(config_path: Optional[str | Path] = None) -> RalphConfig:
         memory_enabled=memory_config.get("enabled", True),
         memory_store_path=memory_config.get("store_path", "ralph_memory.mv2"),
         memory_embedding_model=memory_config.get("embedding_model", "all-MiniLM-L6-v2"),
+        memory_fsync=memory_config.get("fsync", "always"),
+        memory_batch_size=memory_config.get("batch_size", 64),
+        memory_batch_interval=memory_config.get("batch_interval", 0.05),
+        memory_context_tokens=memory_config.get("context_tokens", 300),
         hooks_enabled=hooks_config.get("enabled", True),
         hooks_on_iteration_start=hooks_config.get("on_iteration_start", True),
         hooks_on_iteration_end=hooks_config.get("on_iteration_end", True),
@@ -198,6 +273,15 @@ def load_config(config_path: Optional[str | Path] = None) -> RalphConfig:
         llm_max_tool_iterations=llm_config.get("max_tool_iterations", 10),
         llm_temperature=llm_config.get("temperature", 0.0),
         llm_rate_limit_retries=llm_config.get("rate_limit_retries", 3),
+        llm_prompt_caching=llm_config.get("prompt_caching", False),
+        llm_context_window_tokens=llm_config.get("context_window_tokens", 60000),
+        llm_streaming=llm_config.get("streaming", False),
+        llm_requests_per_minute=llm_config.get("requests_per_minute", 0),
+        llm_tokens_per_minute=llm_config.get("tokens_per_minute", 0),
+        llm_max_concurrent_requests=llm_config.get("max_concurrent_requests", 0),
+        llm_rate_state_path=llm_config.get("rate_state_path"),
+        llm_replay_mode=llm_config.get("replay_mode"),
+        llm_replay_path=llm_config.get("replay_path"),
         git_workflow=git_config.get("workflow", "branch"),
         git_protected_branches=git_config.get("protected_branches", ["main", "master"]),
         git_branch_prefix=git_config.get("branch_prefix", "ralph/"),
@@ -224,6 +308,10 @@ def save_config(config: RalphConfig, config_path: str | Path = "config.yaml") ->
             "enabled": config.memory_enabled,
             "store_path": config.memory_store_path,
             "embedding_model": config.memory_embedding_model,
+            "fsync": config.memory_fsync,
+            "batch_size": config.memory_batch_size,
+            "batch_interval": config.memory_batch_interval,
+            "context_tokens": config.memory_context_tokens,
         },
         "hooks": {
             "enabled": config.hooks_enabled,
@@ -243,6 +331,15 @@ def save_config(config: RalphConfig, config_path: str | Path = "config.yaml") ->
             "max_tool_iterations": config.llm_max_tool_iterations,
             "temperature": config.llm_temperature,
             "rate_limit_retries": config.llm_rate_limit_retries,
+            "prompt_caching": config.llm_prompt_caching,
+            "context_window_tokens": config.llm_context_window_tokens,
+            "streaming": config.llm_streaming,
+            "requests_per_minute": config.llm_requests_per_minute,
+            "tokens_per_minute": config.llm_tokens_per_minute,
+            "max_concurrent_requests": config.llm_max_concurrent_requests,
+            "rate_state_path": config.llm_rate_state_path,
+            "replay_mode": config.llm_replay_mode,
+            "replay_path": config.llm_replay_path,
         },
         "git": {
             "workflow": config.git_workflow,
@@ -28,9 +28,12 @@ if TYPE_CHECKING:
     from ralph_agi.core.config import RalphConfig
     from ralph_agi.llm.agents import BuilderAgent, CriticAgent
     from ralph_agi.llm.orchestrator import LLMOrchestrator
+    from ralph_agi.memory.context import MemoryContextBuilder
     from ralph_agi.memory.store import MemoryStore
     from ralph_agi.tasks.executor import TaskExecutor
 
+logger = logging.getLogger(__name__)
+
 
 @dataclass
 class IterationResult:
@@ -43,6 +46,8 @@ class IterationResult:
         task_title: Title of the task that was executed.
         files_changed: List of files modified during execution.
         tokens_used: Total tokens used in this iteration.
+        input_tokens: Input tokens reported by the LLM calls.
+        output_tokens: Output tokens reported by the LLM calls.
         all_tasks_complete: Whether all tasks in PRD are complete.
         error: Error message if iteration failed.
     """
@@ -53,6 +58,8 @@ class IterationResult:
     task_title: Optional[str] = None
     files_changed: list[str] = field(default_factory=list)
     tokens_used: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
     all_tasks_complete: bool = False
     error: Optional[str] = None
 
@@ -64,13 +71,20 @@ class ToolExecutorAdapter:
     Supports dynamic work directory changes for worktree isolation.
     """
 
-    def __init__(self, work_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        work_dir: Optional[Path] = None,
+        on_tool: Optional[Callable[[str, bool, float], None]] = None,
+    ):
         """Initialize the tool executor.
 
         Args:
             work_dir: Working directory for file operations.
+            on_tool: Called after each tool call with the tool name,
+                whether it succeeded and its duration in seconds.
         """
         self._work_dir = work_dir or Path.cwd()
+        self.on_tool = on_tool
         self._fs_tools = None
         self._shell_tools = None
         self._git_tools = None
@@ -98,8 +112,15 @@ class ToolExecutorAdapter:
     def _ensure_tools(self) -> None:
         """Lazily initialize tools."""
         if self._fs_tools is None:
+            from ralph_agi.tasks.checkout import SparseCheckout
             from ralph_agi.tools.filesystem import FileSystemTools
-            self._fs_tools = FileSystemTools(allowed_roots=[self._work_dir])
+
+            # In a sparse worktree, check out directories as tools reach them
+            sparse = SparseCheckout(self._work_dir)
+            self._fs_tools = FileSystemTools(
+                allowed_roots=[self._work_dir],
+                on_missing=sparse.ensure if sparse.is_enabled() else None,
+            )
 
         if self._shell_tools is None:
             from ralph_agi.tools.shell import ShellTools
@@ -123,13 +144,36 @@ class ToolExecutorAdapter:
         Returns:
             Tool execution result.
         """
+        if self.on_tool is None:
+            return await self._execute(tool_name, arguments)
+
+        start = time.perf_counter()
+        success = False
+        try:
+            result = await self._execute(tool_name, arguments)
+            success = not (isinstance(result, str) and result.startswith(("Error", "Unknown tool")))
+            return result
+        finally:
+            try:
+                self.on_tool(tool_name, success, time.perf_counter() - start)
+            except Exception as e:
+                logger.debug(f"Tool callback failed: {e}")
+
+    async def _execute(
+        self,
+        tool_name: str,
+        arguments: Optional[dict[str, Any]] = None,
+    ) -> Any:
+        """Run a tool without the on_tool callback."""
         self._ensure_tools()
         arguments = arguments or {}
 
         # File system tools
+        # Read-only operations run in a worker thread so concurrent reads
+        # dispatched by the Builder actually overlap.
         if tool_name == "read_file":
             path = arguments.get("path", "")
-            return self._fs_tools.read_file(path)
+            return await asyncio.to_thread(self._fs_tools.read_file, path)
 
         elif tool_name == "write_file":
             path = arguments.get("path", "")
@@ -163,14 +207,14 @@ class ToolExecutorAdapter:
 
         elif tool_name == "list_directory":
             path = arguments.get("path", ".")
-            files = self._fs_tools.list_directory(path)
+            files = await asyncio.to_thread(self._fs_tools.list_directory, path)
             return "\n".join(f.name for f in files)
 
         # Shell tools
         elif tool_name == "run_command":
             command = arguments.get("command", "")
             cwd = arguments.get("cwd")
-            result = self._shell_tools.execute(command, cwd=cwd)
+            result = await self._shell_tools.execute_async(command, cwd=cwd)
             if result.success:
                 return result.stdout
             else:
@@ -178,7 +222,7 @@ class ToolExecutorAdapter:
 
         # Git tools
         elif tool_name == "git_status":
-            status = self._git_tools.status()
+            status = await self._git_tools.status_async()
             parts = [f"Branch: {status.branch}"]
             if status.staged:
                 parts.append(f"Staged: {', '.join(status.staged)}")
@@ -190,8 +234,8 @@ class ToolExecutorAdapter:
 
         elif tool_name == "git_commit":
             message = arguments.get("message", "")
-            self._git_tools.add(".")
-            commit_hash = self._git_tools.commit(message)
+            await self._git_tools.add_async(".")
+            commit_hash = await self._git_tools.commit_async(message)
             if commit_hash:
                 return f"Committed: {commit_hash[:8]} - {message}"
             return "Nothing to commit (working tree clean)"
@@ -252,6 +296,8 @@ class RalphLoop:
         prd_path: Optional[str] = None,
         task_executor: Optional[TaskExecutor] = None,
         orchestrator: Optional[LLMOrchestrator] = None,
+        memory_context_tokens: int = 300,
+        on_event: Optional[Callable[[str, dict[str, Any]], None]] = None,
     ):
         """Initialize the Ralph Loop Engine.
 
@@ -276,6 +322,12 @@ class RalphLoop:
                           Created automatically if prd_path provided.
             orchestrator: Optional LLMOrchestrator for Builder → Critic flow.
                          Created from config if not provided.
+            memory_context_tokens: Token budget for the memory section of
+                         each Builder prompt. Default: 300
+            on_event: Optional progress hook, called with an event name and
+                     data: "iteration_started", "iteration_completed",
+                     "tool" and "tokens". "iteration_completed" also carries
+                     the memory context token totals. Default: None
         """
         if max_iterations < 0:
             raise ValueError("max_iterations must be non-negative")
@@ -301,6 +353,11 @@ class RalphLoop:
 
         # Memory store (optional)
         self._memory_store = memory_store
+        self._memory_context_tokens = memory_context_tokens
+        self._memory_context_builder: Optional[MemoryContextBuilder] = None
+        # Memory context metrics (totals over all iterations)
+        self.memory_context_tokens_used = 0
+        self.memory_context_tokens_saved = 0
 
         # Task management (for LLM execution)
         self._prd_path = Path(prd_path) if prd_path else None
@@ -309,6 +366,9 @@ class RalphLoop:
         self._tool_executor_adapter: Optional[ToolExecutorAdapter] = None  # For worktree isolation
         self._tools: list[Any] = []  # LLM Tool schemas
 
+        # Progress hook (see _emit)
+        self.on_event = on_event
+
         # Set up logging
         self._setup_logging(log_file)
 
@@ -331,7 +391,12 @@ class RalphLoop:
         memory_store = None
         if config.memory_enabled:
             from ralph_agi.memory.store import MemoryStore
-            memory_store = MemoryStore(config.memory_store_path)
+            memory_store = MemoryStore(
+                config.memory_store_path,
+                fsync=config.memory_fsync,
+                batch_size=config.memory_batch_size,
+                batch_interval=config.memory_batch_interval,
+            )
 
         # Create LLM components
         orchestrator = None
@@ -356,10 +421,13 @@ class RalphLoop:
             prd_path=prd_path,
             task_executor=task_executor,
             orchestrator=orchestrator,
+            memory_context_tokens=config.memory_context_tokens,
         )
 
         # Store tool executor for worktree isolation support
         loop._tool_executor_adapter = tool_executor_adapter
+        if tool_executor_adapter:
+            tool_executor_adapter.on_tool = loop._on_tool
 
         # Build tool schemas for LLM
         if orchestrator:
@@ -385,14 +453,23 @@ class RalphLoop:
         """
         from ralph_agi.llm.agents import BuilderAgent, CriticAgent
         from ralph_agi.llm.orchestrator import LLMOrchestrator
+        from ralph_agi.llm.retry import RetryPolicy
+        from ralph_agi.tui.events import emit_agent_thinking
 
         # Create tool executor
         tool_executor = ToolExecutorAdapter(work_dir=work_dir)
 
+        # Clients share one rate budget per provider/model across the process
+        governor = RalphLoop._create_rate_governor(config)
+
         # Create Builder client based on provider
         builder_client = RalphLoop._create_llm_client(
             provider=config.llm_builder_provider,
             model=config.llm_builder_model,
+            prompt_caching=config.llm_prompt_caching,
+            governor=governor,
+            replay_mode=config.llm_replay_mode,
+            replay_path=config.llm_replay_path,
         )
 
         builder = BuilderAgent(
@@ -400,6 +477,10 @@ class RalphLoop:
             tool_executor=tool_executor,
             max_iterations=config.llm_max_tool_iterations,
             max_tokens=config.llm_max_tokens,
+            context_window_tokens=config.llm_context_window_tokens,
+            retry_policy=RetryPolicy(max_retries=config.llm_rate_limit_retries),
+            streaming=config.llm_streaming,
+            on_thinking=emit_agent_thinking,
         )
 
         # Create Critic if enabled
@@ -408,6 +489,9 @@ class RalphLoop:
             critic_client = RalphLoop._create_llm_client(
                 provider=config.llm_critic_provider,
                 model=config.llm_critic_model,
+                governor=governor,
+                replay_mode=config.llm_replay_mode,
+                replay_path=config.llm_replay_path,
             )
             critic = CriticAgent(
                 client=critic_client,
@@ -424,12 +508,44 @@ class RalphLoop:
         return orchestrator, tool_executor
 
     @staticmethod
-    def _create_llm_client(provider: str, model: str) -> Any:
+    def _create_rate_governor(config: RalphConfig) -> Any:
+        """Get the process-wide rate governor for the configured limits.
+
+        Args:
+            config: RalphConfig with llm_* rate limit settings.
+
+        Returns:
+            Shared RateGovernor, or None if no limits are configured.
+        """
+        from ralph_agi.llm.rate_limit import RateLimits, shared_governor
+
+        limits = RateLimits(
+            requests_per_minute=config.llm_requests_per_minute,
+            tokens_per_minute=config.llm_tokens_per_minute,
+            max_concurrent=config.llm_max_concurrent_requests,
+        )
+        return shared_governor(limits, config.llm_rate_state_path)
+
+    @staticmethod
+    def _create_llm_client(
+        provider: str,
+        model: str,
+        prompt_caching: bool = False,
+        governor: Any = None,
+        replay_mode: Optional[str] = None,
+        replay_path: Optional[str] = None,
+    ) -> Any:
         """Create an LLM client for the given provider.
 
         Args:
             provider: Provider name (anthropic, openai, openrouter).
             model: Model name.
+            prompt_caching: Enable prompt cache breakpoints (anthropic only).
+            governor: Optional shared RateGovernor.
+            replay_mode: "record" wraps the provider client in a
+                ReplayLLMClient writing to replay_path; "replay" serves
+                responses from replay_path without a provider client.
+            replay_path: JSONL transcript for replay_mode.
 
         Returns:
             LLM client instance.
@@ -437,18 +553,32 @@ class RalphLoop:
         Raises:
             ValueError: If provider is unknown.
         """
+        if replay_mode == "replay":
+            from ralph_agi.llm.replay import ReplayLLMClient
+            return ReplayLLMClient(replay_path, mode="replay", model=model)
+
+        kwargs: dict[str, Any] = {"model": model}
+        if governor is not None:
+            kwargs["governor"] = governor
         if provider == "anthropic":
             from ralph_agi.llm.anthropic import AnthropicClient
-            return AnthropicClient(model=model)
+            if prompt_caching:
+                kwargs["prompt_caching"] = True
+            client = AnthropicClient(**kwargs)
         elif provider == "openai":
             from ralph_agi.llm.openai import OpenAIClient
-            return OpenAIClient(model=model)
+            client = OpenAIClient(**kwargs)
         elif provider == "openrouter":
             from ralph_agi.llm.openrouter import OpenRouterClient
-            return OpenRouterClient(model=model)
+            client = OpenRouterClient(**kwargs)
         else:
             raise ValueError(f"Unknown LLM provider: {provider}")
 
+        if replay_mode == "record":
+            from ralph_agi.llm.replay import ReplayLLMClient
+            return ReplayLLMClient(replay_path, mode="record", client=client)
+        return client
+
     @staticmethod
     def _build_tool_schemas() -> list[Any]:
         """Build Tool schemas for LLM from available tools.
@@ -721,6 +851,9 @@ class RalphLoop:
         if not checkpoint_path:
             raise ValueError("No checkpoint path specified")
 
+        # Memory written before the checkpoint must survive with it
+        self._flush_memory()
+
         state = self.get_state()
         checkpoint_file = Path(checkpoint_path)
         checkpoint_file.write_text(json.dumps(state, indent=2))
@@ -767,6 +900,28 @@ class RalphLoop:
             self.session_id = state["session_id"]
         self.logger.info(f"Resumed from iteration {self.iteration} (session: {self.session_id[:8]}...)")
 
+    def _emit(self, event: str, **data: Any) -> None:
+        """Send a progress event to the on_event hook, if any.
+
+        A failing hook is logged and otherwise ignored.
+        """
+        if self.on_event is None:
+            return
+        try:
+            self.on_event(event, data)
+        except Exception as e:
+            self.logger.debug(f"Progress hook failed on {event}: {e}")
+
+    def _on_tool(self, tool_name: str, success: bool, duration: float) -> None:
+        """ToolExecutorAdapter callback: report a finished tool call."""
+        self._emit(
+            "tool",
+            iteration=self.iteration + 1,
+            tool=tool_name,
+            success=success,
+            duration_seconds=round(duration, 3),
+        )
+
     def _log_iteration_start(self) -> None:
         """Log the start of an iteration with timestamp and iteration number."""
         self.logger.info(
@@ -868,7 +1023,9 @@ class RalphLoop:
 
         # Step 2: Build context
         project_context = self._build_project_context()
-        memory_context = self._build_memory_context()
+        memory_context = self._build_memory_context(
+            "\n".join([task.description, *task_dict["steps"]])
+        )
 
         # Step 3: Execute via orchestrator
         try:
@@ -902,6 +1059,8 @@ class RalphLoop:
                     task_title=task_title,
                     files_changed=result.files_changed,
                     tokens_used=result.token_usage.total,
+                    input_tokens=result.token_usage.total_input,
+                    output_tokens=result.token_usage.total_output,
                     error=f"Failed to mark complete: {e}",
                 )
 
@@ -912,6 +1071,8 @@ class RalphLoop:
                 task_title=task_title,
                 files_changed=result.files_changed,
                 tokens_used=result.token_usage.total,
+                input_tokens=result.token_usage.total_input,
+                output_tokens=result.token_usage.total_output,
             )
         else:
             # Task failed or blocked
@@ -932,6 +1093,8 @@ class RalphLoop:
                 task_title=task_title,
                 files_changed=result.files_changed,
                 tokens_used=result.token_usage.total,
+                input_tokens=result.token_usage.total_input,
+                output_tokens=result.token_usage.total_output,
                 error=reason,
             )
 
@@ -964,8 +1127,14 @@ class RalphLoop:
 
         return "\n".join(parts) if parts else ""
 
-    def _build_memory_context(self) -> str:
-        """Build memory context string from recent frames.
+    def _build_memory_context(self, task_text: str = "") -> str:
+        """Build memory context string from the frames most relevant to a task.
+
+        Frames are ranked by relevance to ``task_text``, recency and
+        importance, deduplicated and packed into the memory token budget.
+
+        Args:
+            task_text: Description of the task about to run.
 
         Returns:
             Context string with relevant memories.
@@ -974,18 +1143,25 @@ class RalphLoop:
             return ""
 
         try:
-            frames = self.get_context(n=5)
-            if not frames:
-                return ""
-
-            parts = ["## Recent Context"]
-            for frame in frames:
-                content = frame.content
-                if len(content) > 200:
-                    content = content[:200] + "..."
-                parts.append(f"- {content}")
+            if (
+                self._memory_context_builder is None
+                or self._memory_context_builder.store is not self._memory_store
+            ):
+                from ralph_agi.memory.context import MemoryContextBuilder
+
+                self._memory_context_builder = MemoryContextBuilder(
+                    self._memory_store, max_tokens=self._memory_context_tokens
+                )
 
-            return "\n".join(parts)
+            context = self._memory_context_builder.build(task_text, session_id=self.session_id)
+            self.memory_context_tokens_used += context.token_count
+            self.memory_context_tokens_saved += context.tokens_saved
+            if context.frames:
+                self.logger.debug(
+                    f"Memory context: {len(context.frames)} frames, {context.token_count} tokens "
+                    f"({context.tokens_saved} saved vs. {context.baseline_tokens} before)"
+                )
+            return context.text
         except Exception as e:
             self.logger.debug(f"Failed to build memory context: {e}")
             return ""
@@ -1161,16 +1337,34 @@ class RalphLoop:
                     self._handle_graceful_shutdown()
 
                 self._log_iteration_start()
+                self._emit("iteration_started", iteration=self.iteration + 1)
+                started = time.perf_counter()
 
                 try:
                     # Execute with retry logic
                     result = self._execute_with_retry(self._execute_iteration)
                     self._log_iteration_end(result.success)
 
-                    # Accumulate token usage (estimate 70/30 input/output split)
+                    # Accumulate the reported token usage
                     if result.tokens_used:
-                        self.total_input_tokens += int(result.tokens_used * 0.7)
-                        self.total_output_tokens += int(result.tokens_used * 0.3)
+                        self.total_input_tokens += result.input_tokens
+                        self.total_output_tokens += result.output_tokens
+                        self._emit(
+                            "tokens",
+                            iteration=self.iteration + 1,
+                            tokens_used=result.tokens_used,
+                            input_tokens=self.total_input_tokens,
+                            output_tokens=self.total_output_tokens,
+                        )
+                    self._emit(
+                        "iteration_completed",
+                        iteration=self.iteration + 1,
+                        success=result.success,
+                        task_id=result.task_id,
+                        duration_seconds=round(time.perf_counter() - started, 3),
+                        memory_context_tokens_used=self.memory_context_tokens_used,
+                        memory_context_tokens_saved=self.memory_context_tokens_saved,
+                    )
 
                     # Store iteration result in memory (non-blocking)
                     self._store_iteration_result(result)
@@ -1191,6 +1385,15 @@ class RalphLoop:
 
                 except MaxRetriesExceeded as e:
                     self._log_iteration_end(False, str(e))
+                    self._emit(
+                        "iteration_completed",
+                        iteration=self.iteration + 1,
+                        success=False,
+                        error=str(e),
+                        duration_seconds=round(time.perf_counter() - started, 3),
+                        memory_context_tokens_used=self.memory_context_tokens_used,
+                        memory_context_tokens_saved=self.memory_context_tokens_saved,
+                    )
                     raise
 
             # Log final status
@@ -1206,10 +1409,20 @@ class RalphLoop:
                 return False
 
         finally:
+            self._flush_memory()
             # Always restore signal handlers
             if handle_signals:
                 self._restore_signal_handlers()
 
+    def _flush_memory(self) -> None:
+        """Make buffered memory frames durable (batched/OS fsync modes)."""
+        if self._memory_store is None:
+            return
+        try:
+            self._memory_store.flush()
+        except Exception as e:
+            self.logger.warning(f"Failed to flush memory store: {e}")
+
     def _handle_graceful_shutdown(self) -> None:
         """Handle graceful shutdown on interrupt.
 
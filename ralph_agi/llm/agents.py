@@ -6,12 +6,22 @@ in the multi-agent architecture defined in ADR-002.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional, Protocol, runtime_checkable
-
-from ralph_agi.llm.client import LLMResponse, StopReason, Tool, ToolCall
+from typing import Any, Callable, Optional, Protocol, runtime_checkable
+
+from ralph_agi.llm.client import (
+    LLMError,
+    LLMResponse,
+    RateLimitError,
+    StopReason,
+    StreamEventType,
+    Tool,
+    ToolCall,
+)
+from ralph_agi.llm.context_window import ConversationWindow
 from ralph_agi.llm.prompts import (
     BUILDER_SYSTEM_PROMPT,
     CRITIC_SYSTEM_PROMPT,
@@ -20,8 +30,10 @@ from ralph_agi.llm.prompts import (
     extract_completion_signal,
     extract_critic_verdict,
 )
+from ralph_agi.llm.retry import RetryPolicy
 from ralph_agi.llm.verification import verify_files
-from ralph_agi.llm.evaluator import evaluate_acceptance_criteria
+from ralph_agi.llm.evaluator import CriteriaEvaluator
+from ralph_agi.tools.dispatch import ToolDispatcher, classify_tool
 
 logger = logging.getLogger(__name__)
 
@@ -92,6 +104,7 @@ class AgentStatus(Enum):
     COMPLETED = "completed"
     BLOCKED = "blocked"
     MAX_ITERATIONS = "max_iterations"
+    RATE_LIMITED = "rate_limited"
     ERROR = "error"
 
 
@@ -132,6 +145,17 @@ class BuilderResult:
         files_changed: List of files modified (if tracked).
         total_tokens: Total tokens used.
         error: Error message if failed.
+        input_tokens: Uncached input tokens across LLM calls.
+        output_tokens: Output tokens across LLM calls.
+        cache_read_tokens: Prompt tokens read from the prompt cache.
+        cache_write_tokens: Prompt tokens written to the prompt cache.
+        peak_prompt_tokens: Largest prompt (input plus cache tokens) of
+            any single LLM call.
+        context_tokens_saved: Estimated prompt tokens kept out of LLM
+            calls by the context window, summed over calls.
+        rate_limit_retries: LLM calls retried after a rate limit.
+        early_tool_calls: Read-only tool calls started while the LLM
+            response was still streaming.
     """
 
     status: AgentStatus
@@ -142,6 +166,14 @@ class BuilderResult:
     files_changed: list[str] = field(default_factory=list)
     total_tokens: int = 0
     error: Optional[str] = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+    peak_prompt_tokens: int = 0
+    context_tokens_saved: int = 0
+    rate_limit_retries: int = 0
+    early_tool_calls: int = 0
 
     @property
     def is_complete(self) -> bool:
@@ -192,11 +224,30 @@ class BuilderAgent:
     3. Executes any tool calls from the LLM
     4. Continues until task completion or max iterations
 
+    Independent read-only tool calls from one response run concurrently
+    (see ToolDispatcher); writes and commands keep their relative order.
+    Each call sends the conversation through a ConversationWindow, so
+    stale tool results are stubbed out once the prompt outgrows
+    ``context_window_tokens``. A rate-limited call is retried on its own
+    with jittered backoff (see RetryPolicy), keeping the conversation,
+    tool records and changed files accumulated so far.
+
+    With ``streaming`` enabled and a client that supports
+    ``stream_complete``, read-only tool calls at the start of a response
+    begin executing as soon as each tool-use block is complete, while the
+    model is still generating the rest. Generated text is passed line by
+    line to ``on_thinking``.
+
     Attributes:
         client: LLM client for generating responses.
         tool_executor: Executor for running tools.
         max_iterations: Maximum LLM calls per task.
         max_tokens: Maximum tokens per LLM call.
+        max_parallel_tools: Maximum tool calls running at once.
+        context_window_tokens: Estimated prompt budget per call (0 = unbounded).
+        retry_policy: Backoff for rate-limited LLM calls.
+        streaming: Whether LLM calls are streamed.
+        on_thinking: Callback receiving generated text as it arrives.
 
     Example:
         >>> builder = BuilderAgent(client, tool_executor)
@@ -207,6 +258,8 @@ class BuilderAgent:
 
     DEFAULT_MAX_ITERATIONS = 10
     DEFAULT_MAX_TOKENS = 4096
+    DEFAULT_MAX_PARALLEL_TOOLS = ToolDispatcher.DEFAULT_MAX_CONCURRENCY
+    DEFAULT_CONTEXT_WINDOW_TOKENS = ConversationWindow.DEFAULT_MAX_TOKENS
 
     def __init__(
         self,
@@ -214,6 +267,11 @@ class BuilderAgent:
         tool_executor: Optional[ToolExecutorProtocol] = None,
         max_iterations: int = DEFAULT_MAX_ITERATIONS,
         max_tokens: int = DEFAULT_MAX_TOKENS,
+        max_parallel_tools: int = DEFAULT_MAX_PARALLEL_TOOLS,
+        context_window_tokens: int = DEFAULT_CONTEXT_WINDOW_TOKENS,
+        retry_policy: Optional[RetryPolicy] = None,
+        streaming: bool = False,
+        on_thinking: Optional[Callable[[str], None]] = None,
     ):
         """Initialize the Builder agent.
 
@@ -222,11 +280,26 @@ class BuilderAgent:
             tool_executor: Executor for running tools (optional).
             max_iterations: Max LLM calls per task.
             max_tokens: Max tokens per LLM call.
+            max_parallel_tools: Max tool calls running at once (1 = sequential).
+            context_window_tokens: Estimated prompt budget per call before
+                stale tool results are elided (0 = send full history).
+            retry_policy: Backoff for rate-limited LLM calls
+                (default: RetryPolicy()).
+            streaming: Stream LLM calls and start read-only tools before
+                the response is complete. Ignored if the client has no
+                ``stream_complete``.
+            on_thinking: Called with each line of generated text (e.g.
+                ``emit_agent_thinking`` for the TUI).
         """
         self._client = client
         self._tool_executor = tool_executor
         self._max_iterations = max_iterations
         self._max_tokens = max_tokens
+        self._dispatcher = ToolDispatcher(max_concurrency=max_parallel_tools)
+        self._context_window_tokens = context_window_tokens
+        self._retry_policy = retry_policy or RetryPolicy()
+        self._streaming = streaming and hasattr(client, "stream_complete")
+        self._on_thinking = on_thinking
 
     async def execute(
         self,
@@ -250,7 +323,24 @@ class BuilderAgent:
         messages: list[dict[str, Any]] = []
         tool_records: list[ToolExecutionRecord] = []
         total_tokens = 0
+        usage = {
+            "input_tokens": 0,
+            "output_tokens": 0,
+            "cache_read_tokens": 0,
+            "cache_write_tokens": 0,
+            "peak_prompt_tokens": 0,
+            "context_tokens_saved": 0,
+            "rate_limit_retries": 0,
+            "early_tool_calls": 0,
+        }
+        window = (
+            ConversationWindow(max_tokens=self._context_window_tokens)
+            if self._context_window_tokens
+            else None
+        )
         files_changed: list[str] = []
+        # Shared across completion attempts so unchanged passes are reused
+        evaluator = CriteriaEvaluator()
 
         # Build initial task prompt
         task_prompt = build_task_prompt(task, context, memory_context)
@@ -260,16 +350,24 @@ class BuilderAgent:
 
         for iteration in range(self._max_iterations):
             logger.debug(f"Builder iteration {iteration + 1}/{self._max_iterations}")
+            # Tool calls started while streaming, by tool call id
+            started: dict[str, asyncio.Future] = {}
 
             try:
-                # Call LLM
-                response = await self._client.complete(
-                    messages=messages,
-                    system=BUILDER_SYSTEM_PROMPT,
-                    tools=tools if tools else None,
-                    max_tokens=self._max_tokens,
-                )
+                # Call LLM with stale tool results elided
+                request_messages = window.fit(messages) if window else messages
+                if window:
+                    usage["context_tokens_saved"] += window.last_stats.tokens_saved
+                response = await self._complete(request_messages, tools, usage, started)
                 total_tokens += response.total_tokens
+                usage["input_tokens"] += response.input_tokens
+                usage["output_tokens"] += response.output_tokens
+                usage["cache_read_tokens"] += response.cache_read_tokens
+                usage["cache_write_tokens"] += response.cache_write_tokens
+                usage["peak_prompt_tokens"] = max(
+                    usage["peak_prompt_tokens"],
+                    response.input_tokens + response.cache_read_tokens + response.cache_write_tokens,
+                )
 
                 # Add assistant response to conversation
                 assistant_message = self._build_assistant_message(response)
@@ -301,7 +399,7 @@ class BuilderAgent:
                     # Evaluate acceptance criteria externally
                     acceptance = task.get("acceptance_criteria", [])
                     if acceptance:
-                        eval_result = evaluate_acceptance_criteria(acceptance)
+                        eval_result = await asyncio.to_thread(evaluator.evaluate, acceptance)
 
                         if not eval_result.passed:
                             # Acceptance criteria failed
@@ -319,7 +417,7 @@ class BuilderAgent:
                             })
                             continue  # Continue the loop to let Builder fix errors
 
-                        logger.info(f"Acceptance criteria passed: {eval_result.evaluated_count} automated, {eval_result.manual_count} manual")
+                        logger.info(f"Acceptance criteria passed: {eval_result.evaluated_count} automated ({eval_result.cached_count} cached), {eval_result.manual_count} manual in {eval_result.duration_ms}ms")
 
                     logger.info(f"Builder task verified and completed")
                     return BuilderResult(
@@ -330,6 +428,7 @@ class BuilderAgent:
                         final_response=response.content,
                         files_changed=files_changed,
                         total_tokens=total_tokens,
+                        **usage,
                     )
 
                 if status_msg.startswith("BLOCKED"):
@@ -342,6 +441,7 @@ class BuilderAgent:
                         final_response=response.content,
                         files_changed=files_changed,
                         total_tokens=total_tokens,
+                        **usage,
                         error=status_msg,
                     )
 
@@ -352,6 +452,7 @@ class BuilderAgent:
                         iteration + 1,
                         tool_records,
                         files_changed,
+                        started,
                     )
 
                     # Add tool results to conversation
@@ -360,6 +461,19 @@ class BuilderAgent:
                     # No tool calls and end of turn - task might be stuck
                     logger.debug("No tool calls and end_turn - continuing")
 
+            except RateLimitError as e:
+                logger.error(f"Builder rate limit retries exhausted on iteration {iteration + 1}: {e}")
+                return BuilderResult(
+                    status=AgentStatus.RATE_LIMITED,
+                    task=task,
+                    iterations=iteration + 1,
+                    tool_calls=tool_records,
+                    files_changed=files_changed,
+                    total_tokens=total_tokens,
+                    **usage,
+                    error=str(e),
+                )
+
             except Exception as e:
                 logger.error(f"Builder error on iteration {iteration + 1}: {e}")
                 return BuilderResult(
@@ -368,9 +482,13 @@ class BuilderAgent:
                     iterations=iteration + 1,
                     tool_calls=tool_records,
                     total_tokens=total_tokens,
+                    **usage,
                     error=str(e),
                 )
 
+            finally:
+                _discard_started(started)
+
         # Max iterations reached
         logger.warning(f"Builder reached max iterations ({self._max_iterations})")
         return BuilderResult(
@@ -381,8 +499,122 @@ class BuilderAgent:
             final_response=_extract_text_content(messages[-1].get("content")) if messages else "",
             files_changed=files_changed,
             total_tokens=total_tokens,
+            **usage,
         )
 
+    async def _complete(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[Tool],
+        usage: dict[str, int],
+        started: Optional[dict[str, asyncio.Future]] = None,
+    ) -> LLMResponse:
+        """Call the LLM, retrying this call alone on rate limits.
+
+        Args:
+            messages: Messages to send.
+            tools: Tools available to the agent.
+            usage: Usage counters; ``rate_limit_retries`` and
+                ``early_tool_calls`` are incremented.
+            started: Receives tool calls started while streaming, by id.
+
+        Returns:
+            The LLM response.
+
+        Raises:
+            RateLimitError: If the call is still rate limited after
+                ``retry_policy.max_retries`` retries.
+        """
+        started = started if started is not None else {}
+        attempt = 0
+        while True:
+            try:
+                if self._streaming:
+                    return await self._stream(messages, tools, usage, started)
+                response = await self._client.complete(
+                    messages=messages,
+                    system=BUILDER_SYSTEM_PROMPT,
+                    tools=tools if tools else None,
+                    max_tokens=self._max_tokens,
+                )
+                if self._on_thinking and response.content:
+                    thoughts = _ThoughtStream(self._on_thinking)
+                    thoughts.feed(response.content)
+                    thoughts.flush()
+                return response
+            except RateLimitError as e:
+                # Tools started by an aborted stream belong to no response
+                _discard_started(started)
+                if attempt >= self._retry_policy.max_retries:
+                    raise
+                delay = self._retry_policy.delay(attempt, e.retry_after)
+                attempt += 1
+                usage["rate_limit_retries"] += 1
+                logger.warning(
+                    f"Builder rate limited, retrying call in {delay:.1f}s "
+                    f"(attempt {attempt}/{self._retry_policy.max_retries})"
+                )
+                await asyncio.sleep(delay)
+
+    async def _stream(
+        self,
+        messages: list[dict[str, Any]],
+        tools: list[Tool],
+        usage: dict[str, int],
+        started: dict[str, asyncio.Future],
+    ) -> LLMResponse:
+        """Stream one LLM call, starting leading read-only tools early.
+
+        Read-only calls that come before the first mutating call in the
+        response have no predecessors in the dispatcher's plan, so they
+        can start as soon as they are generated. Once a mutating call
+        appears, the rest wait for the full response.
+
+        Args:
+            messages: Messages to send.
+            tools: Tools available to the agent.
+            usage: Usage counters; ``early_tool_calls`` is incremented.
+            started: Receives the started tool calls, by id.
+
+        Returns:
+            The complete LLM response.
+
+        Raises:
+            LLMError: If the stream ends without a final response.
+        """
+        thoughts = _ThoughtStream(self._on_thinking)
+        semaphore = asyncio.Semaphore(self._dispatcher.max_concurrency)
+        # Strictly sequential dispatch leaves nothing to overlap
+        early = self._dispatcher.max_concurrency > 1
+        response: Optional[LLMResponse] = None
+
+        async def run_early(call: ToolCall) -> tuple[str, bool]:
+            async with semaphore:
+                return await self._run_tool(call.name, call.arguments)
+
+        async for event in self._client.stream_complete(
+            messages=messages,
+            system=BUILDER_SYSTEM_PROMPT,
+            tools=tools if tools else None,
+            max_tokens=self._max_tokens,
+        ):
+            if event.type == StreamEventType.TEXT:
+                thoughts.feed(event.text)
+            elif event.type == StreamEventType.TOOL_CALL and event.tool_call is not None:
+                call = event.tool_call
+                early = early and classify_tool(call.name, call.arguments).read_only
+                if early and call.id not in started:
+                    logger.debug(f"Starting {call.name} while response streams")
+                    started[call.id] = asyncio.ensure_future(run_early(call))
+                    usage["early_tool_calls"] += 1
+            elif event.type == StreamEventType.DONE:
+                response = event.response
+
+        thoughts.flush()
+        if response is None:
+            raise LLMError("LLM stream ended without a final response")
+        return response
+
     def _build_assistant_message(self, response: LLMResponse) -> dict[str, Any]:
         """Build assistant message from LLM response.
 
@@ -415,62 +647,43 @@ class BuilderAgent:
         iteration: int,
         records: list[ToolExecutionRecord],
         files_changed: list[str],
+        started: Optional[dict[str, asyncio.Future]] = None,
     ) -> list[dict[str, Any]]:
         """Execute tool calls and build result messages.
 
+        Calls are dispatched through ToolDispatcher, so independent reads
+        overlap while writes to the same path stay ordered. Records and
+        result blocks are emitted in the original call order.
+
         Args:
             tool_calls: List of tool calls from LLM.
             iteration: Current iteration number.
             records: List to append execution records to.
             files_changed: List to track modified files.
+            started: Calls already started while streaming, by id; they
+                are awaited rather than run again.
 
         Returns:
             List of tool result message blocks.
         """
-        results: list[dict[str, Any]] = []
-
-        for tc in tool_calls:
-            logger.debug(f"Executing tool: {tc.name}")
-
-            try:
-                if self._tool_executor:
-                    result = await self._tool_executor.execute(tc.name, tc.arguments)
-                    # Handle ToolResult from our executor
-                    if hasattr(result, "get_text"):
-                        result_text = result.get_text()
-                        success = result.is_success() if hasattr(result, "is_success") else True
-                    else:
-                        result_text = str(result)
-                        success = True
-                else:
-                    # No executor - return mock result
-                    result_text = f"Tool '{tc.name}' executed (no executor configured)"
-                    success = True
-
-                # Track file changes
-                if tc.name in ("write_file", "edit_file", "create_file"):
-                    path = tc.arguments.get("path", tc.arguments.get("file_path", ""))
-                    if path and path not in files_changed:
-                        files_changed.append(path)
-
-                records.append(ToolExecutionRecord(
-                    tool_name=tc.name,
-                    arguments=tc.arguments,
-                    result=result_text[:500] if len(result_text) > 500 else result_text,
-                    success=success,
-                    iteration=iteration,
-                ))
+        running: dict[int, asyncio.Future] = {}
+        if started:
+            for index, tc in enumerate(tool_calls):
+                if tc.id in started:
+                    running[index] = started.pop(tc.id)
+
+        outcomes = await self._dispatcher.run(
+            [(tc.name, tc.arguments) for tc in tool_calls],
+            self._run_tool,
+            started=running,
+        )
 
-                results.append({
-                    "type": "tool_result",
-                    "tool_use_id": tc.id,
-                    "content": result_text,
-                    "is_error": not success,
-                })
+        results: list[dict[str, Any]] = []
 
-            except Exception as e:
-                error_msg = f"Tool execution error: {e}"
-                logger.error(f"Tool {tc.name} failed: {e}")
+        for tc, outcome in zip(tool_calls, outcomes):
+            if isinstance(outcome, BaseException):
+                error_msg = f"Tool execution error: {outcome}"
+                logger.error(f"Tool {tc.name} failed: {outcome}")
 
                 records.append(ToolExecutionRecord(
                     tool_name=tc.name,
@@ -486,9 +699,99 @@ class BuilderAgent:
                     "content": error_msg,
                     "is_error": True,
                 })
+                continue
+
+            result_text, success = outcome
+
+            # Track file changes
+            if tc.name in ("write_file", "edit_file", "create_file"):
+                path = tc.arguments.get("path", tc.arguments.get("file_path", ""))
+                if path and path not in files_changed:
+                    files_changed.append(path)
+
+            records.append(ToolExecutionRecord(
+                tool_name=tc.name,
+                arguments=tc.arguments,
+                result=result_text[:500] if len(result_text) > 500 else result_text,
+                success=success,
+                iteration=iteration,
+            ))
+
+            results.append({
+                "type": "tool_result",
+                "tool_use_id": tc.id,
+                "content": result_text,
+                "is_error": not success,
+            })
 
         return results
 
+    async def _run_tool(
+        self,
+        tool_name: str,
+        arguments: dict[str, Any],
+    ) -> tuple[str, bool]:
+        """Run a single tool call.
+
+        Args:
+            tool_name: Name of the tool.
+            arguments: Tool arguments.
+
+        Returns:
+            Tuple of (result text, success).
+        """
+        logger.debug(f"Executing tool: {tool_name}")
+
+        if not self._tool_executor:
+            # No executor - return mock result
+            return f"Tool '{tool_name}' executed (no executor configured)", True
+
+        result = await self._tool_executor.execute(tool_name, arguments)
+        # Handle ToolResult from our executor
+        if hasattr(result, "get_text"):
+            success = result.is_success() if hasattr(result, "is_success") else True
+            return result.get_text(), success
+        return str(result), True
+
+
+class _ThoughtStream:
+    """Buffers streamed text and passes it on one line at a time."""
+
+    def __init__(self, callback: Optional[Callable[[str], None]]):
+        self._callback = callback
+        self._buffer = ""
+
+    def feed(self, text: str) -> None:
+        if self._callback is None:
+            return
+        self._buffer += text
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            self._emit(line)
+
+    def flush(self) -> None:
+        if self._buffer:
+            self._emit(self._buffer)
+        self._buffer = ""
+
+    def _emit(self, line: str) -> None:
+        if not line.strip():
+            return
+        try:
+            self._callback(line)
+        except Exception as e:
+            logger.debug(f"Thinking callback failed: {e}")
+
+
+def _discard_started(started: dict[str, asyncio.Future]) -> None:
+    """Cancel tool calls started early whose results will not be used."""
+    for future in started.values():
+        if not future.done():
+            future.cancel()
+        elif not future.cancelled():
+            future.exception()  # Mark any error as retrieved
+    started.clear()
+
 
 # =============================================================================
 # Critic Agent
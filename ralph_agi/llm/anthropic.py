@@ -2,10 +2,24 @@
 
 This module provides Claude API integration with native tool_use support,
 serving as the Builder LLM in the multi-agent architecture.
+
+With prompt caching enabled, requests carry cache_control breakpoints on
+the tool definitions, the system prompt and the two most recent turns of
+the conversation. A Builder loop resends the same tools, system prompt
+and growing history on every call, so each call reads the previous
+call's prefix from the cache and only writes the newly appended turn.
+
+With a RateGovernor, each call waits for capacity under the shared
+requests/tokens-per-minute budget and reports its actual usage back.
+
+stream_complete() streams text and yields each tool_use block as soon as
+its input JSON is complete, so callers can start tools while later
+blocks are still being generated.
 """
 
 from __future__ import annotations
 
+import json
 import logging
 import os
 from typing import TYPE_CHECKING, Any, AsyncIterator, Optional
@@ -19,15 +33,21 @@ from ralph_agi.llm.client import (
     ModelNotFoundError,
     RateLimitError,
     StopReason,
+    StreamEvent,
+    StreamEventType,
     Tool,
     ToolCall,
 )
+from ralph_agi.llm.rate_limit import RateGovernor, estimate_request_tokens, governed_call
 
 if TYPE_CHECKING:
     import anthropic
 
 logger = logging.getLogger(__name__)
 
+# Marks the end of a cacheable prefix (5-minute ephemeral cache)
+CACHE_CONTROL = {"type": "ephemeral"}
+
 
 class AnthropicClient:
     """Claude API client with tool_use support.
@@ -38,6 +58,8 @@ class AnthropicClient:
     Attributes:
         model: Claude model to use.
         timeout: Request timeout in seconds.
+        prompt_caching: Whether requests carry cache_control breakpoints.
+        governor: Shared rate governor consulted before each call.
 
     Example:
         >>> client = AnthropicClient(model="claude-sonnet-4-20250514")
@@ -49,6 +71,7 @@ class AnthropicClient:
     """
 
     DEFAULT_MODEL = "claude-sonnet-4-20250514"
+    PROVIDER = "anthropic"
 
     def __init__(
         self,
@@ -56,6 +79,8 @@ class AnthropicClient:
         model: str = DEFAULT_MODEL,
         base_url: Optional[str] = None,
         timeout: float = 120.0,
+        prompt_caching: bool = False,
+        governor: Optional[RateGovernor] = None,
     ):
         """Initialize the Anthropic client.
 
@@ -64,9 +89,14 @@ class AnthropicClient:
             model: Claude model to use. Default: claude-sonnet-4-20250514
             base_url: Optional API base URL for proxies.
             timeout: Request timeout in seconds. Default: 120.0
+            prompt_caching: Mark tools, system prompt and conversation
+                prefix as cacheable. Default: False
+            governor: Optional RateGovernor shared with other clients.
         """
         self.model = model
         self.timeout = timeout
+        self.prompt_caching = prompt_caching
+        self.governor = governor
         self._api_key = api_key
         self._base_url = base_url
         self._client: Optional[anthropic.AsyncAnthropic] = None
@@ -117,6 +147,81 @@ class AnthropicClient:
             for tool in tools
         ]
 
+    def _build_request(
+        self,
+        messages: list[dict[str, Any]],
+        system: Optional[str],
+        tools: Optional[list[Tool]],
+        max_tokens: int,
+        temperature: float,
+        stop_sequences: Optional[list[str]] = None,
+    ) -> dict[str, Any]:
+        """Build messages.create keyword arguments.
+
+        Args:
+            messages: Conversation history.
+            system: Optional system prompt.
+            tools: Optional tools.
+            max_tokens: Maximum tokens to generate.
+            temperature: Sampling temperature.
+            stop_sequences: Optional stop sequences.
+
+        Returns:
+            Request keyword arguments, with cache breakpoints if enabled.
+        """
+        kwargs: dict[str, Any] = {
+            "model": self.model,
+            "messages": self._cacheable_messages(messages) if self.prompt_caching else messages,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+
+        if system:
+            if self.prompt_caching:
+                kwargs["system"] = [
+                    {"type": "text", "text": system, "cache_control": CACHE_CONTROL}
+                ]
+            else:
+                kwargs["system"] = system
+        if tools:
+            converted = self._convert_tools(tools)
+            if self.prompt_caching:
+                converted[-1] = {**converted[-1], "cache_control": CACHE_CONTROL}
+            kwargs["tools"] = converted
+        if stop_sequences:
+            kwargs["stop_sequences"] = stop_sequences
+
+        return kwargs
+
+    @staticmethod
+    def _cacheable_messages(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Add cache breakpoints to the last message and the user turn before it.
+
+        The last message's breakpoint writes the whole conversation to the
+        cache; the earlier user turn is where the previous call's breakpoint
+        sat, so that prefix is read back. Together with tools and system
+        this stays within the API's limit of four breakpoints.
+
+        Args:
+            messages: Conversation history (not modified).
+
+        Returns:
+            Copy of the history with cache_control on up to two messages.
+        """
+        if not messages:
+            return messages
+
+        marked = [len(messages) - 1]
+        for index in range(len(messages) - 2, -1, -1):
+            if messages[index].get("role") == "user":
+                marked.append(index)
+                break
+
+        result = list(messages)
+        for index in marked:
+            result[index] = _with_cache_control(messages[index])
+        return result
+
     async def complete(
         self,
         messages: list[dict[str, Any]],
@@ -149,26 +254,27 @@ class AnthropicClient:
         self._ensure_client()
         assert self._client is not None
 
-        kwargs: dict[str, Any] = {
-            "model": self.model,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-        }
-
-        if system:
-            kwargs["system"] = system
-        if tools:
-            kwargs["tools"] = self._convert_tools(tools)
-        if stop_sequences:
-            kwargs["stop_sequences"] = stop_sequences
+        kwargs = self._build_request(
+            messages, system, tools, max_tokens, temperature, stop_sequences
+        )
 
-        try:
-            response = await self._client.messages.create(**kwargs)
-            return self._parse_response(response)
-        except Exception as e:
-            self._handle_error(e)
-            raise  # Never reached, but makes type checker happy
+        async with governed_call(
+            self.governor, self.PROVIDER, self.model, self._estimate_tokens(kwargs)
+        ) as call:
+            try:
+                response = await self._client.messages.create(**kwargs)
+                result = self._parse_response(response)
+            except Exception as e:
+                self._handle_error(e)
+                raise  # Never reached, but makes type checker happy
+            call.record(_charged_tokens(result))
+            return result
+
+    def _estimate_tokens(self, kwargs: dict[str, Any]) -> int:
+        """Estimate prompt tokens of a request for the rate governor."""
+        if self.governor is None:
+            return 0
+        return estimate_request_tokens(kwargs.get("system"), kwargs.get("tools"), kwargs["messages"])
 
     def _parse_response(self, response: Any) -> LLMResponse:
         """Parse Anthropic response into LLMResponse.
@@ -203,6 +309,13 @@ class AnthropicClient:
             usage={
                 "input_tokens": response.usage.input_tokens,
                 "output_tokens": response.usage.output_tokens,
+                # Cached prompt tokens are billed separately from input_tokens
+                "cache_creation_input_tokens": getattr(
+                    response.usage, "cache_creation_input_tokens", None
+                ) or 0,
+                "cache_read_input_tokens": getattr(
+                    response.usage, "cache_read_input_tokens", None
+                ) or 0,
             },
             model=response.model,
             raw_response=response,
@@ -304,21 +417,174 @@ class AnthropicClient:
         self._ensure_client()
         assert self._client is not None
 
-        kwargs: dict[str, Any] = {
-            "model": self.model,
-            "messages": messages,
-            "max_tokens": max_tokens,
-            "temperature": temperature,
-        }
+        kwargs = self._build_request(messages, system, tools, max_tokens, temperature)
+        estimate = self._estimate_tokens(kwargs)
 
-        if system:
-            kwargs["system"] = system
-        if tools:
-            kwargs["tools"] = self._convert_tools(tools)
+        async with governed_call(self.governor, self.PROVIDER, self.model, estimate) as call:
+            try:
+                async with self._client.messages.stream(**kwargs) as stream:
+                    async for text in stream.text_stream:
+                        yield text
+            except Exception as e:
+                self._handle_error(e)
+            call.record(estimate)  # Stream usage isn't surfaced; charge the estimate
 
-        try:
-            async with self._client.messages.stream(**kwargs) as stream:
-                async for text in stream.text_stream:
-                    yield text
-        except Exception as e:
-            self._handle_error(e)
+    async def stream_complete(
+        self,
+        messages: list[dict[str, Any]],
+        system: Optional[str] = None,
+        tools: Optional[list[Tool]] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        stop_sequences: Optional[list[str]] = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """Stream a completion from Claude, including tool calls.
+
+        Text deltas are yielded as they arrive. A tool_use block is
+        yielded once its content_block_stop event arrives, before the
+        rest of the message has been generated.
+
+        Args:
+            messages: Conversation history as list of message dicts.
+            system: Optional system prompt.
+            tools: Optional list of tools available to Claude.
+            max_tokens: Maximum tokens to generate. Default: 4096
+            temperature: Sampling temperature. Default: 0.0 (deterministic)
+            stop_sequences: Optional stop sequences.
+
+        Yields:
+            TEXT and TOOL_CALL events, then a DONE event carrying the
+            assembled LLMResponse.
+
+        Raises:
+            LLMError: On API errors (same mapping as complete()).
+        """
+        self._ensure_client()
+        assert self._client is not None
+
+        kwargs = self._build_request(
+            messages, system, tools, max_tokens, temperature, stop_sequences
+        )
+
+        async with governed_call(
+            self.governor, self.PROVIDER, self.model, self._estimate_tokens(kwargs)
+        ) as call:
+            text_parts: list[str] = []
+            tool_calls: list[ToolCall] = []
+            # Open tool_use blocks by index: [id, name, partial JSON chunks]
+            open_tools: dict[int, list[Any]] = {}
+            usage: dict[str, int] = {}
+            model = self.model
+            stop_reason: Optional[str] = None
+
+            try:
+                stream = await self._client.messages.create(**kwargs, stream=True)
+                async for event in stream:
+                    if event.type == "message_start":
+                        model = event.message.model or model
+                        usage.update(_usage_dict(event.message.usage))
+                    elif event.type == "content_block_start":
+                        block = event.content_block
+                        if block.type == "tool_use":
+                            open_tools[event.index] = [block.id, block.name, []]
+                    elif event.type == "content_block_delta":
+                        delta = event.delta
+                        if delta.type == "text_delta":
+                            text_parts.append(delta.text)
+                            yield StreamEvent(StreamEventType.TEXT, text=delta.text)
+                        elif delta.type == "input_json_delta" and event.index in open_tools:
+                            open_tools[event.index][2].append(delta.partial_json)
+                    elif event.type == "content_block_stop":
+                        if event.index in open_tools:
+                            tool_id, name, chunks = open_tools.pop(event.index)
+                            tool_call = ToolCall(
+                                id=tool_id, name=name, arguments=_parse_tool_input(chunks)
+                            )
+                            tool_calls.append(tool_call)
+                            yield StreamEvent(StreamEventType.TOOL_CALL, tool_call=tool_call)
+                    elif event.type == "message_delta":
+                        stop_reason = event.delta.stop_reason or stop_reason
+                        if event.usage is not None:
+                            usage["output_tokens"] = event.usage.output_tokens
+            except Exception as e:
+                self._handle_error(e)
+
+            result = LLMResponse(
+                content="".join(text_parts),
+                stop_reason=self._map_stop_reason(stop_reason),
+                tool_calls=tool_calls,
+                usage={
+                    "input_tokens": usage.get("input_tokens", 0),
+                    "output_tokens": usage.get("output_tokens", 0),
+                    "cache_creation_input_tokens": usage.get("cache_creation_input_tokens", 0),
+                    "cache_read_input_tokens": usage.get("cache_read_input_tokens", 0),
+                },
+                model=model,
+            )
+            call.record(_charged_tokens(result))
+            yield StreamEvent(StreamEventType.DONE, response=result)
+
+
+def _charged_tokens(result: LLMResponse) -> int:
+    """Tokens a response counts against the rate limit.
+
+    Prompt tokens written to the cache are reported apart from
+    input_tokens but still count towards the input token limit.
+    """
+    return result.total_tokens + result.cache_write_tokens
+
+
+def _usage_dict(usage: Any) -> dict[str, int]:
+    """Read token counts from a streamed usage object, skipping missing ones."""
+    counts = {}
+    for name in (
+        "input_tokens",
+        "output_tokens",
+        "cache_creation_input_tokens",
+        "cache_read_input_tokens",
+    ):
+        value = getattr(usage, name, None)
+        if isinstance(value, int):
+            counts[name] = value
+    return counts
+
+
+def _parse_tool_input(chunks: list[str]) -> dict[str, Any]:
+    """Parse the streamed input JSON of a tool_use block.
+
+    Args:
+        chunks: partial_json fragments in arrival order.
+
+    Returns:
+        Tool arguments ({} for an empty or malformed input).
+    """
+    raw = "".join(chunks)
+    if not raw:
+        return {}
+    try:
+        arguments = json.loads(raw)
+    except json.JSONDecodeError:
+        logger.warning(f"Malformed streamed tool input: {raw[:200]}")
+        return {}
+    return arguments if isinstance(arguments, dict) else {}
+
+
+def _with_cache_control(message: dict[str, Any]) -> dict[str, Any]:
+    """Copy a message with cache_control on its last content block.
+
+    Args:
+        message: Message dict with string or block-list content.
+
+    Returns:
+        New message dict, or the original if it has nothing to mark.
+    """
+    content = message.get("content")
+    if isinstance(content, str):
+        if not content:
+            return message
+        blocks = [{"type": "text", "text": content, "cache_control": CACHE_CONTROL}]
+    elif isinstance(content, list) and content and isinstance(content[-1], dict):
+        blocks = [*content[:-1], {**content[-1], "cache_control": CACHE_CONTROL}]
+    else:
+        return message
+    return {**message, "content": blocks}
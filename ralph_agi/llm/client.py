@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional, Protocol, runtime_checkable
+from typing import Any, AsyncIterator, Optional, Protocol, runtime_checkable
 
 
 class StopReason(Enum):
@@ -49,7 +49,9 @@ class LLMResponse:
         content: Text content of the response.
         stop_reason: Why the LLM stopped generating.
         tool_calls: List of tool calls requested (if any).
-        usage: Token usage statistics.
+        usage: Token usage statistics. Providers with prompt caching
+            also report cache_read_input_tokens and
+            cache_creation_input_tokens (not included in input_tokens).
         model: Model identifier that generated this response.
         raw_response: Original provider response (for debugging).
     """
@@ -81,6 +83,46 @@ class LLMResponse:
         """Get total token count."""
         return self.input_tokens + self.output_tokens
 
+    @property
+    def cache_read_tokens(self) -> int:
+        """Get prompt tokens served from the provider's prompt cache."""
+        return self.usage.get("cache_read_input_tokens", 0)
+
+    @property
+    def cache_write_tokens(self) -> int:
+        """Get prompt tokens written to the provider's prompt cache."""
+        return self.usage.get("cache_creation_input_tokens", 0)
+
+
+class StreamEventType(Enum):
+    """Kind of event yielded by a streaming completion."""
+
+    TEXT = "text"
+    TOOL_CALL = "tool_call"
+    DONE = "done"
+
+
+@dataclass(frozen=True)
+class StreamEvent:
+    """One event from a streaming completion.
+
+    TEXT events carry a chunk of generated text as it arrives. A
+    TOOL_CALL event is yielded as soon as a tool-use block has been fully
+    generated, while the model may still be producing later blocks. The
+    final DONE event carries the assembled LLMResponse with usage.
+
+    Attributes:
+        type: Event kind.
+        text: Text chunk (TEXT events).
+        tool_call: Completed tool call (TOOL_CALL events).
+        response: Complete response (DONE event).
+    """
+
+    type: StreamEventType
+    text: str = ""
+    tool_call: Optional[ToolCall] = None
+    response: Optional[LLMResponse] = None
+
 
 @dataclass(frozen=True)
 class Tool:
@@ -206,6 +248,39 @@ class LLMClient(Protocol):
         ...
 
 
+@runtime_checkable
+class StreamingLLMClient(LLMClient, Protocol):
+    """LLM client that can stream text and tool calls as they are generated."""
+
+    def stream_complete(
+        self,
+        messages: list[dict[str, Any]],
+        system: Optional[str] = None,
+        tools: Optional[list[Tool]] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        stop_sequences: Optional[list[str]] = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """Stream a completion, including tool calls.
+
+        Args:
+            messages: Conversation history as list of message dicts.
+            system: Optional system prompt.
+            tools: Optional list of tools available to the LLM.
+            max_tokens: Maximum tokens to generate.
+            temperature: Sampling temperature (0.0 = deterministic).
+            stop_sequences: Optional stop sequences.
+
+        Yields:
+            TEXT and TOOL_CALL events as they are generated, then one
+            DONE event with the complete LLMResponse.
+
+        Raises:
+            LLMError: On API errors.
+        """
+        ...
+
+
 def create_tool_result_message(tool_call_id: str, result: str, is_error: bool = False) -> dict[str, Any]:
     """Create a tool result message for continuing the conversation.
 
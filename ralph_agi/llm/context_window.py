@@ -0,0 +1,328 @@
+"""Rolling context window for long Builder conversations.
+
+The Builder resends its whole conversation on every LLM call, and most of
+it is tool output: full file contents from read_file, full stdout from
+run_command. Once a result is a few turns old the model rarely needs it
+verbatim, and reads that a later edit has made out of date are actively
+misleading.
+
+ConversationWindow sits between the Builder and the client. The Builder
+keeps its full message history; before each call, ``fit`` returns a copy
+in which stale tool results are replaced by one-line stubs such as::
+
+    [read_file src/app.py, 412 lines, superseded by later edit_file;
+     elided from context, call the tool again if needed]
+
+Elision only happens when the estimated prompt exceeds ``max_tokens``,
+and then removes enough to drop below ``target_ratio * max_tokens``.
+Superseded results go first, then the oldest ones. The last
+``keep_turns`` rounds of tool results and every non-tool message are
+always sent verbatim. Once a result is elided it stays elided, so the
+prompt prefix only changes at those compaction points and prompt
+caching keeps working between them.
+
+Usage:
+    from ralph_agi.llm.context_window import ConversationWindow
+
+    window = ConversationWindow(max_tokens=60_000)
+    response = await client.complete(messages=window.fit(messages), ...)
+    print(window.last_stats.tokens_saved)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from ralph_agi.tools.dispatch import READ_ONLY_TOOLS, classify_tool
+
+logger = logging.getLogger(__name__)
+
+# Per-message framing overhead (role, block types), in tokens
+_MESSAGE_OVERHEAD = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate tokens for text (~4 characters per token)."""
+    return len(text) // 4 + 1
+
+
+def _result_text(content: Any) -> str:
+    """Flatten tool_result content (string or list of text blocks)."""
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return "\n".join(
+            str(block.get("text", "")) for block in content if isinstance(block, dict)
+        )
+    return "" if content is None else str(content)
+
+
+def _block_tokens(block: Any) -> int:
+    if isinstance(block, str):
+        return estimate_tokens(block)
+    if not isinstance(block, dict):
+        return estimate_tokens(str(block))
+    block_type = block.get("type")
+    if block_type == "text":
+        return estimate_tokens(str(block.get("text", "")))
+    if block_type == "tool_result":
+        return estimate_tokens(_result_text(block.get("content")))
+    if block_type == "tool_use":
+        return estimate_tokens(str(block.get("name", "")) + json.dumps(block.get("input", {}), default=str))
+    return estimate_tokens(json.dumps(block, default=str))
+
+
+def message_tokens(message: dict[str, Any]) -> int:
+    """Estimate the prompt tokens one message contributes."""
+    content = message.get("content")
+    if isinstance(content, list):
+        return _MESSAGE_OVERHEAD + sum(_block_tokens(block) for block in content)
+    return _MESSAGE_OVERHEAD + _block_tokens(content or "")
+
+
+@dataclass
+class WindowStats:
+    """Outcome of fitting one request into the window.
+
+    Attributes:
+        full_tokens: Estimated tokens of the unmodified history.
+        prompt_tokens: Estimated tokens of the messages actually sent.
+        elided_count: Tool results currently replaced by stubs.
+        newly_elided: Tool results elided by this call.
+    """
+
+    full_tokens: int = 0
+    prompt_tokens: int = 0
+    elided_count: int = 0
+    newly_elided: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        """Estimated tokens kept out of this request."""
+        return self.full_tokens - self.prompt_tokens
+
+
+@dataclass
+class _ToolUse:
+    name: str
+    arguments: dict[str, Any]
+    position: int  # Order of the call within the conversation
+
+
+@dataclass
+class _Elision:
+    stub: str
+    saved: int
+
+
+class ConversationWindow:
+    """Token-budgeted view over a Builder conversation.
+
+    One instance per conversation: it remembers which tool results it has
+    elided so the stubs stay stable across calls.
+
+    Attributes:
+        max_tokens: Estimated prompt budget that triggers elision.
+        keep_turns: Most recent tool-result rounds always kept verbatim.
+        target_ratio: Fraction of max_tokens to compact down to.
+        min_result_tokens: Results smaller than this are never stubbed.
+    """
+
+    DEFAULT_MAX_TOKENS = 60_000
+    DEFAULT_KEEP_TURNS = 3
+    DEFAULT_TARGET_RATIO = 0.6
+    DEFAULT_MIN_RESULT_TOKENS = 64
+
+    def __init__(
+        self,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        keep_turns: int = DEFAULT_KEEP_TURNS,
+        target_ratio: float = DEFAULT_TARGET_RATIO,
+        min_result_tokens: int = DEFAULT_MIN_RESULT_TOKENS,
+    ):
+        """Initialize the window.
+
+        Args:
+            max_tokens: Estimated prompt budget that triggers elision.
+            keep_turns: Most recent tool-result rounds kept verbatim.
+            target_ratio: Fraction of max_tokens to compact down to, so
+                compactions (and prompt cache misses) stay rare.
+            min_result_tokens: Results smaller than this are never stubbed.
+
+        Raises:
+            ValueError: If an argument is out of range.
+        """
+        if max_tokens < 1:
+            raise ValueError("max_tokens must be at least 1")
+        if keep_turns < 0:
+            raise ValueError("keep_turns must be non-negative")
+        if not 0 < target_ratio <= 1:
+            raise ValueError("target_ratio must be in (0, 1]")
+        self.max_tokens = max_tokens
+        self.keep_turns = keep_turns
+        self.target_ratio = target_ratio
+        self.min_result_tokens = min_result_tokens
+        self._elided: dict[str, _Elision] = {}
+        self.last_stats = WindowStats()
+
+    @property
+    def elided_count(self) -> int:
+        """Number of tool results replaced by stubs so far."""
+        return len(self._elided)
+
+    def fit(self, messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Return the messages to send, eliding stale tool results if needed.
+
+        The input list and its messages are never modified.
+
+        Args:
+            messages: Full conversation history.
+
+        Returns:
+            Messages with elided tool results replaced by stubs.
+        """
+        uses: dict[str, _ToolUse] = {}
+        results: list[tuple[int, dict[str, Any], int]] = []  # (message index, block, tokens)
+        result_rounds: list[int] = []
+        full_tokens = 0
+
+        for index, message in enumerate(messages):
+            full_tokens += message_tokens(message)
+            content = message.get("content")
+            if not isinstance(content, list):
+                continue
+            has_result = False
+            for block in content:
+                if not isinstance(block, dict):
+                    continue
+                if block.get("type") == "tool_use":
+                    uses[block.get("id", "")] = _ToolUse(
+                        name=str(block.get("name", "")),
+                        arguments=block.get("input") or {},
+                        position=len(uses),
+                    )
+                elif block.get("type") == "tool_result":
+                    results.append((index, block, _block_tokens(block)))
+                    has_result = True
+            if has_result:
+                result_rounds.append(index)
+
+        prompt_tokens = full_tokens - sum(e.saved for e in self._elided.values())
+        newly_elided = 0
+
+        if prompt_tokens > self.max_tokens:
+            protected_from = (
+                result_rounds[-self.keep_turns] if self.keep_turns and result_rounds else len(messages)
+            )
+            target = int(self.max_tokens * self.target_ratio)
+            for block, tokens, stub in self._candidates(results, uses, protected_from):
+                if prompt_tokens <= target:
+                    break
+                saved = tokens - estimate_tokens(stub)
+                if saved <= 0:
+                    continue
+                self._elided[block["tool_use_id"]] = _Elision(stub=stub, saved=saved)
+                prompt_tokens -= saved
+                newly_elided += 1
+            logger.debug(
+                f"Context window: elided {newly_elided} tool results, "
+                f"~{full_tokens} -> ~{prompt_tokens} tokens"
+            )
+
+        self.last_stats = WindowStats(
+            full_tokens=full_tokens,
+            prompt_tokens=prompt_tokens,
+            elided_count=len(self._elided),
+            newly_elided=newly_elided,
+        )
+        if not self._elided:
+            return list(messages)
+        return [self._apply(message) for message in messages]
+
+    def _candidates(
+        self,
+        results: list[tuple[int, dict[str, Any], int]],
+        uses: dict[str, _ToolUse],
+        protected_from: int,
+    ) -> list[tuple[dict[str, Any], int, str]]:
+        """Elidable results as (block, tokens, stub), superseded ones first."""
+        superseded: list[tuple[dict[str, Any], int, str]] = []
+        stale: list[tuple[dict[str, Any], int, str]] = []
+        for index, block, tokens in results:
+            use_id = block.get("tool_use_id")
+            if index >= protected_from or not use_id or use_id in self._elided:
+                continue
+            if tokens < self.min_result_tokens:
+                continue
+            use = uses.get(use_id)
+            by = self._superseded_by(use, uses) if use else None
+            stub = self._stub(use, block, superseded_by=by)
+            (superseded if by else stale).append((block, tokens, stub))
+        return superseded + stale
+
+    @staticmethod
+    def _superseded_by(use: _ToolUse, uses: dict[str, _ToolUse]) -> Optional[str]:
+        """Name of a later call that makes this read's result out of date."""
+        if use.name not in READ_ONLY_TOOLS:
+            return None
+        access = classify_tool(use.name, use.arguments)
+        if access.path is None:
+            return None
+        for later in uses.values():
+            if later.position <= use.position:
+                continue
+            later_access = classify_tool(later.name, later.arguments)
+            if later_access.path == access.path and (
+                not later_access.read_only or later.name == use.name
+            ):
+                return later.name
+        return None
+
+    @staticmethod
+    def _stub(use: Optional[_ToolUse], block: dict[str, Any], superseded_by: Optional[str]) -> str:
+        """One-line summary replacing an elided tool result."""
+        text = _result_text(block.get("content"))
+        lines = text.count("\n") + 1 if text else 0
+        parts = []
+        if use:
+            args = use.arguments
+            target = args.get("path") or args.get("file_path") or args.get("command") or ""
+            target = str(target)
+            if len(target) > 80:
+                target = target[:77] + "..."
+            parts.append(f"{use.name} {target}".strip())
+        else:
+            parts.append("tool result")
+        parts.append(f"{lines} lines")
+        if block.get("is_error"):
+            parts.append("failed")
+        if superseded_by:
+            parts.append(f"superseded by later {superseded_by}")
+        elif use is None or use.name not in READ_ONLY_TOOLS:
+            last_line = next((line.strip() for line in reversed(text.splitlines()) if line.strip()), "")
+            if last_line:
+                if len(last_line) > 120:
+                    last_line = last_line[:117] + "..."
+                parts.append(f"last line: {last_line!r}")
+        return f"[{', '.join(parts)}; elided from context, call the tool again if needed]"
+
+    def _apply(self, message: dict[str, Any]) -> dict[str, Any]:
+        content = message.get("content")
+        if not isinstance(content, list):
+            return message
+        if not any(
+            isinstance(block, dict) and block.get("tool_use_id") in self._elided for block in content
+        ):
+            return message
+        new_content = []
+        for block in content:
+            elision = (
+                self._elided.get(block.get("tool_use_id"))
+                if isinstance(block, dict) and block.get("type") == "tool_result"
+                else None
+            )
+            new_content.append({**block, "content": elision.stub} if elision else block)
+        return {**message, "content": new_content}
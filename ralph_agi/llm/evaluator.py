@@ -4,14 +4,24 @@ This module provides an independent evaluation system that runs acceptance
 criteria checks externally, preventing the Builder from "gaming" the results.
 The evaluator can run shell commands, pytest tests, and grep patterns to
 verify that acceptance criteria are actually met.
+
+CriteriaEvaluator runs independent checks concurrently and remembers
+which criteria passed for a given state of their input files, so that
+when the Builder re-signals completion after a fix only the criteria
+whose inputs changed (or that failed) are run again.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import os
 import re
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional
@@ -29,12 +39,17 @@ class CriterionResult:
         method: How it was evaluated (command, pattern, manual).
         output: Output from evaluation (stdout, match result).
         error: Error message if evaluation failed.
+        duration_ms: Time spent evaluating in this attempt.
+        cached: Whether the result was reused from an earlier attempt
+            because none of the criterion's inputs changed.
     """
     criterion: str
     passed: bool
     method: str = "manual"
     output: str = ""
     error: Optional[str] = None
+    duration_ms: int = 0
+    cached: bool = False
 
 
 @dataclass
@@ -46,14 +61,21 @@ class EvaluationResult:
         results: Individual results for each criterion.
         evaluated_count: Number of criteria that were automatically evaluated.
         manual_count: Number of criteria requiring manual verification.
+        duration_ms: Wall-clock time for the whole evaluation.
     """
     passed: bool
     results: list[CriterionResult] = field(default_factory=list)
     evaluated_count: int = 0
     manual_count: int = 0
+    duration_ms: int = 0
+
+    @property
+    def cached_count(self) -> int:
+        """Number of results reused from an earlier attempt."""
+        return sum(1 for r in self.results if r.cached)
 
     @classmethod
-    def success(cls, results: list[CriterionResult]) -> "EvaluationResult":
+    def success(cls, results: list[CriterionResult], duration_ms: int = 0) -> "EvaluationResult":
         """Create a successful evaluation result."""
         evaluated = sum(1 for r in results if r.method != "manual")
         manual = sum(1 for r in results if r.method == "manual")
@@ -62,10 +84,11 @@ class EvaluationResult:
             results=results,
             evaluated_count=evaluated,
             manual_count=manual,
+            duration_ms=duration_ms,
         )
 
     @classmethod
-    def failure(cls, results: list[CriterionResult]) -> "EvaluationResult":
+    def failure(cls, results: list[CriterionResult], duration_ms: int = 0) -> "EvaluationResult":
         """Create a failed evaluation result."""
         evaluated = sum(1 for r in results if r.method != "manual")
         manual = sum(1 for r in results if r.method == "manual")
@@ -74,6 +97,7 @@ class EvaluationResult:
             results=results,
             evaluated_count=evaluated,
             manual_count=manual,
+            duration_ms=duration_ms,
         )
 
 
@@ -265,6 +289,34 @@ def check_line_count(
         return (False, f"Error reading file: {e}")
 
 
+def classify_criterion(criterion: str) -> tuple[str, tuple]:
+    """Determine how a criterion can be evaluated.
+
+    Checks are tried in order: executable command, line count (more
+    specific than a file check), file existence/content, then manual.
+
+    Args:
+        criterion: Acceptance criterion text.
+
+    Returns:
+        Tuple of (method, arguments) where method is one of "command",
+        "line_count", "file_check" or "manual".
+    """
+    command = extract_command(criterion)
+    if command:
+        return ("command", (command,))
+
+    line_check = extract_line_count_check(criterion)
+    if line_check:
+        return ("line_count", line_check)
+
+    file_check = extract_file_check(criterion)
+    if file_check:
+        return ("file_check", file_check)
+
+    return ("manual", ())
+
+
 def evaluate_criterion(
     criterion: str,
     work_dir: Optional[Path] = None,
@@ -284,92 +336,371 @@ def evaluate_criterion(
     Returns:
         CriterionResult with evaluation details.
     """
-    # Try to extract and run a command
-    command = extract_command(criterion)
-    if command:
-        success, output = run_command(command, work_dir)
-        return CriterionResult(
-            criterion=criterion,
-            passed=success,
-            method="command",
-            output=output[:500],  # Truncate long output
-        )
+    start = time.perf_counter()
+    method, args = classify_criterion(criterion)
+
+    if method == "command":
+        success, output = run_command(args[0], work_dir)
+        output = output[:500]  # Truncate long output
+    elif method == "line_count":
+        success, output = check_line_count(args[0], args[1], work_dir)
+    elif method == "file_check":
+        success, output = check_file_content(args[0], args[1], work_dir)
+    else:
+        # Fall back to manual verification
+        success, output = True, "Requires manual verification"  # Assume pass
 
-    # Try to check line count (do this before file check since it's more specific)
-    line_check = extract_line_count_check(criterion)
-    if line_check:
-        filepath, min_lines = line_check
-        success, message = check_line_count(filepath, min_lines, work_dir)
-        return CriterionResult(
-            criterion=criterion,
-            passed=success,
-            method="line_count",
-            output=message,
+    return CriterionResult(
+        criterion=criterion,
+        passed=success,
+        method=method,
+        output=output,
+        duration_ms=int((time.perf_counter() - start) * 1000),
+    )
+
+
+class _ContentHasher:
+    """Content hashes of files, recomputed only when a file's stat changes."""
+
+    # Directories never considered inputs of a check
+    SKIP_DIRS = frozenset({
+        ".git", ".ralph", "__pycache__", "node_modules", ".venv", "venv",
+        ".pytest_cache", ".mypy_cache", ".ruff_cache", ".tox",
+    })
+
+    GIT_TIMEOUT = 30
+
+    def __init__(self) -> None:
+        self._hashes: dict[str, tuple[tuple[int, int, int], str]] = {}
+        self._git_tops: dict[Path, Optional[Path]] = {}
+        self._lock = threading.Lock()
+
+    def file_hash(self, path: Path) -> str:
+        """Get a file's content hash ("missing" if it doesn't exist)."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            return "missing"
+        return self._hash(str(path), st)
+
+    def tree_hash(self, root: Path) -> str:
+        """Get a signature of the files under root that changes when they do.
+
+        In a git work tree the signature is built from git's own view of
+        the files: the staged object ids of tracked files (``git ls-files
+        -s``) plus the content hash of each file ``git status`` reports as
+        modified or untracked, so only those are read. Ignored files are
+        not part of it. Elsewhere it is a stat-only signature (path,
+        mtime, size, inode) of every file, without reading any of them.
+        """
+        signature = self._git_tree_hash(root)
+        if signature is not None:
+            return signature
+
+        digest = hashlib.sha1()
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = sorted(d for d in dirnames if d not in self.SKIP_DIRS)
+            for name in sorted(filenames):
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                rel = os.path.relpath(path, root)
+                digest.update(
+                    f"{rel}\0{st.st_mtime_ns}\0{st.st_size}\0{st.st_ino}\0".encode(
+                        "utf-8", "surrogateescape"
+                    )
+                )
+        return digest.hexdigest()
+
+    def _git(self, root: Path, *args: str) -> Optional[bytes]:
+        """Run a git command in root, returning None if it fails."""
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=root,
+                capture_output=True,
+                timeout=self.GIT_TIMEOUT,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        return result.stdout if result.returncode == 0 else None
+
+    def _git_toplevel(self, root: Path) -> Optional[Path]:
+        """Get the top of the git work tree containing root, if any."""
+        with self._lock:
+            if root in self._git_tops:
+                return self._git_tops[root]
+        out = self._git(root, "rev-parse", "--show-toplevel")
+        top = Path(os.fsdecode(out.strip())) if out else None
+        with self._lock:
+            self._git_tops[root] = top
+        return top
+
+    def _git_tree_hash(self, root: Path) -> Optional[str]:
+        """Get the signature of root from git (None if root isn't in a work tree)."""
+        top = self._git_toplevel(root)
+        if top is None:
+            return None
+        staged = self._git(root, "ls-files", "-s", "-z")
+        status = self._git(
+            root, "status", "--porcelain", "-z", "--untracked-files=all", "--", ".",
         )
+        if staged is None or status is None:
+            return None
+
+        digest = hashlib.sha1(staged)
+        entries = iter(status.split(b"\0"))
+        for entry in entries:
+            if not entry:
+                continue
+            xy, rel = entry[:2], entry[3:]
+            if xy[:1] in (b"R", b"C"):
+                next(entries, None)  # Source path of a rename or copy
+            path = top / os.fsdecode(rel)
+            digest.update(xy + b"\0" + rel + b"\0" + self.file_hash(path).encode() + b"\0")
+        return digest.hexdigest()
+
+    def _hash(self, path: str, st: os.stat_result) -> str:
+        signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+        with self._lock:
+            cached = self._hashes.get(path)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        digest = hashlib.sha1()
+        try:
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    digest.update(chunk)
+        except OSError:
+            return "unreadable"
+        value = digest.hexdigest()
+        with self._lock:
+            self._hashes[path] = (signature, value)
+        return value
+
+
+class CriteriaEvaluator:
+    """Evaluates acceptance criteria concurrently, reusing unchanged passes.
+
+    Commands may depend on each other ("build succeeds", then "cat the
+    build output"), so they run one at a time, in criteria order, on a
+    single lane of a thread pool. Read-only file and line-count checks
+    run alongside them on the remaining workers. A passed result is remembered together with the content
+    hash of its inputs: the checked file for file/line-count criteria,
+    and a signature of the whole working directory for commands, since a
+    command may read anything. On the next evaluate() the criterion is only run
+    again if that hash changed. Failed criteria are always re-run.
+
+    Keep one evaluator per task so retries after a fix share its memory.
 
-    # Try to check file existence/content
-    file_check = extract_file_check(criterion)
-    if file_check:
-        filepath, content = file_check
-        success, message = check_file_content(filepath, content, work_dir)
+    Attributes:
+        work_dir: Directory checks run in and paths resolve against
+        max_workers: Maximum checks running at once (commands use one)
+    """
+
+    DEFAULT_MAX_WORKERS = 4
+
+    def __init__(
+        self,
+        work_dir: Optional[Path] = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        """Initialize evaluator.
+
+        Args:
+            work_dir: Working directory (default: current directory)
+            max_workers: Maximum concurrent checks (1 = sequential)
+        """
+        self._work_dir = Path(work_dir) if work_dir else Path.cwd()
+        self._max_workers = max(1, max_workers)
+        self._hasher = _ContentHasher()
+        self._passed: dict[str, tuple[str, CriterionResult]] = {}
+
+    @property
+    def work_dir(self) -> Path:
+        """Get working directory."""
+        return self._work_dir
+
+    @property
+    def max_workers(self) -> int:
+        """Get maximum concurrent checks."""
+        return self._max_workers
+
+    def evaluate(self, criteria: list[str], fail_fast: bool = False) -> EvaluationResult:
+        """Evaluate criteria, re-running only those whose inputs changed.
+
+        Args:
+            criteria: List of acceptance criterion strings.
+            fail_fast: Stop on the first failure (in criteria order) if True.
+                Checks already running are allowed to finish.
+
+        Returns:
+            EvaluationResult with results in criteria order and timings.
+        """
+        start = time.perf_counter()
+        if not criteria:
+            return EvaluationResult.success([])
+
+        plans = [classify_criterion(c) for c in criteria]
+        tree_hash = (
+            self._hasher.tree_hash(self._work_dir)
+            if any(method == "command" for method, _ in plans)
+            else ""
+        )
+        input_hashes = [
+            self._input_hash(method, args, tree_hash) for method, args in plans
+        ]
+
+        results: list[CriterionResult] = []
+        all_passed = True
+
+        with ThreadPoolExecutor(max_workers=self._max_workers) as pool:
+            futures: list = []
+            commands: list[tuple[str, Future]] = []
+            checks: list[tuple[int, str]] = []
+            for criterion, (method, _), input_hash in zip(criteria, plans, input_hashes):
+                reused = self._reuse(criterion, method, input_hash)
+                if reused is not None:
+                    futures.append(reused)
+                elif method == "command":
+                    future: Future = Future()
+                    commands.append((criterion, future))
+                    futures.append(future)
+                else:
+                    checks.append((len(futures), criterion))
+                    futures.append(None)
+
+            if commands:
+                pool.submit(self._run_commands, commands, fail_fast)
+            for index, criterion in checks:
+                futures[index] = pool.submit(evaluate_criterion, criterion, self._work_dir)
+
+            for criterion, future in zip(criteria, futures):
+                result = future if isinstance(future, CriterionResult) else future.result()
+                results.append(result)
+
+                # Only count automated checks against pass/fail
+                if result.method != "manual" and not result.passed:
+                    all_passed = False
+                    logger.warning(f"Criterion failed: {criterion}")
+                    logger.warning(f"  Output: {result.output}")
+
+                    if fail_fast:
+                        for pending in futures:
+                            if not isinstance(pending, CriterionResult):
+                                pending.cancel()
+                        break
+                elif result.method != "manual":
+                    logger.info(
+                        f"Criterion passed{' (cached)' if result.cached else ''}: "
+                        f"{criterion} [{result.duration_ms}ms]"
+                    )
+
+        self._remember(criteria, plans, input_hashes, results)
+
+        duration_ms = int((time.perf_counter() - start) * 1000)
+        if all_passed:
+            return EvaluationResult.success(results, duration_ms)
+        return EvaluationResult.failure(results, duration_ms)
+
+    def clear(self) -> None:
+        """Forget all remembered passes."""
+        self._passed.clear()
+
+    def _run_commands(self, commands: list[tuple[str, Future]], fail_fast: bool) -> None:
+        """Run command criteria one at a time, in criteria order."""
+        for index, (criterion, future) in enumerate(commands):
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = evaluate_criterion(criterion, self._work_dir)
+            except BaseException as e:
+                future.set_exception(e)
+                continue
+            future.set_result(result)
+
+            if fail_fast and not result.passed:
+                for _, pending in commands[index + 1:]:
+                    pending.cancel()
+                return
+
+    def _input_hash(self, method: str, args: tuple, tree_hash: str) -> str:
+        """Hash the inputs a check depends on."""
+        if method == "command":
+            return tree_hash
+        if method in ("line_count", "file_check"):
+            path = Path(args[0])
+            if not path.is_absolute():
+                path = self._work_dir / path
+            return self._hasher.file_hash(path)
+        return ""
+
+    def _reuse(self, criterion: str, method: str, input_hash: str) -> Optional[CriterionResult]:
+        """Get a remembered pass if the criterion's inputs are unchanged."""
+        if method == "manual":
+            return None
+        remembered = self._passed.get(criterion)
+        if remembered is None or remembered[0] != input_hash:
+            return None
+        previous = remembered[1]
         return CriterionResult(
             criterion=criterion,
-            passed=success,
-            method="file_check",
-            output=message,
+            passed=True,
+            method=previous.method,
+            output=previous.output,
+            cached=True,
         )
 
-    # Fall back to manual verification
-    return CriterionResult(
-        criterion=criterion,
-        passed=True,  # Assume pass for manual criteria
-        method="manual",
-        output="Requires manual verification",
-    )
+    def _remember(
+        self,
+        criteria: list[str],
+        plans: list[tuple[str, tuple]],
+        input_hashes: list[str],
+        results: list[CriterionResult],
+    ) -> None:
+        """Store passes and drop failures for the next attempt."""
+        # Commands may write files (caches, coverage); key their passes on
+        # the state they left behind so an untouched tree reuses them.
+        tree_after = None
+        for criterion, (method, _), input_hash, result in zip(criteria, plans, input_hashes, results):
+            if result.method == "manual" or result.cached:
+                continue
+            if not result.passed:
+                self._passed.pop(criterion, None)
+                continue
+            if method == "command":
+                if tree_after is None:
+                    tree_after = self._hasher.tree_hash(self._work_dir)
+                input_hash = tree_after
+            self._passed[criterion] = (input_hash, result)
 
 
 def evaluate_acceptance_criteria(
     criteria: list[str],
     work_dir: Optional[Path] = None,
     fail_fast: bool = False,
+    max_workers: int = CriteriaEvaluator.DEFAULT_MAX_WORKERS,
 ) -> EvaluationResult:
     """Evaluate all acceptance criteria for a task.
 
-    This is the main entry point for acceptance criteria evaluation.
-    It runs each criterion through automatic evaluation where possible.
+    This is the main entry point for one-off acceptance criteria
+    evaluation. Use a CriteriaEvaluator directly to reuse unchanged
+    passes across repeated evaluations.
 
     Args:
         criteria: List of acceptance criterion strings.
         work_dir: Working directory for execution.
         fail_fast: Stop on first failure if True.
+        max_workers: Maximum concurrent checks (1 = sequential).
 
     Returns:
         EvaluationResult with all results.
     """
-    if not criteria:
-        return EvaluationResult.success([])
-
-    results: list[CriterionResult] = []
-    all_passed = True
-
-    for criterion in criteria:
-        result = evaluate_criterion(criterion, work_dir)
-        results.append(result)
-
-        # Only count automated checks against pass/fail
-        if result.method != "manual" and not result.passed:
-            all_passed = False
-            logger.warning(f"Criterion failed: {criterion}")
-            logger.warning(f"  Output: {result.output}")
-
-            if fail_fast:
-                break
-        elif result.method != "manual":
-            logger.info(f"Criterion passed: {criterion}")
-
-    if all_passed:
-        return EvaluationResult.success(results)
-    return EvaluationResult.failure(results)
+    evaluator = CriteriaEvaluator(work_dir=work_dir, max_workers=max_workers)
+    return evaluator.evaluate(criteria, fail_fast=fail_fast)
 
 
 def criterion_mentions_keyword(criterion: str, keyword: str) -> bool:
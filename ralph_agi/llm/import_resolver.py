@@ -0,0 +1,321 @@
+"""Import resolution for code verification.
+
+Checking that a changed file's imports exist used to start a fresh
+``python -c "import X"`` per module per file. ImportResolver answers the
+same question with ``importlib`` finders against the search path the
+target interpreter would use from the file's directory, without
+executing any module code:
+
+- In-process (default): module specs are looked up with
+  ``importlib.machinery.PathFinder`` against an explicit path list, so
+  this process's sys.path and sys.modules are never touched.
+- Isolated: when the target interpreter differs from the current one
+  (e.g. a worktree virtualenv) or isolation is requested, lookups go to a
+  single long-lived worker subprocess running that interpreter.
+
+Results are cached per (interpreter, search path fingerprint, module).
+The fingerprint includes the mtime of every search path entry, so
+installing a package or adding a module invalidates affected entries.
+
+Usage:
+    from ralph_agi.llm.import_resolver import get_import_resolver
+
+    resolver = get_import_resolver()
+    missing = resolver.missing(["os", "requests"], Path("src/pkg"))
+"""
+
+from __future__ import annotations
+
+import hashlib
+import inspect
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def _find_module(name: str, path: list[str]) -> bool:
+    """Check whether a top-level module can be found on ``path``.
+
+    Consults the interpreter's meta path finders the way ``import`` would,
+    but with PathFinder restricted to ``path``. Also used verbatim as the
+    isolated worker's lookup function, so it must stay self-contained.
+    """
+    import importlib.machinery
+    import sys
+
+    if name in sys.builtin_module_names:
+        return True
+
+    for finder in sys.meta_path:
+        try:
+            if finder is importlib.machinery.PathFinder:
+                spec = importlib.machinery.PathFinder.find_spec(name, path)
+            else:
+                spec = finder.find_spec(name, None)
+        except (ImportError, ValueError, AttributeError, TypeError):
+            continue
+        if spec is not None:
+            return True
+    return False
+
+
+_WORKER_SOURCE = (
+    "import importlib, json, sys\n"
+    + inspect.getsource(_find_module)
+    + """
+for line in sys.stdin:
+    request = json.loads(line)
+    if request.get("invalidate"):
+        importlib.invalidate_caches()
+    found = {name: _find_module(name, request["path"]) for name in request["modules"]}
+    sys.stdout.write(json.dumps(found) + "\\n")
+    sys.stdout.flush()
+"""
+)
+
+
+class ImportResolver:
+    """Resolves top-level module names with a shared, invalidating cache.
+
+    Thread-safe. One resolver serves any number of directories; each
+    directory gets the interpreter's default search path with the
+    directory itself prepended, matching ``python -c`` run from there.
+
+    Attributes:
+        interpreter: Path to the Python interpreter being checked against
+        isolated: Whether lookups run in a worker subprocess
+    """
+
+    DEFAULT_MAX_ENTRIES = 10000
+
+    # Base search paths per interpreter, shared across resolvers
+    _base_paths: dict[str, list[str]] = {}
+    _base_paths_lock = threading.Lock()
+
+    def __init__(
+        self,
+        interpreter: Optional[str] = None,
+        isolated: bool = False,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """Initialize resolver.
+
+        Args:
+            interpreter: Interpreter to resolve for (default: sys.executable)
+            isolated: Force lookups into a worker subprocess even for the
+                current interpreter
+            max_entries: Cache size at which the cache is cleared
+        """
+        self._interpreter = interpreter or sys.executable
+        self._isolated = isolated or os.path.realpath(self._interpreter) != os.path.realpath(
+            sys.executable
+        )
+        self._max_entries = max_entries
+        self._cache: dict[tuple[str, str, str], bool] = {}
+        self._lock = threading.Lock()
+        self._worker: Optional[subprocess.Popen] = None
+        self._worker_fingerprint: Optional[str] = None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def interpreter(self) -> str:
+        """Get interpreter path."""
+        return self._interpreter
+
+    @property
+    def isolated(self) -> bool:
+        """Check whether lookups run in a worker subprocess."""
+        return self._isolated
+
+    def search_path(self, directory: Path) -> list[str]:
+        """Get the module search path for code run from ``directory``.
+
+        Args:
+            directory: Directory the importing file lives in
+
+        Returns:
+            List of path entries, most specific first
+        """
+        return [str(directory)] + self._base_path()
+
+    def resolve(self, module: str, directory: Path) -> bool:
+        """Check whether a top-level module is importable from a directory.
+
+        Args:
+            module: Top-level module name (e.g. "os", "requests")
+            directory: Directory the importing file lives in
+
+        Returns:
+            True if the module can be found. Lookup failures are treated
+            as resolvable so verification never blocks on the checker.
+        """
+        return self.resolve_many([module], directory)[module]
+
+    def missing(self, modules: Iterable[str], directory: Path) -> list[str]:
+        """Get the modules that cannot be found from a directory.
+
+        Args:
+            modules: Top-level module names
+            directory: Directory the importing file lives in
+
+        Returns:
+            Sorted list of unresolvable module names
+        """
+        results = self.resolve_many(modules, directory)
+        return sorted(name for name, found in results.items() if not found)
+
+    def resolve_many(self, modules: Iterable[str], directory: Path) -> dict[str, bool]:
+        """Resolve several top-level modules from one directory.
+
+        Args:
+            modules: Top-level module names
+            directory: Directory the importing file lives in
+
+        Returns:
+            Dict mapping each module name to whether it was found
+        """
+        path = self.search_path(directory)
+        fingerprint = self._fingerprint(path)
+
+        results: dict[str, bool] = {}
+        pending: list[str] = []
+        with self._lock:
+            for name in set(modules):
+                cached = self._cache.get((self._interpreter, fingerprint, name))
+                if cached is None:
+                    pending.append(name)
+                else:
+                    self.hits += 1
+                    results[name] = cached
+            self.misses += len(pending)
+
+        if not pending:
+            return results
+
+        try:
+            if self._isolated:
+                found = self._lookup_in_worker(pending, path, fingerprint)
+            else:
+                found = {name: _find_module(name, path) for name in pending}
+        except Exception as e:
+            logger.debug(f"Import lookup failed, assuming resolvable: {e}")
+            results.update({name: True for name in pending})
+            return results
+
+        with self._lock:
+            if len(self._cache) + len(found) > self._max_entries:
+                self._cache.clear()
+            for name, ok in found.items():
+                self._cache[(self._interpreter, fingerprint, name)] = ok
+        results.update(found)
+        return results
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        with self._lock:
+            self._cache.clear()
+        with self._base_paths_lock:
+            self._base_paths.pop(self._interpreter, None)
+
+    def close(self) -> None:
+        """Stop the worker subprocess, if running."""
+        with self._lock:
+            worker, self._worker = self._worker, None
+        if worker is not None:
+            try:
+                worker.stdin.close()
+                worker.wait(timeout=5)
+            except Exception:
+                worker.kill()
+
+    def _base_path(self) -> list[str]:
+        """Get the interpreter's sys.path, excluding the script directory."""
+        with self._base_paths_lock:
+            cached = self._base_paths.get(self._interpreter)
+        if cached is not None:
+            return cached
+
+        try:
+            result = subprocess.run(
+                [self._interpreter, "-c", "import json, sys; print(json.dumps(sys.path[1:]))"],
+                capture_output=True,
+                timeout=30,
+                check=True,
+                text=True,
+            )
+            base = json.loads(result.stdout)
+        except Exception as e:
+            logger.warning(f"Could not query sys.path of {self._interpreter}: {e}")
+            base = [p for p in sys.path[1:] if p]
+
+        with self._base_paths_lock:
+            self._base_paths[self._interpreter] = base
+        return base
+
+    @staticmethod
+    def _fingerprint(path: list[str]) -> str:
+        """Hash a search path together with the mtime of each entry."""
+        digest = hashlib.sha1()
+        for entry in path:
+            try:
+                mtime = os.stat(entry).st_mtime_ns
+            except OSError:
+                mtime = -1
+            digest.update(f"{entry}\0{mtime}\0".encode("utf-8", "surrogateescape"))
+        return digest.hexdigest()
+
+    def _lookup_in_worker(
+        self, modules: list[str], path: list[str], fingerprint: str
+    ) -> dict[str, bool]:
+        """Resolve modules in the long-lived worker, restarting it once."""
+        with self._lock:
+            for attempt in range(2):
+                if self._worker is None or self._worker.poll() is not None:
+                    self._worker = subprocess.Popen(
+                        [self._interpreter, "-c", _WORKER_SOURCE],
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        text=True,
+                    )
+                    self._worker_fingerprint = None
+                request = {
+                    "modules": modules,
+                    "path": path,
+                    # Directory mtimes changed: let FileFinders rescan
+                    "invalidate": fingerprint != self._worker_fingerprint,
+                }
+                try:
+                    self._worker.stdin.write(json.dumps(request) + "\n")
+                    self._worker.stdin.flush()
+                    line = self._worker.stdout.readline()
+                    if not line:
+                        raise BrokenPipeError("import worker exited")
+                    self._worker_fingerprint = fingerprint
+                    return json.loads(line)
+                except (BrokenPipeError, OSError, ValueError):
+                    self._worker.kill()
+                    self._worker = None
+                    if attempt:
+                        raise
+        raise RuntimeError("unreachable")
+
+
+_default_resolver: Optional[ImportResolver] = None
+_default_resolver_lock = threading.Lock()
+
+
+def get_import_resolver() -> ImportResolver:
+    """Get the process-wide resolver for the current interpreter."""
+    global _default_resolver
+    with _default_resolver_lock:
+        if _default_resolver is None:
+            _default_resolver = ImportResolver()
+        return _default_resolver
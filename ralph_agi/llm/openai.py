@@ -2,6 +2,10 @@
 
 This module provides GPT API integration for the Critic agent
 in the multi-agent architecture.
+
+stream_complete() streams text and yields each tool call as soon as the
+model moves on to the next one, so callers can start tools while later
+calls are still being generated.
 """
 
 from __future__ import annotations
@@ -19,9 +23,12 @@ from ralph_agi.llm.client import (
     ModelNotFoundError,
     RateLimitError,
     StopReason,
+    StreamEvent,
+    StreamEventType,
     Tool,
     ToolCall,
 )
+from ralph_agi.llm.rate_limit import RateGovernor, estimate_request_tokens, governed_call
 
 if TYPE_CHECKING:
     import openai
@@ -38,6 +45,7 @@ class OpenAIClient:
     Attributes:
         model: GPT model to use.
         timeout: Request timeout in seconds.
+        governor: Shared rate governor consulted before each call.
 
     Example:
         >>> client = OpenAIClient(model="gpt-4o")
@@ -49,6 +57,7 @@ class OpenAIClient:
     """
 
     DEFAULT_MODEL = "gpt-4o"
+    PROVIDER = "openai"
 
     def __init__(
         self,
@@ -56,6 +65,7 @@ class OpenAIClient:
         model: str = DEFAULT_MODEL,
         base_url: Optional[str] = None,
         timeout: float = 120.0,
+        governor: Optional[RateGovernor] = None,
     ):
         """Initialize the OpenAI client.
 
@@ -64,9 +74,11 @@ class OpenAIClient:
             model: GPT model to use. Default: gpt-4o
             base_url: Optional API base URL for proxies.
             timeout: Request timeout in seconds. Default: 120.0
+            governor: Optional RateGovernor shared with other clients.
         """
         self.model = model
         self.timeout = timeout
+        self.governor = governor
         self._api_key = api_key
         self._base_url = base_url
         self._client: Optional[openai.AsyncOpenAI] = None
@@ -283,12 +295,23 @@ class OpenAIClient:
         if stop_sequences:
             kwargs["stop"] = stop_sequences
 
-        try:
-            response = await self._client.chat.completions.create(**kwargs)
-            return self._parse_response(response)
-        except Exception as e:
-            self._handle_error(e)
-            raise  # Never reached, but makes type checker happy
+        async with governed_call(
+            self.governor, self.PROVIDER, self.model, self._estimate_tokens(kwargs)
+        ) as call:
+            try:
+                response = await self._client.chat.completions.create(**kwargs)
+                result = self._parse_response(response)
+            except Exception as e:
+                self._handle_error(e)
+                raise  # Never reached, but makes type checker happy
+            call.record(result.total_tokens)
+            return result
+
+    def _estimate_tokens(self, kwargs: dict[str, Any]) -> int:
+        """Estimate prompt tokens of a request for the rate governor."""
+        if self.governor is None:
+            return 0
+        return estimate_request_tokens(kwargs.get("tools"), kwargs["messages"])
 
     def _parse_response(self, response: Any) -> LLMResponse:
         """Parse OpenAI response into LLMResponse.
@@ -446,11 +469,140 @@ class OpenAIClient:
 
         if tools:
             kwargs["tools"] = self._convert_tools(tools)
+        estimate = self._estimate_tokens(kwargs)
+
+        async with governed_call(self.governor, self.PROVIDER, self.model, estimate) as call:
+            try:
+                stream = await self._client.chat.completions.create(**kwargs)
+                async for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+            except Exception as e:
+                self._handle_error(e)
+            call.record(estimate)  # Stream usage isn't surfaced; charge the estimate
+
+    async def stream_complete(
+        self,
+        messages: list[dict[str, Any]],
+        system: Optional[str] = None,
+        tools: Optional[list[Tool]] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        stop_sequences: Optional[list[str]] = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """Stream a completion from GPT, including tool calls.
 
-        try:
-            stream = await self._client.chat.completions.create(**kwargs)
-            async for chunk in stream:
-                if chunk.choices and chunk.choices[0].delta.content:
-                    yield chunk.choices[0].delta.content
-        except Exception as e:
-            self._handle_error(e)
+        Tool call deltas arrive by index; a call is complete once a delta
+        for a later index (or the finish reason) arrives, and is yielded
+        then.
+
+        Args:
+            messages: Conversation history as list of message dicts.
+            system: Optional system prompt (prepended to messages).
+            tools: Optional list of tools available to GPT.
+            max_tokens: Maximum tokens to generate. Default: 4096
+            temperature: Sampling temperature. Default: 0.0 (deterministic)
+            stop_sequences: Optional stop sequences.
+
+        Yields:
+            TEXT and TOOL_CALL events, then a DONE event carrying the
+            assembled LLMResponse.
+
+        Raises:
+            LLMError: On API errors (same mapping as complete()).
+        """
+        import json
+
+        self._ensure_client()
+        assert self._client is not None
+
+        kwargs: dict[str, Any] = {
+            "model": self.model,
+            "messages": self._build_messages(messages, system),
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stream": True,
+            "stream_options": {"include_usage": True},
+        }
+
+        if tools:
+            kwargs["tools"] = self._convert_tools(tools)
+        if stop_sequences:
+            kwargs["stop"] = stop_sequences
+
+        def finish(entry: list[Any]) -> ToolCall:
+            tool_id, name, chunks = entry
+            try:
+                arguments = json.loads("".join(chunks)) if chunks else {}
+            except json.JSONDecodeError:
+                arguments = {}
+            return ToolCall(
+                id=tool_id,
+                name=name,
+                arguments=arguments if isinstance(arguments, dict) else {},
+            )
+
+        async with governed_call(
+            self.governor, self.PROVIDER, self.model, self._estimate_tokens(kwargs)
+        ) as call:
+            text_parts: list[str] = []
+            tool_calls: list[ToolCall] = []
+            # Tool calls still being generated by index: [id, name, argument chunks]
+            pending: dict[int, list[Any]] = {}
+            usage: dict[str, int] = {}
+            model = self.model
+            finish_reason: Optional[str] = None
+
+            try:
+                stream = await self._client.chat.completions.create(**kwargs)
+                async for chunk in stream:
+                    model = getattr(chunk, "model", None) or model
+                    if getattr(chunk, "usage", None) is not None:
+                        usage = {
+                            "input_tokens": chunk.usage.prompt_tokens,
+                            "output_tokens": chunk.usage.completion_tokens,
+                        }
+                    if not chunk.choices:
+                        continue
+                    choice = chunk.choices[0]
+                    delta = choice.delta
+                    if delta.content:
+                        text_parts.append(delta.content)
+                        yield StreamEvent(StreamEventType.TEXT, text=delta.content)
+                    for tc in delta.tool_calls or []:
+                        # A new index means every earlier call is complete
+                        for index in sorted(i for i in pending if i < tc.index):
+                            tool_calls.append(finish(pending.pop(index)))
+                            yield StreamEvent(StreamEventType.TOOL_CALL, tool_call=tool_calls[-1])
+                        entry = pending.setdefault(tc.index, [None, "", []])
+                        if tc.id:
+                            entry[0] = tc.id
+                        if tc.function is not None:
+                            if tc.function.name:
+                                entry[1] = tc.function.name
+                            if tc.function.arguments:
+                                entry[2].append(tc.function.arguments)
+                    if choice.finish_reason:
+                        finish_reason = choice.finish_reason
+                        for index in sorted(pending):
+                            tool_calls.append(finish(pending.pop(index)))
+                            yield StreamEvent(StreamEventType.TOOL_CALL, tool_call=tool_calls[-1])
+            except Exception as e:
+                self._handle_error(e)
+
+            for index in sorted(pending):
+                tool_calls.append(finish(pending.pop(index)))
+                yield StreamEvent(StreamEventType.TOOL_CALL, tool_call=tool_calls[-1])
+
+            result = LLMResponse(
+                content="".join(text_parts),
+                stop_reason=self._map_stop_reason(finish_reason),
+                tool_calls=tool_calls,
+                usage={
+                    "input_tokens": usage.get("input_tokens", 0),
+                    "output_tokens": usage.get("output_tokens", 0),
+                },
+                model=model,
+            )
+            call.record(result.total_tokens)
+            yield StreamEvent(StreamEventType.DONE, response=result)
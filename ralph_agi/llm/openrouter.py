@@ -21,6 +21,7 @@ from ralph_agi.llm.client import (
     Tool,
 )
 from ralph_agi.llm.openai import OpenAIClient
+from ralph_agi.llm.rate_limit import RateGovernor
 
 if TYPE_CHECKING:
     import openai
@@ -84,6 +85,7 @@ class OpenRouterClient(OpenAIClient):
 
     OPENROUTER_BASE_URL = "https://openrouter.ai/api/v1"
     DEFAULT_MODEL = "anthropic/claude-sonnet-4.5"
+    PROVIDER = "openrouter"
 
     def __init__(
         self,
@@ -92,6 +94,7 @@ class OpenRouterClient(OpenAIClient):
         timeout: float = 120.0,
         site_url: Optional[str] = None,
         app_name: Optional[str] = None,
+        governor: Optional[RateGovernor] = None,
     ):
         """Initialize the OpenRouter client.
 
@@ -102,6 +105,7 @@ class OpenRouterClient(OpenAIClient):
             timeout: Request timeout in seconds. Default: 120.0
             site_url: Optional URL for your site (for OpenRouter analytics).
             app_name: Optional app name (for OpenRouter analytics).
+            governor: Optional RateGovernor shared with other clients.
         """
         # Resolve model alias if provided
         resolved_model = MODELS.get(model, model)
@@ -112,6 +116,7 @@ class OpenRouterClient(OpenAIClient):
             model=resolved_model,
             base_url=self.OPENROUTER_BASE_URL,
             timeout=timeout,
+            governor=governor,
         )
 
         self.site_url = site_url
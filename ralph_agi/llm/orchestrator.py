@@ -46,12 +46,25 @@ class TokenUsage:
         builder_output: Output tokens used by Builder.
         critic_input: Input tokens used by Critic.
         critic_output: Output tokens used by Critic.
+        builder_cache_read: Builder prompt tokens read from the prompt cache.
+        builder_cache_write: Builder prompt tokens written to the prompt cache.
+        builder_calls: Builder LLM calls made.
+        builder_prompt_tokens: Builder prompt tokens (input plus cache) sent.
+        builder_peak_prompt: Largest single Builder prompt.
+        builder_context_saved: Estimated Builder prompt tokens elided by
+            the context window.
     """
 
     builder_input: int = 0
     builder_output: int = 0
     critic_input: int = 0
     critic_output: int = 0
+    builder_cache_read: int = 0
+    builder_cache_write: int = 0
+    builder_calls: int = 0
+    builder_prompt_tokens: int = 0
+    builder_peak_prompt: int = 0
+    builder_context_saved: int = 0
 
     @property
     def total_input(self) -> int:
@@ -68,11 +81,35 @@ class TokenUsage:
         """Total tokens used."""
         return self.total_input + self.total_output
 
-    def add_builder_usage(self, tokens: int) -> None:
-        """Add tokens from Builder execution."""
-        # Estimate 70/30 split for input/output
-        self.builder_input += int(tokens * 0.7)
-        self.builder_output += int(tokens * 0.3)
+    def add_builder_usage(self, input_tokens: int, output_tokens: int) -> None:
+        """Add input and output tokens reported by Builder execution."""
+        self.builder_input += input_tokens
+        self.builder_output += output_tokens
+
+    @property
+    def cache_hit_ratio(self) -> float:
+        """Share of Builder prompt tokens served from the prompt cache."""
+        prompt = self.builder_input + self.builder_cache_read + self.builder_cache_write
+        return self.builder_cache_read / prompt if prompt else 0.0
+
+    def add_builder_cache_usage(self, read: int, write: int) -> None:
+        """Add prompt cache tokens from Builder execution."""
+        self.builder_cache_read += read
+        self.builder_cache_write += write
+
+    @property
+    def builder_prompt_per_call(self) -> float:
+        """Average Builder prompt size per LLM call."""
+        return self.builder_prompt_tokens / self.builder_calls if self.builder_calls else 0.0
+
+    def add_builder_window_usage(self, result: BuilderResult) -> None:
+        """Add per-call prompt sizes and context window savings from a Builder run."""
+        self.builder_calls += result.iterations
+        self.builder_prompt_tokens += (
+            result.input_tokens + result.cache_read_tokens + result.cache_write_tokens
+        )
+        self.builder_peak_prompt = max(self.builder_peak_prompt, result.peak_prompt_tokens)
+        self.builder_context_saved += result.context_tokens_saved
 
     def add_critic_usage(self, tokens: int) -> None:
         """Add tokens from Critic execution."""
@@ -127,15 +164,17 @@ class LLMOrchestrator:
     The orchestrator:
     1. Executes the Builder agent on a task
     2. Optionally passes results to Critic for review
-    3. Handles rate limits with exponential backoff
+    3. Handles rate limits: the Builder retries individual LLM calls
+       itself and reports exhausted retries as RATE_LIMITED; Critic
+       reviews are retried here with exponential backoff
     4. Tracks token usage across agents
 
     Attributes:
         builder: Builder agent instance.
         critic: Critic agent instance (optional).
         critic_enabled: Whether to run Critic reviews.
-        max_rate_limit_retries: Max retries on rate limit.
-        base_retry_delay: Initial delay for exponential backoff.
+        max_rate_limit_retries: Max Critic retries on rate limit.
+        base_retry_delay: Initial delay for Critic retry backoff.
 
     Example:
         >>> orchestrator = LLMOrchestrator(builder, critic)
@@ -161,8 +200,8 @@ class LLMOrchestrator:
             builder: Builder agent for task execution.
             critic: Critic agent for review (optional).
             critic_enabled: Whether to run Critic reviews.
-            max_rate_limit_retries: Max retries on rate limit errors.
-            base_retry_delay: Initial delay in seconds for retry backoff.
+            max_rate_limit_retries: Max Critic retries on rate limit errors.
+            base_retry_delay: Initial delay in seconds for Critic retry backoff.
         """
         self._builder = builder
         self._critic = critic
@@ -193,55 +232,43 @@ class LLMOrchestrator:
 
         logger.info(f"Orchestrator starting task: {task.get('title', 'Unknown')}")
 
-        # Execute Builder with rate limit retry
-        builder_result: Optional[BuilderResult] = None
-
-        for attempt in range(self._max_rate_limit_retries + 1):
-            try:
-                builder_result = await self._builder.execute(
-                    task=task,
-                    tools=tools,
-                    context=context,
-                    memory_context=memory_context,
-                )
-                token_usage.add_builder_usage(builder_result.total_tokens)
-                break
-
-            except RateLimitError as e:
-                rate_limit_retries += 1
-                if attempt >= self._max_rate_limit_retries:
-                    logger.error(f"Rate limit retries exhausted: {e}")
-                    return OrchestratorResult(
-                        status=OrchestratorStatus.MAX_RETRIES,
-                        task=task,
-                        token_usage=token_usage,
-                        rate_limit_retries=rate_limit_retries,
-                        error=str(e),
-                    )
-
-                # Exponential backoff
-                delay = self._calculate_retry_delay(attempt, e.retry_after)
-                logger.warning(f"Rate limited, retrying in {delay:.1f}s (attempt {attempt + 1})")
-                await asyncio.sleep(delay)
-
-            except LLMError as e:
-                logger.error(f"Builder LLM error: {e}")
-                return OrchestratorResult(
-                    status=OrchestratorStatus.ERROR,
-                    task=task,
-                    token_usage=token_usage,
-                    error=str(e),
-                )
-
-        if builder_result is None:
+        # Execute Builder (it retries rate-limited LLM calls itself)
+        try:
+            builder_result = await self._builder.execute(
+                task=task,
+                tools=tools,
+                context=context,
+                memory_context=memory_context,
+            )
+        except LLMError as e:
+            logger.error(f"Builder LLM error: {e}")
             return OrchestratorResult(
                 status=OrchestratorStatus.ERROR,
                 task=task,
                 token_usage=token_usage,
-                error="Builder did not produce a result",
+                error=str(e),
             )
 
+        token_usage.add_builder_usage(builder_result.input_tokens, builder_result.output_tokens)
+        token_usage.add_builder_cache_usage(
+            builder_result.cache_read_tokens, builder_result.cache_write_tokens
+        )
+        token_usage.add_builder_window_usage(builder_result)
+        rate_limit_retries += builder_result.rate_limit_retries
+
         # Check Builder result
+        if builder_result.status == AgentStatus.RATE_LIMITED:
+            logger.error(f"Builder rate limit retries exhausted: {builder_result.error}")
+            return OrchestratorResult(
+                status=OrchestratorStatus.MAX_RETRIES,
+                task=task,
+                builder_result=builder_result,
+                token_usage=token_usage,
+                iterations=builder_result.iterations,
+                rate_limit_retries=rate_limit_retries,
+                error=builder_result.error,
+            )
+
         if builder_result.status == AgentStatus.BLOCKED:
             logger.warning(f"Builder blocked: {builder_result.error}")
             return OrchestratorResult(
@@ -0,0 +1,459 @@
+"""Shared rate governor for LLM calls.
+
+Every RalphLoop, API task callback and batch worker builds its own LLM
+clients, so without coordination N parallel workers each assume they
+have the whole provider quota, trip 429s together and back off
+together. RateGovernor is the single place they ask before sending:
+
+- Token buckets per ``provider:model`` for requests/minute and
+  tokens/minute, refilled continuously.
+- An optional cap on concurrent in-flight requests.
+- A shared pause after a 429, so one worker's ``retry_after`` holds back
+  every worker instead of each discovering the limit on its own.
+
+Clients reserve the estimated prompt size before a call and report the
+actual usage afterwards, which refunds or charges the difference.
+
+The governor is shared across threads as one in-process object (see
+``shared_governor``). With ``state_path`` set the bucket state lives in
+a small JSON file guarded by a file lock (``flock``, or ``msvcrt`` on
+Windows), so worker processes started by BatchExecutor draw from the
+same budget. Async callers read and write that file in a worker thread.
+
+Usage:
+    from ralph_agi.llm.rate_limit import RateGovernor, RateLimits
+
+    governor = RateGovernor(RateLimits(requests_per_minute=50, tokens_per_minute=40_000))
+    client = AnthropicClient(governor=governor)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import uuid
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Callable, Iterator, Optional
+
+from ralph_agi.llm.client import RateLimitError
+
+# Cross-platform file locking
+if sys.platform == "win32":
+    import msvcrt
+
+    HAS_FCNTL = False
+else:
+    import fcntl
+
+    HAS_FCNTL = True
+
+logger = logging.getLogger(__name__)
+
+# Pause applied after a 429 without retry-after
+DEFAULT_PENALTY = 5.0
+
+# Longest single sleep while waiting, so state changes are picked up
+MAX_POLL_INTERVAL = 1.0
+
+# In-flight slots older than this are assumed leaked
+STALE_SLOT_SECONDS = 900.0
+
+
+@dataclass(frozen=True)
+class RateLimits:
+    """Limits for one provider/model. Zero means unlimited.
+
+    Attributes:
+        requests_per_minute: Requests allowed per minute.
+        tokens_per_minute: Tokens (input plus output) allowed per minute.
+        max_concurrent: Requests allowed in flight at once.
+    """
+
+    requests_per_minute: int = 0
+    tokens_per_minute: int = 0
+    max_concurrent: int = 0
+
+    def __post_init__(self) -> None:
+        if min(self.requests_per_minute, self.tokens_per_minute, self.max_concurrent) < 0:
+            raise ValueError("rate limits must be non-negative")
+
+    @property
+    def unlimited(self) -> bool:
+        """True if no limit is set."""
+        return not (self.requests_per_minute or self.tokens_per_minute or self.max_concurrent)
+
+
+@dataclass
+class Reservation:
+    """Capacity granted for one LLM call.
+
+    Attributes:
+        key: Bucket key (``provider:model``).
+        tokens: Tokens reserved up front (the estimate).
+        slot: In-flight slot id, if concurrency is limited.
+        waited: Seconds spent waiting for capacity.
+    """
+
+    key: str
+    tokens: int
+    slot: Optional[str] = None
+    waited: float = 0.0
+
+
+def estimate_request_tokens(*parts: Any) -> int:
+    """Estimate prompt tokens of request parts (~4 characters per token)."""
+    return sum(len(json.dumps(part, default=str)) for part in parts if part) // 4 + 1
+
+
+class RateGovernor:
+    """Token-bucket rate limiter and concurrency cap shared by LLM clients.
+
+    Thread-safe; with ``state_path`` also process-safe.
+
+    Attributes:
+        limits: Default limits for every provider/model.
+        overrides: Limits per ``provider`` or ``provider:model`` key.
+        state_path: Shared state file for cross-process use, or None.
+    """
+
+    def __init__(
+        self,
+        limits: Optional[RateLimits] = None,
+        overrides: Optional[dict[str, RateLimits]] = None,
+        state_path: Optional[str | Path] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the governor.
+
+        Args:
+            limits: Default limits for every provider/model.
+            overrides: Limits per ``provider`` or ``provider:model`` key.
+            state_path: JSON file holding bucket state shared between
+                processes. None keeps state in memory.
+            clock: Wall-clock source (shared across processes, so not
+                monotonic).
+        """
+        self.limits = limits or RateLimits()
+        self.overrides = dict(overrides or {})
+        self.state_path = Path(state_path) if state_path else None
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._memory: dict[str, Any] = {}
+        if self.state_path:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+
+    def limits_for(self, provider: str, model: str) -> RateLimits:
+        """Limits for a provider/model (most specific override wins)."""
+        return self.overrides.get(
+            f"{provider}:{model}", self.overrides.get(provider, self.limits)
+        )
+
+    async def acquire(self, provider: str, model: str, tokens: int) -> Reservation:
+        """Wait until the call fits within the limits, then reserve it.
+
+        Args:
+            provider: Provider name (anthropic, openai, openrouter).
+            model: Model name.
+            tokens: Estimated tokens for the call.
+
+        Returns:
+            Reservation to pass to release() once the call finishes.
+        """
+        start = self._clock()
+        while True:
+            reservation, wait = await self._off_loop(self.try_acquire, provider, model, tokens)
+            if reservation is not None:
+                reservation.waited = self._clock() - start
+                if reservation.waited > 0.5:
+                    logger.debug(f"Rate governor held {reservation.key} for {reservation.waited:.1f}s")
+                return reservation
+            await asyncio.sleep(min(wait, MAX_POLL_INTERVAL))
+
+    def try_acquire(
+        self, provider: str, model: str, tokens: int
+    ) -> tuple[Optional[Reservation], float]:
+        """Reserve capacity if available right now.
+
+        Args:
+            provider: Provider name.
+            model: Model name.
+            tokens: Estimated tokens for the call.
+
+        Returns:
+            (reservation, 0.0) if granted, else (None, seconds to wait).
+        """
+        limits = self.limits_for(provider, model)
+        key = f"{provider}:{model}"
+        if limits.unlimited:
+            return Reservation(key=key, tokens=0), 0.0
+
+        with self._state() as state:
+            now = self._clock()
+            bucket = self._bucket(state, key, limits, now)
+
+            if bucket["paused_until"] > now:
+                return None, bucket["paused_until"] - now
+
+            slots = bucket["slots"]
+            if limits.max_concurrent:
+                self._prune_slots(slots, now)
+                if len(slots) >= limits.max_concurrent:
+                    return None, 0.05
+
+            wait = 0.0
+            if limits.requests_per_minute and bucket["requests"] < 1:
+                wait = (1 - bucket["requests"]) * 60 / limits.requests_per_minute
+            # A call larger than the whole bucket goes once the bucket is full
+            needed = min(tokens, limits.tokens_per_minute)
+            if limits.tokens_per_minute and bucket["tokens"] < needed:
+                wait = max(wait, (needed - bucket["tokens"]) * 60 / limits.tokens_per_minute)
+            if wait > 0:
+                return None, wait
+
+            if limits.requests_per_minute:
+                bucket["requests"] -= 1
+            if limits.tokens_per_minute:
+                bucket["tokens"] -= tokens
+            slot = None
+            if limits.max_concurrent:
+                slot = uuid.uuid4().hex[:12]
+                slots[slot] = [os.getpid(), now]
+            return Reservation(key=key, tokens=tokens if limits.tokens_per_minute else 0, slot=slot), 0.0
+
+    def release(
+        self,
+        reservation: Reservation,
+        actual_tokens: Optional[int] = None,
+        retry_after: Optional[float] = None,
+        rate_limited: bool = False,
+    ) -> None:
+        """Finish a call: free its slot and settle its token usage.
+
+        Args:
+            reservation: Reservation returned by acquire().
+            actual_tokens: Tokens the call really used; None refunds the
+                estimate (the request failed before using any).
+            retry_after: Server-requested delay after a 429.
+            rate_limited: The call was rejected with a 429; pauses the
+                bucket for ``retry_after`` (or DEFAULT_PENALTY).
+        """
+        provider, _, model = reservation.key.partition(":")
+        limits = self.limits_for(provider, model)
+        if limits.unlimited:
+            return
+        with self._state() as state:
+            now = self._clock()
+            bucket = self._bucket(state, reservation.key, limits, now)
+            if reservation.slot:
+                bucket["slots"].pop(reservation.slot, None)
+            if limits.tokens_per_minute:
+                used = actual_tokens if actual_tokens is not None else 0
+                bucket["tokens"] = min(
+                    limits.tokens_per_minute, bucket["tokens"] + reservation.tokens - used
+                )
+            if rate_limited:
+                pause = retry_after if retry_after is not None else DEFAULT_PENALTY
+                bucket["paused_until"] = max(bucket["paused_until"], now + pause)
+                logger.warning(f"Rate governor: {reservation.key} rate limited, pausing all callers {pause:.1f}s")
+
+    async def release_async(
+        self,
+        reservation: Reservation,
+        actual_tokens: Optional[int] = None,
+        retry_after: Optional[float] = None,
+        rate_limited: bool = False,
+    ) -> None:
+        """release() for async callers; see release()."""
+        await self._off_loop(
+            self.release, reservation, actual_tokens, retry_after, rate_limited
+        )
+
+    async def _off_loop(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Call func, in a worker thread if it takes the state file lock."""
+        if self.state_path is None:
+            return func(*args)
+        return await asyncio.to_thread(func, *args)
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Current bucket levels per key (for metrics and debugging)."""
+        with self._state() as state:
+            return json.loads(json.dumps(state))
+
+    @contextmanager
+    def _state(self) -> Iterator[dict[str, Any]]:
+        """Lock and yield the bucket state, persisting it afterwards."""
+        with self._lock:
+            if self.state_path is None:
+                yield self._memory
+                return
+            fd = os.open(self.state_path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                _lock_fd(fd)
+                raw = b""
+                while chunk := os.read(fd, 65536):
+                    raw += chunk
+                try:
+                    state = json.loads(raw) if raw else {}
+                except json.JSONDecodeError:
+                    logger.warning(f"Rate governor state {self.state_path} is corrupt, resetting")
+                    state = {}
+                yield state
+                data = json.dumps(state).encode()
+                os.lseek(fd, 0, os.SEEK_SET)
+                os.ftruncate(fd, 0)
+                os.write(fd, data)
+            finally:
+                os.close(fd)  # Releases the lock
+
+    @staticmethod
+    def _bucket(state: dict[str, Any], key: str, limits: RateLimits, now: float) -> dict[str, Any]:
+        """Get the bucket for a key, refilled up to ``now``."""
+        bucket = state.get(key)
+        if bucket is None:
+            bucket = state[key] = {
+                "requests": float(limits.requests_per_minute),
+                "tokens": float(limits.tokens_per_minute),
+                "updated": now,
+                "paused_until": 0.0,
+                "slots": {},
+            }
+            return bucket
+        elapsed = max(0.0, now - bucket["updated"])
+        if limits.requests_per_minute:
+            bucket["requests"] = min(
+                float(limits.requests_per_minute),
+                bucket["requests"] + elapsed * limits.requests_per_minute / 60,
+            )
+        if limits.tokens_per_minute:
+            bucket["tokens"] = min(
+                float(limits.tokens_per_minute),
+                bucket["tokens"] + elapsed * limits.tokens_per_minute / 60,
+            )
+        bucket["updated"] = now
+        return bucket
+
+    @staticmethod
+    def _prune_slots(slots: dict[str, list], now: float) -> None:
+        """Drop slots held by dead processes or leaked long ago."""
+        for slot, (pid, started) in list(slots.items()):
+            if now - started > STALE_SLOT_SECONDS or not _pid_alive(pid):
+                del slots[slot]
+
+
+def _lock_fd(fd: int) -> None:
+    """Take an exclusive lock on a file, held until it is closed."""
+    if HAS_FCNTL:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    else:
+        # Windows: lock the first byte (LK_LOCK retries for up to 10s)
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+
+def _pid_alive(pid: int) -> bool:
+    if pid == os.getpid():
+        return True
+    if not HAS_FCNTL:
+        # os.kill(pid, 0) terminates the process on Windows; leaked slots
+        # there expire after STALE_SLOT_SECONDS instead
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+@dataclass
+class CallUsage:
+    """Usage reported back from inside a governed_call block.
+
+    Attributes:
+        tokens: Tokens the call actually used, or None if unknown.
+    """
+
+    tokens: Optional[int] = None
+
+    def record(self, tokens: int) -> None:
+        """Record the tokens the call actually used."""
+        self.tokens = tokens
+
+
+@asynccontextmanager
+async def governed_call(
+    governor: Optional[RateGovernor], provider: str, model: str, tokens: int
+) -> AsyncIterator[CallUsage]:
+    """Wrap one LLM call with a governor.
+
+    Acquires capacity before the block runs. Afterwards it releases the
+    capacity, charging the usage recorded in the block, or pausing the
+    bucket if the block raised RateLimitError. A no-op when ``governor``
+    is None.
+
+    Args:
+        governor: Governor to consult, or None.
+        provider: Provider name.
+        model: Model name.
+        tokens: Estimated tokens for the call.
+
+    Yields:
+        CallUsage to record the actual token usage on.
+
+    Example:
+        >>> async with governed_call(self.governor, "anthropic", self.model, estimate) as call:
+        ...     response = await send()
+        ...     call.record(response.total_tokens)
+    """
+    usage = CallUsage()
+    if governor is None:
+        yield usage
+        return
+    reservation = await governor.acquire(provider, model, tokens)
+    try:
+        yield usage
+    except RateLimitError as e:
+        await governor.release_async(reservation, retry_after=e.retry_after, rate_limited=True)
+        raise
+    except BaseException:
+        # May be a cancellation: release without awaiting so it can't be skipped
+        governor.release(reservation)
+        raise
+    await governor.release_async(reservation, actual_tokens=usage.tokens)
+
+
+_shared: dict[tuple[RateLimits, Optional[str]], RateGovernor] = {}
+_shared_lock = threading.Lock()
+
+
+def shared_governor(
+    limits: RateLimits, state_path: Optional[str | Path] = None
+) -> Optional[RateGovernor]:
+    """Process-wide governor for the given limits and state file.
+
+    Clients created anywhere in the process with the same settings get
+    the same governor, so threads share one budget.
+
+    Args:
+        limits: Limits applied to every provider/model.
+        state_path: Shared state file for cross-process limits.
+
+    Returns:
+        The shared RateGovernor, or None if ``limits`` is unlimited.
+    """
+    if limits.unlimited:
+        return None
+    key = (limits, str(Path(state_path).resolve()) if state_path else None)
+    with _shared_lock:
+        governor = _shared.get(key)
+        if governor is None:
+            governor = _shared[key] = RateGovernor(limits, state_path=state_path)
+        return governor
@@ -0,0 +1,409 @@
+"""Record/replay LLM client for deterministic runs and benchmarks.
+
+ReplayLLMClient wraps another client in ``record`` mode and appends every
+request/response pair to a JSONL transcript. In ``replay`` mode it
+serves those responses back without calling a provider, so a whole
+RalphLoop, ParallelExecutor or BatchExecutor run can be repeated and
+timed with provider latency taken out of the picture.
+
+Requests are matched by a hash of the canonical request. Volatile
+details are scrubbed before hashing: timestamps, durations, commit SHAs
+and UUIDs. If nothing matches exactly, the client falls back to the same
+turn of the same conversation. A conversation is identified by its
+system prompt and first user message. A request that matches neither
+raises ReplayMiss.
+
+Transcripts are shared safely: writers append whole lines under a file
+lock (``flock``, or ``msvcrt`` on Windows), so batch workers can record
+into one file.
+
+Usage:
+    from ralph_agi.llm.replay import ReplayLLMClient
+
+    recorder = ReplayLLMClient("session.jsonl", mode="record", client=AnthropicClient())
+    player = ReplayLLMClient("session.jsonl", mode="replay")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional, Sequence
+
+from ralph_agi.llm.client import (
+    LLMError,
+    LLMResponse,
+    StopReason,
+    StreamEvent,
+    StreamEventType,
+    Tool,
+    ToolCall,
+)
+
+# Cross-platform file locking
+if sys.platform == "win32":
+    import msvcrt
+
+    HAS_FCNTL = False
+else:
+    import fcntl
+
+    HAS_FCNTL = True
+
+logger = logging.getLogger(__name__)
+
+REPLAY_MODES = ("record", "replay")
+
+# Request details that change between otherwise identical runs
+DEFAULT_SCRUB_PATTERNS = (
+    r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?",  # Timestamps
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",  # UUIDs
+    r"\b[0-9a-f]{7,40}\b",  # Commit SHAs
+    r"\b\d+(?:\.\d+)?m?s\b",  # Durations
+)
+
+
+class ReplayMiss(LLMError):
+    """No recorded response matches a request in replay mode."""
+
+    def __init__(self, message: str):
+        super().__init__(message, retryable=False)
+
+
+class ReplayLLMClient:
+    """LLM client that records sessions to disk and replays them.
+
+    Attributes:
+        path: JSONL transcript file.
+        mode: ``record`` or ``replay``.
+        model: Model name reported on replayed responses.
+        latency_scale: Replayed calls sleep for the recorded latency
+            times this factor (0 = return immediately).
+        calls: Completions served or recorded by this client.
+        exact_hits: Replayed requests that matched exactly.
+        turn_hits: Replayed requests matched by conversation and turn.
+        replay_seconds: Time spent serving replayed calls.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        mode: str = "replay",
+        client: Any = None,
+        model: str = "",
+        latency_scale: float = 0.0,
+        scrub_patterns: Sequence[str] = DEFAULT_SCRUB_PATTERNS,
+    ):
+        """Initialize the client.
+
+        Args:
+            path: JSONL transcript file (created in record mode).
+            mode: ``record`` (call ``client`` and save) or ``replay``.
+            client: Client to record from (required in record mode).
+            model: Model name reported on replayed responses.
+            latency_scale: Factor applied to recorded latencies on replay.
+            scrub_patterns: Regexes for volatile request details that are
+                ignored when matching.
+
+        Raises:
+            ValueError: If the mode is unknown or record mode has no client.
+        """
+        if mode not in REPLAY_MODES:
+            raise ValueError(f"mode must be one of {REPLAY_MODES}, got {mode!r}")
+        if mode == "record" and client is None:
+            raise ValueError("record mode needs a client to record from")
+        self.path = Path(path)
+        self.mode = mode
+        self.model = model or getattr(client, "model", "")
+        self.latency_scale = latency_scale
+        self.calls = 0
+        self.exact_hits = 0
+        self.turn_hits = 0
+        self.replay_seconds = 0.0
+        self._client = client
+        self._scrub = re.compile("|".join(f"(?:{p})" for p in scrub_patterns)) if scrub_patterns else None
+        self._lock = threading.Lock()
+        self._by_key: Optional[dict[str, deque]] = None
+        self._by_turn: dict[tuple[str, int], deque] = {}
+
+    @property
+    def governor(self) -> Any:
+        """Rate governor of the recorded client (None on replay)."""
+        return getattr(self._client, "governor", None)
+
+    def request_keys(
+        self,
+        messages: list[dict[str, Any]],
+        system: Optional[str] = None,
+        tools: Optional[list[Tool]] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        stop_sequences: Optional[list[str]] = None,
+    ) -> tuple[str, str, int]:
+        """Compute the matching keys for a request.
+
+        Args:
+            messages: Conversation history.
+            system: System prompt.
+            tools: Tools offered to the model.
+            max_tokens: Maximum tokens to generate.
+            temperature: Sampling temperature.
+            stop_sequences: Stop sequences.
+
+        Returns:
+            (request key, conversation key, turn) where turn counts the
+            assistant messages already in the history.
+        """
+        request = {
+            "system": system,
+            "messages": messages,
+            "tools": [[t.name, t.description, t.input_schema] for t in tools or []],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stop_sequences": stop_sequences,
+        }
+        first_user = next((m for m in messages if m.get("role") == "user"), None)
+        turn = sum(1 for m in messages if m.get("role") == "assistant")
+        return (
+            self._digest(request),
+            self._digest({"system": system, "first": first_user}),
+            turn,
+        )
+
+    async def complete(
+        self,
+        messages: list[dict[str, Any]],
+        system: Optional[str] = None,
+        tools: Optional[list[Tool]] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        stop_sequences: Optional[list[str]] = None,
+    ) -> LLMResponse:
+        """Record or replay a completion.
+
+        Args:
+            messages: Conversation history as list of message dicts.
+            system: Optional system prompt.
+            tools: Optional list of tools available to the LLM.
+            max_tokens: Maximum tokens to generate.
+            temperature: Sampling temperature.
+            stop_sequences: Optional stop sequences.
+
+        Returns:
+            The recorded client's response, or the replayed one.
+
+        Raises:
+            ReplayMiss: In replay mode, if no recorded response matches.
+            LLMError: Errors from the recorded client pass through
+                (and are not recorded).
+        """
+        keys = self.request_keys(messages, system, tools, max_tokens, temperature, stop_sequences)
+        if self.mode == "replay":
+            return await self._replay(keys)
+
+        start = time.perf_counter()
+        response = await self._client.complete(
+            messages=messages,
+            system=system,
+            tools=tools,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stop_sequences=stop_sequences,
+        )
+        self._record(keys, response, time.perf_counter() - start)
+        return response
+
+    async def stream_complete(
+        self,
+        messages: list[dict[str, Any]],
+        system: Optional[str] = None,
+        tools: Optional[list[Tool]] = None,
+        max_tokens: int = 4096,
+        temperature: float = 0.0,
+        stop_sequences: Optional[list[str]] = None,
+    ) -> AsyncIterator[StreamEvent]:
+        """Record or replay a streamed completion.
+
+        Replayed responses are streamed as one TEXT event, one TOOL_CALL
+        event per tool call and the DONE event. Recording passes the
+        wrapped client's events through (or synthesizes them if it
+        cannot stream).
+
+        Args:
+            messages: Conversation history as list of message dicts.
+            system: Optional system prompt.
+            tools: Optional list of tools available to the LLM.
+            max_tokens: Maximum tokens to generate.
+            temperature: Sampling temperature.
+            stop_sequences: Optional stop sequences.
+
+        Yields:
+            TEXT and TOOL_CALL events, then a DONE event.
+
+        Raises:
+            ReplayMiss: In replay mode, if no recorded response matches.
+        """
+        kwargs = {
+            "messages": messages,
+            "system": system,
+            "tools": tools,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "stop_sequences": stop_sequences,
+        }
+        if self.mode == "record" and hasattr(self._client, "stream_complete"):
+            keys = self.request_keys(**kwargs)
+            start = time.perf_counter()
+            async for event in self._client.stream_complete(**kwargs):
+                if event.type == StreamEventType.DONE and event.response is not None:
+                    self._record(keys, event.response, time.perf_counter() - start)
+                yield event
+            return
+
+        response = await self.complete(**kwargs)
+        if response.content:
+            yield StreamEvent(StreamEventType.TEXT, text=response.content)
+        for tool_call in response.tool_calls:
+            yield StreamEvent(StreamEventType.TOOL_CALL, tool_call=tool_call)
+        yield StreamEvent(StreamEventType.DONE, response=response)
+
+    def _digest(self, value: Any) -> str:
+        text = json.dumps(value, sort_keys=True, default=str)
+        if self._scrub is not None:
+            text = self._scrub.sub("#", text)
+        return hashlib.sha256(text.encode()).hexdigest()[:32]
+
+    def _record(self, keys: tuple[str, str, int], response: LLMResponse, latency: float) -> None:
+        """Append one exchange to the transcript."""
+        key, conversation, turn = keys
+        entry = {
+            "key": key,
+            "conversation": conversation,
+            "turn": turn,
+            "latency": round(latency, 4),
+            "response": _response_to_dict(response),
+        }
+        line = json.dumps(entry, default=str) + "\n"
+        with self._lock:
+            self.calls += 1
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                _lock_file(f)
+                try:
+                    f.write(line)
+                    f.flush()
+                finally:
+                    _unlock_file(f)
+
+    async def _replay(self, keys: tuple[str, str, int]) -> LLMResponse:
+        """Serve the recorded response for a request."""
+        start = time.perf_counter()
+        key, conversation, turn = keys
+        with self._lock:
+            self._load()
+            assert self._by_key is not None
+            entry = _take(self._by_key.get(key))
+            if entry is not None:
+                self.exact_hits += 1
+            else:
+                entry = _take(self._by_turn.get((conversation, turn)))
+                if entry is None:
+                    raise ReplayMiss(
+                        f"No recorded response for request {key} "
+                        f"(conversation {conversation}, turn {turn}) in {self.path}"
+                    )
+                self.turn_hits += 1
+            self.calls += 1
+
+        if self.latency_scale > 0:
+            await asyncio.sleep(entry["latency"] * self.latency_scale)
+        response = _response_from_dict(entry["response"], self.model)
+        self.replay_seconds += time.perf_counter() - start
+        return response
+
+    def _load(self) -> None:
+        """Index the transcript (once per client)."""
+        if self._by_key is not None:
+            return
+        by_key: dict[str, deque] = defaultdict(deque)
+        by_turn: dict[tuple[str, int], deque] = defaultdict(deque)
+        if not self.path.exists():
+            raise ReplayMiss(f"Replay transcript not found: {self.path}")
+        with open(self.path, encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.warning(f"Skipping malformed transcript line {line_no} in {self.path}")
+                    continue
+                by_key[entry["key"]].append(entry)
+                by_turn[(entry["conversation"], entry["turn"])].append(entry)
+        self._by_key = dict(by_key)
+        self._by_turn = dict(by_turn)
+        logger.debug(f"Loaded {sum(len(q) for q in by_key.values())} recorded responses from {self.path}")
+
+
+def _lock_file(f) -> None:
+    """Take an exclusive lock on an open file."""
+    if HAS_FCNTL:
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+    else:
+        # Windows: lock the first byte (LK_LOCK retries for up to 10s)
+        os.lseek(f.fileno(), 0, os.SEEK_SET)
+        msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+
+
+def _unlock_file(f) -> None:
+    """Release a lock taken by _lock_file."""
+    if HAS_FCNTL:
+        fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    else:
+        os.lseek(f.fileno(), 0, os.SEEK_SET)
+        try:
+            msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+        except OSError:
+            pass  # Already unlocked
+
+
+def _take(entries: Optional[deque]) -> Optional[dict[str, Any]]:
+    """Next recorded entry for a key; the last one repeats once exhausted."""
+    if not entries:
+        return None
+    return entries.popleft() if len(entries) > 1 else entries[0]
+
+
+def _response_to_dict(response: LLMResponse) -> dict[str, Any]:
+    return {
+        "content": response.content,
+        "stop_reason": response.stop_reason.value,
+        "tool_calls": [
+            {"id": tc.id, "name": tc.name, "arguments": tc.arguments}
+            for tc in response.tool_calls
+        ],
+        "usage": dict(response.usage),
+        "model": response.model,
+    }
+
+
+def _response_from_dict(data: dict[str, Any], model: str = "") -> LLMResponse:
+    return LLMResponse(
+        content=data.get("content", ""),
+        stop_reason=StopReason(data.get("stop_reason", StopReason.END_TURN.value)),
+        tool_calls=[
+            ToolCall(id=tc["id"], name=tc["name"], arguments=tc.get("arguments", {}))
+            for tc in data.get("tool_calls", [])
+        ],
+        usage=dict(data.get("usage", {})),
+        model=data.get("model") or model,
+    )
@@ -0,0 +1,72 @@
+"""Backoff policy for retrying rate-limited LLM calls.
+
+Retries happen around individual ``complete()`` calls so a 429 in the
+middle of a Builder loop costs one call, not the whole conversation.
+Delays are jittered so parallel workers that were throttled together
+don't all retry in the same instant, and a server-provided
+``retry_after`` is always honoured as the minimum wait.
+
+Usage:
+    from ralph_agi.llm.retry import RetryPolicy
+
+    policy = RetryPolicy(max_retries=3, base_delay=2.0)
+    await asyncio.sleep(policy.delay(attempt, error.retry_after))
+"""
+
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+from typing import Optional
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Jittered exponential backoff for rate-limited calls.
+
+    Attributes:
+        max_retries: Retries per call before giving up.
+        base_delay: Delay in seconds before the first retry.
+        max_delay: Upper bound for the exponential delay.
+        jitter: Fraction of each delay that is randomized (0 = none).
+    """
+
+    max_retries: int = 3
+    base_delay: float = 2.0
+    max_delay: float = 60.0
+    jitter: float = 0.5
+
+    def __post_init__(self) -> None:
+        if self.max_retries < 0:
+            raise ValueError("max_retries must be non-negative")
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise ValueError("delays must be non-negative")
+        if not 0 <= self.jitter <= 1:
+            raise ValueError("jitter must be between 0 and 1")
+
+    def delay(
+        self,
+        attempt: int,
+        retry_after: Optional[float] = None,
+        rng: Optional[random.Random] = None,
+    ) -> float:
+        """Seconds to wait before retry number ``attempt + 1``.
+
+        Without ``retry_after`` the delay is ``base_delay * 2**attempt``
+        (capped at ``max_delay``) with its top ``jitter`` fraction
+        randomized. With ``retry_after`` the server's value is the floor
+        and up to ``jitter`` of it is added on top.
+
+        Args:
+            attempt: Retry attempt number (0-indexed).
+            retry_after: Optional server-specified delay.
+            rng: Random source (defaults to the module generator).
+
+        Returns:
+            Delay in seconds.
+        """
+        uniform = (rng or random).random()
+        if retry_after is not None:
+            return retry_after * (1 + self.jitter * uniform)
+        backoff = min(self.max_delay, self.base_delay * (2 ** attempt))
+        return backoff * (1 - self.jitter * uniform)
@@ -14,6 +14,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from ralph_agi.llm.import_resolver import ImportResolver, get_import_resolver
+
 logger = logging.getLogger(__name__)
 
 
@@ -61,13 +63,18 @@ def verify_python_syntax(file_path: Path) -> tuple[bool, Optional[str]]:
         return (False, f"Error parsing {file_path}: {e}")
 
 
-def verify_python_imports(file_path: Path) -> tuple[bool, Optional[str]]:
+def verify_python_imports(
+    file_path: Path,
+    resolver: Optional[ImportResolver] = None,
+) -> tuple[bool, Optional[str]]:
     """Check that Python imports resolve correctly.
 
-    This runs 'python -c "import ..."' for each import to verify it exists.
+    Each top-level import is looked up from the file's directory with
+    an ImportResolver (cached, no module code is executed).
 
     Args:
         file_path: Path to the Python file.
+        resolver: Resolver to use (default: process-wide shared resolver).
 
     Returns:
         Tuple of (is_valid, error_message).
@@ -86,35 +93,18 @@ def verify_python_imports(file_path: Path) -> tuple[bool, Optional[str]]:
             for alias in node.names:
                 imports.append(alias.name.split('.')[0])
         elif isinstance(node, ast.ImportFrom):
-            if node.module:
+            # Relative imports have level > 0 and are skipped
+            if node.module and node.level == 0:
                 imports.append(node.module.split('.')[0])
 
-    # Check each import
-    errors = []
-    for module in set(imports):
-        # Skip relative imports and common stdlib modules
-        if module.startswith('.'):
-            continue
+    if not imports:
+        return (True, None)
 
-        try:
-            result = subprocess.run(
-                [sys.executable, "-c", f"import {module}"],
-                capture_output=True,
-                timeout=5,
-                cwd=file_path.parent,
-            )
-            if result.returncode != 0:
-                error_output = result.stderr.decode().strip()
-                # Only report if it's a genuine import error
-                if "ModuleNotFoundError" in error_output or "ImportError" in error_output:
-                    errors.append(f"Import error in {file_path}: Cannot import '{module}'")
-        except subprocess.TimeoutExpired:
-            pass  # Ignore timeout - import might be slow
-        except Exception:
-            pass  # Ignore other errors
+    resolver = resolver or get_import_resolver()
+    missing = resolver.missing(imports, file_path.parent)
 
-    if errors:
-        return (False, errors[0])  # Return first error
+    if missing:
+        return (False, f"Import error in {file_path}: Cannot import '{missing[0]}'")
     return (True, None)
 
 
@@ -9,6 +9,7 @@ Key Components:
 - MemoryFrame: A unit of memory with content, metadata, and timestamps
 - MemoryQueryResult: Result wrapper with query metadata and token counts
 - JSONLBackupStore: Crash-safe JSONL backup for memory frames
+- MemoryContextBuilder: Relevance-ranked, token-budgeted prompt context
 - GitMemory: Git integration for medium-term memory
 - GitCommit: Structured git commit data
 - KnowledgeStore: Long-term knowledge management
@@ -28,6 +29,7 @@ from ralph_agi.memory.compaction import (
     ImportanceLevel,
     create_llm_summarizer,
 )
+from ralph_agi.memory.context import MemoryContext, MemoryContextBuilder
 from ralph_agi.memory.git import GitCommit, GitError, GitMemory
 from ralph_agi.memory.hooks import (
     HookConfig,
@@ -50,6 +52,8 @@ __all__ = [
     "MemoryFrame",
     "MemoryQueryResult",
     "JSONLBackupStore",
+    "MemoryContext",
+    "MemoryContextBuilder",
     "GitMemory",
     "GitCommit",
     "GitError",
@@ -0,0 +1,453 @@
+"""Token-budgeted memory context assembly.
+
+Builds the memory section of a Builder prompt from frames that are
+relevant to the task at hand, instead of the N most recent frames.
+
+Pipeline:
+1. Gather candidates: a hybrid search on the task text (or keyword
+   lookups of its distinctive words without memvid), the current
+   session's frames, and recent frames from any session.
+2. Score each candidate on relevance to the task, recency and
+   importance (KnowledgeStore importance levels).
+3. Drop near-duplicates (word shingle overlap), keeping the best.
+4. Pack frames scoring above a minimum greedily into a token budget,
+   trimming long frames.
+
+Usage:
+    from ralph_agi.memory.context import MemoryContextBuilder
+
+    builder = MemoryContextBuilder(store, max_tokens=300)
+    context = builder.build(task_description, session_id=session_id)
+    prompt_section = context.text
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+from ralph_agi.memory.knowledge import ObservationType
+
+if TYPE_CHECKING:
+    from ralph_agi.memory.store import MemoryFrame, MemoryStore
+
+logger = logging.getLogger(__name__)
+
+CONTEXT_HEADER = "## Recent Context"
+
+_WORD_RE = re.compile(r"[a-z0-9_]+")
+
+# Words too common in task descriptions and frames to signal relevance
+_STOPWORDS = frozenset(
+    "the and for with that this from into are was were has have had not but you "
+    "all any can will should must when then than them they their its use using "
+    "add new make sure task iteration completed successfully".split()
+)
+
+# Importance (1-10) for frame types that aren't KnowledgeStore observations
+_FRAME_TYPE_IMPORTANCE = {
+    "iteration_result": 5,
+    "git_commit": 4,
+    "compaction_summary": 4,
+}
+_DEFAULT_IMPORTANCE = 5
+
+# The fixed policy this builder replaced: the session's newest frames,
+# each cut to a number of characters. Savings are measured against it.
+LEGACY_FRAME_COUNT = 5
+LEGACY_FRAME_CHARS = 200
+
+
+def _tokens(text: str) -> int:
+    """Estimate tokens like MemoryFrame.estimate_tokens (~4 chars/token)."""
+    return len(text) // 4 + 1
+
+
+def legacy_context_tokens(session_frames: list[MemoryFrame]) -> int:
+    """Estimate tokens the old fixed memory context would have used.
+
+    Args:
+        session_frames: The current session's frames, most recent first.
+
+    Returns:
+        Estimated tokens of the old context (0 if it would be empty).
+    """
+    lines = [CONTEXT_HEADER]
+    for frame in session_frames[:LEGACY_FRAME_COUNT]:
+        content = frame.content if isinstance(frame.content, str) else ""
+        if len(content) > LEGACY_FRAME_CHARS:
+            content = content[:LEGACY_FRAME_CHARS] + "..."
+        lines.append(f"- {content}")
+    return _tokens("\n".join(lines)) if len(lines) > 1 else 0
+
+
+def _terms(text: str) -> set[str]:
+    """Significant lowercase words of a text."""
+    return {w for w in _WORD_RE.findall(text.lower()) if len(w) > 2 and w not in _STOPWORDS}
+
+
+def _shingles(text: str, size: int = 3) -> set[tuple[str, ...]]:
+    """Word n-grams for near-duplicate detection (digits normalized)."""
+    words = [re.sub(r"\d+", "#", w) for w in _WORD_RE.findall(text.lower())]
+    if len(words) < size:
+        return {tuple(words)} if words else set()
+    return {tuple(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+def frame_importance(frame: MemoryFrame) -> int:
+    """Get a frame's importance on the KnowledgeStore 1-10 scale.
+
+    Uses the ``importance`` recorded in the frame metadata when present
+    (KnowledgeStore observations), otherwise the importance of its
+    observation type, otherwise a per-frame-type default.
+
+    Args:
+        frame: The frame to rate.
+
+    Returns:
+        Importance score (1-10).
+    """
+    metadata = frame.metadata if isinstance(frame.metadata, dict) else {}
+    importance = metadata.get("importance")
+    if isinstance(importance, (int, float)):
+        return max(1, min(10, int(importance)))
+
+    frame_type = frame.frame_type if isinstance(frame.frame_type, str) else ""
+    try:
+        return ObservationType(frame_type).importance
+    except ValueError:
+        return _FRAME_TYPE_IMPORTANCE.get(frame_type, _DEFAULT_IMPORTANCE)
+
+
+@dataclass
+class ScoredFrame:
+    """A candidate frame with its ranking components (each 0.0-1.0).
+
+    Attributes:
+        frame: The memory frame.
+        relevance: Similarity to the task.
+        recency: Position among candidates, newest = 1.0.
+        importance: Normalized importance.
+        score: Weighted combination used for ranking.
+    """
+
+    frame: MemoryFrame
+    relevance: float
+    recency: float
+    importance: float
+    score: float = 0.0
+
+
+@dataclass
+class MemoryContext:
+    """Assembled memory context with budget metrics.
+
+    Attributes:
+        text: Rendered context section ("" if nothing was selected).
+        frames: Selected frames, best first.
+        token_count: Estimated tokens of ``text``.
+        max_tokens: Budget the context was packed into.
+        candidate_count: Unique candidate frames considered.
+        candidate_tokens: Estimated tokens of all candidates in full.
+        baseline_tokens: Estimated tokens the old fixed policy (the
+            session's 5 newest frames, 200 chars each) would have used.
+        duplicates_dropped: Candidates dropped as near-duplicates.
+        trimmed_count: Selected frames shortened to fit.
+    """
+
+    text: str = ""
+    frames: list[MemoryFrame] = field(default_factory=list)
+    token_count: int = 0
+    max_tokens: int = 0
+    candidate_count: int = 0
+    candidate_tokens: int = 0
+    baseline_tokens: int = 0
+    duplicates_dropped: int = 0
+    trimmed_count: int = 0
+
+    @property
+    def tokens_saved(self) -> int:
+        """Tokens avoided compared to the old fixed policy.
+
+        Negative when this context is larger than the old one.
+        """
+        return self.baseline_tokens - self.token_count
+
+
+class MemoryContextBuilder:
+    """Ranks memory frames for a task and packs them into a token budget.
+
+    Attributes:
+        store: Memory store frames are drawn from.
+        max_tokens: Token budget for the rendered context.
+        min_score: Frames scoring below this are never included.
+    """
+
+    # About what the old fixed policy sent (5 frames of up to 200 chars)
+    DEFAULT_MAX_TOKENS = 300
+    # A frame with no relevance needs to be among the newest few to pass
+    DEFAULT_MIN_SCORE = 0.25
+
+    def __init__(
+        self,
+        store: MemoryStore,
+        max_tokens: int = DEFAULT_MAX_TOKENS,
+        candidate_limit: int = 40,
+        max_frame_tokens: int = 100,
+        min_score: float = DEFAULT_MIN_SCORE,
+        relevance_weight: float = 0.6,
+        recency_weight: float = 0.25,
+        importance_weight: float = 0.15,
+        recency_half_life: float = 5.0,
+        duplicate_threshold: float = 0.8,
+        keyword_lookups: int = 4,
+    ):
+        """Initialize builder.
+
+        Args:
+            store: Memory store to draw frames from
+            max_tokens: Token budget for the rendered context
+            candidate_limit: Frames fetched from each candidate source
+            max_frame_tokens: Longest a single frame may be in the context;
+                longer frames are trimmed
+            min_score: Minimum ranking score (0.0-1.0) for a frame to be
+                included, however much budget is left
+            relevance_weight: Weight of task relevance in the score
+            recency_weight: Weight of recency in the score
+            importance_weight: Weight of importance in the score
+            recency_half_life: Candidates (by age rank) after which the
+                recency component halves
+            duplicate_threshold: Shingle Jaccard similarity at or above
+                which two frames count as duplicates
+            keyword_lookups: Task words searched as keywords when no
+                ranked (hybrid) search is available
+        """
+        self.store = store
+        self.max_tokens = max_tokens
+        self._candidate_limit = candidate_limit
+        self._max_frame_tokens = max_frame_tokens
+        self.min_score = min_score
+        self._weights = (relevance_weight, recency_weight, importance_weight)
+        self._recency_half_life = recency_half_life
+        self._duplicate_threshold = duplicate_threshold
+        self._keyword_lookups = keyword_lookups
+
+    def build(
+        self,
+        task_text: str = "",
+        session_id: Optional[str] = None,
+    ) -> MemoryContext:
+        """Assemble the memory context for a task.
+
+        Args:
+            task_text: Task description (and title/steps) to rank against.
+                Without it, frames are ranked on recency and importance.
+            session_id: Current session, whose frames are always candidates.
+
+        Returns:
+            MemoryContext with rendered text and metrics.
+        """
+        search_scores: dict[str, float] = {}
+        session_frames: list[MemoryFrame] = []
+        candidates = self._gather(task_text, session_id, search_scores, session_frames)
+        result = MemoryContext(
+            max_tokens=self.max_tokens,
+            candidate_count=len(candidates),
+            candidate_tokens=sum(_tokens(self._content(f)) for f in candidates),
+            baseline_tokens=legacy_context_tokens(session_frames),
+        )
+        if not candidates or self.max_tokens <= 0:
+            return result
+
+        ranked = self._rank(candidates, task_text, search_scores)
+        unique, result.duplicates_dropped = self._deduplicate(ranked)
+        self._pack(unique, result)
+
+        logger.debug(
+            f"Memory context: {len(result.frames)}/{result.candidate_count} frames, "
+            f"{result.token_count}/{self.max_tokens} tokens "
+            f"({result.tokens_saved} saved, {result.duplicates_dropped} duplicates)"
+        )
+        return result
+
+    def _gather(
+        self,
+        task_text: str,
+        session_id: Optional[str],
+        search_scores: dict[str, float],
+        session_frames: list[MemoryFrame],
+    ) -> list[MemoryFrame]:
+        """Collect unique candidate frames from all sources.
+
+        The session's own frames are also copied into ``session_frames``.
+        """
+        seen: dict[Any, MemoryFrame] = {}
+
+        def collect(frames: Any) -> list[MemoryFrame]:
+            try:
+                return [f for f in frames if isinstance(getattr(f, "content", None), str)]
+            except TypeError:
+                return []
+
+        sources: list[list[MemoryFrame]] = []
+        if task_text.strip():
+            try:
+                # Empty when memvid is unavailable; lexical scoring below
+                # still ranks the session/recent candidates
+                hits = collect(
+                    self.store.search_hybrid(task_text[:500], limit=self._candidate_limit)
+                )
+                scores = [
+                    float(f.score) for f in hits if isinstance(f.score, (int, float))
+                ]
+                top = max(scores, default=0.0)
+                for f in hits:
+                    if top > 0 and isinstance(f.score, (int, float)):
+                        search_scores[self._key(f)] = max(0.0, float(f.score) / top)
+                sources.append(hits)
+            except Exception as e:
+                logger.debug(f"Memory context search failed: {e}")
+
+            if not search_scores:
+                # No ranked search (e.g. the JSONL fallback): look up the
+                # task's most distinctive words as plain keywords instead
+                for term in self._keywords(task_text):
+                    try:
+                        sources.append(
+                            collect(self.store.search(term, limit=self._candidate_limit // 4))
+                        )
+                    except Exception as e:
+                        logger.debug(f"Memory context keyword search failed: {e}")
+
+        if session_id:
+            try:
+                session_frames.extend(
+                    collect(self.store.get_by_session(session_id, limit=self._candidate_limit))
+                )
+                sources.append(session_frames)
+            except Exception as e:
+                logger.debug(f"Memory context session lookup failed: {e}")
+
+        try:
+            sources.append(collect(self.store.get_recent(self._candidate_limit)))
+        except Exception as e:
+            logger.debug(f"Memory context recent lookup failed: {e}")
+
+        for frames in sources:
+            for frame in frames:
+                seen.setdefault(self._key(frame), frame)
+        return list(seen.values())
+
+    def _rank(
+        self,
+        candidates: list[MemoryFrame],
+        task_text: str,
+        search_scores: dict[str, float],
+    ) -> list[ScoredFrame]:
+        """Score candidates, best first."""
+        task_terms = _terms(task_text)
+        by_age = sorted(
+            candidates,
+            key=lambda f: f.timestamp if isinstance(f.timestamp, str) else "",
+            reverse=True,
+        )
+        age_rank = {id(f): rank for rank, f in enumerate(by_age)}
+        w_rel, w_rec, w_imp = self._weights
+        if not task_terms and not search_scores:
+            # Nothing to be relevant to: rank on recency and importance only
+            w_rel = 0.0
+
+        scored = []
+        for frame in candidates:
+            relevance = search_scores.get(self._key(frame), 0.0)
+            if task_terms:
+                frame_terms = _terms(self._content(frame))
+                if frame_terms:
+                    overlap = len(task_terms & frame_terms)
+                    lexical = overlap / math.sqrt(len(task_terms) * len(frame_terms))
+                    relevance = max(relevance, min(1.0, lexical))
+            recency = 0.5 ** (age_rank[id(frame)] / self._recency_half_life)
+            importance = frame_importance(frame) / 10
+            scored.append(
+                ScoredFrame(
+                    frame=frame,
+                    relevance=relevance,
+                    recency=recency,
+                    importance=importance,
+                    score=w_rel * relevance + w_rec * recency + w_imp * importance,
+                )
+            )
+        scored.sort(key=lambda s: s.score, reverse=True)
+        return scored
+
+    def _deduplicate(self, ranked: list[ScoredFrame]) -> tuple[list[ScoredFrame], int]:
+        """Drop frames nearly identical to a higher-ranked frame."""
+        kept: list[ScoredFrame] = []
+        kept_shingles: list[set[tuple[str, ...]]] = []
+        dropped = 0
+        for item in ranked:
+            shingles = _shingles(self._content(item.frame))
+            duplicate = False
+            for other in kept_shingles:
+                union = len(shingles | other)
+                if union and len(shingles & other) / union >= self._duplicate_threshold:
+                    duplicate = True
+                    break
+            if duplicate:
+                dropped += 1
+                continue
+            kept.append(item)
+            kept_shingles.append(shingles)
+        return kept, dropped
+
+    def _pack(self, ranked: list[ScoredFrame], result: MemoryContext) -> None:
+        """Greedily fill the budget in rank order, trimming long frames."""
+        lines = [CONTEXT_HEADER]
+        used = _tokens(CONTEXT_HEADER)
+        for item in ranked:
+            if item.score < self.min_score:
+                break
+            remaining = self.max_tokens - used
+            if remaining < 16:
+                break
+            content = " ".join(self._content(item.frame).split())
+            frame_type = item.frame.frame_type if isinstance(item.frame.frame_type, str) else ""
+            prefix = f"- [{frame_type}] " if frame_type else "- "
+            limit_chars = min(self._max_frame_tokens, remaining) * 4 - len(prefix) - 4
+            if limit_chars <= 0:
+                continue
+            if len(content) > limit_chars:
+                content = content[: limit_chars - 3].rstrip() + "..."
+                result.trimmed_count += 1
+            line = prefix + content
+            cost = _tokens(line)
+            if used + cost > self.max_tokens:
+                continue
+            lines.append(line)
+            used += cost
+            result.frames.append(item.frame)
+
+        if result.frames:
+            result.text = "\n".join(lines)
+            result.token_count = _tokens(result.text)
+
+    def _keywords(self, task_text: str) -> list[str]:
+        """Pick the task's longest significant words, plural 's' stripped."""
+        words = {
+            w[:-1] if len(w) > 4 and w.endswith("s") and not w.endswith("ss") else w
+            for w in _terms(task_text)
+            if not w.isdigit()
+        }
+        return sorted(words, key=lambda w: (-len(w), w))[: self._keyword_lookups]
+
+    @staticmethod
+    def _content(frame: MemoryFrame) -> str:
+        return frame.content if isinstance(frame.content, str) else ""
+
+    @staticmethod
+    def _key(frame: MemoryFrame) -> Any:
+        frame_id = getattr(frame, "id", None)
+        return frame_id if isinstance(frame_id, str) and frame_id else id(frame)
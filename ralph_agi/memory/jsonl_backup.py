@@ -7,7 +7,11 @@ as a fallback for searching historical data.
 Design Principles:
 - Append-only (crash-safe)
 - File locking for concurrent access safety (cross-platform)
+- Configurable durability: fsync every frame, group-commit frames in
+  batches, or leave write-back to the OS
 - Simple grep-based search fallback
+- Sidecar offset index (see jsonl_index) so filtered searches, counts
+  and recent-frame reads don't parse the whole file
 - Zero dependencies beyond stdlib
 
 Platform Support:
@@ -22,7 +26,10 @@ import logging
 import os
 import re
 import sys
-from collections import deque
+import atexit
+import threading
+import time
+import weakref
 from dataclasses import asdict
 from datetime import datetime, timezone
 from pathlib import Path
@@ -38,11 +45,19 @@ else:
 
     HAS_FCNTL = True
 
+from .jsonl_index import JSONLIndex, date_bounds, iter_lines_reverse, parse_frame, parse_timestamp
+
 if TYPE_CHECKING:
     from .store import MemoryFrame
 
 logger = logging.getLogger(__name__)
 
+# Durability policies for JSONLBackupStore.append
+FSYNC_ALWAYS = "always"  # fsync each frame before append returns
+FSYNC_BATCH = "batch"  # buffer frames, write + fsync once per group
+FSYNC_OS = "os"  # write each frame, let the OS decide when to flush
+FSYNC_POLICIES = (FSYNC_ALWAYS, FSYNC_BATCH, FSYNC_OS)
+
 
 def _lock_file_exclusive(f) -> None:
     """Acquire exclusive lock on file (cross-platform)."""
@@ -65,6 +80,17 @@ def _unlock_file(f) -> None:
             pass  # Already unlocked
 
 
+# Stores with a group-commit thread; flushed at interpreter exit since the
+# thread is a daemon and would otherwise drop buffered frames.
+_batched_stores: "weakref.WeakSet[JSONLBackupStore]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_batched_stores() -> None:
+    for store in list(_batched_stores):
+        store.flush()
+
+
 class JSONLBackupStore:
     """Append-only JSONL backup for memory frames.
 
@@ -88,30 +114,76 @@ class JSONLBackupStore:
         implemented using fcntl on Unix and msvcrt on Windows.
     """
 
-    def __init__(self, backup_path: str | Path = "ralph_memory.jsonl"):
+    DEFAULT_BATCH_SIZE = 64
+    DEFAULT_BATCH_INTERVAL = 0.05  # seconds
+
+    def __init__(
+        self,
+        backup_path: str | Path = "ralph_memory.jsonl",
+        use_index: bool = True,
+        fsync: str = FSYNC_ALWAYS,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        batch_interval: float = DEFAULT_BATCH_INTERVAL,
+    ):
         """Initialize the JSONL backup store.
 
         Args:
             backup_path: Path to the .jsonl file. Will be created if
                         it doesn't exist.
+            use_index: Maintain and use a sidecar offset index
+                      (``<backup_path>.idx``) for filtered reads.
+            fsync: Durability policy. "always" fsyncs every frame before
+                  append returns. "batch" buffers frames and writes them
+                  with a single fsync once ``batch_size`` frames are
+                  pending or ``batch_interval`` seconds have passed.
+                  "os" writes every frame but never fsyncs on its own.
+            batch_size: Pending frames that trigger a group commit
+                       ("batch" only).
+            batch_interval: Maximum seconds a frame stays buffered
+                           ("batch" only).
+
+        Raises:
+            ValueError: If the policy or batch settings are invalid.
         """
+        if fsync not in FSYNC_POLICIES:
+            raise ValueError(f"fsync must be one of {FSYNC_POLICIES}, got '{fsync}'")
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if batch_interval <= 0:
+            raise ValueError("batch_interval must be positive")
+
         self.backup_path = Path(backup_path)
+        self.fsync = fsync
+        self.batch_size = batch_size
+        self.batch_interval = batch_interval
+        self._index = JSONLIndex(self.backup_path) if use_index else None
+
+        # Writer state, guarded by _write_lock
+        self._write_lock = threading.Lock()
+        self._file = None
+        self._pending: list[tuple[bytes, dict[str, Any]]] = []
+        self._unsynced = False
+
+        # Background group-commit thread ("batch" only), started lazily
+        self._flush_requested = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._stopping = False
 
     def append(self, frame_data: dict[str, Any]) -> bool:
         """Append a frame to the backup file.
 
-        Uses file locking to ensure safe concurrent writes.
+        Uses file locking to ensure safe concurrent writes. The sidecar
+        index is updated under the same lock. With the "batch" policy
+        the frame is only buffered; it is written and fsynced with its
+        group, on ``flush()`` or ``close()``, or before the next read.
 
         Args:
             frame_data: Dictionary with frame data (id, content, frame_type, etc.)
 
         Returns:
-            True if write succeeded, False otherwise.
+            True if the frame was written (or buffered), False otherwise.
         """
         try:
-            # Ensure parent directory exists
-            self.backup_path.parent.mkdir(parents=True, exist_ok=True)
-
             # Add backup timestamp
             frame_data = {
                 **frame_data,
@@ -119,79 +191,233 @@ class JSONLBackupStore:
             }
 
             # Serialize to JSON
-            line = json.dumps(frame_data, default=str) + "\n"
-
-            # Append with file locking
-            with open(self.backup_path, "a", encoding="utf-8") as f:
-                _lock_file_exclusive(f)
-                try:
-                    f.write(line)
-                    f.flush()
-                    os.fsync(f.fileno())  # Ensure data hits disk
-                finally:
-                    _unlock_file(f)
-
+            line = (json.dumps(frame_data, default=str) + "\n").encode("utf-8")
+
+            if self.fsync == FSYNC_BATCH:
+                with self._write_lock:
+                    self._pending.append((line, frame_data))
+                    full = len(self._pending) >= self.batch_size
+                if full:
+                    return self.flush()
+                self._request_flush()
+                return True
+
+            with self._write_lock:
+                self._write_locked([(line, frame_data)], sync=self.fsync == FSYNC_ALWAYS)
             return True
 
         except Exception as e:
             logger.error(f"Failed to write JSONL backup: {e}")
             return False
 
+    def flush(self) -> bool:
+        """Write buffered frames and fsync anything not yet on disk.
+
+        Call at shutdown and checkpoints when using the "batch" or "os"
+        policy. A no-op when nothing is pending.
+
+        Returns:
+            True if all frames are durable, False if the write failed.
+            Frames that could not be written stay pending and are retried
+            by the next flush or close.
+        """
+        with self._write_lock:
+            pending, self._pending = self._pending, []
+            try:
+                if pending:
+                    self._write_locked(pending, sync=True)
+                elif self._unsynced and self._file is not None:
+                    os.fsync(self._file.fileno())
+                    self._unsynced = False
+                return True
+            except Exception as e:
+                # Keep the frames (ahead of any newer ones) for the next flush
+                self._pending[:0] = pending
+                logger.error(f"Failed to flush JSONL backup ({len(pending)} frames): {e}")
+                return False
+
+    def close(self) -> None:
+        """Flush pending frames and release the file handle.
+
+        The store stays usable; the next append reopens the file.
+        """
+        flusher = self._flusher
+        if flusher is not None:
+            self._stopping = True
+            self._flush_requested.set()
+            flusher.join(timeout=5)
+            self._flusher = None
+            self._stopping = False
+
+        self.flush()
+        with self._write_lock:
+            if self._file is not None:
+                try:
+                    self._file.close()
+                except OSError as e:
+                    logger.warning(f"Error closing JSONL backup: {e}")
+                self._file = None
+
+    @property
+    def pending_count(self) -> int:
+        """Number of frames buffered but not yet written."""
+        return len(self._pending)
+
+    def _write_pending(self) -> None:
+        """Make buffered frames visible to readers before a read."""
+        if self._pending:
+            self.flush()
+
+    def _write_locked(self, entries: list[tuple[bytes, dict[str, Any]]], sync: bool) -> None:
+        """Write frames in one locked append (caller holds _write_lock).
+
+        Args:
+            entries: (serialized line, frame data) pairs, in order.
+            sync: fsync before releasing the file lock.
+        """
+        f = self._open_locked()
+        _lock_file_exclusive(f)
+        try:
+            offset = f.seek(0, os.SEEK_END)
+            f.write(b"".join(line for line, _ in entries))
+            f.flush()
+            if sync:
+                os.fsync(f.fileno())
+            self._unsynced = not sync
+            indexed = []
+            for line, frame_data in entries:
+                indexed.append((offset, line, frame_data))
+                offset += len(line)
+            self._index_append_locked(indexed)
+        finally:
+            _unlock_file(f)
+
+    def _open_locked(self):
+        """Get the append handle, reopening if the file was moved or deleted."""
+        if self._file is not None:
+            try:
+                current = os.stat(self.backup_path)
+                opened = os.fstat(self._file.fileno())
+                if (current.st_dev, current.st_ino) == (opened.st_dev, opened.st_ino):
+                    return self._file
+            except OSError:
+                pass
+            self._file.close()
+            self._file = None
+
+        self.backup_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.backup_path, "ab")
+        return self._file
+
+    def _request_flush(self) -> None:
+        """Wake (starting if needed) the group-commit thread."""
+        if self._flusher is None:
+            with self._write_lock:
+                if self._flusher is None:
+                    self._flusher = threading.Thread(
+                        target=self._flush_loop, name="jsonl-backup-flush", daemon=True
+                    )
+                    self._flusher.start()
+                    _batched_stores.add(self)
+        self._flush_requested.set()
+
+    def _flush_loop(self) -> None:
+        """Group-commit pending frames at most ``batch_interval`` after they arrive."""
+        while True:
+            self._flush_requested.wait()
+            if not self._stopping:
+                # Let the group fill up for one window, then commit it. Frames
+                # arriving after clear() re-set the event for the next round.
+                time.sleep(self.batch_interval)
+            self._flush_requested.clear()
+            self.flush()
+            if self._stopping:
+                return
+
     def search(
         self,
         query: str,
         frame_type: Optional[str] = None,
         limit: int = 10,
         case_insensitive: bool = True,
+        session_id: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
     ) -> list[dict[str, Any]]:
         """Search the backup file using simple text matching.
 
-        This is a fallback search that doesn't require Memvid.
-        It's slower than Memvid but guaranteed to work.
+        This is a fallback search that doesn't require Memvid. Type,
+        session and date filters are resolved through the offset index,
+        so only matching frames are read. Otherwise the file is read
+        backwards and the search stops once ``limit`` matches are found.
 
         Args:
             query: Text to search for in content field. Use "*" for all.
             frame_type: Optional filter by frame type.
             limit: Maximum number of results.
             case_insensitive: Whether to ignore case in search.
+            session_id: Optional filter by session identifier.
+            start_date: Only frames at or after this ISO date/datetime.
+            end_date: Only frames at or before this ISO date/datetime
+                     (a date without time covers the whole day).
 
         Returns:
             List of matching frame dictionaries, most recent first.
         """
-        if not self.backup_path.exists():
+        self._write_pending()
+        if not self.backup_path.exists() or limit <= 0:
             return []
 
         try:
-            # Collect all matches first (need to reverse for recency)
-            all_matches = []
             pattern = re.compile(
                 re.escape(query), re.IGNORECASE if case_insensitive else 0
             )
-
-            with open(self.backup_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        frame = json.loads(line)
-
-                        # Filter by type if specified
-                        if frame_type and frame.get("frame_type") != frame_type:
-                            continue
-
-                        # Search in content
-                        content = frame.get("content", "")
-                        if query == "*" or pattern.search(content):
-                            all_matches.append(frame)
-
-                    except json.JSONDecodeError:
-                        continue  # Skip malformed lines
-
-            # Return most recent first, limited
-            all_matches.reverse()
-            return all_matches[:limit]
+            needle = _raw_needle(query, case_insensitive)
+            start, end = date_bounds(start_date, end_date)
+            filtered = bool(frame_type or session_id or start_date or end_date)
+
+            def match(line: bytes) -> Optional[dict[str, Any]]:
+                if needle is not None:
+                    raw = line.lower() if case_insensitive else line
+                    if needle not in raw:
+                        return None
+                frame = parse_frame(line)
+                if frame is None:
+                    return None
+                if frame_type and frame.get("frame_type") != frame_type:
+                    return None
+                if session_id and frame.get("session_id") != session_id:
+                    return None
+                if (start_date or end_date) and not (
+                    start <= parse_timestamp(frame.get("timestamp")) <= end
+                ):
+                    return None
+                content = frame.get("content", "")
+                if query == "*" or (isinstance(content, str) and pattern.search(content)):
+                    return frame
+                return None
+
+            matches: list[dict[str, Any]] = []
+            with open(self.backup_path, "rb") as f:
+                if filtered and self._refresh_index():
+                    for offset, length in self._index.positions(
+                        frame_type or None, session_id or None, start, end
+                    ):
+                        f.seek(offset)
+                        frame = match(f.read(length))
+                        if frame is not None:
+                            matches.append(frame)
+                            if len(matches) >= limit:
+                                break
+                else:
+                    for _, line in iter_lines_reverse(f):
+                        frame = match(line)
+                        if frame is not None:
+                            matches.append(frame)
+                            if len(matches) >= limit:
+                                break
+
+            return matches
 
         except Exception as e:
             logger.error(f"Failed to search JSONL backup: {e}")
@@ -200,8 +426,8 @@ class JSONLBackupStore:
     def get_recent(self, n: int = 10) -> list[dict[str, Any]]:
         """Get the most recent N frames from the backup.
 
-        Uses a memory-efficient approach that only keeps the last N
-        lines in memory, avoiding loading the entire file.
+        Reads the file backwards from the end, so the cost depends on
+        N rather than on the size of the file.
 
         Args:
             n: Maximum number of frames to return.
@@ -209,29 +435,19 @@ class JSONLBackupStore:
         Returns:
             List of frame dictionaries, most recent first.
         """
-        if not self.backup_path.exists():
+        self._write_pending()
+        if not self.backup_path.exists() or n <= 0:
             return []
 
         try:
-            # Use deque to efficiently keep only last N valid lines
-            recent_lines: deque[str] = deque(maxlen=n * 2)  # Buffer for invalid lines
-
-            with open(self.backup_path, "r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if line:
-                        recent_lines.append(line)
-
-            # Parse from most recent, collecting up to n valid frames
             frames = []
-            for line in reversed(recent_lines):
-                try:
-                    frames.append(json.loads(line))
-                    if len(frames) >= n:
-                        break
-                except json.JSONDecodeError:
-                    continue
-
+            with open(self.backup_path, "rb") as f:
+                for _, line in iter_lines_reverse(f):
+                    frame = parse_frame(line)
+                    if frame is not None:
+                        frames.append(frame)
+                        if len(frames) >= n:
+                            break
             return frames
 
         except Exception as e:
@@ -244,24 +460,63 @@ class JSONLBackupStore:
         Returns:
             Number of valid JSON lines in the file.
         """
+        self._write_pending()
         if not self.backup_path.exists():
             return 0
 
+        if self._refresh_index():
+            return len(self._index)
+
         try:
             count = 0
-            with open(self.backup_path, "r", encoding="utf-8") as f:
+            with open(self.backup_path, "rb") as f:
                 for line in f:
-                    if line.strip():
-                        try:
-                            json.loads(line)
-                            count += 1
-                        except json.JSONDecodeError:
-                            pass
+                    if parse_frame(line) is not None:
+                        count += 1
             return count
         except Exception as e:
             logger.error(f"Failed to count JSONL backup: {e}")
             return 0
 
+    def rebuild_index(self) -> None:
+        """Rebuild the sidecar index from a full scan of the backup file."""
+        self._write_pending()
+        if self._index is None or not self.backup_path.exists():
+            return
+        with open(self.backup_path, "ab") as f:
+            _lock_file_exclusive(f)
+            try:
+                self._index.rebuild_locked()
+            finally:
+                _unlock_file(f)
+
+    def _refresh_index(self) -> bool:
+        """Bring the index up to date, rebuilding it if necessary.
+
+        Returns:
+            True if the index can be used for reads.
+        """
+        if self._index is None:
+            return False
+        try:
+            if not self._index.refresh():
+                self.rebuild_index()
+            return True
+        except Exception as e:
+            logger.warning(f"JSONL index unavailable, scanning file: {e}")
+            return False
+
+    def _index_append_locked(self, entries: list[tuple[int, bytes, dict[str, Any]]]) -> None:
+        """Record appended frames in the index (caller holds the lock)."""
+        if self._index is None:
+            return
+        try:
+            self._index.record_locked(entries)
+        except Exception as e:
+            # The frames are safely written; readers will index them from
+            # the unindexed tail of the file.
+            logger.warning(f"Failed to update JSONL index: {e}")
+
     def exists(self) -> bool:
         """Check if the backup file exists.
 
@@ -271,6 +526,20 @@ class JSONLBackupStore:
         return self.backup_path.exists()
 
 
+def _raw_needle(query: str, case_insensitive: bool) -> Optional[bytes]:
+    """Get bytes that must appear in a raw JSON line for it to match.
+
+    Only ASCII text that json.dumps writes verbatim is usable; for other
+    queries every line has to be parsed.
+    """
+    if query == "*" or not query:
+        return None
+    if not all(32 <= ord(c) < 127 and c not in '"\\' for c in query):
+        return None
+    needle = query.encode("ascii")
+    return needle.lower() if case_insensitive else needle
+
+
 def frame_to_dict(frame: "MemoryFrame") -> dict[str, Any]:
     """Convert a MemoryFrame to a dictionary for JSONL serialization.
 
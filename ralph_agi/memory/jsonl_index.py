@@ -0,0 +1,510 @@
+"""Sidecar offset index for the JSONL memory backup.
+
+JSONLBackupStore used to parse the whole backup file on every search
+and count. This module keeps a small index next to it
+(``ralph_memory.jsonl.idx``) with one line per frame:
+
+    <byte offset>\\t<byte length>\\t<epoch seconds>\\t<frame_type>\\t<session_id>
+
+The index is append-only and is written by the process that appends the
+frame, while it still holds the backup file's lock. Readers load it once
+and afterwards only read what was added since. Frames that are in the
+backup but not yet in the index (written by an older version, or by a
+writer that crashed between the two writes) are picked up by scanning
+just the unindexed tail of the backup file.
+
+In memory, entries live in flat arrays with per-type and per-session
+position lists, so filters only touch matching frames.
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import logging
+import math
+import os
+import threading
+from array import array
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, BinaryIO, Iterator, Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+INDEX_SUFFIX = ".idx"
+INDEX_HEADER = b"#ralph-jsonl-index v1\n"
+
+# Timestamp used for frames without a parseable timestamp. Matches the
+# string comparison in MemoryStore._apply_filters, where "" sorts before
+# any start date and before any end date.
+_NO_TIMESTAMP = -math.inf
+
+# Block size for reverse and catch-up reads
+_BLOCK_SIZE = 1 << 20
+
+
+def parse_timestamp(value: Any) -> float:
+    """Convert an ISO 8601 timestamp to epoch seconds.
+
+    Naive timestamps are treated as UTC.
+
+    Args:
+        value: Timestamp string (or anything else)
+
+    Returns:
+        Epoch seconds, or -inf if the value can't be parsed
+    """
+    if not isinstance(value, str) or not value:
+        return _NO_TIMESTAMP
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return _NO_TIMESTAMP
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def date_bounds(
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+) -> tuple[float, float]:
+    """Convert start/end date filters to an inclusive epoch range.
+
+    Mirrors MemoryStore._apply_filters: an end date without a time
+    component covers the whole day.
+
+    Args:
+        start_date: ISO date or datetime, inclusive
+        end_date: ISO date or datetime, inclusive
+
+    Returns:
+        Tuple of (start, end) epoch seconds
+    """
+    start = parse_timestamp(start_date) if start_date else -math.inf
+    if end_date:
+        end = parse_timestamp(end_date if "T" in end_date else f"{end_date}T23:59:59")
+    else:
+        end = math.inf
+    return start, end
+
+
+def iter_lines_reverse(f: BinaryIO, end: Optional[int] = None) -> Iterator[tuple[int, bytes]]:
+    """Yield complete lines of a file from the end backwards.
+
+    Reads fixed-size blocks from ``end`` towards the start, so the cost
+    depends on how many lines are consumed, not on the file size. A
+    trailing line without a newline (a write in progress) is skipped.
+
+    Args:
+        f: File opened in binary mode
+        end: Byte position to read back from (default: end of file)
+
+    Yields:
+        Tuples of (byte offset, line including its newline)
+    """
+    position = f.seek(0, os.SEEK_END) if end is None else end
+    buffer = b""
+    trimmed = False
+
+    while position > 0 or buffer:
+        if position > 0:
+            size = min(_BLOCK_SIZE, position)
+            position -= size
+            f.seek(position)
+            buffer = f.read(size) + buffer
+
+        if not trimmed:
+            cut = buffer.rfind(b"\n")
+            if cut == -1:
+                if position == 0:
+                    return
+                continue
+            buffer = buffer[: cut + 1]
+            trimmed = True
+
+        # buffer holds bytes [position, position + len(buffer)) and ends
+        # with a newline; its first line is only complete at file start.
+        head = 0 if position == 0 else buffer.find(b"\n") + 1
+        line_end = position + len(buffer)
+        for line in reversed(buffer[head:].split(b"\n")[:-1]):
+            line_end -= len(line) + 1
+            yield line_end, line + b"\n"
+        buffer = buffer[:head]
+
+
+def iter_lines(f: BinaryIO, start: int, end: int) -> Iterator[tuple[int, bytes]]:
+    """Yield complete lines of a file between two byte offsets.
+
+    Args:
+        f: File opened in binary mode
+        start: Offset of the first line
+        end: Offset to stop reading at
+
+    Yields:
+        Tuples of (byte offset, line including its newline)
+    """
+    f.seek(start)
+    position = start
+    pending = b""
+    while position < end:
+        block = f.read(min(_BLOCK_SIZE, end - position))
+        if not block:
+            break
+        line_start = position - len(pending)
+        position += len(block)
+        lines = (pending + block).split(b"\n")
+        pending = lines.pop()
+        for line in lines:
+            yield line_start, line + b"\n"
+            line_start += len(line) + 1
+
+
+def parse_frame(line: bytes) -> Optional[dict[str, Any]]:
+    """Parse a backup line, returning None for blank or malformed lines."""
+    if not line.strip():
+        return None
+    try:
+        frame = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return frame if isinstance(frame, dict) else None
+
+
+class JSONLIndex:
+    """In-memory view of the sidecar index, kept in sync with the files.
+
+    Thread-safe. refresh() and positions() never take the backup file
+    lock; record_locked() and rebuild_locked() must be called while the
+    caller holds it.
+
+    Attributes:
+        data_path: Path to the .jsonl backup file
+        index_path: Path to the sidecar index file
+    """
+
+    def __init__(self, data_path: str | Path, index_path: str | Path | None = None):
+        """Initialize index.
+
+        Args:
+            data_path: Path to the .jsonl backup file
+            index_path: Path to the index file (default: data_path + ".idx")
+        """
+        self.data_path = Path(data_path)
+        self.index_path = (
+            Path(index_path)
+            if index_path
+            else self.data_path.with_name(self.data_path.name + INDEX_SUFFIX)
+        )
+        self._lock = threading.RLock()
+        self._reset()
+
+    def _reset(self) -> None:
+        self._offsets = array("q")
+        self._lengths = array("q")
+        self._times = array("d")
+        self._types: list[Optional[str]] = []
+        self._sessions: list[Optional[str]] = []
+        self._by_type: dict[str, array] = {}
+        self._by_session: dict[str, array] = {}
+        self._interned: dict[str, str] = {}
+        # Data file offset up to which frames are indexed in memory, and
+        # up to which they are recorded in the index file (always <=)
+        self._covered = 0
+        self._file_covered = 0
+        # Bytes of the index file consumed, and file identities
+        self._index_pos = 0
+        self._index_ino: Optional[int] = None
+        self._data_ino: Optional[int] = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._offsets)
+
+    def refresh(self) -> bool:
+        """Bring the in-memory index up to date with both files.
+
+        Returns:
+            True if up to date; False if the index file is missing,
+            corrupt or describes a different data file and must be
+            rebuilt with rebuild_locked().
+        """
+        with self._lock:
+            data_size = self._sync()
+            if data_size is None:
+                return False
+            if data_size > self._covered:
+                self._scan_data(data_size)
+            return True
+
+    def positions(
+        self,
+        frame_type: Optional[str] = None,
+        session_id: Optional[str] = None,
+        start: float = -math.inf,
+        end: float = math.inf,
+    ) -> Iterator[tuple[int, int]]:
+        """Iterate indexed frames matching filters, newest first.
+
+        Args:
+            frame_type: Only frames of this type
+            session_id: Only frames from this session
+            start: Minimum timestamp (epoch seconds, inclusive)
+            end: Maximum timestamp (epoch seconds, inclusive)
+
+        Yields:
+            Tuples of (byte offset, byte length) into the data file
+        """
+        need_type: Optional[str] = None
+        need_session: Optional[str] = None
+        with self._lock:
+            candidates: Sequence[int]
+            if frame_type is not None and session_id is not None:
+                by_type = self._by_type.get(frame_type, array("q"))
+                by_session = self._by_session.get(session_id, array("q"))
+                if len(by_session) < len(by_type):
+                    candidates, need_type = by_session, frame_type
+                else:
+                    candidates, need_session = by_type, session_id
+            elif frame_type is not None:
+                candidates = self._by_type.get(frame_type, array("q"))
+            elif session_id is not None:
+                candidates = self._by_session.get(session_id, array("q"))
+            else:
+                candidates = range(len(self._offsets))
+            # Arrays are append-only (a reset replaces them), so holding
+            # references plus a length snapshot stays consistent
+            count = len(candidates)
+            offsets, lengths, times = self._offsets, self._lengths, self._times
+            types, sessions = self._types, self._sessions
+
+        filter_dates = start != -math.inf or end != math.inf
+        for k in range(count - 1, -1, -1):
+            i = candidates[k]
+            if need_type is not None and types[i] != need_type:
+                continue
+            if need_session is not None and sessions[i] != need_session:
+                continue
+            if filter_dates and not (start <= times[i] <= end):
+                continue
+            yield offsets[i], lengths[i]
+
+    def record_locked(self, entries: list[tuple[int, bytes, dict[str, Any]]]) -> None:
+        """Index frames just appended to the data file, in one index write.
+
+        Also writes out any frames before them that the index file lacks.
+
+        Args:
+            entries: (offset, line, frame) for each appended line, in
+                file order
+        """
+        if not entries:
+            return
+        with self._lock:
+            if self._sync(writing=True) is None:
+                self.rebuild_locked()
+                return  # The rebuild scan included the new lines
+            first_offset = entries[0][0]
+            if self._covered < first_offset:
+                self._scan_data(first_offset)
+            for offset, line, frame in entries:
+                if self._covered <= offset:
+                    self._add(offset, len(line), frame)
+
+            first = bisect.bisect_left(self._offsets, self._file_covered)
+            lines = b"".join(self._format(i) for i in range(first, len(self._offsets)))
+            with open(self.index_path, "ab") as f:
+                f.write(lines)
+            self._index_pos += len(lines)
+            self._file_covered = self._covered
+
+    def rebuild_locked(self) -> None:
+        """Rebuild the index file from a full scan of the data file."""
+        with self._lock:
+            self._reset()
+            try:
+                data_stat = os.stat(self.data_path)
+            except FileNotFoundError:
+                self.index_path.unlink(missing_ok=True)
+                return
+
+            tmp_path = self.index_path.with_name(self.index_path.name + ".tmp")
+            with open(tmp_path, "wb") as out:
+                out.write(INDEX_HEADER)
+                self._scan_data(data_stat.st_size)
+                out.write(b"".join(self._format(i) for i in range(len(self._offsets))))
+            os.replace(tmp_path, self.index_path)
+
+            index_stat = os.stat(self.index_path)
+            self._index_pos = index_stat.st_size
+            self._index_ino = index_stat.st_ino
+            self._data_ino = data_stat.st_ino
+            self._file_covered = self._covered
+            logger.debug(
+                f"Rebuilt JSONL index with {len(self._offsets)} frames: {self.index_path}"
+            )
+
+    def _sync(self, writing: bool = False) -> Optional[int]:
+        """Validate file identities and read new index lines.
+
+        Args:
+            writing: Caller holds the data lock; an unterminated index
+                line can only be left by a crashed writer and is dropped.
+
+        Returns:
+            Current data file size, or None if a rebuild is needed
+        """
+        try:
+            data_stat = os.stat(self.data_path)
+        except FileNotFoundError:
+            self._reset()
+            return 0
+
+        if self._data_ino is not None and (
+            data_stat.st_ino != self._data_ino or data_stat.st_size < self._covered
+        ):
+            # Backup was replaced or truncated
+            self._reset()
+            return None
+
+        if not self._read_index_file(truncate_partial=writing):
+            self._reset()
+            return None
+        if data_stat.st_size < self._file_covered:
+            self._reset()
+            return None
+
+        self._data_ino = data_stat.st_ino
+        return data_stat.st_size
+
+    def _read_index_file(self, truncate_partial: bool = False) -> bool:
+        """Consume new complete lines from the index file."""
+        try:
+            stat = os.stat(self.index_path)
+        except FileNotFoundError:
+            return False
+
+        if self._index_ino is not None and stat.st_ino != self._index_ino:
+            # Rebuilt by another process: reload it from the start
+            self._reset()
+        if stat.st_size < self._index_pos:
+            return False
+        if stat.st_size == self._index_pos:
+            return True
+
+        with open(self.index_path, "rb") as f:
+            f.seek(self._index_pos)
+            chunk = f.read(stat.st_size - self._index_pos)
+
+        consumed = 0
+        if self._index_pos == 0:
+            if not chunk.startswith(INDEX_HEADER):
+                return False
+            consumed = len(INDEX_HEADER)
+
+        last_newline = chunk.rfind(b"\n")
+        if last_newline >= consumed:
+            if not self._load_entries(chunk[consumed:last_newline].decode("utf-8", "replace")):
+                return False
+            consumed = last_newline + 1
+
+        self._index_ino = stat.st_ino
+        self._index_pos += consumed
+        if truncate_partial and self._index_pos < stat.st_size:
+            os.truncate(self.index_path, self._index_pos)
+        return True
+
+    def _load_entries(self, text: str) -> bool:
+        """Add entries from index file lines, column-wise for speed."""
+        # One flat list of strings: unlike per-row lists, strings are not
+        # tracked by the cyclic GC, which otherwise dominates large loads
+        fields = text.replace("\n", "\t").split("\t")
+        if len(fields) != 5 * (text.count("\n") + 1):
+            return False
+        types_col = fields[3::5]
+        sessions_col = fields[4::5]
+        try:
+            offsets = list(map(int, fields[0::5]))
+            lengths = list(map(int, fields[1::5]))
+            times = list(map(float, fields[2::5]))
+        except ValueError:
+            return False
+
+        self._file_covered = offsets[-1] + lengths[-1]
+        # Entries below coverage were already indexed by a catch-up scan
+        skip = bisect.bisect_left(offsets, self._covered)
+        if skip == len(offsets):
+            return True
+
+        intern = self._interned.setdefault
+        types = [intern(t, t) if t else None for t in types_col[skip:]]
+        sessions = [intern(v, v) if v else None for v in sessions_col[skip:]]
+
+        start = len(self._offsets)
+        self._offsets.extend(offsets[skip:])
+        self._lengths.extend(lengths[skip:])
+        self._times.extend(times[skip:])
+        self._types.extend(types)
+        self._sessions.extend(sessions)
+        for postings, values in ((self._by_type, types), (self._by_session, sessions)):
+            for position, value in enumerate(values, start):
+                if value is not None:
+                    positions = postings.get(value)
+                    if positions is None:
+                        positions = postings[value] = array("q")
+                    positions.append(position)
+        self._covered = offsets[-1] + lengths[-1]
+        return True
+
+    def _scan_data(self, end: int) -> None:
+        """Index complete frames in the data file from coverage to ``end``."""
+        with open(self.data_path, "rb") as f:
+            for offset, line in iter_lines(f, self._covered, end):
+                frame = parse_frame(line)
+                if frame is not None:
+                    self._add(offset, len(line), frame)
+                else:
+                    self._covered = offset + len(line)
+
+    def _intern(self, value: Any) -> Optional[str]:
+        if value is None:
+            return None
+        value = str(value).replace("\t", " ").replace("\n", " ")
+        return self._interned.setdefault(value, value)
+
+    def _add(self, offset: int, length: int, frame: dict[str, Any]) -> None:
+        self._add_raw(
+            offset,
+            length,
+            parse_timestamp(frame.get("timestamp")),
+            self._intern(frame.get("frame_type")),
+            self._intern(frame.get("session_id")),
+        )
+
+    def _add_raw(
+        self,
+        offset: int,
+        length: int,
+        timestamp: float,
+        frame_type: Optional[str],
+        session_id: Optional[str],
+    ) -> None:
+        position = len(self._offsets)
+        self._offsets.append(offset)
+        self._lengths.append(length)
+        self._times.append(timestamp)
+        self._types.append(frame_type)
+        self._sessions.append(session_id)
+        if frame_type is not None:
+            self._by_type.setdefault(frame_type, array("q")).append(position)
+        if session_id is not None:
+            self._by_session.setdefault(session_id, array("q")).append(position)
+        self._covered = offset + length
+
+    def _format(self, position: int) -> bytes:
+        return (
+            f"{self._offsets[position]}\t{self._lengths[position]}\t"
+            f"{self._times[position]!r}\t{self._types[position] or ''}\t"
+            f"{self._sessions[position] or ''}\n"
+        ).encode("utf-8")
@@ -111,12 +111,23 @@ class MemoryStore:
         >>> recent = store.get_recent(10)
     """
 
-    def __init__(self, store_path: str | Path = "ralph_memory.mv2"):
+    def __init__(
+        self,
+        store_path: str | Path = "ralph_memory.mv2",
+        fsync: str = "always",
+        batch_size: int = JSONLBackupStore.DEFAULT_BATCH_SIZE,
+        batch_interval: float = JSONLBackupStore.DEFAULT_BATCH_INTERVAL,
+    ):
         """Initialize the memory store.
 
         Args:
             store_path: Path to the Memvid .mv2 file. Will be created
                        on first write if it doesn't exist.
+            fsync: Durability policy for the JSONL backup
+                  ("always", "batch" or "os"). See JSONLBackupStore.
+            batch_size: Frames per group commit with fsync="batch".
+            batch_interval: Maximum seconds a frame is buffered with
+                           fsync="batch".
         """
         self.store_path = Path(store_path)
         self._mv = None
@@ -124,7 +135,9 @@ class MemoryStore:
 
         # Initialize JSONL backup store (same name with .jsonl extension)
         jsonl_path = self.store_path.with_suffix(".jsonl")
-        self._jsonl_backup = JSONLBackupStore(jsonl_path)
+        self._jsonl_backup = JSONLBackupStore(
+            jsonl_path, fsync=fsync, batch_size=batch_size, batch_interval=batch_interval
+        )
 
     @property
     def initialized(self) -> bool:
@@ -347,7 +360,13 @@ class MemoryStore:
             List of MemoryFrame objects from the session.
         """
         if not self._ensure_initialized(create=False):
-            return []
+            # Fall back to the JSONL backup's session index
+            try:
+                results = self._jsonl_backup.search("*", session_id=session_id, limit=limit)
+                return [dict_to_frame(r) for r in results]
+            except Exception as e:
+                logger.error(f"JSONL fallback for session frames failed: {e}")
+                return []
 
         try:
             # Search by session tag
@@ -528,7 +547,12 @@ class MemoryStore:
                 if mode in ("semantic", "hybrid"):
                     logger.warning(f"JSONL fallback doesn't support {mode} mode, using keyword")
                 jsonl_results = self._jsonl_backup.search(
-                    query, frame_type=frame_type, limit=limit * 3
+                    query,
+                    frame_type=frame_type,
+                    limit=limit * 3,
+                    session_id=session_id,
+                    start_date=start_date,
+                    end_date=end_date,
                 )
                 frames = [dict_to_frame(r) for r in jsonl_results]
             else:
@@ -677,12 +701,21 @@ class MemoryStore:
             )
         return frames
 
+    def flush(self) -> None:
+        """Make all appended frames durable.
+
+        Writes and fsyncs frames the JSONL backup is still buffering
+        (fsync="batch") or has left to the OS (fsync="os").
+        """
+        self._jsonl_backup.flush()
+
     def close(self) -> None:
         """Close the memory store and release resources.
 
         Should be called when done using the store to ensure
         all data is properly flushed.
         """
+        self._jsonl_backup.close()
         if self._mv is not None:
             try:
                 self._mv.seal()
@@ -26,8 +26,18 @@ Task Queue (new in ADR-005):
 - QueuedTask: Task definition with lifecycle management
 - TaskStatus: Task lifecycle states (pending, running, complete, failed)
 - TaskPriority: Priority levels (P0-P4)
+- TaskIndex: In-memory status/priority/dependency index behind TaskQueue
+- TaskStorage: Pluggable queue persistence (YAML files or SQLite)
 - WorktreeManager: Git worktree isolation for parallel execution
 - ActiveWorktree: Info about an active worktree
+- WorktreeRegistry: Process-safe SQLite record of active worktrees
+- WorktreePool: Pre-warmed, recycled worktrees handed out by WorktreeManager
+- SparseCheckout: Sparse worktree cone, widened as tools reach new paths
+- ChangeTracker: Files a task added, modified or deleted (git or scan)
+- BlobStore: Content-addressed store for artifact contents
+- TaskLog: Append-only per-task execution log with offset-based tailing
+- TaskWatcher: Debounced inotify/polling watcher for task file changes
+- StorageWatcher: Polling watcher for tasks in other storage backends
 """
 
 from ralph_agi.tasks.executor import (
@@ -77,14 +87,53 @@ from ralph_agi.tasks.queue import (
     TaskNotFoundError,
     TaskValidationError,
     generate_task_id,
+    TaskIndex,
+)
+from ralph_agi.tasks.storage import (
+    TaskStorage,
+    YamlTaskStorage,
+    SQLiteTaskStorage,
+    StorageError,
+    create_storage,
 )
 from ralph_agi.tasks.worktree import (
     WorktreeManager,
+    WorktreePool,
     ActiveWorktree,
     WorktreeError,
     WorktreeExistsError,
     WorktreeNotFoundError,
 )
+from ralph_agi.tasks.registry import (
+    RegistryError,
+    WorktreeRegistry,
+)
+from ralph_agi.tasks.checkout import (
+    SharedDir,
+    SparseCheckout,
+    derive_sparse_paths,
+    share_dependency_dirs,
+)
+from ralph_agi.tasks.blobs import (
+    BlobError,
+    BlobNotFoundError,
+    BlobStore,
+)
+from ralph_agi.tasks.changes import (
+    ChangeTracker,
+    ChangeType,
+    FileChange,
+)
+from ralph_agi.tasks.logs import (
+    LogChunk,
+    TaskLog,
+)
+from ralph_agi.tasks.watcher import (
+    StorageWatcher,
+    TaskEvent,
+    TaskEventType,
+    TaskWatcher,
+)
 from ralph_agi.tasks.parallel import (
     ParallelExecutor,
     TaskResult,
@@ -140,12 +189,37 @@ __all__ = [
     "TaskNotFoundError",
     "TaskValidationError",
     "generate_task_id",
+    "TaskIndex",
+    "TaskStorage",
+    "YamlTaskStorage",
+    "SQLiteTaskStorage",
+    "StorageError",
+    "create_storage",
     # Worktree Manager (ADR-005)
     "WorktreeManager",
+    "WorktreePool",
     "ActiveWorktree",
     "WorktreeError",
     "WorktreeExistsError",
     "WorktreeNotFoundError",
+    "WorktreeRegistry",
+    "RegistryError",
+    "SparseCheckout",
+    "SharedDir",
+    "derive_sparse_paths",
+    "share_dependency_dirs",
+    "ChangeTracker",
+    "ChangeType",
+    "FileChange",
+    "BlobStore",
+    "BlobError",
+    "BlobNotFoundError",
+    "TaskLog",
+    "LogChunk",
+    "TaskWatcher",
+    "StorageWatcher",
+    "TaskEvent",
+    "TaskEventType",
     # Parallel Executor (Story 7.3)
     "ParallelExecutor",
     "TaskResult",
@@ -6,7 +6,8 @@ independent worktrees, each running its own RALPH loop.
 Design Principles:
 - True parallelism via multiprocessing (not threads)
 - Each worker manages its own worktree
-- Progress tracked via filesystem for cross-process communication
+- Live progress (status, iterations, tool calls, tokens) sent over a pipe
+  per worker; progress files only back up status for crashed workers
 - Configurable parallelism limit to manage resources
 """
 
@@ -21,12 +22,16 @@ import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
+from multiprocessing.connection import Connection, wait
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Optional
 
+from ralph_agi.tasks.registry import ActiveWorktree, RegistryError, WorktreeRegistry
+
 if TYPE_CHECKING:
     from ralph_agi.core.config import RalphConfig
     from ralph_agi.tasks.prd import PRD
+    from ralph_agi.tasks.worktree import WorktreePool
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +39,8 @@ logger = logging.getLogger(__name__)
 DEFAULT_PARALLEL_LIMIT = 3
 PROGRESS_DIR_NAME = ".ralph-batch"
 PROGRESS_FILE_SUFFIX = ".progress.json"
+RATE_STATE_FILE_NAME = "llm-rate.json"
+POOL_DIR_NAME = "ralph-batch-pool"
 
 
 class WorkerStatus(Enum):
@@ -47,6 +54,14 @@ class WorkerStatus(Enum):
     CANCELLED = "cancelled"
 
 
+# Worktree registry status for each worker status that changes it
+_REGISTRY_STATUS = {
+    WorkerStatus.RUNNING: "running",
+    WorkerStatus.COMPLETED: "ready_to_merge",
+    WorkerStatus.FAILED: "error",
+}
+
+
 @dataclass
 class BatchConfig:
     """Configuration for batch processing.
@@ -57,6 +72,13 @@ class BatchConfig:
         progress_dir: Directory for progress files.
         cleanup_on_complete: If True, cleanup worktrees after successful completion.
         cleanup_on_failure: If True, cleanup worktrees after failure.
+        worktree_pool_size: Clean worktrees to keep for reuse (0 disables
+            the pool). Workers then start with a branch switch instead of
+            a full checkout.
+        sparse_checkout: Check out only the directories a feature's
+            description, steps and acceptance criteria mention.
+        shared_dirs: Dependency directories (e.g. "node_modules") copied
+            into each worktree from the main checkout.
     """
 
     parallel_limit: int = DEFAULT_PARALLEL_LIMIT
@@ -64,6 +86,9 @@ class BatchConfig:
     progress_dir: Optional[Path] = None
     cleanup_on_complete: bool = True
     cleanup_on_failure: bool = False
+    worktree_pool_size: int = 0
+    sparse_checkout: bool = False
+    shared_dirs: tuple[str, ...] = ()
 
 
 @dataclass
@@ -83,6 +108,10 @@ class WorkerProgress:
         completed_at: When the worker completed (if applicable).
         error: Error message if failed.
         output: Final output or result message.
+        tool_calls: Tool calls made so far.
+        input_tokens: Input tokens used so far.
+        output_tokens: Output tokens used so far.
+        last_tool: Most recent tool called.
     """
 
     task_id: str
@@ -97,6 +126,10 @@ class WorkerProgress:
     completed_at: Optional[str] = None
     error: Optional[str] = None
     output: Optional[str] = None
+    tool_calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    last_tool: Optional[str] = None
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -113,6 +146,10 @@ class WorkerProgress:
             "completed_at": self.completed_at,
             "error": self.error,
             "output": self.output,
+            "tool_calls": self.tool_calls,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "last_tool": self.last_tool,
         }
 
     @classmethod
@@ -131,6 +168,10 @@ class WorkerProgress:
             completed_at=data.get("completed_at"),
             error=data.get("error"),
             output=data.get("output"),
+            tool_calls=data.get("tool_calls", 0),
+            input_tokens=data.get("input_tokens", 0),
+            output_tokens=data.get("output_tokens", 0),
+            last_tool=data.get("last_tool"),
         )
 
 
@@ -174,6 +215,16 @@ class BatchProgress:
         """Count of failed workers."""
         return sum(1 for w in self.workers.values() if w.status == WorkerStatus.FAILED)
 
+    @property
+    def total_tokens(self) -> int:
+        """Tokens used by all workers."""
+        return sum(w.input_tokens + w.output_tokens for w in self.workers.values())
+
+    @property
+    def tool_calls(self) -> int:
+        """Tool calls made by all workers."""
+        return sum(w.tool_calls for w in self.workers.values())
+
     @property
     def is_complete(self) -> bool:
         """Check if all workers have finished."""
@@ -192,10 +243,18 @@ def _run_worker(
     branch_name: str,
     progress_dir: str,
     max_iterations: int,
+    worktree_ready: bool = False,
+    sparse_paths: Optional[list[str]] = None,
+    shared_dirs: tuple[str, ...] = (),
+    channel: Optional[Connection] = None,
 ) -> None:
     """Worker function that runs in a subprocess.
 
-    Creates a worktree and runs an independent RALPH loop.
+    Creates a worktree and runs an independent RALPH loop. Status changes
+    and the loop's iteration, tool and token events are sent to the parent
+    over ``channel`` as ``(worker_id, event, data)`` tuples. Status changes
+    are also written to a progress file, which the parent reads only if
+    the worker exits without reporting its final status.
 
     Args:
         task_id: ID of the task to work on.
@@ -206,10 +265,43 @@ def _run_worker(
         branch_name: Git branch name for the worktree.
         progress_dir: Directory for progress files.
         max_iterations: Maximum iterations for the loop.
+        worktree_ready: The worktree was already checked out by the
+            parent (from the pool); don't create it.
+        sparse_paths: Directories for a sparse checkout (None for a full
+            checkout).
+        shared_dirs: Dependency directories to copy from the main checkout.
+        channel: Write end of the parent's progress pipe (None to only
+            write the progress file).
     """
     import shutil
 
     progress_file = Path(progress_dir) / f"{worker_id}{PROGRESS_FILE_SUFFIX}"
+    registry = None
+    registry_key = branch_name.removeprefix("ralph/")
+    counters: dict[str, Any] = {
+        "tool_calls": 0, "input_tokens": 0, "output_tokens": 0, "last_tool": None,
+    }
+
+    def send(event: str, data: dict[str, Any]) -> None:
+        """Send an event to the parent; stop sending once the pipe breaks."""
+        nonlocal channel
+        if channel is None:
+            return
+        try:
+            channel.send((worker_id, event, data))
+        except (OSError, ValueError) as e:
+            logger.debug(f"Worker {worker_id}: progress channel closed: {e}")
+            channel = None
+
+    def on_loop_event(event: str, data: dict[str, Any]) -> None:
+        """RalphLoop progress hook."""
+        if event == "tool":
+            counters["tool_calls"] += 1
+            counters["last_tool"] = data["tool"]
+        elif event == "tokens":
+            counters["input_tokens"] = data["input_tokens"]
+            counters["output_tokens"] = data["output_tokens"]
+        send(event, data)
 
     def update_progress(
         status: WorkerStatus,
@@ -233,6 +325,7 @@ def _run_worker(
             ) else None,
             error=error,
             output=output,
+            **counters,
         )
 
         # Read existing progress to preserve started_at
@@ -250,6 +343,13 @@ def _run_worker(
         with open(temp_file, "w") as f:
             json.dump(progress.to_dict(), f, indent=2)
         temp_file.rename(progress_file)
+        send("status", progress.to_dict())
+
+        if registry is not None and status in _REGISTRY_STATUS:
+            try:
+                registry.update_status(registry_key, _REGISTRY_STATUS[status])
+            except RegistryError as e:
+                logger.warning(f"Worker {worker_id}: could not update worktree registry: {e}")
 
     try:
         update_progress(WorkerStatus.STARTING)
@@ -261,15 +361,33 @@ def _run_worker(
         prd_file = Path(prd_path)
         repo_path = prd_file.parent
 
-        git = GitTools(repo_path=repo_path)
-        git.worktree_add(
-            path=worktree_path,
-            branch=branch_name,
-            create_branch=True,
-            base_ref="HEAD",
-        )
+        if not worktree_ready:
+            git = GitTools(repo_path=repo_path)
+            git.worktree_add(
+                path=worktree_path,
+                branch=branch_name,
+                create_branch=True,
+                base_ref="HEAD",
+                sparse_paths=sparse_paths,
+            )
 
-        logger.info(f"Worker {worker_id}: Created worktree at {worktree_path}")
+            logger.info(f"Worker {worker_id}: Created worktree at {worktree_path}")
+
+        if shared_dirs:
+            from ralph_agi.tasks.checkout import share_dependency_dirs
+
+            share_dependency_dirs(repo_path, worktree_path, shared_dirs)
+
+        # Record the worktree where the executor and API can see it
+        try:
+            registry = WorktreeRegistry.for_repo(repo_path)
+            registry.add(
+                ActiveWorktree(task_id=registry_key, path=worktree_path, branch=branch_name),
+                replace=True,
+            )
+        except RegistryError as e:
+            logger.warning(f"Worker {worker_id}: could not register worktree: {e}")
+            registry = None
 
         # Copy PRD to worktree (so loop can modify it independently)
         worktree_prd = Path(worktree_path) / prd_file.name
@@ -282,15 +400,17 @@ def _run_worker(
         from ralph_agi.core.loop import RalphLoop
 
         config = load_config(config_path)
+        if not config.llm_rate_state_path:
+            # Workers draw from one LLM rate budget instead of one each
+            config.llm_rate_state_path = str(Path(progress_dir) / RATE_STATE_FILE_NAME)
 
         # Create loop with worktree PRD
         loop = RalphLoop.from_config(config, prd_path=str(worktree_prd))
+        loop.on_event = on_loop_event
 
         # Run the loop with iteration tracking
         completed = False
         try:
-            # Run loop - we can't easily inject iteration callbacks
-            # so we just run and check result
             completed = loop.run(handle_signals=False)
             update_progress(
                 WorkerStatus.COMPLETED,
@@ -309,6 +429,9 @@ def _run_worker(
     except Exception as e:
         logger.error(f"Worker {worker_id} failed: {e}")
         update_progress(WorkerStatus.FAILED, error=str(e))
+    finally:
+        if channel is not None:
+            channel.close()
 
 
 class BatchExecutor:
@@ -357,7 +480,11 @@ class BatchExecutor:
 
         # Track workers
         self._workers: dict[str, multiprocessing.Process] = {}
+        self._channels: dict[str, Connection] = {}
         self._batch_progress: Optional[BatchProgress] = None
+        self._pool: Optional[WorktreePool] = None
+        self._released: set[str] = set()
+        self._prd: Optional[PRD] = None
 
     def run(
         self,
@@ -372,8 +499,10 @@ class BatchExecutor:
             task_ids: Specific task IDs to process. If None, processes
                      all ready tasks from PRD.
             max_iterations: Maximum iterations per worker.
-            on_progress: Optional callback for progress updates.
-            poll_interval: Seconds between progress polls.
+            on_progress: Optional callback, called whenever worker events
+                arrive or a worker exits.
+            poll_interval: Longest wait between progress checks when no
+                worker reports anything.
 
         Returns:
             Final BatchProgress with all worker results.
@@ -408,6 +537,8 @@ class BatchExecutor:
                     completed_at=datetime.now(timezone.utc).isoformat(),
                 )
 
+        self._prd = prd
+
         # Initialize batch progress
         batch_id = str(uuid4())[:8]
         self._batch_progress = BatchProgress(
@@ -419,6 +550,10 @@ class BatchExecutor:
         # Create progress directory
         self._progress_dir.mkdir(parents=True, exist_ok=True)
 
+        self._released.clear()
+        if self._batch_config.worktree_pool_size > 0:
+            self._open_pool(len(task_ids))
+
         # Initialize worker progress
         for task_id in task_ids:
             worker_id = f"{batch_id}-{task_id}"
@@ -443,9 +578,8 @@ class BatchExecutor:
                     task_id = pending.pop(0)
                     self._start_worker(task_id, batch_id, max_iterations)
 
-                # Poll for progress
-                time.sleep(poll_interval)
-                self._update_progress()
+                # Wait for worker events or exits
+                self._update_progress(timeout=poll_interval)
 
                 # Check for completed workers
                 completed_workers = []
@@ -456,6 +590,12 @@ class BatchExecutor:
                 for worker_id in completed_workers:
                     process = self._workers.pop(worker_id)
                     process.join()  # Ensure cleanup
+                    self._finish_worker(worker_id, process.exitcode)
+
+                if self._pool is not None and completed_workers:
+                    # Recycle before starting the next workers so they reuse them
+                    for worker_id in completed_workers:
+                        self._recycle_worktree(worker_id)
 
                 # Notify callback
                 if on_progress:
@@ -473,8 +613,23 @@ class BatchExecutor:
         if self._batch_config.cleanup_on_complete:
             self._cleanup_completed_worktrees()
 
+        if self._pool is not None:
+            self._pool.drain()
+
         return self._batch_progress
 
+    def _open_pool(self, task_count: int) -> None:
+        """Create the worktree pool and warm it for the first workers."""
+        from ralph_agi.tasks.worktree import WorktreePool
+        from ralph_agi.tools.git import GitTools
+
+        self._pool = WorktreePool(
+            GitTools(repo_path=self._repo_path),
+            self._worktree_base / POOL_DIR_NAME,
+            size=self._batch_config.worktree_pool_size,
+        )
+        self._pool.warm(count=min(task_count, self._batch_config.parallel_limit))
+
     def _start_worker(
         self,
         task_id: str,
@@ -495,6 +650,17 @@ class BatchExecutor:
 
         worktree_path = str(self._worktree_base / f"ralph-batch-{safe_task_id}")
         branch_name = f"ralph/batch-{safe_task_id}"
+        worktree_ready = False
+        sparse_paths = self._sparse_paths(task_id)
+
+        if self._pool is not None and sparse_paths is None:
+            from ralph_agi.tasks.worktree import WorktreeError
+
+            try:
+                worktree_path = str(self._pool.acquire(branch_name))
+                worktree_ready = True
+            except WorktreeError as e:
+                logger.warning(f"Worktree pool unavailable for {task_id}: {e}")
 
         # Update progress
         if worker_id in self._batch_progress.workers:
@@ -502,7 +668,8 @@ class BatchExecutor:
             self._batch_progress.workers[worker_id].worktree_path = worktree_path
             self._batch_progress.workers[worker_id].branch_name = branch_name
 
-        # Start subprocess
+        # Start subprocess, with a pipe for its progress events
+        reader, writer = multiprocessing.Pipe(duplex=False)
         process = multiprocessing.Process(
             target=_run_worker,
             args=(
@@ -514,25 +681,109 @@ class BatchExecutor:
                 branch_name,
                 str(self._progress_dir),
                 max_iterations,
+                worktree_ready,
+                sparse_paths,
+                tuple(self._batch_config.shared_dirs),
+                writer,
             ),
             name=f"ralph-worker-{task_id}",
         )
         process.start()
+        # Only the worker holds the write end, so the pipe hits EOF when it exits
+        writer.close()
         self._workers[worker_id] = process
+        self._channels[worker_id] = reader
 
         logger.info(f"Started worker {worker_id} for task {task_id}")
 
-    def _update_progress(self) -> None:
-        """Update batch progress from worker progress files."""
-        for worker_id in self._batch_progress.workers:
-            progress_file = self._progress_dir / f"{worker_id}{PROGRESS_FILE_SUFFIX}"
-            if progress_file.exists():
-                try:
-                    with open(progress_file) as f:
-                        data = json.load(f)
-                    self._batch_progress.workers[worker_id] = WorkerProgress.from_dict(data)
-                except Exception as e:
-                    logger.debug(f"Error reading progress for {worker_id}: {e}")
+    def _sparse_paths(self, task_id: str) -> Optional[list[str]]:
+        """Sparse checkout directories for a feature (None when disabled)."""
+        if not self._batch_config.sparse_checkout:
+            return None
+        from ralph_agi.tasks.checkout import derive_sparse_paths, task_hints
+
+        feature = next((f for f in self._prd.features if f.id == task_id), None) if self._prd else None
+        return derive_sparse_paths(self._repo_path, task_hints(feature) if feature else [])
+
+    def _update_progress(self, timeout: float = 0.0) -> None:
+        """Apply the events workers have sent.
+
+        Args:
+            timeout: Seconds to wait for the first event or worker exit
+                when none is pending.
+        """
+        waitables: list[Any] = list(self._channels.values())
+        waitables.extend(process.sentinel for process in self._workers.values())
+        if not waitables:
+            if timeout > 0:
+                time.sleep(timeout)
+            return
+        if not wait(waitables, timeout):
+            return
+        for worker_id in list(self._channels):
+            self._receive(worker_id)
+
+    def _receive(self, worker_id: str) -> None:
+        """Apply a worker's queued events; close its pipe at EOF."""
+        conn = self._channels[worker_id]
+        try:
+            while conn.poll():
+                _, event, data = conn.recv()
+                self._apply_event(worker_id, event, data)
+        except (EOFError, OSError):
+            conn.close()
+            del self._channels[worker_id]
+        except Exception as e:
+            logger.debug(f"Bad progress event from {worker_id}: {e}")
+
+    def _apply_event(self, worker_id: str, event: str, data: dict[str, Any]) -> None:
+        """Fold one worker event into the batch progress."""
+        if event == "status":
+            self._batch_progress.workers[worker_id] = WorkerProgress.from_dict(data)
+            return
+        progress = self._batch_progress.workers.get(worker_id)
+        if progress is None:
+            return
+        if event in ("iteration_started", "iteration_completed"):
+            progress.iteration = data["iteration"]
+        elif event == "tool":
+            progress.tool_calls += 1
+            progress.last_tool = data["tool"]
+        elif event == "tokens":
+            progress.input_tokens = data["input_tokens"]
+            progress.output_tokens = data["output_tokens"]
+        progress.updated_at = datetime.now(timezone.utc).isoformat()
+
+    def _finish_worker(self, worker_id: str, exitcode: Optional[int]) -> None:
+        """Settle an exited worker's progress.
+
+        Reads the rest of its events. If none carried a final status (the
+        worker crashed or its pipe broke), falls back to its progress file,
+        and marks it failed if that has none either.
+        """
+        if worker_id in self._channels:
+            self._receive(worker_id)
+        progress = self._batch_progress.workers.get(worker_id)
+        if progress is None or progress.status not in (WorkerStatus.STARTING, WorkerStatus.RUNNING):
+            return
+
+        progress_file = self._progress_dir / f"{worker_id}{PROGRESS_FILE_SUFFIX}"
+        if progress_file.exists():
+            try:
+                with open(progress_file) as f:
+                    recovered = WorkerProgress.from_dict(json.load(f))
+                # Keep the live counters; the file only has status changes
+                for name in ("iteration", "tool_calls", "input_tokens", "output_tokens", "last_tool"):
+                    setattr(recovered, name, getattr(progress, name) or getattr(recovered, name))
+                progress = self._batch_progress.workers[worker_id] = recovered
+            except Exception as e:
+                logger.debug(f"Error reading progress for {worker_id}: {e}")
+
+        if progress.status in (WorkerStatus.STARTING, WorkerStatus.RUNNING):
+            progress.status = WorkerStatus.FAILED
+            progress.error = progress.error or f"Worker exited with code {exitcode} without reporting"
+            progress.completed_at = datetime.now(timezone.utc).isoformat()
+            logger.warning(f"Worker {worker_id} exited with code {exitcode} without reporting")
 
     def _cancel_workers(self) -> None:
         """Cancel all running workers."""
@@ -548,6 +799,40 @@ class BatchExecutor:
                 self._batch_progress.workers[worker_id].status = WorkerStatus.CANCELLED
 
         self._workers.clear()
+        # Drop events still queued so they don't overwrite CANCELLED
+        for conn in self._channels.values():
+            conn.close()
+        self._channels.clear()
+
+    def _recycle_worktree(self, worker_id: str) -> None:
+        """Return a completed worker's pooled worktree and delete its branch."""
+        progress = self._batch_progress.workers.get(worker_id)
+        if (
+            not self._batch_config.cleanup_on_complete
+            or progress is None
+            or progress.status != WorkerStatus.COMPLETED
+            or not progress.worktree_path
+        ):
+            return
+
+        from ralph_agi.tasks.worktree import WorktreeError
+        from ralph_agi.tools.git import GitCommandError, GitTools
+
+        try:
+            if not self._pool.release(progress.worktree_path, force=True):
+                return
+        except (WorktreeError, GitCommandError) as e:
+            logger.warning(f"Failed to recycle worktree for {worker_id}: {e}")
+            return
+        self._released.add(worker_id)
+        self._unregister(progress)
+
+        if progress.branch_name and progress.branch_name not in ("main", "master", "develop"):
+            try:
+                GitTools(repo_path=self._repo_path).delete_branch(progress.branch_name, force=True)
+            except GitCommandError as e:
+                logger.debug(f"Could not delete branch {progress.branch_name}: {e}")
+        logger.info(f"Recycled worktree for {worker_id}")
 
     def _cleanup_completed_worktrees(self) -> None:
         """Cleanup worktrees for completed workers."""
@@ -556,7 +841,7 @@ class BatchExecutor:
         cleanup = create_cleanup_manager(self._repo_path)
 
         for worker_id, progress in self._batch_progress.workers.items():
-            if progress.status != WorkerStatus.COMPLETED:
+            if progress.status != WorkerStatus.COMPLETED or worker_id in self._released:
                 continue
 
             if not progress.worktree_path:
@@ -566,10 +851,22 @@ class BatchExecutor:
             if worktree_path.exists():
                 result = cleanup.cleanup_worktree(worktree_path)
                 if result.success:
+                    self._unregister(progress)
                     logger.info(f"Cleaned up worktree for {worker_id}")
                 else:
                     logger.warning(f"Failed to cleanup worktree for {worker_id}: {result.error}")
 
+    def _unregister(self, progress: WorkerProgress) -> None:
+        """Drop a cleaned-up worker's worktree from the registry."""
+        if not progress.branch_name:
+            return
+        try:
+            WorktreeRegistry.for_repo(self._repo_path).remove(
+                progress.branch_name.removeprefix("ralph/")
+            )
+        except RegistryError as e:
+            logger.warning(f"Failed to unregister worktree {progress.branch_name}: {e}")
+
     def get_progress(self) -> Optional[BatchProgress]:
         """Get current batch progress.
 
@@ -595,7 +892,8 @@ def format_batch_progress(progress: BatchProgress) -> str:
         f"  Running: {progress.running_count}  "
         f"Completed: {progress.completed_count}  "
         f"Failed: {progress.failed_count}  "
-        f"Pending: {progress.pending_count}",
+        f"Pending: {progress.pending_count}"
+        + (f"  Tokens: {progress.total_tokens:,}" if progress.total_tokens else ""),
         "",
     ]
 
@@ -611,7 +909,12 @@ def format_batch_progress(progress: BatchProgress) -> str:
 
         line = f"  {status_symbol} {worker.task_id}"
         if worker.status == WorkerStatus.RUNNING:
-            line += f" (iteration {worker.iteration}/{worker.max_iterations})"
+            line += f" (iteration {worker.iteration}/{worker.max_iterations}"
+            if worker.tool_calls:
+                line += f", {worker.tool_calls} tool calls"
+            if worker.input_tokens or worker.output_tokens:
+                line += f", {worker.input_tokens + worker.output_tokens:,} tokens"
+            line += ")"
         elif worker.status == WorkerStatus.COMPLETED:
             line += f" - {worker.output or 'done'}"
         elif worker.status == WorkerStatus.FAILED:
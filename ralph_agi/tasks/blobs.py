@@ -0,0 +1,282 @@
+"""Content-addressed blob store for task artifacts.
+
+Artifact contents are kept in `.ralph/blobs/` instead of inline in each
+task's YAML file. A blob is keyed by the sha256 of its content, so the
+same file produced by several tasks is stored once. The task YAML only
+holds the key.
+
+Blobs are gzip-compressed when that makes them meaningfully smaller.
+They are stored as ``ab/abcdef....gz``; incompressible content is stored
+uncompressed as ``ab/abcdef...``.
+
+Usage:
+    from ralph_agi.tasks.blobs import BlobStore
+
+    store = BlobStore(Path(".ralph/blobs"))
+    digest = store.put_file(Path("src/app.py"))
+    for chunk in store.iter_chunks(digest):
+        ...
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import time
+from pathlib import Path
+from typing import BinaryIO, Iterable, Iterator
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 64 * 1024
+
+# Keep compressed output only if it is at most this fraction of the original
+COMPRESSION_THRESHOLD = 0.9
+
+_DIGEST_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+class BlobError(Exception):
+    """Raised when a blob cannot be stored or read."""
+
+    pass
+
+
+class BlobNotFoundError(BlobError):
+    """Raised when a blob does not exist in the store."""
+
+    def __init__(self, digest: str):
+        self.digest = digest
+        super().__init__(f"Blob not found: {digest}")
+
+
+class BlobStore:
+    """Stores file contents by sha256, deduplicated and optionally compressed."""
+
+    def __init__(self, root: Path | str, compress: bool = True):
+        """Initialize the store.
+
+        Args:
+            root: Directory holding the blobs (created on first write).
+            compress: Gzip blobs when it saves space.
+        """
+        self.root = Path(root)
+        self.compress = compress
+
+    def put(self, data: bytes) -> str:
+        """Store bytes and return their sha256 digest."""
+        digest = hashlib.sha256(data).hexdigest()
+        if self._touch(digest):
+            return digest
+
+        try:
+            if self.compress and data:
+                compressed = gzip.compress(data, mtime=0)
+                if len(compressed) <= len(data) * COMPRESSION_THRESHOLD:
+                    self._commit(self._write_temp(digest, [compressed]), digest, compressed=True)
+                    return digest
+            self._commit(self._write_temp(digest, [data]), digest, compressed=False)
+        except OSError as e:
+            raise BlobError(f"Failed to store blob {digest}: {e}") from e
+        return digest
+
+    def put_file(self, path: Path | str) -> str:
+        """Store a file's content without loading it all into memory.
+
+        Returns:
+            The sha256 digest of the content.
+
+        Raises:
+            BlobError: If the file cannot be read or the blob written.
+        """
+        path = Path(path)
+        try:
+            digest = _hash_file(path)
+            if self._touch(digest):
+                return digest
+
+            size = path.stat().st_size
+            if self.compress and size:
+                temp = self._write_temp(digest, _read_chunks(path), gzip_level=6)
+                if temp.stat().st_size <= size * COMPRESSION_THRESHOLD:
+                    self._commit(temp, digest, compressed=True)
+                    return digest
+                temp.unlink()
+            self._commit(self._write_temp(digest, _read_chunks(path)), digest, compressed=False)
+            return digest
+        except OSError as e:
+            raise BlobError(f"Failed to store {path}: {e}") from e
+
+    def exists(self, digest: str) -> bool:
+        """Check whether a blob is stored."""
+        return self._find(digest) is not None
+
+    def is_compressed(self, digest: str) -> bool:
+        """Whether a blob is stored gzip-compressed.
+
+        Raises:
+            BlobNotFoundError: If the blob doesn't exist.
+        """
+        return self._locate(digest).suffix == ".gz"
+
+    def open(self, digest: str) -> BinaryIO:
+        """Open a blob for reading its original content.
+
+        Raises:
+            BlobNotFoundError: If the blob doesn't exist.
+        """
+        path = self._locate(digest)
+        if path.suffix == ".gz":
+            return gzip.open(path, "rb")
+        return open(path, "rb")
+
+    def read(self, digest: str) -> bytes:
+        """Read a blob's content into memory."""
+        with self.open(digest) as f:
+            return f.read()
+
+    def iter_chunks(self, digest: str, raw: bool = False) -> Iterator[bytes]:
+        """Yield a blob's content in chunks.
+
+        Args:
+            digest: Blob key.
+            raw: Yield the stored bytes (gzip data for compressed blobs)
+                instead of the original content.
+
+        Raises:
+            BlobNotFoundError: If the blob doesn't exist.
+        """
+        f = open(self._locate(digest), "rb") if raw else self.open(digest)
+
+        def chunks() -> Iterator[bytes]:
+            with f:
+                while chunk := f.read(CHUNK_SIZE):
+                    yield chunk
+
+        return chunks()
+
+    def prune(self, referenced: Iterable[str], min_age: float = 3600.0) -> int:
+        """Delete blobs that are no longer referenced.
+
+        Args:
+            referenced: Digests still in use.
+            min_age: Only delete blobs older than this many seconds, so
+                blobs written for a task that hasn't been saved yet
+                survive.
+
+        Returns:
+            Number of blobs deleted.
+        """
+        keep = set(referenced)
+        cutoff = time.time() - min_age
+        removed = 0
+        if not self.root.is_dir():
+            return 0
+        for shard in self.root.iterdir():
+            if not shard.is_dir():
+                continue
+            for path in shard.iterdir():
+                digest = path.name.removesuffix(".gz")
+                if not _DIGEST_RE.match(digest) or digest in keep:
+                    continue
+                try:
+                    if path.stat().st_mtime < cutoff:
+                        path.unlink()
+                        removed += 1
+                except OSError:
+                    pass
+        if removed:
+            logger.info(f"Pruned {removed} unreferenced blob(s)")
+        return removed
+
+    def _path(self, digest: str) -> Path:
+        if not _DIGEST_RE.match(digest):
+            raise BlobNotFoundError(digest)
+        return self.root / digest[:2] / digest
+
+    def _find(self, digest: str) -> Path | None:
+        try:
+            path = self._path(digest)
+        except BlobNotFoundError:
+            return None
+        gz_path = path.with_name(path.name + ".gz")
+        if gz_path.exists():
+            return gz_path
+        if path.exists():
+            return path
+        return None
+
+    def _touch(self, digest: str) -> bool:
+        """Mark an existing blob as just written, so prune() keeps it.
+
+        Returns:
+            False if the blob doesn't exist (or was pruned meanwhile).
+        """
+        path = self._find(digest)
+        if path is None:
+            return False
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _locate(self, digest: str) -> Path:
+        path = self._find(digest)
+        if path is None:
+            raise BlobNotFoundError(digest)
+        return path
+
+    def _write_temp(
+        self,
+        digest: str,
+        chunks: Iterable[bytes],
+        gzip_level: int | None = None,
+    ) -> Path:
+        """Write content to a temp file next to the blob's final path.
+
+        Args:
+            digest: Blob key.
+            chunks: Content to write.
+            gzip_level: Compress while writing at this level.
+        """
+        shard = self._path(digest).parent
+        shard.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(dir=shard, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as raw:
+                if gzip_level is None:
+                    for chunk in chunks:
+                        raw.write(chunk)
+                else:
+                    with gzip.GzipFile(fileobj=raw, mode="wb", compresslevel=gzip_level, mtime=0) as out:
+                        for chunk in chunks:
+                            out.write(chunk)
+        except BaseException:
+            Path(temp_name).unlink(missing_ok=True)
+            raise
+        return Path(temp_name)
+
+    def _commit(self, temp: Path, digest: str, compressed: bool) -> None:
+        """Move a finished temp file into place atomically."""
+        path = self._path(digest)
+        if compressed:
+            path = path.with_name(path.name + ".gz")
+        os.replace(temp, path)
+
+
+def _read_chunks(path: Path) -> Iterator[bytes]:
+    with open(path, "rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            yield chunk
+
+
+def _hash_file(path: Path) -> str:
+    hasher = hashlib.sha256()
+    for chunk in _read_chunks(path):
+        hasher.update(chunk)
+    return hasher.hexdigest()
@@ -0,0 +1,328 @@
+"""Change detection for task worktrees.
+
+Finds the files a task added, modified or deleted without walking and
+reading the whole tree. In a git worktree the changes come from git:
+
+- ``git status --porcelain=v2`` lists tracked and untracked (not
+  ignored) files that differ from HEAD.
+- ``git diff --name-status`` from the base commit to HEAD adds anything
+  the task committed.
+
+Outside git, a snapshot of (inode, size, mtime) per file is compared
+instead. Either way, files that were already dirty when the snapshot
+was taken are only reported if they changed again.
+
+Only sizes are collected up front; contents are read on request or
+copied into the task queue's BlobStore.
+
+Usage:
+    from ralph_agi.tasks.changes import ChangeTracker
+
+    tracker = ChangeTracker(worktree_path)
+    tracker.snapshot()
+    # ... run the task ...
+    for change in tracker.changes():
+        print(change.change_type.value, change.path, change.size)
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import subprocess
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Optional
+
+from ralph_agi.tasks.blobs import BlobError, BlobStore
+from ralph_agi.tasks.queue import TaskArtifact
+
+logger = logging.getLogger(__name__)
+
+# Largest file whose content is returned as inline text
+MAX_INLINE_CONTENT_BYTES = 100_000
+
+# Largest file copied into the blob store when it becomes an artifact
+MAX_STORED_ARTIFACT_BYTES = 10 * 1024 * 1024
+
+# Directories skipped by the non-git scan
+EXCLUDE_DIRS = frozenset({
+    ".git", "node_modules", "__pycache__", ".venv", "venv", ".ralph", "dist", "build",
+})
+
+GIT_TIMEOUT = 60
+
+# (inode, size, mtime_ns); None for a file that doesn't exist
+FileSignature = Optional[tuple[int, int, int]]
+
+
+class ChangeType(str, Enum):
+    """How a file changed."""
+
+    ADDED = "added"
+    MODIFIED = "modified"
+    DELETED = "deleted"
+
+
+@dataclass
+class FileChange:
+    """A file added, modified or deleted by a task.
+
+    Attributes:
+        path: Path relative to the tracked root.
+        change_type: How the file changed.
+        size: Size in bytes (None for deleted files).
+        root: Tracked root directory.
+    """
+
+    path: str
+    change_type: ChangeType
+    size: Optional[int]
+    root: Path
+
+    @property
+    def absolute_path(self) -> Path:
+        """Absolute path of the file."""
+        return self.root / self.path
+
+    def read_text(self, max_bytes: int = MAX_INLINE_CONTENT_BYTES) -> Optional[str]:
+        """Read the file's content.
+
+        Returns:
+            The text, or None if the file is deleted, larger than
+            ``max_bytes``, binary or unreadable.
+        """
+        if self.change_type == ChangeType.DELETED:
+            return None
+        return read_text_content(self.absolute_path, max_bytes)
+
+    def to_artifact(
+        self,
+        include_content: bool = False,
+        blobs: Optional[BlobStore] = None,
+    ) -> TaskArtifact:
+        """Convert to a TaskArtifact.
+
+        Args:
+            include_content: Read small text files inline. By default
+                content is left for the caller to load on request.
+            blobs: Store the file's content here (up to
+                MAX_STORED_ARTIFACT_BYTES) so it outlives the worktree.
+        """
+        deleted = self.change_type == ChangeType.DELETED
+        suffix = Path(self.path).suffix
+        blob = None
+        if blobs is not None and not deleted and (self.size or 0) <= MAX_STORED_ARTIFACT_BYTES:
+            try:
+                blob = blobs.put_file(self.absolute_path)
+            except BlobError as e:
+                logger.warning(f"Could not store artifact {self.path}: {e}")
+        return TaskArtifact(
+            path=self.path,
+            absolute_path=None if deleted else str(self.absolute_path),
+            file_type=suffix.lstrip(".") if suffix else None,
+            size=self.size,
+            content=self.read_text() if include_content else None,
+            change_type=self.change_type.value,
+            blob=blob,
+        )
+
+
+def read_text_content(path: Path, max_bytes: int = MAX_INLINE_CONTENT_BYTES) -> Optional[str]:
+    """Read a small text file.
+
+    Returns:
+        The text, or None if the file is missing, larger than
+        ``max_bytes``, binary or unreadable.
+    """
+    try:
+        if path.stat().st_size > max_bytes:
+            return None
+        return path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+class ChangeTracker:
+    """Tracks file changes under a directory between two points in time."""
+
+    def __init__(self, root: Path | str, base_commit: Optional[str] = None):
+        """Initialize the tracker.
+
+        Args:
+            root: Directory to track (usually a task worktree).
+            base_commit: Commit to diff against in a git worktree
+                (default: HEAD when the snapshot is taken).
+        """
+        self.root = Path(root)
+        self.base_commit = base_commit
+        self._git: Optional[bool] = None
+        self._prefix = ""
+        # Git: signatures of files already dirty at snapshot time.
+        # Non-git: signatures of every file.
+        self._baseline: dict[str, FileSignature] = {}
+        self._snapshot_taken = False
+
+    @property
+    def uses_git(self) -> bool:
+        """Whether changes come from git rather than a file scan."""
+        if self._git is None:
+            prefix = self._run_git("rev-parse", "--show-prefix")
+            self._git = prefix is not None
+            self._prefix = (prefix or "").strip()
+        return self._git
+
+    def snapshot(self) -> None:
+        """Record the state changes are measured from."""
+        if self.uses_git:
+            if self.base_commit is None:
+                head = self._run_git("rev-parse", "--verify", "HEAD")
+                self.base_commit = head.strip() if head else None
+            self._baseline = {
+                path: self._signature(path) for path in self._git_changes()
+            }
+        else:
+            self._baseline = self._scan()
+        self._snapshot_taken = True
+
+    def changes(self) -> list[FileChange]:
+        """List files changed since the snapshot, sorted by path."""
+        if not self._snapshot_taken:
+            raise RuntimeError("snapshot() must be called before changes()")
+
+        if self.uses_git:
+            found = {
+                path: change_type
+                for path, change_type in self._git_changes().items()
+                if path not in self._baseline or self._signature(path) != self._baseline[path]
+            }
+            sizes = {path: self._size(path) for path in found}
+        else:
+            current = self._scan()
+            found = {}
+            for path, signature in current.items():
+                before = self._baseline.get(path)
+                if before is None:
+                    found[path] = ChangeType.ADDED
+                elif before != signature:
+                    found[path] = ChangeType.MODIFIED
+            for path in self._baseline.keys() - current.keys():
+                found[path] = ChangeType.DELETED
+            sizes = {path: sig[1] if sig else None for path, sig in current.items()}
+
+        return [
+            FileChange(
+                path=path,
+                change_type=change_type,
+                size=None if change_type == ChangeType.DELETED else sizes.get(path),
+                root=self.root,
+            )
+            for path, change_type in sorted(found.items())
+        ]
+
+    def _git_changes(self) -> dict[str, ChangeType]:
+        """Changes from the base commit to the working tree.
+
+        ``git status`` compares the working tree (tracked and untracked)
+        with HEAD in one pass. If the task committed, a tree-to-tree
+        ``git diff`` from the base to HEAD fills in the rest; it doesn't
+        touch the working tree.
+        """
+        # path -> (exists at base, exists now)
+        presence: dict[str, tuple[bool, bool]] = {}
+
+        head = self._run_git("rev-parse", "--verify", "HEAD")
+        if self.base_commit and head and head.strip() != self.base_commit:
+            diff = self._run_git(
+                "diff", "--name-status", "-z", "--no-renames", "--relative",
+                self.base_commit, "HEAD", "--",
+            )
+            fields = (diff or "").split("\0")
+            for status, path in zip(fields[::2], fields[1::2]):
+                presence[path] = (not status.startswith("A"), not status.startswith("D"))
+
+        status = self._run_git(
+            "status", "--porcelain=v2", "-z", "--no-renames", "--untracked-files=all", "--", ".",
+        )
+        for entry in (status or "").split("\0"):
+            if entry.startswith("? "):
+                path, in_head, now = entry[2:], False, True
+            elif entry.startswith("1 "):
+                xy = entry[2:4]
+                path, in_head, now = entry.split(" ", 8)[-1], xy[0] != "A", "D" not in xy
+            elif entry.startswith("u "):
+                path, in_head, now = entry.split(" ", 10)[-1], True, True
+            else:
+                continue
+            # Porcelain paths are relative to the repository root
+            if not path.startswith(self._prefix):
+                continue
+            path = path[len(self._prefix):]
+            in_base = presence[path][0] if path in presence else in_head
+            presence[path] = (in_base, now)
+
+        changes: dict[str, ChangeType] = {}
+        for path, (in_base, now) in presence.items():
+            if in_base and now:
+                changes[path] = ChangeType.MODIFIED
+            elif now:
+                changes[path] = ChangeType.ADDED
+            elif in_base:
+                changes[path] = ChangeType.DELETED
+        return changes
+
+    def _run_git(self, *args: str) -> Optional[str]:
+        """Run git in the root; None if git is unavailable or fails."""
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                cwd=self.root,
+                capture_output=True,
+                text=True,
+                timeout=GIT_TIMEOUT,
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            logger.debug(f"git {args[0]} failed in {self.root}: {e}")
+            return None
+        if result.returncode != 0:
+            logger.debug(f"git {args[0]} failed in {self.root}: {result.stderr.strip()}")
+            return None
+        return result.stdout
+
+    def _signature(self, path: str) -> FileSignature:
+        try:
+            st = os.stat(self.root / path)
+        except OSError:
+            return None
+        return (st.st_ino, st.st_size, st.st_mtime_ns)
+
+    def _size(self, path: str) -> Optional[int]:
+        try:
+            return os.stat(self.root / path).st_size
+        except OSError:
+            return None
+
+    def _scan(self) -> dict[str, FileSignature]:
+        """Signatures of every file under the root, skipping EXCLUDE_DIRS."""
+        signatures: dict[str, FileSignature] = {}
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            try:
+                entries = os.scandir(self.root / rel_dir)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    rel_path = os.path.join(rel_dir, entry.name) if rel_dir else entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in EXCLUDE_DIRS:
+                                stack.append(rel_path)
+                            continue
+                        st = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+                    signatures[rel_path] = (st.st_ino, st.st_size, st.st_mtime_ns)
+        return signatures
@@ -0,0 +1,338 @@
+"""Lighter worktree checkouts for large repositories.
+
+Two opt-in ways to make a task worktree cheaper to create:
+
+- Sparse checkout. Only the directories a task refers to (paths in its
+  description, steps, acceptance criteria or ``metadata["paths"]``) are
+  checked out, in git's cone mode, plus the files at the repository root.
+  When a file tool touches a path outside the cone, ``SparseCheckout.ensure``
+  adds its directory with ``git sparse-checkout add``.
+- Shared dependency directories. Directories such as ``node_modules`` or
+  ``.venv`` are copied from the main checkout instead of being installed
+  again. Files are cloned copy-on-write (Linux ``FICLONE``, e.g. btrfs or
+  XFS) where the filesystem supports it, otherwise hard-linked. Hard links
+  share the file with the main checkout, so tools that rewrite files in
+  place would change both; package managers replace files instead.
+
+Usage:
+    from ralph_agi.tasks.checkout import (
+        SparseCheckout, derive_sparse_paths, share_dependency_dirs, task_hints,
+    )
+
+    cone = derive_sparse_paths(repo_path, task_hints(task))
+    git.worktree_add(str(path), branch, sparse_paths=cone)
+    share_dependency_dirs(repo_path, path, ["node_modules", ".venv"])
+
+    sparse = SparseCheckout(path)
+    sparse.ensure(path / "docs" / "api.md")  # Widens the cone if needed
+"""
+
+from __future__ import annotations
+
+import errno
+import logging
+import os
+import re
+import shutil
+import subprocess
+import sys
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+GIT_TIMEOUT = 60
+
+# Ways to copy a shared directory, most to least preferred
+SHARE_MODES = ("auto", "reflink", "hardlink", "copy")
+
+# linux/fs.h: _IOW(0x94, 9, int)
+_FICLONE = 0x40049409
+
+# errno values meaning "this filesystem can't clone/link these files"
+_NO_REFLINK = {errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS, errno.EBADF}
+_NO_HARDLINK = {errno.EXDEV, errno.EPERM, errno.EMLINK, errno.EOPNOTSUPP}
+
+# Path-like tokens in free text: "src/app/main.py", "frontend", "./lib/"
+_PATH_TOKEN = re.compile(r"[\w.\-/]+")
+
+
+def task_hints(task: Any) -> list[str]:
+    """Text that may mention the paths a task will touch.
+
+    Works for queued tasks and PRD features: the description, steps and
+    acceptance criteria, and ``metadata["paths"]`` if present.
+    """
+    hints = [getattr(task, "description", "") or ""]
+    hints.extend(getattr(task, "steps", ()) or ())
+    hints.extend(getattr(task, "acceptance_criteria", ()) or ())
+    paths = (getattr(task, "metadata", None) or {}).get("paths")
+    if isinstance(paths, str):
+        hints.append(paths)
+    elif isinstance(paths, (list, tuple)):
+        hints.extend(str(p) for p in paths)
+    return hints
+
+
+def derive_sparse_paths(repo_path: str | Path, hints: Iterable[str]) -> list[str]:
+    """Directories to check out for paths mentioned in ``hints``.
+
+    Each path-like token maps to the deepest directory tracked at HEAD
+    that contains it, so ``src/api/users.py`` gives ``src/api`` (whether
+    or not the file exists yet). Tokens that aren't under a tracked
+    directory are ignored; root files are always checked out.
+
+    Args:
+        repo_path: Repository (or worktree) to look the paths up in
+        hints: Free text and paths
+
+    Returns:
+        Sorted directories, without any nested inside another
+    """
+    tracked = _tracked_dirs(Path(repo_path))
+    if tracked is None:
+        return []
+    found = set()
+    for hint in hints:
+        for token in _PATH_TOKEN.findall(hint):
+            # Drop "./" in front and sentence punctuation after
+            directory = _deepest_tracked(token.removeprefix("./").rstrip("./"), tracked)
+            if directory:
+                found.add(directory)
+    return _outermost(found)
+
+
+class SparseCheckout:
+    """The sparse-checkout cone of a worktree."""
+
+    def __init__(self, root: str | Path):
+        """Initialize for a worktree. Nothing is run until first use.
+
+        Args:
+            root: Top directory of the worktree
+        """
+        self.root = Path(root).resolve()
+        self._lock = threading.Lock()
+        self._cone: Optional[list[str]] = None
+        self._tracked: Optional[set[str]] = None
+        self.widened = 0
+
+    def is_enabled(self) -> bool:
+        """Whether the worktree is a cone-mode sparse checkout."""
+        listed = _run_git(self.root, "config", "--bool", "--get-regexp", r"^core\.sparsecheckout")
+        settings = dict(line.split(" ", 1) for line in (listed or "").splitlines() if " " in line)
+        return (
+            settings.get("core.sparsecheckout") == "true"
+            and settings.get("core.sparsecheckoutcone") == "true"
+        )
+
+    def cone(self) -> list[str]:
+        """Directories currently checked out (besides root files)."""
+        with self._lock:
+            return list(self._load_cone())
+
+    def ensure(self, path: str | Path) -> bool:
+        """Make sure the directory holding ``path`` is checked out.
+
+        Args:
+            path: Absolute path, or path relative to the worktree
+
+        Returns:
+            True if the cone was widened
+        """
+        path = Path(path)
+        if not path.is_absolute():
+            path = self.root / path
+        try:
+            rel = path.resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return False
+
+        with self._lock:
+            if self._tracked is None:
+                self._tracked = _tracked_dirs(self.root) or set()
+            directory = _deepest_tracked(rel, self._tracked)
+            cone = self._load_cone()
+            if not directory or _materialized(directory, cone):
+                return False
+            if _run_git(self.root, "sparse-checkout", "add", "--", directory) is None:
+                return False
+            self._cone = _outermost([*cone, directory])
+            self.widened += 1
+        logger.info(f"SPARSE_WIDEN: {self.root} += {directory}")
+        return True
+
+    def _load_cone(self) -> list[str]:
+        if self._cone is None:
+            listed = _run_git(self.root, "sparse-checkout", "list") or ""
+            self._cone = [line.strip() for line in listed.splitlines() if line.strip()]
+        return self._cone
+
+
+@dataclass
+class SharedDir:
+    """A dependency directory copied into a worktree.
+
+    Attributes:
+        path: Directory relative to the repository root
+        method: "reflink", "hardlink" or "copy" (the last one used if the
+            filesystem forced a fallback part way)
+        files: Number of files copied
+    """
+
+    path: str
+    method: str
+    files: int
+
+
+def share_dependency_dirs(
+    source_root: str | Path,
+    dest_root: str | Path,
+    dirs: Iterable[str],
+    mode: str = "auto",
+) -> list[SharedDir]:
+    """Copy dependency directories from the main checkout into a worktree.
+
+    Directories missing from the source, or already present in the
+    worktree, are skipped.
+
+    Args:
+        source_root: Main checkout
+        dest_root: Worktree
+        dirs: Directories relative to the repository root
+        mode: "auto" (reflink, else hard link), "reflink" (else copy),
+            "hardlink" or "copy"
+
+    Returns:
+        The directories copied
+
+    Raises:
+        ValueError: If the mode is unknown
+    """
+    if mode not in SHARE_MODES:
+        raise ValueError(f"Unknown share mode: {mode}")
+    source_root, dest_root = Path(source_root), Path(dest_root)
+    shared = []
+    for rel in dirs:
+        src, dst = source_root / rel, dest_root / rel
+        if not src.is_dir() or dst.exists():
+            continue
+        linker = _Linker(mode)
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            shutil.copytree(src, dst, symlinks=True, copy_function=linker.copy)
+        except (OSError, shutil.Error) as e:
+            logger.warning(f"Could not share {rel} into {dest_root}: {e}")
+            shutil.rmtree(dst, ignore_errors=True)
+            continue
+        shared.append(SharedDir(rel, linker.method, linker.files))
+        logger.info(f"SHARED_DIR: {rel} -> {dest_root} ({linker.method}, {linker.files} files)")
+    return shared
+
+
+class _Linker:
+    """copytree copy_function that clones or links, falling back once."""
+
+    def __init__(self, mode: str):
+        self.method = "reflink" if mode in ("auto", "reflink") else mode
+        self._fallback = "copy" if mode == "reflink" else "hardlink"
+        self.files = 0
+
+    def copy(self, src: str, dst: str) -> str:
+        if self.method == "reflink":
+            try:
+                _reflink(src, dst)
+                self.files += 1
+                return dst
+            except OSError as e:
+                if e.errno not in _NO_REFLINK:
+                    raise
+                self.method = self._fallback
+        if self.method == "hardlink":
+            try:
+                os.link(src, dst)
+                self.files += 1
+                return dst
+            except OSError as e:
+                if e.errno not in _NO_HARDLINK:
+                    raise
+                self.method = "copy"
+        shutil.copy2(src, dst)
+        self.files += 1
+        return dst
+
+
+def _reflink(src: str, dst: str) -> None:
+    """Clone a file's blocks copy-on-write."""
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.EOPNOTSUPP, "reflink needs Linux FICLONE")
+    import fcntl
+
+    with open(src, "rb") as fsrc:
+        try:
+            with open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+        except OSError:
+            os.unlink(dst)
+            raise
+    shutil.copystat(src, dst)
+
+
+def _tracked_dirs(root: Path) -> Optional[set[str]]:
+    """Directories tracked at HEAD, or None outside git."""
+    listed = _run_git(root, "ls-tree", "-r", "-d", "--name-only", "HEAD")
+    if listed is None:
+        return None
+    return {line for line in listed.splitlines() if line}
+
+
+def _deepest_tracked(rel: str, tracked: set[str]) -> str:
+    """Deepest tracked directory that is ``rel`` or contains it ("" if none)."""
+    parts = [p for p in rel.split("/") if p and p != "."]
+    for end in range(len(parts), 0, -1):
+        candidate = "/".join(parts[:end])
+        if candidate in tracked:
+            return candidate
+    return ""
+
+
+def _materialized(directory: str, cone: list[str]) -> bool:
+    """Whether the files directly in ``directory`` are checked out.
+
+    In cone mode that is true for directories in the cone, below one, or
+    on the way to one.
+    """
+    return any(
+        directory == c or directory.startswith(c + "/") or c.startswith(directory + "/")
+        for c in cone
+    )
+
+
+def _outermost(dirs: Iterable[str]) -> list[str]:
+    """Sorted directories, dropping any inside another."""
+    result: list[str] = []
+    for directory in sorted(set(dirs)):
+        if not any(directory.startswith(kept + "/") for kept in result):
+            result.append(directory)
+    return result
+
+
+def _run_git(root: Path, *args: str) -> Optional[str]:
+    """Run git in ``root``; None if git is unavailable or fails."""
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            cwd=root,
+            capture_output=True,
+            text=True,
+            timeout=GIT_TIMEOUT,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.debug(f"git {args[0]} failed in {root}: {e}")
+        return None
+    if result.returncode != 0:
+        logger.debug(f"git {args[0]} failed in {root}: {result.stderr.strip()}")
+        return None
+    return result.stdout
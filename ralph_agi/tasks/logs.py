@@ -0,0 +1,312 @@
+"""Append-only execution log stream for a task.
+
+Log entries are written to `.ralph/logs/<task_id>.jsonl` as the task
+runs, one JSON object per line, so the API and TUI can follow a long task
+while it is still running. The task record itself only keeps a pointer to
+the log and the last few entries.
+
+Positions in the stream are byte offsets into the log as if it were one
+uncompressed file. A client that has read up to offset N asks for
+``since=N`` and gets only what was appended after that.
+
+When the active file grows past ``max_bytes`` it is gzip-compressed into
+a segment named ``<task_id>.<start>-<end>.jsonl.gz``, keeping its offsets.
+Only the newest ``max_segments`` segments are kept. Reads from an offset
+that has been rotated away start at the oldest remaining entry.
+
+Usage:
+    from ralph_agi.tasks.logs import TaskLog
+
+    log = TaskLog(Path(".ralph/logs"), "fix-login-a1b2c3")
+    log.append("info", "Running Builder agent...")
+
+    chunk = log.read(since=0)
+    for entry in chunk.entries:
+        print(entry.level, entry.message)
+    next_since = chunk.offset
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import os
+import re
+import shutil
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import IO, AsyncIterator, Callable, Optional
+
+from ralph_agi.tasks.queue import ExecutionLog
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 4 * 1024 * 1024
+DEFAULT_MAX_SEGMENTS = 8
+DEFAULT_READ_LIMIT = 1000
+
+# Bytes read from the end of the active file by tail()
+TAIL_BYTES = 64 * 1024
+
+
+@dataclass
+class LogChunk:
+    """Entries read from a task log.
+
+    Attributes:
+        entries: Entries in order.
+        offset: Offset to pass as ``since`` for the next read.
+        start: Oldest offset still available.
+        end: Offset at the end of the log when it was read.
+    """
+
+    entries: list[ExecutionLog] = field(default_factory=list)
+    offset: int = 0
+    start: int = 0
+    end: int = 0
+
+    @property
+    def caught_up(self) -> bool:
+        """Whether everything written so far has been read."""
+        return self.offset >= self.end
+
+    def to_dict(self) -> dict:
+        return {
+            "entries": [entry.to_dict() for entry in self.entries],
+            "offset": self.offset,
+            "start": self.start,
+            "end": self.end,
+        }
+
+
+@dataclass
+class _Segment:
+    start: int
+    end: int
+    path: Path
+    compressed: bool
+
+    def open(self) -> IO[bytes]:
+        return gzip.open(self.path, "rb") if self.compressed else open(self.path, "rb")
+
+
+class TaskLog:
+    """Append-only JSONL log for one task, with rotation and tailing."""
+
+    def __init__(
+        self,
+        log_dir: Path | str,
+        task_id: str,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_segments: int = DEFAULT_MAX_SEGMENTS,
+    ):
+        """Initialize the log.
+
+        Args:
+            log_dir: Directory holding task logs (created on first write).
+            task_id: Task the log belongs to.
+            max_bytes: Rotate the active file once it reaches this size.
+            max_segments: Compressed segments to keep.
+        """
+        self.log_dir = Path(log_dir)
+        self.task_id = task_id
+        self.max_bytes = max_bytes
+        self.max_segments = max_segments
+        self._segment_re = re.compile(rf"^{re.escape(task_id)}\.(\d+)-(\d+)\.jsonl\.gz$")
+        self._lock = threading.Lock()
+        self._file: Optional[IO[bytes]] = None
+        self._active_start = 0
+        self._active_size = 0
+        self.count = 0
+
+    @property
+    def path(self) -> Path:
+        """The active log file."""
+        return self.log_dir / f"{self.task_id}.jsonl"
+
+    def append(self, level: str, message: str, timestamp: Optional[str] = None) -> ExecutionLog:
+        """Append an entry and flush it so readers see it immediately.
+
+        Args:
+            level: info, warn or error.
+            message: Log message.
+            timestamp: ISO timestamp (default: now).
+
+        Returns:
+            The entry written.
+        """
+        entry = ExecutionLog(
+            timestamp=timestamp or datetime.now(timezone.utc).isoformat(),
+            level=level,
+            message=message,
+        )
+        line = (json.dumps(entry.to_dict(), ensure_ascii=False) + "\n").encode("utf-8")
+        with self._lock:
+            if self._file is None:
+                self._open()
+            elif self._active_size + len(line) > self.max_bytes and self._active_size:
+                self._rotate()
+            self._file.write(line)
+            self._file.flush()
+            self._active_size += len(line)
+            self.count += 1
+        return entry
+
+    def close(self) -> None:
+        """Close the active file (reads still work)."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def read(self, since: int = 0, limit: int = DEFAULT_READ_LIMIT) -> LogChunk:
+        """Read entries appended at or after an offset.
+
+        Args:
+            since: Offset from a previous read's ``offset`` (0 for the start).
+            limit: Maximum entries to return.
+
+        Returns:
+            The entries and the offset to continue from. An offset past
+            the end returns no entries and keeps the offset.
+        """
+        segments = self._segments()
+        start = segments[0].start if segments else 0
+        end = segments[-1].end if segments else 0
+        chunk = LogChunk(offset=max(since, start), start=start, end=end)
+
+        for segment in segments:
+            if segment.end <= chunk.offset or len(chunk.entries) >= limit:
+                continue
+            try:
+                with segment.open() as f:
+                    skip = chunk.offset - segment.start
+                    if skip:
+                        f.seek(skip)
+                    for raw in f:
+                        if not raw.endswith(b"\n") or len(chunk.entries) >= limit:
+                            break  # Partly written line, or enough entries
+                        chunk.offset += len(raw)
+                        entry = _parse(raw)
+                        if entry is not None:
+                            chunk.entries.append(entry)
+            except FileNotFoundError:
+                break  # Rotated while reading; the next read picks it up
+        return chunk
+
+    def tail(self, count: int = 50) -> list[ExecutionLog]:
+        """Last entries of the active file (cheap; reads at most TAIL_BYTES)."""
+        try:
+            with open(self.path, "rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                f.seek(max(0, size - TAIL_BYTES))
+                data = f.read()
+        except FileNotFoundError:
+            return []
+        lines = data.split(b"\n")[:-1]  # Drop the partial last line
+        if size > TAIL_BYTES and lines:
+            lines = lines[1:]  # First line may be cut
+        entries = [entry for entry in map(_parse, lines[-count:]) if entry is not None]
+        return entries
+
+    async def follow(
+        self,
+        since: int = 0,
+        poll_interval: float = 0.25,
+        stop: Optional[Callable[[], bool]] = None,
+    ) -> AsyncIterator[LogChunk]:
+        """Yield new entries as they are appended.
+
+        Args:
+            since: Offset to start from.
+            poll_interval: Seconds between checks when there is nothing new.
+            stop: Checked when caught up; ends the stream when it returns
+                True (e.g. the task finished).
+        """
+        offset = since
+        stopping = False
+        while True:
+            chunk = await asyncio.to_thread(self.read, offset)
+            offset = chunk.offset
+            if chunk.entries:
+                yield chunk
+                continue
+            if stopping:
+                return
+            if stop is not None and stop():
+                # Drain anything written just before stopping
+                stopping = True
+                continue
+            await asyncio.sleep(poll_interval)
+
+    def delete(self) -> None:
+        """Remove the log and all its segments."""
+        self.close()
+        for segment in self._segments():
+            segment.path.unlink(missing_ok=True)
+
+    def _open(self) -> None:
+        """Open the active file, continuing an existing log."""
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        rotated = self._rotated()
+        self._active_start = rotated[-1].end if rotated else 0
+        self._file = open(self.path, "ab")
+        self._active_size = self._file.tell()
+
+    def _rotate(self) -> None:
+        """Compress the active file into a segment and prune old ones."""
+        self._file.close()
+        self._file = None
+        end = self._active_start + self._active_size
+        segment = self.log_dir / f"{self.task_id}.{self._active_start}-{end}.jsonl.gz"
+        # Move the active file aside first so readers never see the same
+        # bytes both as a segment and as the active file
+        rotating = self.path.with_suffix(".rotating")
+        os.replace(self.path, rotating)
+        temp = segment.with_name(segment.name + ".tmp")
+        with open(rotating, "rb") as src, gzip.open(temp, "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.replace(temp, segment)
+        rotating.unlink()
+
+        for old in self._rotated()[:-self.max_segments or None]:
+            old.path.unlink(missing_ok=True)
+
+        self._active_start = end
+        self._active_size = 0
+        self._file = open(self.path, "ab")
+
+    def _rotated(self) -> list[_Segment]:
+        segments = []
+        try:
+            names = os.listdir(self.log_dir)
+        except FileNotFoundError:
+            return []
+        for name in names:
+            match = self._segment_re.match(name)
+            if match:
+                start, end = int(match.group(1)), int(match.group(2))
+                segments.append(_Segment(start, end, self.log_dir / name, compressed=True))
+        return sorted(segments, key=lambda s: s.start)
+
+    def _segments(self) -> list[_Segment]:
+        """Rotated segments plus the active file, in offset order."""
+        segments = self._rotated()
+        start = segments[-1].end if segments else 0
+        try:
+            size = self.path.stat().st_size
+        except FileNotFoundError:
+            return segments
+        segments.append(_Segment(start, start + size, self.path, compressed=False))
+        return segments
+
+
+def _parse(raw: bytes) -> Optional[ExecutionLog]:
+    try:
+        return ExecutionLog.from_dict(json.loads(raw))
+    except (ValueError, AttributeError):
+        return None
@@ -34,14 +34,15 @@ from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Iterable, Optional, Sequence
 
+from ralph_agi.tasks.checkout import task_hints
 from ralph_agi.tasks.queue import (
     TaskQueue,
     QueuedTask,
     TaskStatus,
-    TaskNotFoundError,
 )
+from ralph_agi.tasks.watcher import StorageWatcher, TaskWatcher
 from ralph_agi.tasks.worktree import (
     WorktreeManager,
     ActiveWorktree,
@@ -135,12 +136,117 @@ class ExecutionProgress:
         }
 
 
+class ReadySet:
+    """Dependency-aware set of tasks that can be dispatched right now.
+
+    A task is ready when its status is "ready" and every dependency is
+    complete or pending_merge (missing dependencies count as satisfied).
+    The set is rebuilt once from the queue and then maintained
+    incrementally: when a task changes, only that task and the tasks that
+    depend on it are re-evaluated.
+
+    Thread-safe; updates arrive from worker threads and API callbacks.
+    """
+
+    SATISFIED = (TaskStatus.COMPLETE, TaskStatus.PENDING_MERGE)
+
+    def __init__(self, queue: TaskQueue):
+        """Initialize ready set.
+
+        Args:
+            queue: Queue used to look up dependency state
+        """
+        self._queue = queue
+        self._tasks: dict[str, QueuedTask] = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._tasks
+
+    def _is_ready(self, task: QueuedTask) -> bool:
+        return task.status == TaskStatus.READY and self._queue.dependencies_met(
+            task, satisfied=self.SATISFIED, missing_ok=True
+        )
+
+    def rebuild(self) -> None:
+        """Recompute the set from the queue."""
+        ready = {t.id: t for t in self._queue.list(status="ready") if self._is_ready(t)}
+        with self._lock:
+            self._tasks = ready
+
+    def update(self, task: QueuedTask) -> bool:
+        """Re-evaluate a changed task and the tasks waiting on it.
+
+        Args:
+            task: Task whose state changed
+
+        Returns:
+            True if any task became ready
+        """
+        became_ready = self._evaluate(task)
+
+        # A finished task may unblock its dependents
+        if task.status in self.SATISFIED:
+            for dependent in self._queue.dependents(task.id):
+                became_ready |= self._evaluate(dependent)
+
+        return became_ready
+
+    def _evaluate(self, task: QueuedTask) -> bool:
+        ready = self._is_ready(task)
+        with self._lock:
+            if not ready:
+                self._tasks.pop(task.id, None)
+                return False
+            added = task.id not in self._tasks
+            self._tasks[task.id] = task
+            return added
+
+    def discard(self, task_id: str) -> None:
+        """Remove a task from the set."""
+        with self._lock:
+            self._tasks.pop(task_id, None)
+
+    def take(self, limit: int, exclude: Iterable[str] = ()) -> list[QueuedTask]:
+        """Remove and return the highest priority ready tasks.
+
+        Args:
+            limit: Maximum number of tasks to return
+            exclude: Task IDs to skip (e.g. already running)
+
+        Returns:
+            Up to ``limit`` tasks, P0 first, oldest first within a priority
+        """
+        if limit <= 0:
+            return []
+
+        excluded = set(exclude)
+        with self._lock:
+            candidates = sorted(
+                (t for t in self._tasks.values() if t.id not in excluded),
+                key=lambda t: (t.priority.value, t.created_at.timestamp(), t.id),
+            )[:limit]
+            for task in candidates:
+                del self._tasks[task.id]
+        return candidates
+
+
 class ParallelExecutor:
     """Executes multiple tasks in parallel using git worktrees.
 
     Each task is executed in its own isolated worktree, allowing
     concurrent development without merge conflicts.
 
+    Dispatch is event-driven: a ReadySet tracks tasks whose dependencies
+    are met, and the dispatcher sleeps until a task finishes or the queue
+    changes instead of polling. While running, a TaskWatcher (or a
+    StorageWatcher for non-YAML storage) reports tasks written by other
+    processes (the CLI, the API server, an editor) as they change; a slow
+    periodic rebuild is the safety net.
+
     Example:
         executor = ParallelExecutor(
             project_root=Path("."),
@@ -160,6 +266,7 @@ class ParallelExecutor:
 
     DEFAULT_MAX_CONCURRENT = 3
     DEFAULT_TASK_TIMEOUT = 3600  # 1 hour
+    DEFAULT_RESCAN_INTERVAL = 5.0  # Catch queue edits made outside this process
 
     def __init__(
         self,
@@ -170,6 +277,11 @@ class ParallelExecutor:
         on_task_start: Optional[Callable[[QueuedTask], None]] = None,
         on_task_complete: Optional[Callable[[TaskResult], None]] = None,
         on_progress: Optional[Callable[[ExecutionProgress], None]] = None,
+        rescan_interval: float = DEFAULT_RESCAN_INTERVAL,
+        watch_queue: bool = True,
+        worktree_pool_size: int = 0,
+        sparse_checkout: bool = False,
+        shared_dirs: Sequence[str] = (),
     ):
         """Initialize parallel executor.
 
@@ -181,10 +293,27 @@ class ParallelExecutor:
             on_task_start: Callback when task starts
             on_task_complete: Callback when task completes
             on_progress: Callback for progress updates
+            rescan_interval: Seconds between full ready-set rebuilds while
+                idle, to pick up queue edits made outside this process
+                (default: 5.0)
+            watch_queue: Watch the task directory while running so edits
+                from other processes dispatch at once. Disable when the
+                caller already forwards changes via notify_task_changed.
+            worktree_pool_size: Clean worktrees to keep ready so a task
+                starts with a branch switch instead of a full checkout
+                (default: 0, create a worktree per task)
+            sparse_checkout: Check out only the directories a task's
+                description, criteria and ``metadata["paths"]`` mention;
+                file tools widen the checkout when they need more
+            shared_dirs: Dependency directories (e.g. "node_modules",
+                ".venv") copied into each worktree from the main checkout
         """
         self._project_root = Path(project_root).resolve() if project_root else Path.cwd()
         self._max_concurrent = max_concurrent
         self._task_timeout = task_timeout
+        self._rescan_interval = rescan_interval
+        self._watch_queue = watch_queue
+        self._sparse_checkout = sparse_checkout
 
         # Callbacks
         self._task_callback = task_callback
@@ -193,8 +322,18 @@ class ParallelExecutor:
         self._on_progress = on_progress
 
         # Initialize queue and worktree manager
-        self._queue = TaskQueue(project_root=self._project_root)
-        self._worktree_manager = WorktreeManager(repo_path=self._project_root)
+        self._queue = TaskQueue(
+            project_root=self._project_root,
+            on_task_added=self.notify_task_changed,
+            on_task_updated=self.notify_task_changed,
+        )
+        self._worktree_manager = WorktreeManager(
+            repo_path=self._project_root,
+            pool_size=worktree_pool_size,
+            sparse_checkout=sparse_checkout,
+            shared_dirs=shared_dirs,
+        )
+        self._ready = ReadySet(self._queue)
 
         # Execution state
         self._state = ExecutionState.IDLE
@@ -204,6 +343,10 @@ class ParallelExecutor:
         self._running_futures: dict[str, Future] = {}
         self._stop_event = threading.Event()
 
+        # Dispatcher wakeup, bound to the loop running run()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+
         logger.debug(
             f"ParallelExecutor initialized: root={self._project_root}, "
             f"max_concurrent={max_concurrent}"
@@ -231,40 +374,86 @@ class ParallelExecutor:
             raise ValueError("max_concurrent must be at least 1")
         self._max_concurrent = value
 
+    def _wake(self) -> None:
+        """Wake the dispatcher loop. Safe to call from any thread."""
+        loop, wakeup = self._loop, self._wakeup
+        if loop is None or wakeup is None:
+            return
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:
+            pass  # Loop already closed
+
+    def notify_task_changed(self, task: QueuedTask) -> None:
+        """Update the ready set after a queue mutation.
+
+        Registered as the executor queue's on_task_added/on_task_updated
+        callback. Other queue instances in the same process (e.g. the API's)
+        should forward their callbacks here so approvals dispatch at once.
+
+        Args:
+            task: The added or updated task
+        """
+        if self._loop is None:
+            return  # Not running; run() rebuilds the set on start
+
+        if self._ready.update(task):
+            self._wake()
+
+    def notify_task_removed(self, task_id: str) -> None:
+        """Drop a deleted task from the ready set.
+
+        Args:
+            task_id: ID of the removed task
+        """
+        self._ready.discard(task_id)
+
+    def _open_watcher(self) -> Optional[TaskWatcher | StorageWatcher]:
+        """Watch the task queue, if enabled.
+
+        Opened before the ready set is first built, so nothing written in
+        between is missed.
+        """
+        if not self._watch_queue:
+            return None
+        try:
+            return self._queue.watcher()
+        except (OSError, NotImplementedError) as e:
+            logger.warning(
+                f"Not watching task queue: {e}; changes from other processes "
+                f"are picked up every {self._rescan_interval:.0f}s"
+            )
+            return None
+
+    async def _follow_queue(self, watcher: TaskWatcher | StorageWatcher) -> None:
+        """Feed task file changes from other processes into the ready set."""
+        async for event in watcher:
+            if event.task is None:
+                self.notify_task_removed(event.task_id)
+            else:
+                self.notify_task_changed(event.task)
+
     def _get_ready_tasks(self) -> list[QueuedTask]:
         """Get tasks ready for execution (status=ready, dependencies met).
 
         Returns:
             List of tasks ready to execute, sorted by priority
         """
-        # Only pick up tasks with status "ready" (approved by human)
+        # Only pick up tasks with status "ready" (approved by human).
+        # list() is already sorted by priority (P0 first).
         ready_tasks = self._queue.list(status="ready")
-        result = []
-
-        for task in ready_tasks:
-            if not task.dependencies:
-                result.append(task)
-                continue
-
-            # Check if all dependencies are complete or pending_merge
-            all_deps_done = True
-            for dep_id in task.dependencies:
-                try:
-                    dep = self._queue.get(dep_id)
-                    # Dependencies are satisfied if complete or pending_merge
-                    if dep.status not in (TaskStatus.COMPLETE, TaskStatus.PENDING_MERGE):
-                        all_deps_done = False
-                        break
-                except TaskNotFoundError:
-                    # Dependency doesn't exist - treat as satisfied
-                    pass
-
-            if all_deps_done:
-                result.append(task)
-
-        # Sort by priority (P0 first)
-        result.sort(key=lambda t: t.priority.value)
-        return result
+
+        # Dependencies are satisfied if complete or pending_merge;
+        # a dependency that doesn't exist is treated as satisfied.
+        return [
+            task
+            for task in ready_tasks
+            if self._queue.dependencies_met(
+                task,
+                satisfied=(TaskStatus.COMPLETE, TaskStatus.PENDING_MERGE),
+                missing_ok=True,
+            )
+        ]
 
     def _execute_task(self, task: QueuedTask) -> TaskResult:
         """Execute a single task in a worktree.
@@ -288,7 +477,9 @@ class ParallelExecutor:
             self._queue.update_status(task.id, "running")
 
             # Create worktree for this task
-            worktree_path = self._worktree_manager.create(task.id)
+            # Sparse checkouts are cut to the paths the task mentions
+            hints = {"hints": task_hints(task)} if self._sparse_checkout else {}
+            worktree_path = self._worktree_manager.create(task.id, **hints)
             worktree = self._worktree_manager.get(task.id)
             branch = worktree.branch
 
@@ -388,8 +579,9 @@ class ParallelExecutor:
             self._progress.running -= 1
 
         finally:
-            # Remove from running futures
+            # Remove from running futures and let the dispatcher fill the slot
             self._running_futures.pop(task_id, None)
+            self._wake()
 
     def run_sync(self, max_tasks: Optional[int] = None) -> list[TaskResult]:
         """Run task processing synchronously.
@@ -424,16 +616,23 @@ class ParallelExecutor:
         self._progress = ExecutionProgress()
         self._executor = ThreadPoolExecutor(max_workers=self._max_concurrent)
         self._running_futures = {}
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        watcher = self._open_watcher()
+        follower = asyncio.create_task(self._follow_queue(watcher)) if watcher else None
+        # Fill the worktree pool while the first tasks start
+        warming = asyncio.create_task(asyncio.to_thread(self._worktree_manager.warm_pool))
 
         try:
-            # Count total pending tasks
-            ready_tasks = self._get_ready_tasks()
+            # Build the ready set once; callbacks keep it current from here
+            self._ready.rebuild()
+            initial = len(self._ready)
             if max_tasks:
-                ready_tasks = ready_tasks[:max_tasks]
-            self._progress.total_tasks = len(ready_tasks)
-            self._progress.pending = len(ready_tasks)
+                initial = min(initial, max_tasks)
+            self._progress.total_tasks = initial
+            self._progress.pending = initial
 
-            logger.info(f"PARALLEL_START: {len(ready_tasks)} tasks, max_concurrent={self._max_concurrent}")
+            logger.info(f"PARALLEL_START: {initial} tasks, max_concurrent={self._max_concurrent}")
 
             tasks_started = 0
 
@@ -442,22 +641,20 @@ class ParallelExecutor:
                 if max_tasks and tasks_started >= max_tasks:
                     break
 
-                # Get ready tasks
-                ready = self._get_ready_tasks()
+                # Clear before looking, so a wakeup during dispatch isn't lost
+                self._wakeup.clear()
+
+                # Take ready tasks up to concurrency limit
+                slots_available = self._max_concurrent - len(self._running_futures)
                 if max_tasks:
-                    remaining = max_tasks - tasks_started
-                    ready = ready[:remaining]
+                    slots_available = min(slots_available, max_tasks - tasks_started)
+                ready = self._ready.take(slots_available, exclude=self._running_futures)
 
                 # No more tasks and nothing running - we're done
                 if not ready and not self._running_futures:
                     break
 
-                # Submit new tasks up to concurrency limit
-                slots_available = self._max_concurrent - len(self._running_futures)
-                for task in ready[:slots_available]:
-                    if task.id in self._running_futures:
-                        continue  # Already running
-
+                for task in ready:
                     # Submit task
                     future = self._executor.submit(self._execute_task, task)
                     self._running_futures[task.id] = future
@@ -470,12 +667,15 @@ class ParallelExecutor:
 
                     logger.debug(f"Submitted task: {task.id}")
 
-                # Wait a bit before checking again
-                await asyncio.sleep(0.5)
+                # Sleep until a task finishes or the queue changes
+                await self._wait_for_wakeup()
 
             # Wait for remaining tasks to complete
             while self._running_futures:
-                await asyncio.sleep(0.5)
+                self._wakeup.clear()
+                if not self._running_futures:
+                    break
+                await self._wait_for_wakeup(rebuild=False)
 
             logger.info(
                 f"PARALLEL_COMPLETE: {self._progress.completed} succeeded, "
@@ -485,11 +685,30 @@ class ParallelExecutor:
             return self._progress.results
 
         finally:
+            if follower is not None:
+                follower.cancel()
+                await asyncio.gather(follower, return_exceptions=True)
+                watcher.close()
+            await asyncio.gather(warming, return_exceptions=True)
             self._executor.shutdown(wait=True)
             self._executor = None
+            self._loop = None
+            self._wakeup = None
             with self._state_lock:
                 self._state = ExecutionState.STOPPED
 
+    async def _wait_for_wakeup(self, rebuild: bool = True) -> None:
+        """Wait for a wakeup, rebuilding the ready set if none arrives.
+
+        Args:
+            rebuild: Rebuild the ready set when the rescan interval elapses
+        """
+        try:
+            await asyncio.wait_for(self._wakeup.wait(), timeout=self._rescan_interval)
+        except asyncio.TimeoutError:
+            if rebuild:
+                self._ready.rebuild()
+
     def start(self) -> None:
         """Start background task processing.
 
@@ -514,6 +733,7 @@ class ParallelExecutor:
         """
         logger.info("Stopping parallel executor...")
         self._stop_event.set()
+        self._wake()
 
         with self._state_lock:
             self._state = ExecutionState.STOPPING
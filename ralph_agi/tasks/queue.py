@@ -28,19 +28,34 @@ Usage:
 
 from __future__ import annotations
 
+import bisect
+import copy
 import hashlib
+import heapq
 import logging
-import os
 import re
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Iterable, Iterator
 
 import yaml
 
+from ralph_agi.tasks.blobs import BlobError, BlobStore
+from ralph_agi.tasks.storage import (
+    StorageError,
+    TaskStorage,
+    YamlTaskStorage,
+    create_storage,
+)
+
+if TYPE_CHECKING:
+    from ralph_agi.tasks.logs import TaskLog
+    from ralph_agi.tasks.watcher import StorageWatcher, TaskEvent, TaskWatcher
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,6 +72,11 @@ class TaskStatus(Enum):
     CANCELLED = "cancelled"
 
 
+_TERMINAL_STATUSES = frozenset(
+    {TaskStatus.COMPLETE, TaskStatus.FAILED, TaskStatus.CANCELLED}
+)
+
+
 class TaskPriority(Enum):
     """Task priority levels."""
 
@@ -126,7 +146,9 @@ class TaskArtifact:
     absolute_path: str | None = None
     file_type: str | None = None  # Extension
     size: int | None = None  # Bytes
-    content: str | None = None  # Optional inline content (for small files)
+    content: str | None = None  # Inline content (legacy; new artifacts use blob)
+    change_type: str | None = None  # added, modified or deleted
+    blob: str | None = None  # sha256 of the content in the task queue's BlobStore
 
     def to_dict(self) -> dict[str, Any]:
         data = {"path": self.path}
@@ -138,6 +160,10 @@ class TaskArtifact:
             data["size"] = self.size
         if self.content:
             data["content"] = self.content
+        if self.change_type:
+            data["change_type"] = self.change_type
+        if self.blob:
+            data["blob"] = self.blob
         return data
 
     @classmethod
@@ -148,6 +174,8 @@ class TaskArtifact:
             file_type=data.get("file_type"),
             size=data.get("size"),
             content=data.get("content"),
+            change_type=data.get("change_type"),
+            blob=data.get("blob"),
         )
 
 
@@ -159,9 +187,11 @@ class TaskOutput:
     text: str | None = None  # Primary text output
     markdown: str | None = None  # Markdown formatted output
     artifacts: list[TaskArtifact] = field(default_factory=list)
-    logs: list[ExecutionLog] = field(default_factory=list)
+    logs: list[ExecutionLog] = field(default_factory=list)  # Last entries only
     tokens_used: int | None = None
     api_calls: int | None = None
+    log_file: str | None = None  # Full log, relative to the project root
+    log_count: int | None = None  # Entries the last run wrote to log_file
 
     def to_dict(self) -> dict[str, Any]:
         data: dict[str, Any] = {}
@@ -179,6 +209,10 @@ class TaskOutput:
             data["tokens_used"] = self.tokens_used
         if self.api_calls is not None:
             data["api_calls"] = self.api_calls
+        if self.log_file:
+            data["log_file"] = self.log_file
+        if self.log_count is not None:
+            data["log_count"] = self.log_count
         return data
 
     @classmethod
@@ -191,6 +225,8 @@ class TaskOutput:
             logs=[ExecutionLog.from_dict(log) for log in data.get("logs", [])],
             tokens_used=data.get("tokens_used"),
             api_calls=data.get("api_calls"),
+            log_file=data.get("log_file"),
+            log_count=data.get("log_count"),
         )
 
 
@@ -350,7 +386,150 @@ class QueuedTask:
     @property
     def is_terminal(self) -> bool:
         """Check if task is in a terminal state."""
-        return self.status in (TaskStatus.COMPLETE, TaskStatus.FAILED, TaskStatus.CANCELLED)
+        return self.status in _TERMINAL_STATUSES
+
+
+# Sort key used by the index: (priority value, created_at timestamp, task ID)
+_SortKey = tuple[int, float, str]
+
+
+def _sort_key(task: QueuedTask) -> _SortKey:
+    return (task.priority.value, task.created_at.timestamp(), task.id)
+
+
+class TaskIndex:
+    """In-memory index of queued tasks.
+
+    Tasks are bucketed by status, and each bucket is kept sorted by
+    (priority, created_at, id) so the highest priority task of a status is
+    found with a bisect rather than a scan. A reverse dependency map
+    answers "which tasks wait on X" without touching the other tasks.
+
+    The index is not thread-safe on its own; TaskQueue guards it.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: dict[str, QueuedTask] = {}
+        self._keys: dict[str, _SortKey] = {}
+        self._statuses: dict[str, TaskStatus] = {}
+        self._deps: dict[str, tuple[str, ...]] = {}
+        self._by_status: dict[TaskStatus, list[_SortKey]] = {s: [] for s in TaskStatus}
+        self._dependents: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def __contains__(self, task_id: object) -> bool:
+        return task_id in self._tasks
+
+    def get(self, task_id: str) -> QueuedTask | None:
+        """Get the indexed task (not a copy)."""
+        return self._tasks.get(task_id)
+
+    def status_of(self, task_id: str) -> TaskStatus | None:
+        """Get the indexed status of a task, or None if unknown."""
+        return self._statuses.get(task_id)
+
+    def put(self, task: QueuedTask) -> None:
+        """Add or replace a task in the index."""
+        self.remove(task.id)
+
+        key = _sort_key(task)
+        deps = tuple(task.dependencies)
+        self._tasks[task.id] = task
+        self._keys[task.id] = key
+        self._statuses[task.id] = task.status
+        self._deps[task.id] = deps
+        bisect.insort(self._by_status[task.status], key)
+        for dep_id in deps:
+            self._dependents.setdefault(dep_id, set()).add(task.id)
+
+    def remove(self, task_id: str) -> QueuedTask | None:
+        """Remove a task from the index.
+
+        Returns:
+            The removed task, or None if it wasn't indexed
+        """
+        task = self._tasks.pop(task_id, None)
+        if task is None:
+            return None
+
+        key = self._keys.pop(task_id)
+        bucket = self._by_status[self._statuses.pop(task_id)]
+        pos = bisect.bisect_left(bucket, key)
+        if pos < len(bucket) and bucket[pos] == key:
+            del bucket[pos]
+
+        for dep_id in self._deps.pop(task_id, ()):
+            waiting = self._dependents.get(dep_id)
+            if waiting is not None:
+                waiting.discard(task_id)
+                if not waiting:
+                    del self._dependents[dep_id]
+        return task
+
+    def clear(self) -> None:
+        """Drop every task from the index."""
+        self.__init__()
+
+    def ids(self) -> list[str]:
+        """Get all indexed task IDs."""
+        return list(self._tasks)
+
+    def dependents(self, task_id: str) -> set[str]:
+        """Get IDs of tasks that list ``task_id`` as a dependency."""
+        return set(self._dependents.get(task_id, ()))
+
+    def count(self, status: TaskStatus) -> int:
+        """Number of tasks with a given status."""
+        return len(self._by_status[status])
+
+    def iter_sorted(
+        self,
+        statuses: Iterable[TaskStatus],
+        priority: TaskPriority | None = None,
+    ) -> Iterator[QueuedTask]:
+        """Iterate tasks of the given statuses in priority/creation order.
+
+        Args:
+            statuses: Statuses to include
+            priority: Only yield tasks with this priority (bisected range)
+        """
+        buckets = []
+        for status in statuses:
+            bucket = self._by_status[status]
+            if priority is not None:
+                lo = bisect.bisect_left(bucket, (priority.value,))
+                hi = bisect.bisect_left(bucket, (priority.value + 1,))
+                bucket = bucket[lo:hi]
+            buckets.append(bucket)
+
+        for key in heapq.merge(*buckets):
+            yield self._tasks[key[2]]
+
+    def dependencies_met(
+        self,
+        task: QueuedTask,
+        satisfied: Iterable[TaskStatus] = (TaskStatus.COMPLETE,),
+        missing_ok: bool = False,
+    ) -> bool:
+        """Check a task's dependencies against indexed statuses.
+
+        Args:
+            task: Task whose dependencies to check
+            satisfied: Statuses that count as "done"
+            missing_ok: Treat unknown dependencies as satisfied
+        """
+        satisfied = set(satisfied)
+        for dep_id in task.dependencies:
+            status = self._statuses.get(dep_id)
+            if status is None:
+                if not missing_ok:
+                    return False
+                continue
+            if status not in satisfied:
+                return False
+        return True
 
 
 def generate_task_id(description: str) -> str:
@@ -377,11 +556,18 @@ class TaskQueue:
 
     Tasks are stored as YAML files in `.ralph/tasks/`. Each task file
     contains the complete task definition and is updated in-place as
-    the task progresses through its lifecycle.
+    the task progresses through its lifecycle. An optional SQLite
+    backend keeps the tasks in `.ralph/tasks.db` and writes the YAML
+    files as an export.
+
+    Reads are served from an in-memory TaskIndex. Before each read the
+    storage backend reports what changed outside this process (by file
+    mtime for YAML, by data_version for SQLite) and only those tasks are
+    re-parsed.
 
     The queue supports:
     - Adding tasks via CLI or programmatically
-    - Watching for new task files
+    - Watching for added, updated and removed task files
     - Dependency tracking between tasks
     - Priority-based selection
     - Atomic file updates
@@ -403,12 +589,15 @@ class TaskQueue:
     """
 
     TASKS_DIR = ".ralph/tasks"
+    BLOBS_DIR = ".ralph/blobs"
+    LOGS_DIR = ".ralph/logs"
 
     def __init__(
         self,
         project_root: str | Path | None = None,
         on_task_added: Callable[[QueuedTask], None] | None = None,
         on_task_updated: Callable[[QueuedTask], None] | None = None,
+        storage: str | TaskStorage | None = None,
     ):
         """Initialize task queue.
 
@@ -416,6 +605,8 @@ class TaskQueue:
             project_root: Root directory of the project (default: current dir)
             on_task_added: Callback when a new task is added
             on_task_updated: Callback when a task is updated
+            storage: Storage backend: "yaml" (default), "sqlite", or a
+                TaskStorage instance
         """
         self._root = Path(project_root).resolve() if project_root else Path.cwd()
         self._tasks_dir = self._root / self.TASKS_DIR
@@ -425,13 +616,40 @@ class TaskQueue:
         # Ensure tasks directory exists
         self._tasks_dir.mkdir(parents=True, exist_ok=True)
 
-        logger.debug(f"TaskQueue initialized: {self._tasks_dir}")
+        self._storage = create_storage(storage, self._tasks_dir)
+        self._blobs = BlobStore(self._root / self.BLOBS_DIR)
+        self._index = TaskIndex()
+        self._lock = threading.RLock()
+
+        logger.debug(f"TaskQueue initialized: {self._tasks_dir} ({self._storage.name})")
 
     @property
     def tasks_dir(self) -> Path:
         """Get the tasks directory path."""
         return self._tasks_dir
 
+    @property
+    def storage(self) -> TaskStorage:
+        """Get the storage backend."""
+        return self._storage
+
+    @property
+    def blobs(self) -> BlobStore:
+        """Get the artifact content store."""
+        return self._blobs
+
+    @property
+    def logs_dir(self) -> Path:
+        """Get the execution log directory path."""
+        return self._root / self.LOGS_DIR
+
+    def task_log(self, task_id: str) -> TaskLog:
+        """Get the append-only execution log for a task."""
+        # Imported here: logs.py depends on this module
+        from ralph_agi.tasks.logs import TaskLog
+
+        return TaskLog(self.logs_dir, task_id)
+
     def _task_path(self, task_id: str) -> Path:
         """Get file path for a task ID."""
         return self._tasks_dir / f"{task_id}.yaml"
@@ -451,36 +669,61 @@ class TaskQueue:
             logger.warning(f"Failed to load task {path}: {e}")
             return None
 
-    def _save_task(self, task: QueuedTask) -> None:
-        """Save a task to YAML file atomically."""
-        path = self._task_path(task.id)
+    def _refresh(self) -> None:
+        """Apply changes made outside this queue to the index.
+
+        Only records the backend reports as changed are parsed, so a
+        refresh with no external edits costs a directory stat pass (YAML)
+        or a single pragma query (SQLite).
+        """
+        with self._lock:
+            changes = self._storage.changes()
+            if not changes:
+                return
 
-        # Write to temp file first
-        temp_path = path.with_suffix(".yaml.tmp")
+            if changes.full:
+                self._index.clear()
 
-        try:
-            # Serialize with nice formatting
-            content = yaml.dump(
-                task.to_dict(),
-                default_flow_style=False,
-                sort_keys=False,
-                allow_unicode=True,
-            )
+            for task_id in changes.removed:
+                self._index.remove(task_id)
 
-            # Write atomically
-            with open(temp_path, "w") as f:
-                f.write(content)
+            for task_id, record in changes.updated.items():
+                try:
+                    self._index.put(QueuedTask.from_dict(record))
+                except Exception as e:
+                    logger.warning(f"Failed to index task {task_id}: {e}")
+                    self._index.remove(task_id)
 
-            # Atomic rename
-            temp_path.replace(path)
+    def _store_artifact_contents(self, task: QueuedTask) -> None:
+        """Move inline artifact contents into the blob store.
 
-            logger.debug(f"Saved task: {task.id}")
+        Task records then only carry blob keys, which keeps them small
+        to parse. Older records with inline content are migrated the
+        next time they are saved.
+        """
+        if task.output is None:
+            return
+        for artifact in task.output.artifacts:
+            if artifact.content is None or artifact.blob:
+                continue
+            try:
+                artifact.blob = self._blobs.put(artifact.content.encode("utf-8"))
+                artifact.content = None
+            except BlobError as e:
+                logger.warning(f"Keeping {artifact.path} inline for {task.id}: {e}")
 
-        except Exception as e:
-            # Clean up temp file on failure
-            if temp_path.exists():
-                temp_path.unlink()
-            raise QueueError(f"Failed to save task {task.id}: {e}") from e
+    def _save_task(self, task: QueuedTask) -> None:
+        """Persist a task and update the index."""
+        self._store_artifact_contents(task)
+        with self._lock:
+            try:
+                self._storage.write(task.id, task.to_dict())
+            except StorageError as e:
+                raise QueueError(f"Failed to save task {task.id}: {e}") from e
+
+            self._index.put(copy.deepcopy(task))
+
+        logger.debug(f"Saved task: {task.id}")
 
     def add(
         self,
@@ -520,13 +763,13 @@ class TaskQueue:
             task_id = generate_task_id(description)
 
         # Check for duplicates
-        if self._task_path(task_id).exists():
+        if self._storage.exists(task_id):
             raise TaskValidationError(f"Task already exists: {task_id}")
 
         # Validate dependencies exist
         if dependencies:
             for dep_id in dependencies:
-                if not self._task_path(dep_id).exists():
+                if not self._storage.exists(dep_id):
                     logger.warning(f"Dependency not found: {dep_id}")
 
         # Create task
@@ -540,7 +783,7 @@ class TaskQueue:
             metadata=metadata or {},
         )
 
-        # Save to file
+        # Save to storage
         self._save_task(task)
 
         # Callback
@@ -562,13 +805,12 @@ class TaskQueue:
         Raises:
             TaskNotFoundError: If task doesn't exist
         """
-        path = self._task_path(task_id)
-        task = self._load_task(path)
-
-        if task is None:
-            raise TaskNotFoundError(task_id)
-
-        return task
+        with self._lock:
+            self._refresh()
+            task = self._index.get(task_id)
+            if task is None:
+                raise TaskNotFoundError(task_id)
+            return copy.deepcopy(task)
 
     def list(
         self,
@@ -586,8 +828,6 @@ class TaskQueue:
         Returns:
             List of matching tasks, sorted by priority then creation date
         """
-        tasks = []
-
         # Parse status filter
         status_filter: set[TaskStatus] | None = None
         if status is not None:
@@ -606,31 +846,17 @@ class TaskQueue:
             else:
                 priority_filter = priority
 
-        # Load all tasks
-        for path in self._tasks_dir.glob("*.yaml"):
-            if path.suffix == ".tmp":
-                continue
+        statuses = status_filter or set(TaskStatus)
+        if not include_terminal:
+            statuses = {s for s in statuses if s not in _TERMINAL_STATUSES}
 
-            task = self._load_task(path)
-            if task is None:
-                continue
-
-            # Apply filters
-            if status_filter and task.status not in status_filter:
-                continue
-
-            if priority_filter and task.priority != priority_filter:
-                continue
-
-            if not include_terminal and task.is_terminal:
-                continue
-
-            tasks.append(task)
-
-        # Sort by priority (ascending) then creation date (ascending)
-        tasks.sort(key=lambda t: (t.priority.value, t.created_at))
-
-        return tasks
+        with self._lock:
+            self._refresh()
+            # Sorted by priority (ascending) then creation date (ascending)
+            return [
+                copy.deepcopy(task)
+                for task in self._index.iter_sorted(statuses, priority_filter)
+            ]
 
     def next(self) -> QueuedTask | None:
         """Get the next task to process.
@@ -641,31 +867,66 @@ class TaskQueue:
         Returns:
             Next task to process, or None if queue is empty
         """
-        pending = self.list(status=["pending", "ready"])
-
-        for task in pending:
-            # Check dependencies
-            if self._dependencies_met(task):
-                return task
+        with self._lock:
+            self._refresh()
+            for task in self._index.iter_sorted((TaskStatus.PENDING, TaskStatus.READY)):
+                # Check dependencies
+                if self._dependencies_met(task):
+                    return copy.deepcopy(task)
 
         return None
 
     def _dependencies_met(self, task: QueuedTask) -> bool:
-        """Check if all dependencies for a task are complete."""
-        if not task.dependencies:
+        """Check if all dependencies for a task are complete.
+
+        Uses the index as is; the caller holds the lock and has refreshed.
+        """
+        if self._index.dependencies_met(task):
             return True
 
         for dep_id in task.dependencies:
-            try:
-                dep_task = self.get(dep_id)
-                if dep_task.status != TaskStatus.COMPLETE:
-                    return False
-            except TaskNotFoundError:
+            if dep_id not in self._index:
                 # Missing dependency - treat as not met
                 logger.warning(f"Task {task.id} has missing dependency: {dep_id}")
-                return False
+        return False
 
-        return True
+    def dependencies_met(
+        self,
+        task: QueuedTask,
+        satisfied: Iterable[str | TaskStatus] = (TaskStatus.COMPLETE,),
+        missing_ok: bool = False,
+    ) -> bool:
+        """Check a task's dependencies against the indexed queue state.
+
+        Args:
+            task: Task whose dependencies to check
+            satisfied: Statuses that count as a finished dependency
+            missing_ok: Treat dependencies that don't exist as satisfied
+
+        Returns:
+            True if every dependency is satisfied
+        """
+        statuses = [TaskStatus(s) if isinstance(s, str) else s for s in satisfied]
+        with self._lock:
+            self._refresh()
+            return self._index.dependencies_met(task, statuses, missing_ok=missing_ok)
+
+    def dependents(self, task_id: str) -> list[QueuedTask]:
+        """Get tasks that depend on the given task.
+
+        Args:
+            task_id: Task to look up
+
+        Returns:
+            Tasks listing ``task_id`` in their dependencies
+        """
+        with self._lock:
+            self._refresh()
+            return [
+                copy.deepcopy(self._index.get(dep_id))
+                for dep_id in sorted(self._index.dependents(task_id))
+                if dep_id in self._index
+            ]
 
     def update_status(
         self,
@@ -697,37 +958,38 @@ class TaskQueue:
         Raises:
             TaskNotFoundError: If task doesn't exist
         """
-        task = self.get(task_id)
+        with self._lock:
+            task = self.get(task_id)
 
-        # Parse status
-        if isinstance(status, str):
-            status = TaskStatus(status)
-
-        # Update fields
-        task.status = status
-        task.updated_at = datetime.now(timezone.utc)
-
-        if status == TaskStatus.RUNNING:
-            task.started_at = datetime.now(timezone.utc)
-
-        if status in (TaskStatus.COMPLETE, TaskStatus.FAILED, TaskStatus.CANCELLED):
-            task.completed_at = datetime.now(timezone.utc)
-
-        if worktree_path is not None:
-            task.worktree_path = worktree_path
-        if branch is not None:
-            task.branch = branch
-        if pr_url is not None:
-            task.pr_url = pr_url
-        if pr_number is not None:
-            task.pr_number = pr_number
-        if confidence is not None:
-            task.confidence = confidence
-        if error is not None:
-            task.error = error
-
-        # Save
-        self._save_task(task)
+            # Parse status
+            if isinstance(status, str):
+                status = TaskStatus(status)
+
+            # Update fields
+            task.status = status
+            task.updated_at = datetime.now(timezone.utc)
+
+            if status == TaskStatus.RUNNING:
+                task.started_at = datetime.now(timezone.utc)
+
+            if status in _TERMINAL_STATUSES:
+                task.completed_at = datetime.now(timezone.utc)
+
+            if worktree_path is not None:
+                task.worktree_path = worktree_path
+            if branch is not None:
+                task.branch = branch
+            if pr_url is not None:
+                task.pr_url = pr_url
+            if pr_number is not None:
+                task.pr_number = pr_number
+            if confidence is not None:
+                task.confidence = confidence
+            if error is not None:
+                task.error = error
+
+            # Save
+            self._save_task(task)
 
         # Callback
         if self._on_task_updated:
@@ -745,12 +1007,15 @@ class TaskQueue:
         Returns:
             True if removed, False if not found
         """
-        path = self._task_path(task_id)
+        with self._lock:
+            removed = self._storage.delete(task_id)
+            self._index.remove(task_id)
 
-        if not path.exists():
+        if not removed:
             return False
 
-        path.unlink()
+        self.task_log(task_id).delete()
+
         logger.info(f"QUEUE_REMOVE: {task_id}")
         return True
 
@@ -763,81 +1028,136 @@ class TaskQueue:
         Returns:
             Number of tasks removed
         """
-        removed = 0
+        statuses = set(_TERMINAL_STATUSES)
+        if include_running:
+            statuses.add(TaskStatus.RUNNING)
 
-        for path in self._tasks_dir.glob("*.yaml"):
-            task = self._load_task(path)
-            if task is None:
-                continue
-
-            should_remove = task.is_terminal
-            if include_running and task.status == TaskStatus.RUNNING:
-                should_remove = True
+        removed = 0
+        with self._lock:
+            self._refresh()
+            for task in list(self._index.iter_sorted(statuses)):
+                if self._storage.delete(task.id):
+                    removed += 1
+                self._index.remove(task.id)
+                self.task_log(task.id).delete()
 
-            if should_remove:
-                path.unlink()
-                removed += 1
+            if removed:
+                self.prune_blobs()
 
         logger.info(f"QUEUE_CLEAR: Removed {removed} tasks")
         return removed
 
+    def prune_blobs(self, min_age: float = 3600.0) -> int:
+        """Delete artifact blobs no task refers to any more.
+
+        Args:
+            min_age: Only delete blobs older than this many seconds.
+
+        Returns:
+            Number of blobs deleted.
+        """
+        with self._lock:
+            self._refresh()
+            referenced = {
+                artifact.blob
+                for task in self._index.iter_sorted(TaskStatus)
+                if task.output
+                for artifact in task.output.artifacts
+                if artifact.blob
+            }
+        return self._blobs.prune(referenced, min_age=min_age)
+
     def stats(self) -> dict[str, int]:
         """Get queue statistics.
 
         Returns:
             Dict with counts by status
         """
-        stats = {status.value: 0 for status in TaskStatus}
-        stats["total"] = 0
-
-        for path in self._tasks_dir.glob("*.yaml"):
-            task = self._load_task(path)
-            if task:
-                stats[task.status.value] += 1
-                stats["total"] += 1
+        with self._lock:
+            self._refresh()
+            stats = {status.value: self._index.count(status) for status in TaskStatus}
+            stats["total"] = len(self._index)
 
         return stats
 
+    def watcher(
+        self,
+        debounce: float = 0.1,
+        poll_interval: float = 1.0,
+        backend: str = "auto",
+    ) -> TaskWatcher | StorageWatcher:
+        """Create a watcher for tasks added, updated or removed.
+
+        With YAML storage the task files are watched, using inotify on
+        Linux and polling elsewhere. Other backends are polled through
+        ``changes()`` on a second storage instance (for SQLite, one
+        ``PRAGMA data_version`` query per poll). See
+        ``ralph_agi.tasks.watcher``.
+
+        Args:
+            debounce: Seconds of quiet before file changes are reported
+            poll_interval: Seconds between scans when not using inotify
+            backend: "auto", "inotify" or "polling" (YAML storage only)
+
+        Raises:
+            NotImplementedError: If the storage backend can't be watched
+        """
+        # Imported here: watcher.py depends on this module
+        from ralph_agi.tasks.watcher import StorageWatcher, TaskWatcher
+
+        if not isinstance(self._storage, YamlTaskStorage):
+            return StorageWatcher(self._storage.reopen(), poll_interval=poll_interval)
+
+        return TaskWatcher(
+            self._tasks_dir,
+            debounce=debounce,
+            poll_interval=poll_interval,
+            backend=backend,
+        )
+
+    async def events(self, debounce: float = 0.1) -> AsyncIterator[TaskEvent]:
+        """Yield task file changes as they happen.
+
+        Example:
+            async for event in queue.events():
+                print(event.type.value, event.task_id)
+        """
+        with self.watcher(debounce=debounce) as watcher:
+            async for event in watcher:
+                yield event
+
     def watch(
         self,
         callback: Callable[[QueuedTask], None],
         poll_interval: float = 1.0,
+        stop: threading.Event | None = None,
+        on_event: Callable[[TaskEvent], None] | None = None,
     ) -> None:
         """Watch for new tasks in the queue directory.
 
-        This is a blocking call that polls the directory for new files.
-        Use in a background thread or with asyncio.
+        This is a blocking call; it returns when ``stop`` is set or on
+        KeyboardInterrupt. Use ``watcher().start()`` or ``events()`` to
+        watch without blocking.
 
         Args:
-            callback: Function to call when new task is detected
-            poll_interval: How often to check for new files (seconds)
+            callback: Function to call when a new task is detected
+            poll_interval: How often to check for changes when inotify is
+                unavailable (seconds)
+            stop: Event that ends the watch when set
+            on_event: Function to call for every added, updated or
+                removed task
         """
-        seen_files: set[str] = set()
+        from ralph_agi.tasks.watcher import TaskEventType
 
-        # Initialize with existing files
-        for path in self._tasks_dir.glob("*.yaml"):
-            seen_files.add(path.name)
+        def dispatch(event: TaskEvent) -> None:
+            if event.type == TaskEventType.ADDED:
+                logger.info(f"QUEUE_WATCH: New task detected: {event.task_id}")
+                callback(event.task)
+            if on_event is not None:
+                on_event(event)
 
-        logger.info(f"Watching for new tasks in {self._tasks_dir}")
-
-        while True:
+        with self.watcher(poll_interval=poll_interval) as watcher:
             try:
-                current_files = {p.name for p in self._tasks_dir.glob("*.yaml")}
-                new_files = current_files - seen_files
-
-                for filename in new_files:
-                    path = self._tasks_dir / filename
-                    task = self._load_task(path)
-                    if task:
-                        logger.info(f"QUEUE_WATCH: New task detected: {task.id}")
-                        callback(task)
-
-                seen_files = current_files
-                time.sleep(poll_interval)
-
+                watcher.watch(dispatch, stop=stop)
             except KeyboardInterrupt:
                 logger.info("Watch stopped")
-                break
-            except Exception as e:
-                logger.error(f"Watch error: {e}")
-                time.sleep(poll_interval)
@@ -0,0 +1,311 @@
+"""Process-safe registry of active task worktrees.
+
+Worktree records live in a SQLite database (`.ralph/worktrees.db`) in WAL
+mode, so the executor, batch worker processes and the API can register
+and update worktrees at the same time. Each change is a single-row
+statement: nothing is lost when two processes write at once, and an
+update doesn't rewrite every other record.
+
+Records from the previous `.ralph/worktrees.json` state file are
+imported the first time the registry is used, and the file is renamed
+to `worktrees.json.migrated`.
+
+Usage:
+    from ralph_agi.tasks.registry import ActiveWorktree, WorktreeRegistry
+
+    registry = WorktreeRegistry.for_repo(repo_path)
+    if registry.add(ActiveWorktree("fix-login", path, "ralph/fix-login")):
+        registry.update_status("fix-login", "running")
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_FILE = ".ralph/worktrees.db"
+LEGACY_STATE_FILE = ".ralph/worktrees.json"
+
+# Seconds to wait for another process's write transaction
+BUSY_TIMEOUT = 30.0
+
+_COLUMNS = ("task_id", "path", "branch", "commit_hash", "created_at", "status")
+_UPDATABLE = {"path", "branch", "commit", "status"}
+
+
+class RegistryError(Exception):
+    """Raised when the worktree registry can't be read or written."""
+
+    pass
+
+
+@dataclass
+class ActiveWorktree:
+    """Information about an active worktree.
+
+    Attributes:
+        task_id: Task this worktree is for
+        path: Absolute path to worktree directory
+        branch: Git branch name
+        commit: Current commit hash
+        created_at: When the worktree was created
+        status: Current status (created, running, ready_to_merge, error)
+    """
+
+    task_id: str
+    path: str
+    branch: str
+    commit: str = ""
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    status: str = "created"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "task_id": self.task_id,
+            "path": self.path,
+            "branch": self.branch,
+            "commit": self.commit,
+            "created_at": self.created_at.isoformat(),
+            "status": self.status,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ActiveWorktree":
+        """Create from dictionary."""
+        created_at = data.get("created_at")
+        if isinstance(created_at, str):
+            created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+        elif created_at is None:
+            created_at = datetime.now(timezone.utc)
+
+        return cls(
+            task_id=data["task_id"],
+            path=data["path"],
+            branch=data["branch"],
+            commit=data.get("commit", ""),
+            created_at=created_at,
+            status=data.get("status", "created"),
+        )
+
+
+class WorktreeRegistry:
+    """Active worktrees in a SQLite database shared between processes."""
+
+    def __init__(self, db_path: str | Path, legacy_state: str | Path | None = None):
+        """Initialize the registry. The database is opened on first use.
+
+        Args:
+            db_path: Database file (its directory is created if missing)
+            legacy_state: JSON state file to import from, if any
+        """
+        self._db_path = Path(db_path)
+        self._legacy_state = Path(legacy_state) if legacy_state else None
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid = 0
+
+    @classmethod
+    def for_repo(cls, repo_path: str | Path) -> WorktreeRegistry:
+        """The registry of a repository (`.ralph/worktrees.db`)."""
+        repo_path = Path(repo_path)
+        return cls(repo_path / REGISTRY_FILE, legacy_state=repo_path / LEGACY_STATE_FILE)
+
+    @property
+    def db_path(self) -> Path:
+        """Get the database file path."""
+        return self._db_path
+
+    def add(self, worktree: ActiveWorktree, replace: bool = False) -> bool:
+        """Register a worktree.
+
+        Args:
+            worktree: Worktree to record
+            replace: Overwrite an existing record for the task
+
+        Returns:
+            False if the task already has a worktree (and replace is False)
+        """
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        _, changed = self._execute(
+            f"{verb} INTO worktrees ({', '.join(_COLUMNS)}) VALUES (?, ?, ?, ?, ?, ?)",
+            _row(worktree),
+        )
+        return changed > 0
+
+    def get(self, task_id: str) -> Optional[ActiveWorktree]:
+        """Get a task's worktree, or None."""
+        rows, _ = self._execute(
+            f"SELECT {', '.join(_COLUMNS)} FROM worktrees WHERE task_id = ?", (task_id,)
+        )
+        return _from_row(rows[0]) if rows else None
+
+    def list(self) -> list[ActiveWorktree]:
+        """All worktrees, oldest first."""
+        rows, _ = self._execute(f"SELECT {', '.join(_COLUMNS)} FROM worktrees ORDER BY created_at")
+        return [_from_row(row) for row in rows]
+
+    def update(self, task_id: str, **fields: str) -> Optional[ActiveWorktree]:
+        """Update fields of one worktree.
+
+        Args:
+            task_id: Task whose worktree to update
+            **fields: path, branch, commit and/or status
+
+        Returns:
+            The updated worktree, or None if the task has none
+
+        Raises:
+            ValueError: If a field can't be updated
+        """
+        unknown = set(fields) - _UPDATABLE
+        if unknown:
+            raise ValueError(f"Cannot update worktree fields: {sorted(unknown)}")
+        assignments = ", ".join(
+            f"{'commit_hash' if name == 'commit' else name} = ?" for name in fields
+        )
+        # UPDATE ... RETURNING needs SQLite 3.35; read the row back in the
+        # same transaction instead so older system libraries work too.
+        try:
+            with self._lock:
+                conn = self._connect()
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    conn.execute(
+                        f"UPDATE worktrees SET {assignments} WHERE task_id = ?",
+                        (*fields.values(), task_id),
+                    )
+                    row = conn.execute(
+                        f"SELECT {', '.join(_COLUMNS)} FROM worktrees WHERE task_id = ?",
+                        (task_id,),
+                    ).fetchone()
+                    conn.execute("COMMIT")
+                except sqlite3.Error:
+                    conn.execute("ROLLBACK")
+                    raise
+        except sqlite3.Error as e:
+            raise RegistryError(f"Worktree registry {self._db_path}: {e}") from e
+        return _from_row(row) if row else None
+
+    def update_status(self, task_id: str, status: str) -> Optional[ActiveWorktree]:
+        """Set a worktree's status; None if the task has none."""
+        return self.update(task_id, status=status)
+
+    def remove(self, task_id: str) -> bool:
+        """Unregister a worktree. Returns False if there was none."""
+        _, changed = self._execute("DELETE FROM worktrees WHERE task_id = ?", (task_id,))
+        return changed > 0
+
+    def counts(self) -> dict[str, int]:
+        """Number of worktrees per status."""
+        rows, _ = self._execute("SELECT status, COUNT(*) FROM worktrees GROUP BY status")
+        return dict(rows)
+
+    def close(self) -> None:
+        """Close this process's connection (reopened on next use)."""
+        with self._lock:
+            if self._conn is not None and self._pid == os.getpid():
+                self._conn.close()
+            self._conn = None
+
+    def _execute(self, sql: str, params: Iterable[Any] = ()) -> tuple[list[tuple], int]:
+        """Run one statement; its rows and the number of rows changed."""
+        try:
+            with self._lock:
+                cursor = self._connect().execute(sql, tuple(params))
+                return cursor.fetchall(), cursor.rowcount
+        except sqlite3.Error as e:
+            raise RegistryError(f"Worktree registry {self._db_path}: {e}") from e
+
+    def _connect(self) -> sqlite3.Connection:
+        """This process's connection. Caller must hold _lock.
+
+        A connection inherited across fork() is never used; the child
+        opens its own.
+        """
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+
+        self._db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            str(self._db_path),
+            timeout=BUSY_TIMEOUT,
+            check_same_thread=False,
+            isolation_level=None,  # Autocommit; explicit transactions below
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS worktrees ("
+            " task_id TEXT PRIMARY KEY,"
+            " path TEXT NOT NULL,"
+            " branch TEXT NOT NULL,"
+            " commit_hash TEXT NOT NULL DEFAULT '',"
+            " created_at TEXT NOT NULL,"
+            " status TEXT NOT NULL)"
+        )
+        self._conn, self._pid = conn, os.getpid()
+        self._import_legacy(conn)
+        return conn
+
+    def _import_legacy(self, conn: sqlite3.Connection) -> None:
+        """Seed an empty registry from the old JSON state file."""
+        if self._legacy_state is None or not self._legacy_state.exists():
+            return
+        try:
+            with open(self._legacy_state) as f:
+                data = json.load(f)
+            worktrees = [ActiveWorktree.from_dict(v) for v in data.get("worktrees", {}).values()]
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning(f"Failed to import worktree state {self._legacy_state}: {e}")
+            return
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if conn.execute("SELECT COUNT(*) FROM worktrees").fetchone()[0] == 0:
+                conn.executemany(
+                    f"INSERT OR IGNORE INTO worktrees ({', '.join(_COLUMNS)}) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    [_row(w) for w in worktrees],
+                )
+                logger.info(f"Imported {len(worktrees)} worktrees into {self._db_path}")
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        try:
+            self._legacy_state.replace(self._legacy_state.with_suffix(".json.migrated"))
+        except FileNotFoundError:
+            pass  # Another process migrated it
+
+
+def _row(worktree: ActiveWorktree) -> tuple[str, ...]:
+    return (
+        worktree.task_id,
+        worktree.path,
+        worktree.branch,
+        worktree.commit,
+        worktree.created_at.astimezone(timezone.utc).isoformat(),
+        worktree.status,
+    )
+
+
+def _from_row(row: tuple[str, ...]) -> ActiveWorktree:
+    task_id, path, branch, commit, created_at, status = row
+    return ActiveWorktree(
+        task_id=task_id,
+        path=path,
+        branch=branch,
+        commit=commit,
+        created_at=datetime.fromisoformat(created_at),
+        status=status,
+    )
@@ -0,0 +1,636 @@
+"""Pluggable storage backends for the task queue.
+
+The TaskQueue keeps an in-memory index of tasks and delegates persistence
+to a storage backend. Backends deal only in serialized task records
+(the dicts produced by ``QueuedTask.to_dict()``), which keeps them free of
+queue logic and lets the queue detect external changes cheaply.
+
+Backends:
+- YamlTaskStorage: One YAML file per task in `.ralph/tasks/` (default).
+  Changes are detected by comparing file mtime/size/inode signatures, so
+  only files that actually changed are re-parsed.
+- SQLiteTaskStorage: Tasks stored in `.ralph/tasks.db` (WAL journal).
+  YAML files are still written as an export format so humans, git and
+  the dashboard can keep reading them.
+
+Usage:
+    from ralph_agi.tasks.storage import create_storage
+
+    storage = create_storage("sqlite", tasks_dir=Path(".ralph/tasks"))
+    storage.write("fix-login-a1b2c3", task.to_dict())
+
+    changes = storage.changes()
+    for task_id, record in changes.updated.items():
+        ...
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+
+class StorageError(Exception):
+    """Raised when a storage backend fails to persist a task."""
+
+    pass
+
+
+@dataclass
+class StorageChanges:
+    """Changes observed in a backend since the previous ``changes()`` call.
+
+    Attributes:
+        updated: Task records that were added or modified, keyed by task ID
+        removed: IDs of tasks that no longer exist
+        full: True if ``updated`` is a complete snapshot and any task not
+            in it should be dropped
+    """
+
+    updated: dict[str, dict[str, Any]] = field(default_factory=dict)
+    removed: set[str] = field(default_factory=set)
+    full: bool = False
+
+    def __bool__(self) -> bool:
+        return bool(self.updated or self.removed or self.full)
+
+
+def dump_task_yaml(path: Path, record: dict[str, Any]) -> None:
+    """Write a task record to a YAML file atomically.
+
+    Args:
+        path: Destination file
+        record: Serialized task (``QueuedTask.to_dict()``)
+
+    Raises:
+        StorageError: If the file cannot be written
+    """
+    temp_path = path.with_suffix(".yaml.tmp")
+
+    try:
+        content = yaml.dump(
+            record,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
+
+        with open(temp_path, "w") as f:
+            f.write(content)
+
+        # Atomic rename
+        temp_path.replace(path)
+
+    except Exception as e:
+        if temp_path.exists():
+            temp_path.unlink()
+        raise StorageError(str(e)) from e
+
+
+def load_task_yaml(path: Path) -> dict[str, Any] | None:
+    """Read a task record from a YAML file.
+
+    Returns:
+        The record, or None if the file is missing, empty or invalid
+    """
+    try:
+        with open(path) as f:
+            data = yaml.safe_load(f)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"Failed to load task {path}: {e}")
+        return None
+
+    if not isinstance(data, dict) or "id" not in data:
+        return None
+    return data
+
+
+class TaskStorage(ABC):
+    """Abstract persistence backend for queued tasks."""
+
+    name: str = "base"
+
+    @abstractmethod
+    def read(self, task_id: str) -> dict[str, Any] | None:
+        """Read a single task record, or None if it doesn't exist."""
+        pass
+
+    @abstractmethod
+    def write(self, task_id: str, record: dict[str, Any]) -> None:
+        """Persist a task record, replacing any existing one.
+
+        Raises:
+            StorageError: If the record cannot be persisted
+        """
+        pass
+
+    @abstractmethod
+    def delete(self, task_id: str) -> bool:
+        """Delete a task record.
+
+        Returns:
+            True if a record was removed
+
+        Raises:
+            StorageError: If the deletion cannot be persisted
+        """
+        pass
+
+    @abstractmethod
+    def exists(self, task_id: str) -> bool:
+        """Check whether a task record exists."""
+        pass
+
+    @abstractmethod
+    def changes(self) -> StorageChanges:
+        """Return changes made outside this instance since the last call.
+
+        The first call returns a full snapshot. Writes and deletes made
+        through this instance are never reported back.
+        """
+        pass
+
+    def reopen(self) -> TaskStorage:
+        """Open another instance on the same tasks, e.g. for a watcher.
+
+        Its ``changes()`` reports writes made through this instance too.
+
+        Raises:
+            NotImplementedError: If the backend can't be opened twice
+        """
+        raise NotImplementedError(f"{self.name} task storage can't be reopened")
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+        pass
+
+
+# Signature used to detect file changes without parsing: (mtime_ns, size, inode)
+_FileSignature = tuple[int, int, int]
+
+
+class YamlTaskStorage(TaskStorage):
+    """One YAML file per task, with mtime-based change detection.
+
+    ``changes()`` first stats the tasks directory. If its mtime hasn't
+    moved since the last full pass (and that pass started well after the
+    mtime, so no change can hide in the same timestamp tick), nothing was
+    added, removed or renamed in and the call returns at once. Otherwise it
+    does one ``os.scandir`` pass; files whose (mtime, size, inode)
+    signature is unchanged are skipped, so only changed files are parsed.
+
+    Writes that rewrite a file in place don't touch the directory mtime;
+    they are picked up by a full pass at least every
+    ``FULL_SCAN_INTERVAL`` seconds.
+    """
+
+    name = "yaml"
+
+    # Longest time an unchanged directory mtime is trusted
+    FULL_SCAN_INTERVAL = 2.0
+    # Filesystem timestamp granularity to allow for (coarsest common: 1s)
+    MTIME_GRANULARITY_NS = 1_000_000_000
+
+    def __init__(self, tasks_dir: Path):
+        """Initialize YAML storage.
+
+        Args:
+            tasks_dir: Directory holding the task files (created if missing)
+        """
+        self._tasks_dir = Path(tasks_dir)
+        self._tasks_dir.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        # filename -> (signature, task_id) for every file seen so far
+        self._seen: dict[str, tuple[_FileSignature, str]] = {}
+        self._scanned = False
+        # Directory (mtime_ns, inode) and wall/monotonic start of the last full pass
+        self._dir_sig: tuple[int, int] | None = None
+        self._scan_started_ns = 0
+        self._scan_started = 0.0
+
+    @property
+    def tasks_dir(self) -> Path:
+        """Get the tasks directory path."""
+        return self._tasks_dir
+
+    def path_for(self, task_id: str) -> Path:
+        """Get file path for a task ID."""
+        return self._tasks_dir / f"{task_id}.yaml"
+
+    @staticmethod
+    def _signature(st: os.stat_result) -> _FileSignature:
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+    def read(self, task_id: str) -> dict[str, Any] | None:
+        return load_task_yaml(self.path_for(task_id))
+
+    def write(self, task_id: str, record: dict[str, Any]) -> None:
+        path = self.path_for(task_id)
+        dump_task_yaml(path, record)
+
+        # Remember our own write so changes() doesn't re-parse it
+        try:
+            sig = self._signature(path.stat())
+        except OSError:
+            return
+        with self._lock:
+            self._seen[path.name] = (sig, task_id)
+
+    def delete(self, task_id: str) -> bool:
+        path = self.path_for(task_id)
+        with self._lock:
+            self._seen.pop(path.name, None)
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        return True
+
+    def exists(self, task_id: str) -> bool:
+        return self.path_for(task_id).exists()
+
+    def _directory_unchanged(self) -> bool:
+        """Whether the last full pass is still current. Caller holds _lock."""
+        if self._dir_sig is None:
+            return False
+        if time.monotonic() - self._scan_started >= self.FULL_SCAN_INTERVAL:
+            return False
+        try:
+            st = os.stat(self._tasks_dir)
+        except OSError:
+            return False
+        return (
+            (st.st_mtime_ns, st.st_ino) == self._dir_sig
+            and st.st_mtime_ns + self.MTIME_GRANULARITY_NS < self._scan_started_ns
+        )
+
+    def changes(self) -> StorageChanges:
+        result = StorageChanges()
+
+        with self._lock:
+            if self._scanned and self._directory_unchanged():
+                return result
+
+            full = not self._scanned
+            self._scanned = True
+            current: dict[str, _FileSignature] = {}
+
+            # Stat the directory before listing it, so a change made during
+            # the pass shows up as a new mtime next time
+            self._scan_started_ns = time.time_ns()
+            self._scan_started = time.monotonic()
+            try:
+                st = os.stat(self._tasks_dir)
+                self._dir_sig = (st.st_mtime_ns, st.st_ino)
+            except OSError:
+                self._dir_sig = None
+
+            try:
+                with os.scandir(self._tasks_dir) as it:
+                    for entry in it:
+                        if not entry.name.endswith(".yaml"):
+                            continue
+                        try:
+                            current[entry.name] = self._signature(entry.stat())
+                        except FileNotFoundError:
+                            continue  # Removed mid-scan
+            except FileNotFoundError:
+                pass
+
+            for name in set(self._seen) - set(current):
+                _, task_id = self._seen.pop(name)
+                result.removed.add(task_id)
+
+            for name, sig in current.items():
+                previous = self._seen.get(name)
+                if not full and previous is not None and previous[0] == sig:
+                    continue
+
+                record = load_task_yaml(self._tasks_dir / name)
+                if record is None:
+                    # Keep the signature so an invalid file isn't re-parsed
+                    # on every refresh; drop any task it used to hold.
+                    if previous is not None:
+                        result.removed.add(previous[1])
+                    self._seen[name] = (sig, "")
+                    continue
+
+                task_id = str(record["id"])
+                if previous is not None and previous[1] and previous[1] != task_id:
+                    result.removed.add(previous[1])
+                self._seen[name] = (sig, task_id)
+                result.updated[task_id] = record
+                result.removed.discard(task_id)
+
+        result.removed.discard("")
+        result.full = full
+        return result
+
+
+class SQLiteTaskStorage(TaskStorage):
+    """Tasks stored in a SQLite database, with YAML files as an export.
+
+    The database runs in WAL mode so readers never block the writer.
+    External commits (another process, or the CLI) are detected through
+    ``PRAGMA data_version``, which only changes when a *different*
+    connection commits.
+
+    Every write stamps the row with the next value of a database-wide
+    ``seq`` counter, and every delete leaves a tombstone with its own
+    ``seq``. ``changes()`` remembers the highest ``seq`` it has seen and
+    fetches only newer rows and tombstones, so an external commit costs
+    parsing the tasks it touched rather than the whole table.
+
+    On first use an empty database is seeded from any YAML files already
+    present in the tasks directory.
+    """
+
+    name = "sqlite"
+
+    DB_FILE = "tasks.db"
+
+    def __init__(
+        self,
+        tasks_dir: Path,
+        db_path: Path | None = None,
+        export_yaml: bool = True,
+    ):
+        """Initialize SQLite storage.
+
+        Args:
+            tasks_dir: Directory for YAML exports (created if missing)
+            db_path: Database file (default: `tasks.db` next to tasks_dir)
+            export_yaml: Also write each task to `tasks_dir` as YAML
+        """
+        self._tasks_dir = Path(tasks_dir)
+        self._tasks_dir.mkdir(parents=True, exist_ok=True)
+        self._db_path = Path(db_path) if db_path else self._tasks_dir.parent / self.DB_FILE
+        self._export_yaml = export_yaml
+        self._lock = threading.Lock()
+        self._data_version: int | None = None
+        # Highest seq reported by changes(); None until the first snapshot
+        self._last_seq: int | None = None
+        # seq of each write/delete made through this instance, not reported back
+        self._own_seqs: dict[str, int] = {}
+
+        self._conn = sqlite3.connect(
+            str(self._db_path),
+            check_same_thread=False,
+            isolation_level=None,  # Autocommit; explicit transactions below
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tasks ("
+            " id TEXT PRIMARY KEY,"
+            " status TEXT NOT NULL,"
+            " priority TEXT NOT NULL,"
+            " record TEXT NOT NULL,"
+            " seq INTEGER NOT NULL DEFAULT 0)"
+        )
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(tasks)")}
+        if "seq" not in columns:
+            # Databases created before change sequencing
+            self._conn.execute("ALTER TABLE tasks ADD COLUMN seq INTEGER NOT NULL DEFAULT 0")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS deleted_tasks ("
+            " id TEXT PRIMARY KEY,"
+            " seq INTEGER NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_seq ON tasks(seq)")
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_deleted_tasks_seq ON deleted_tasks(seq)"
+        )
+
+        self._import_yaml()
+
+    @property
+    def db_path(self) -> Path:
+        """Get the database file path."""
+        return self._db_path
+
+    def _import_yaml(self) -> None:
+        """Seed an empty database from existing YAML task files."""
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+            if count:
+                return
+
+            rows = []
+            for path in self._tasks_dir.glob("*.yaml"):
+                record = load_task_yaml(path)
+                if record is not None:
+                    rows.append(self._row(str(record["id"]), record))
+
+            if rows:
+                self._conn.execute("BEGIN IMMEDIATE")
+                first = self._next_seq()
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO tasks (id, status, priority, record, seq) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    [row + (first + i,) for i, row in enumerate(rows)],
+                )
+                self._conn.execute("COMMIT")
+                logger.info(f"Imported {len(rows)} tasks into {self._db_path}")
+
+    @staticmethod
+    def _row(task_id: str, record: dict[str, Any]) -> tuple[str, str, str, str]:
+        return (
+            task_id,
+            str(record.get("status", "pending")),
+            str(record.get("priority", "P2")),
+            json.dumps(record, default=str),
+        )
+
+    def _max_seq(self) -> int:
+        """Highest seq stamped so far. Caller holds _lock."""
+        return self._conn.execute(
+            "SELECT MAX(COALESCE((SELECT MAX(seq) FROM tasks), 0),"
+            " COALESCE((SELECT MAX(seq) FROM deleted_tasks), 0))"
+        ).fetchone()[0]
+
+    def _next_seq(self) -> int:
+        """Next seq to stamp. Caller holds _lock inside a write transaction.
+
+        ``BEGIN IMMEDIATE`` takes the database write lock, so no other
+        connection can stamp the same value.
+        """
+        return self._max_seq() + 1
+
+    def _yaml_path(self, task_id: str) -> Path:
+        return self._tasks_dir / f"{task_id}.yaml"
+
+    def read(self, task_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT record FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def write(self, task_id: str, record: dict[str, Any]) -> None:
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    seq = self._next_seq()
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO tasks (id, status, priority, record, seq) "
+                        "VALUES (?, ?, ?, ?, ?)",
+                        self._row(task_id, record) + (seq,),
+                    )
+                    self._conn.execute("DELETE FROM deleted_tasks WHERE id = ?", (task_id,))
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                self._own_seqs[task_id] = seq
+        except sqlite3.Error as e:
+            raise StorageError(str(e)) from e
+
+        if self._export_yaml:
+            dump_task_yaml(self._yaml_path(task_id), record)
+
+    def delete(self, task_id: str) -> bool:
+        try:
+            with self._lock:
+                self._conn.execute("BEGIN IMMEDIATE")
+                try:
+                    cursor = self._conn.execute("DELETE FROM tasks WHERE id = ?", (task_id,))
+                    deleted = cursor.rowcount > 0
+                    if deleted:
+                        seq = self._next_seq()
+                        self._conn.execute(
+                            "INSERT OR REPLACE INTO deleted_tasks (id, seq) VALUES (?, ?)",
+                            (task_id, seq),
+                        )
+                    self._conn.execute("COMMIT")
+                except BaseException:
+                    self._conn.execute("ROLLBACK")
+                    raise
+                if deleted:
+                    self._own_seqs[task_id] = seq
+        except sqlite3.Error as e:
+            raise StorageError(str(e)) from e
+
+        if self._export_yaml:
+            self._yaml_path(task_id).unlink(missing_ok=True)
+        return deleted
+
+    def exists(self, task_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM tasks WHERE id = ?", (task_id,)
+            ).fetchone()
+        return row is not None
+
+    def changes(self) -> StorageChanges:
+        with self._lock:
+            version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if version == self._data_version:
+                return StorageChanges()
+            self._data_version = version
+
+            if self._last_seq is None:
+                # First call: full snapshot. One read transaction keeps the
+                # rows and the seq watermark consistent.
+                self._conn.execute("BEGIN")
+                try:
+                    rows = self._conn.execute("SELECT id, record FROM tasks").fetchall()
+                    self._last_seq = self._max_seq()
+                finally:
+                    self._conn.execute("COMMIT")
+                self._own_seqs.clear()
+                return StorageChanges(
+                    updated={task_id: json.loads(record) for task_id, record in rows},
+                    full=True,
+                )
+
+            self._conn.execute("BEGIN")
+            try:
+                rows = self._conn.execute(
+                    "SELECT id, record, seq FROM tasks WHERE seq > ?", (self._last_seq,)
+                ).fetchall()
+                tombstones = self._conn.execute(
+                    "SELECT id, seq FROM deleted_tasks WHERE seq > ?", (self._last_seq,)
+                ).fetchall()
+            finally:
+                self._conn.execute("COMMIT")
+
+            own = self._own_seqs
+            changes = StorageChanges(
+                updated={
+                    task_id: json.loads(record)
+                    for task_id, record, seq in rows
+                    if own.get(task_id) != seq
+                },
+                removed={task_id for task_id, seq in tombstones if own.get(task_id) != seq},
+            )
+            self._last_seq = max(
+                [self._last_seq] + [row[2] for row in rows] + [row[1] for row in tombstones]
+            )
+            # Every own write is committed before this read, so all are covered
+            self._own_seqs.clear()
+
+        return changes
+
+    def reopen(self) -> SQLiteTaskStorage:
+        return SQLiteTaskStorage(self._tasks_dir, self._db_path, export_yaml=False)
+
+    def export(self) -> int:
+        """Write every task to the tasks directory as YAML.
+
+        Returns:
+            Number of tasks exported
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT id, record FROM tasks").fetchall()
+        for task_id, record in rows:
+            dump_task_yaml(self._yaml_path(task_id), json.loads(record))
+        return len(rows)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_storage(
+    backend: str | TaskStorage | None,
+    tasks_dir: Path,
+) -> TaskStorage:
+    """Create a storage backend by name.
+
+    Args:
+        backend: "yaml" (default), "sqlite", or an existing TaskStorage
+        tasks_dir: Directory holding the YAML task files
+
+    Returns:
+        A TaskStorage instance
+
+    Raises:
+        ValueError: If the backend name is unknown
+    """
+    if isinstance(backend, TaskStorage):
+        return backend
+
+    name = (backend or "yaml").lower()
+    if name == "yaml":
+        return YamlTaskStorage(tasks_dir)
+    if name == "sqlite":
+        return SQLiteTaskStorage(tasks_dir)
+
+    raise ValueError(f"Unknown task storage backend: {backend}")
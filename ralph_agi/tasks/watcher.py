@@ -0,0 +1,658 @@
+"""Watch the task directory for added, updated and removed tasks.
+
+On Linux the watcher uses inotify, so it sleeps until a task file is
+written, renamed or deleted. Elsewhere, or if inotify is unavailable,
+it falls back to comparing ``os.scandir`` (mtime, size, inode)
+signatures every ``poll_interval`` seconds.
+
+Changes are debounced: once something changes, the watcher waits until
+the directory has been quiet for ``debounce`` seconds (but no longer than
+``max_delay``) and then reports one event per task file. Only ``*.yaml``
+files are considered, so the ``.yaml.tmp`` files written by atomic saves
+never show up. A file that can't be parsed (e.g. half-written by an
+editor) is skipped until it is written again.
+
+Backends that keep tasks somewhere else (e.g. SQLite) are followed by
+StorageWatcher instead, which polls the backend's ``changes()`` on its
+own storage instance and reports the same events.
+
+Usage:
+    from ralph_agi.tasks.watcher import TaskWatcher
+
+    # Async iterator
+    with TaskWatcher(Path(".ralph/tasks")) as watcher:
+        async for event in watcher:
+            print(event.type.value, event.task_id)
+
+    # Callback on a background thread
+    watcher = TaskWatcher(Path(".ralph/tasks"))
+    watcher.start(lambda event: print(event.type.value, event.task_id))
+    ...
+    watcher.close()
+"""
+
+from __future__ import annotations
+
+import asyncio
+import ctypes
+import ctypes.util
+import errno
+import logging
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import AsyncIterator, Callable, Iterator, Optional
+
+from ralph_agi.tasks.queue import QueuedTask
+from ralph_agi.tasks.storage import TaskStorage, load_task_yaml
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEBOUNCE = 0.1
+DEFAULT_POLL_INTERVAL = 1.0
+
+# Longest a steady stream of writes can hold back events
+DEFAULT_MAX_DELAY = 1.0
+
+TASK_SUFFIX = ".yaml"
+
+# (mtime_ns, size, inode)
+_FileSignature = tuple[int, int, int]
+
+# inotify(7) constants
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_FROM = 0x00000040
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_DELETE = 0x00000200
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_IN_Q_OVERFLOW = 0x00004000
+_IN_ONLYDIR = 0x01000000
+_WATCH_MASK = (
+    _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+    | _IN_DELETE_SELF | _IN_MOVE_SELF | _IN_ONLYDIR
+)
+_EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+_READ_SIZE = 64 * 1024
+
+
+class TaskEventType(str, Enum):
+    """How a task file changed."""
+
+    ADDED = "added"
+    UPDATED = "updated"
+    REMOVED = "removed"
+
+
+@dataclass
+class TaskEvent:
+    """A change to a task file.
+
+    Attributes:
+        type: Added, updated or removed.
+        task_id: ID of the task.
+        task: The task as now on disk (None when removed).
+    """
+
+    type: TaskEventType
+    task_id: str
+    task: Optional[QueuedTask] = None
+
+
+class _PollingBackend:
+    """Finds changed files by diffing scandir signatures."""
+
+    name = "polling"
+
+    def __init__(self, tasks_dir: Path):
+        self._tasks_dir = tasks_dir
+        self._snapshot = _scan(tasks_dir)
+
+    def fileno(self) -> Optional[int]:
+        return None
+
+    def read(self) -> Optional[set[str]]:
+        current = _scan(self._tasks_dir)
+        previous, self._snapshot = self._snapshot, current
+        return {
+            name for name in current.keys() | previous.keys()
+            if current.get(name) != previous.get(name)
+        }
+
+    def close(self) -> None:
+        pass
+
+
+class _InotifyBackend:
+    """Reads changed file names from an inotify watch on the directory."""
+
+    name = "inotify"
+
+    def __init__(self, tasks_dir: Path):
+        libc = _libc()
+        if libc is None:
+            raise OSError(errno.ENOSYS, "inotify is not available")
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(fd, os.fsencode(tasks_dir), _WATCH_MASK) < 0:
+            error = ctypes.get_errno()
+            os.close(fd)
+            raise OSError(error, f"inotify_add_watch failed for {tasks_dir}")
+        self._fd = fd
+
+    def fileno(self) -> Optional[int]:
+        return self._fd
+
+    def read(self) -> Optional[set[str]]:
+        """Drain pending events without blocking.
+
+        Returns:
+            Names of files that changed, or None if events were lost
+            (queue overflow, or the directory itself moved).
+        """
+        names: set[str] = set()
+        lost = False
+        while True:
+            try:
+                data = os.read(self._fd, _READ_SIZE)
+            except BlockingIOError:
+                break
+            offset = 0
+            while offset < len(data):
+                _, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset:offset + length].rstrip(b"\0")
+                offset += length
+                if mask & (_IN_Q_OVERFLOW | _IN_DELETE_SELF | _IN_MOVE_SELF):
+                    lost = True
+                elif name:
+                    names.add(os.fsdecode(name))
+        return None if lost else names
+
+    def close(self) -> None:
+        os.close(self._fd)
+
+
+_libc_handle: Optional[ctypes.CDLL] = None
+
+
+def _libc() -> Optional[ctypes.CDLL]:
+    """libc with inotify, or None off Linux."""
+    global _libc_handle
+    if not sys.platform.startswith("linux"):
+        return None
+    if _libc_handle is None:
+        try:
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            libc.inotify_init1.argtypes = [ctypes.c_int]
+            libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+        except (OSError, AttributeError):
+            return None
+        _libc_handle = libc
+    return _libc_handle
+
+
+def inotify_available() -> bool:
+    """Whether the inotify backend can be used on this platform."""
+    return _libc() is not None
+
+
+def _scan(tasks_dir: Path) -> dict[str, _FileSignature]:
+    """Signatures of the task files in a directory."""
+    signatures: dict[str, _FileSignature] = {}
+    try:
+        with os.scandir(tasks_dir) as it:
+            for entry in it:
+                if not entry.name.endswith(TASK_SUFFIX):
+                    continue
+                try:
+                    st = entry.stat()
+                except FileNotFoundError:
+                    continue  # Removed mid-scan
+                signatures[entry.name] = (st.st_mtime_ns, st.st_size, st.st_ino)
+    except FileNotFoundError:
+        pass
+    return signatures
+
+
+class TaskWatcher:
+    """Debounced watcher for a task directory."""
+
+    def __init__(
+        self,
+        tasks_dir: Path | str,
+        debounce: float = DEFAULT_DEBOUNCE,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_delay: float = DEFAULT_MAX_DELAY,
+        backend: str = "auto",
+    ):
+        """Initialize the watcher. Tasks already present are not reported.
+
+        Args:
+            tasks_dir: Directory holding the task YAML files.
+            debounce: Seconds of quiet before changes are reported.
+            poll_interval: Seconds between scans for the polling backend.
+            max_delay: Report changes after this many seconds even if
+                writes keep arriving.
+            backend: "inotify", "polling", or "auto" (inotify when
+                available).
+
+        Raises:
+            ValueError: If the backend name is unknown.
+            OSError: If "inotify" was requested and can't be set up.
+        """
+        if backend not in ("auto", "inotify", "polling"):
+            raise ValueError(f"Unknown watcher backend: {backend}")
+        self.tasks_dir = Path(tasks_dir)
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.max_delay = max_delay
+
+        self._backend: _InotifyBackend | _PollingBackend
+        if backend != "polling" and (backend == "inotify" or inotify_available()):
+            try:
+                self._backend = _InotifyBackend(self.tasks_dir)
+            except OSError as e:
+                if backend == "inotify":
+                    raise
+                logger.debug(f"inotify unavailable ({e}); polling {self.tasks_dir}")
+                self._backend = _PollingBackend(self.tasks_dir)
+        else:
+            self._backend = _PollingBackend(self.tasks_dir)
+
+        # Wakes a blocked inotify wait when the watcher is closed
+        self._wake_r, self._wake_w = os.pipe() if self._backend.fileno() is not None else (-1, -1)
+        self._known = _scan(self.tasks_dir)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stopped = threading.Event()
+        self._waiting = 0
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def backend(self) -> str:
+        """Name of the backend in use ("inotify" or "polling")."""
+        return self._backend.name
+
+    @property
+    def closed(self) -> bool:
+        """Whether the watcher has been closed."""
+        return self._closed
+
+    def poll(self, timeout: Optional[float] = None) -> list[TaskEvent]:
+        """Wait for the next batch of changes.
+
+        Args:
+            timeout: Seconds to wait (None waits until something changes
+                or the watcher is closed).
+
+        Returns:
+            Events in the batch; empty on timeout or close.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._closed:
+            wait = self._idle_wait(deadline)
+            if wait is not None and wait <= 0:
+                break
+            names = self._wait(wait)
+            if names:
+                events = self._resolve(self._settle(names))
+                if events:
+                    return events
+        return []
+
+    def watch(
+        self,
+        callback: Callable[[TaskEvent], None],
+        stop: Optional[threading.Event] = None,
+    ) -> None:
+        """Call ``callback`` for every event until closed. Blocks.
+
+        Args:
+            callback: Called with each event, in order.
+            stop: Also return once this is set.
+        """
+        logger.info(f"Watching {self.tasks_dir} ({self.backend})")
+        while not self._closed and not (stop is not None and stop.is_set()):
+            for event in self.poll(timeout=self.poll_interval):
+                try:
+                    callback(event)
+                except Exception as e:
+                    logger.error(f"Task watch callback failed for {event.task_id}: {e}")
+
+    def start(self, callback: Callable[[TaskEvent], None]) -> threading.Thread:
+        """Run ``watch(callback)`` on a background thread until closed."""
+        if self._thread is not None:
+            raise RuntimeError("Watcher is already running")
+        self._thread = threading.Thread(
+            target=self.watch, args=(callback,), name="task-watcher", daemon=True,
+        )
+        self._thread.start()
+        return self._thread
+
+    async def events(self) -> AsyncIterator[TaskEvent]:
+        """Yield events as they happen, until the watcher is closed."""
+        while not self._closed:
+            names = await self._wait_async(self._idle_wait(None))
+            if not names:
+                continue
+            names = await self._settle_async(names)
+            for event in await asyncio.to_thread(self._resolve, names):
+                yield event
+
+    def __aiter__(self) -> AsyncIterator[TaskEvent]:
+        return self.events()
+
+    def close(self) -> None:
+        """Stop watching. Blocked waits return and the iterator ends."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            idle = not self._waiting
+        self._stopped.set()
+        if self._wake_w >= 0:
+            os.write(self._wake_w, b"\0")
+        if idle:
+            self._release()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+
+    def __enter__(self) -> TaskWatcher:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _idle_wait(self, deadline: Optional[float]) -> Optional[float]:
+        """How long to wait for the first change."""
+        wait = None if self._backend.fileno() is not None else self.poll_interval
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            wait = remaining if wait is None else min(wait, remaining)
+        return wait
+
+    @contextmanager
+    def _waiting_on_fds(self) -> Iterator[bool]:
+        """Mark the backend's descriptors in use; yields False if closed.
+
+        ``close()`` leaves descriptors that are being waited on open; the
+        last waiter releases them.
+        """
+        with self._lock:
+            if self._closed:
+                yield False
+                return
+            self._waiting += 1
+        try:
+            yield True
+        finally:
+            with self._lock:
+                self._waiting -= 1
+                release = self._closed and not self._waiting
+            if release:
+                self._release()
+
+    def _wait(self, timeout: Optional[float]) -> set[str]:
+        """Block until something changes; names of the files that did."""
+        fd = self._backend.fileno()
+        if fd is None:
+            self._stopped.wait(timeout)
+            return set() if self._closed else self._read()
+        with self._waiting_on_fds() as open_:
+            if not open_:
+                return set()
+            select.select([fd, self._wake_r], [], [], timeout)
+            return set() if self._closed else self._read()
+
+    async def _wait_async(self, timeout: Optional[float]) -> set[str]:
+        fd = self._backend.fileno()
+        if fd is None:
+            await asyncio.sleep(timeout or 0)
+            return set() if self._closed else await asyncio.to_thread(self._read)
+        with self._waiting_on_fds() as open_:
+            if not open_:
+                return set()
+            loop = asyncio.get_running_loop()
+            ready = asyncio.Event()
+            loop.add_reader(fd, ready.set)
+            loop.add_reader(self._wake_r, ready.set)
+            try:
+                async with asyncio.timeout(timeout):
+                    await ready.wait()
+            except TimeoutError:
+                pass
+            finally:
+                loop.remove_reader(fd)
+                loop.remove_reader(self._wake_r)
+            return set() if self._closed else self._read()
+
+    def _read(self) -> set[str]:
+        names = self._backend.read()
+        if names is None:
+            logger.debug(f"Lost change events for {self.tasks_dir}; rescanning")
+            names = set(self._known) | set(_scan(self.tasks_dir))
+        return {name for name in names if name.endswith(TASK_SUFFIX)}
+
+    def _settle(self, names: set[str]) -> set[str]:
+        """Collect further changes until the directory is quiet."""
+        deadline = time.monotonic() + self.max_delay
+        while not self._closed:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            more = self._wait(min(self.debounce, remaining))
+            if not more:
+                break
+            names |= more
+        return names
+
+    async def _settle_async(self, names: set[str]) -> set[str]:
+        deadline = time.monotonic() + self.max_delay
+        while not self._closed:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            more = await self._wait_async(min(self.debounce, remaining))
+            if not more:
+                break
+            names |= more
+        return names
+
+    def _resolve(self, names: set[str]) -> list[TaskEvent]:
+        """Turn changed file names into events, dropping no-op changes."""
+        events = []
+        with self._lock:
+            for name in sorted(names):
+                path = self.tasks_dir / name
+                try:
+                    st = path.stat()
+                except FileNotFoundError:
+                    if self._known.pop(name, None) is not None:
+                        events.append(TaskEvent(TaskEventType.REMOVED, name[: -len(TASK_SUFFIX)]))
+                    continue
+                signature = (st.st_mtime_ns, st.st_size, st.st_ino)
+                previous = self._known.get(name)
+                if previous == signature:
+                    continue
+                record = load_task_yaml(path)
+                if record is None:
+                    continue  # Partly written or invalid; wait for the next write
+                try:
+                    task = QueuedTask.from_dict(record)
+                except Exception as e:
+                    logger.warning(f"Ignoring invalid task file {path}: {e}")
+                    continue
+                self._known[name] = signature
+                kind = TaskEventType.ADDED if previous is None else TaskEventType.UPDATED
+                events.append(TaskEvent(kind, task.id, task))
+        return events
+
+    def _release(self) -> None:
+        self._backend.close()
+        if self._wake_r >= 0:
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+
+
+class StorageWatcher:
+    """Polling watcher for tasks kept in a storage backend.
+
+    Each poll asks the backend for ``changes()``; for SQLite that is one
+    ``PRAGMA data_version`` query unless something was committed. The
+    storage must be an instance of its own (``TaskStorage.reopen()``) so
+    that writes made by the queue in this process are reported too. It
+    is closed with the watcher.
+
+    Commits are atomic, so changes are reported as soon as a poll sees
+    them, without debouncing. Tasks already present are not reported.
+    """
+
+    backend = "storage"
+
+    def __init__(
+        self,
+        storage: TaskStorage,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+    ):
+        """Initialize the watcher.
+
+        Args:
+            storage: Storage instance to poll; owned by the watcher.
+            poll_interval: Seconds between polls.
+        """
+        self.storage = storage
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._closed = False
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._known: dict[str, dict] = {}
+        self._read()  # First call is the full snapshot
+
+    @property
+    def closed(self) -> bool:
+        """Whether the watcher has been closed."""
+        return self._closed
+
+    def poll(self, timeout: Optional[float] = None) -> list[TaskEvent]:
+        """Wait for the next batch of changes.
+
+        Args:
+            timeout: Seconds to wait (None waits until something changes
+                or the watcher is closed).
+
+        Returns:
+            Events in the batch; empty on timeout or close.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self._closed:
+            events = self._read()
+            if events:
+                return events
+            wait = self.poll_interval
+            if deadline is not None:
+                wait = min(wait, deadline - time.monotonic())
+                if wait <= 0:
+                    break
+            self._stopped.wait(wait)
+        return []
+
+    def watch(
+        self,
+        callback: Callable[[TaskEvent], None],
+        stop: Optional[threading.Event] = None,
+    ) -> None:
+        """Call ``callback`` for every event until closed. Blocks.
+
+        Args:
+            callback: Called with each event, in order.
+            stop: Also return once this is set.
+        """
+        logger.info(f"Watching {self.storage.name} task storage")
+        while not self._closed and not (stop is not None and stop.is_set()):
+            for event in self.poll(timeout=self.poll_interval):
+                try:
+                    callback(event)
+                except Exception as e:
+                    logger.error(f"Task watch callback failed for {event.task_id}: {e}")
+
+    def start(self, callback: Callable[[TaskEvent], None]) -> threading.Thread:
+        """Run ``watch(callback)`` on a background thread until closed."""
+        if self._thread is not None:
+            raise RuntimeError("Watcher is already running")
+        self._thread = threading.Thread(
+            target=self.watch, args=(callback,), name="task-watcher", daemon=True,
+        )
+        self._thread.start()
+        return self._thread
+
+    async def events(self) -> AsyncIterator[TaskEvent]:
+        """Yield events as they happen, until the watcher is closed."""
+        while not self._closed:
+            events = await asyncio.to_thread(self._read)
+            for event in events:
+                yield event
+            if not events:
+                await asyncio.sleep(self.poll_interval)
+
+    def __aiter__(self) -> AsyncIterator[TaskEvent]:
+        return self.events()
+
+    def close(self) -> None:
+        """Stop watching and close the storage."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self.storage.close()
+        self._stopped.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=5.0)
+
+    def __enter__(self) -> StorageWatcher:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _read(self) -> list[TaskEvent]:
+        """Turn the backend's changes into events, dropping no-op changes."""
+        with self._lock:
+            if self._closed:
+                return []
+            changes = self.storage.changes()
+            if not changes:
+                return []
+            removed = set(changes.removed)
+            if changes.full:
+                removed |= self._known.keys() - changes.updated.keys()
+
+            events = []
+            for task_id in sorted(removed):
+                if self._known.pop(task_id, None) is not None:
+                    events.append(TaskEvent(TaskEventType.REMOVED, task_id))
+            for task_id, record in sorted(changes.updated.items()):
+                previous = self._known.get(task_id)
+                if previous == record:
+                    continue
+                try:
+                    task = QueuedTask.from_dict(record)
+                except Exception as e:
+                    logger.warning(f"Ignoring invalid task record {task_id}: {e}")
+                    continue
+                self._known[task_id] = record
+                kind = TaskEventType.ADDED if previous is None else TaskEventType.UPDATED
+                events.append(TaskEvent(kind, task_id, task))
+        return events
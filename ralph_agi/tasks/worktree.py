@@ -26,26 +26,40 @@ Usage:
     # List active worktrees
     for info in manager.list_active():
         print(f"{info.task_id}: {info.path}")
+
+    # Keep clean worktrees ready so create() is a branch switch
+    manager = WorktreeManager(repo_path="/path/to/repo", pool_size=3)
+    manager.warm_pool()
 """
 
 from __future__ import annotations
 
-import json
+import itertools
 import logging
 import os
 import shutil
 import threading
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Callable, TypeVar
-
+from typing import Any, Callable, Sequence, TypeVar
+
+from ralph_agi.tasks.checkout import derive_sparse_paths, share_dependency_dirs
+from ralph_agi.tasks.registry import (
+    LEGACY_STATE_FILE,
+    REGISTRY_FILE,
+    ActiveWorktree,
+    WorktreeRegistry,
+)
 from ralph_agi.tools.git import GitCommandError, GitTools, WorktreeInfo
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar("T")
 
+# Pooled worktrees older than this are removed instead of recycled
+DEFAULT_POOL_MAX_AGE = 24 * 3600.0
+
 
 class WorktreeError(Exception):
     """Base exception for worktree operations."""
@@ -71,53 +85,305 @@ class WorktreeNotFoundError(WorktreeError):
 
 
 @dataclass
-class ActiveWorktree:
-    """Information about an active worktree.
-
-    Attributes:
-        task_id: Task this worktree is for
-        path: Absolute path to worktree directory
-        branch: Git branch name
-        commit: Current commit hash
-        created_at: When the worktree was created
-        status: Current status (created, running, ready_to_merge, error)
+class _PooledTree:
+    path: Path
+    created_at: float = field(default_factory=time.time)
+
+
+class WorktreePool:
+    """Clean, detached worktrees kept ready to hand out.
+
+    ``git worktree add`` checks out every file. Switching an existing
+    clean worktree to a new branch only rewrites the files that differ,
+    which on a large repository is the difference between tens of
+    seconds and well under one.
+
+    - ``warm()`` creates detached worktrees until ``size`` are idle.
+    - ``acquire()`` checks a branch out in an idle tree, or creates a new
+      tree if none is idle.
+    - ``release()`` resets the tree, removes untracked and ignored files
+      with ``git clean`` and detaches HEAD so the branch can be deleted.
+      Trees beyond ``size`` idle or older than ``max_age`` are removed.
+
+    Trees live in ``<pool_dir>/<pid>-<n>``. Idle (detached) trees left by a
+    process that has exited are adopted with ``git worktree move``, so
+    each is taken over by one process only.
     """
 
-    task_id: str
-    path: str
-    branch: str
-    commit: str = ""
-    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
-    status: str = "created"
-
-    def to_dict(self) -> dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return {
-            "task_id": self.task_id,
-            "path": self.path,
-            "branch": self.branch,
-            "commit": self.commit,
-            "created_at": self.created_at.isoformat(),
-            "status": self.status,
-        }
+    def __init__(
+        self,
+        git: GitTools,
+        pool_dir: str | Path,
+        size: int = 2,
+        max_age: float = DEFAULT_POOL_MAX_AGE,
+    ):
+        """Initialize the pool. No git commands run until first use.
 
-    @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "ActiveWorktree":
-        """Create from dictionary."""
-        created_at = data.get("created_at")
-        if isinstance(created_at, str):
-            created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
-        elif created_at is None:
-            created_at = datetime.now(timezone.utc)
-
-        return cls(
-            task_id=data["task_id"],
-            path=data["path"],
-            branch=data["branch"],
-            commit=data.get("commit", ""),
-            created_at=created_at,
-            status=data.get("status", "created"),
-        )
+        Args:
+            git: GitTools for the main repository
+            pool_dir: Directory holding the pooled worktrees
+            size: Maximum idle worktrees to keep
+            max_age: Seconds after which a worktree is removed rather
+                than recycled
+        """
+        self._git = git
+        self._pool_dir = Path(pool_dir).resolve()
+        self.size = size
+        self.max_age = max_age
+        self._idle: list[_PooledTree] = []
+        self._in_use: dict[Path, _PooledTree] = {}
+        self._lock = threading.Lock()
+        self._names = itertools.count()
+        self._adopted = False
+        self._counters = {"created": 0, "hits": 0, "misses": 0, "recycled": 0, "discarded": 0}
+
+    @property
+    def pool_dir(self) -> Path:
+        """Directory holding the pooled worktrees."""
+        return self._pool_dir
+
+    def owns(self, path: str | Path) -> bool:
+        """Whether a worktree path belongs to the pool."""
+        return Path(path).resolve().parent == self._pool_dir
+
+    def warm(self, count: int | None = None) -> int:
+        """Create idle worktrees at HEAD until ``size`` are idle.
+
+        Args:
+            count: Create at most this many
+
+        Returns:
+            Number of worktrees created
+        """
+        self._adopt_orphans()
+        self._expire()
+        with self._lock:
+            missing = max(0, self.size - len(self._idle))
+        if count is not None:
+            missing = min(missing, count)
+
+        created = 0
+        for _ in range(missing):
+            path = self._new_path()
+            try:
+                commit = self._resolve("HEAD")
+                self._git._run_git("worktree", "add", "--detach", f'"{path}"', commit)
+            except GitCommandError as e:
+                logger.warning(f"WORKTREE_POOL: could not create {path}: {e}")
+                break
+            with self._lock:
+                self._idle.append(_PooledTree(path))
+                self._counters["created"] += 1
+            created += 1
+        if created:
+            logger.info(f"WORKTREE_POOL: warmed {created} worktree(s) in {self._pool_dir}")
+        return created
+
+    def acquire(self, branch: str, base_ref: str = "HEAD") -> Path:
+        """Check out a branch in a pooled worktree.
+
+        An existing branch is checked out as is; otherwise it is created
+        at ``base_ref`` (resolved in the main repository).
+
+        Returns:
+            Absolute path to the worktree
+
+        Raises:
+            WorktreeError: If no worktree could be prepared
+        """
+        self._adopt_orphans()
+        try:
+            commit = self._resolve(base_ref)
+            exists = bool(self._git._run_git("branch", "--list", branch).strip())
+        except GitCommandError as e:
+            raise WorktreeError(f"Cannot resolve {base_ref}: {e}") from e
+        checkout = ("checkout", "-q", branch) if exists else ("checkout", "-q", "-B", branch, commit)
+
+        tree = self._take_idle()
+        if tree is not None:
+            try:
+                GitTools(repo_path=tree.path)._run_git(*checkout)
+                with self._lock:
+                    self._in_use[tree.path] = tree
+                    self._counters["hits"] += 1
+                logger.info(f"WORKTREE_POOL: {branch} -> {tree.path} (reused)")
+                return tree.path
+            except GitCommandError as e:
+                logger.warning(f"WORKTREE_POOL: discarding {tree.path}: {e}")
+                self._remove(tree.path)
+
+        path = self._new_path()
+        try:
+            self._git.worktree_add(str(path), branch, create_branch=True, base_ref=commit)
+        except GitCommandError as e:
+            raise WorktreeError(f"Failed to create worktree for {branch}: {e}") from e
+        tree = _PooledTree(path)
+        with self._lock:
+            self._in_use[path] = tree
+            self._counters["created"] += 1
+            self._counters["misses"] += 1
+        return path
+
+    def release(self, path: str | Path, force: bool = False) -> bool:
+        """Return a worktree to the pool, or remove it if the pool is full.
+
+        Args:
+            path: Worktree path from ``acquire()``
+            force: Discard uncommitted changes
+
+        Returns:
+            False if the path isn't a pooled worktree (nothing was done)
+
+        Raises:
+            WorktreeError: If the worktree has uncommitted changes and
+                ``force`` is False
+        """
+        path = Path(path).resolve()
+        if not self.owns(path):
+            return False
+
+        tree_git = GitTools(repo_path=path)
+        if not force and tree_git._run_git("status", "--porcelain", check=False).strip():
+            raise WorktreeError(f"Worktree has uncommitted changes: {path}")
+
+        with self._lock:
+            tree = self._in_use.pop(path, None) or _PooledTree(path, _mtime(path))
+            keep = len(self._idle) < self.size and time.time() - tree.created_at < self.max_age
+
+        if keep:
+            try:
+                tree_git._run_git("reset", "-q", "--hard")
+                tree_git._run_git("clean", "-q", "-ffdx")
+                tree_git._run_git("checkout", "-q", "--detach")
+                if not path.name.startswith(f"{os.getpid()}-"):
+                    tree.path = self._move(path)
+            except GitCommandError as e:
+                logger.warning(f"WORKTREE_POOL: could not recycle {path}: {e}")
+                keep = False
+
+        with self._lock:
+            if keep:
+                self._idle.append(tree)
+                self._counters["recycled"] += 1
+            else:
+                self._counters["discarded"] += 1
+        if not keep:
+            self._remove(tree.path)
+        logger.info(f"WORKTREE_POOL: {'recycled' if keep else 'removed'} {tree.path}")
+        return True
+
+    def drain(self) -> int:
+        """Remove all idle worktrees.
+
+        Returns:
+            Number of worktrees removed
+        """
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for tree in idle:
+            self._remove(tree.path)
+        return len(idle)
+
+    def stats(self) -> dict[str, Any]:
+        """Pool size, occupancy and hit counters."""
+        with self._lock:
+            return {
+                "size": self.size,
+                "max_age": self.max_age,
+                "idle": len(self._idle),
+                "in_use": len(self._in_use),
+                **self._counters,
+                "pool_dir": str(self._pool_dir),
+            }
+
+    def _resolve(self, ref: str) -> str:
+        return self._git._run_git("rev-parse", "--verify", f'"{ref}^{{commit}}"').strip()
+
+    def _new_path(self) -> Path:
+        self._pool_dir.mkdir(parents=True, exist_ok=True)
+        while True:
+            path = self._pool_dir / f"{os.getpid()}-{next(self._names)}"
+            if not path.exists():
+                return path
+
+    def _take_idle(self) -> _PooledTree | None:
+        self._expire()
+        with self._lock:
+            return self._idle.pop() if self._idle else None
+
+    def _expire(self) -> None:
+        """Remove idle worktrees older than max_age."""
+        cutoff = time.time() - self.max_age
+        with self._lock:
+            expired = [t for t in self._idle if t.created_at < cutoff]
+            self._idle = [t for t in self._idle if t.created_at >= cutoff]
+            self._counters["discarded"] += len(expired)
+        for tree in expired:
+            self._remove(tree.path)
+
+    def _move(self, path: Path) -> Path:
+        """Rename a worktree into this process's namespace."""
+        target = self._new_path()
+        self._git._run_git("worktree", "move", f'"{path}"', f'"{target}"')
+        return target
+
+    def _adopt_orphans(self) -> None:
+        """Take over idle worktrees left by processes that have exited."""
+        with self._lock:
+            if self._adopted:
+                return
+            self._adopted = True
+        if not self._pool_dir.is_dir():
+            return
+        try:
+            worktrees = self._git.worktree_list()
+        except GitCommandError:
+            return
+
+        adopted = []
+        for info in worktrees:
+            path = Path(info.path)
+            if not info.is_detached or not self.owns(path):
+                continue  # In use by a task, or not ours
+            owner = path.name.split("-", 1)[0]
+            if not owner.isdigit() or _pid_alive(int(owner)):
+                continue
+            try:
+                created_at = _mtime(path)
+                adopted.append(_PooledTree(self._move(path), created_at))
+            except GitCommandError:
+                continue  # Another process got there first
+        with self._lock:
+            self._idle.extend(adopted)
+        if adopted:
+            logger.info(f"WORKTREE_POOL: adopted {len(adopted)} idle worktree(s)")
+
+    def _remove(self, path: Path) -> None:
+        try:
+            self._git.worktree_remove(str(path), force=True)
+        except GitCommandError as e:
+            logger.debug(f"WORKTREE_POOL: git remove failed for {path}: {e}")
+            shutil.rmtree(path, ignore_errors=True)
+            self._git.worktree_prune()
+
+
+def _pid_alive(pid: int) -> bool:
+    if os.name == "nt":
+        return True  # os.kill would terminate the process
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _mtime(path: Path) -> float:
+    try:
+        return path.stat().st_mtime
+    except OSError:
+        return time.time()
 
 
 class WorktreeManager:
@@ -134,7 +400,17 @@ class WorktreeManager:
             task-id-2/            # Worktree for task 2
 
     State tracking:
-        .ralph/worktrees.json     # Active worktree state
+        .ralph/worktrees.db       # Active worktrees (WorktreeRegistry)
+
+    With ``pool_size`` > 0, worktrees come from a WorktreePool in
+    ``<worktree_dir>/.pool/`` and are recycled on cleanup instead of
+    being removed.
+
+    With ``sparse_checkout``, a task created with ``hints`` gets a sparse
+    checkout of the directories the hints mention (see
+    ``ralph_agi.tasks.checkout``); sparse worktrees bypass the pool.
+    ``shared_dirs`` are copied from the main checkout into every new
+    worktree.
 
     Example:
         manager = WorktreeManager("/path/to/repo")
@@ -150,15 +426,20 @@ class WorktreeManager:
         manager.cleanup("add-feature")
     """
 
-    STATE_FILE = ".ralph/worktrees.json"
+    STATE_FILE = REGISTRY_FILE
     DEFAULT_WORKTREE_DIR = "../ralph-worktrees"
     BRANCH_PREFIX = "ralph/"
+    POOL_DIR = ".pool"
 
     def __init__(
         self,
         repo_path: str | Path | None = None,
         worktree_dir: str | Path | None = None,
         git: GitTools | None = None,
+        pool_size: int = 0,
+        pool_max_age: float = DEFAULT_POOL_MAX_AGE,
+        sparse_checkout: bool = False,
+        shared_dirs: Sequence[str] = (),
     ):
         """Initialize worktree manager.
 
@@ -166,6 +447,11 @@ class WorktreeManager:
             repo_path: Path to main git repository (default: current dir)
             worktree_dir: Directory for worktrees (default: ../ralph-worktrees)
             git: GitTools instance to use (created if None)
+            pool_size: Idle worktrees to keep ready (default: 0, no pool)
+            pool_max_age: Seconds before a pooled worktree is replaced
+            sparse_checkout: Check out only the directories a task refers to
+            shared_dirs: Dependency directories (e.g. "node_modules") to
+                copy from the main checkout into new worktrees
         """
         self._repo_path = Path(repo_path).resolve() if repo_path else Path.cwd()
         self._git = git or GitTools(repo_path=self._repo_path)
@@ -176,14 +462,22 @@ class WorktreeManager:
         else:
             self._worktree_dir = (self._repo_path / self.DEFAULT_WORKTREE_DIR).resolve()
 
-        # State file path
-        self._state_file = self._repo_path / self.STATE_FILE
+        # Active worktrees, shared with other processes
+        self._registry = WorktreeRegistry(
+            self._repo_path / self.STATE_FILE,
+            legacy_state=self._repo_path / LEGACY_STATE_FILE,
+        )
 
-        # Thread lock for state file operations
-        self._state_lock = threading.Lock()
+        self._pool = (
+            WorktreePool(self._git, self._worktree_dir / self.POOL_DIR, pool_size, pool_max_age)
+            if pool_size > 0
+            else None
+        )
+        self._sparse_checkout = sparse_checkout
+        self._shared_dirs = list(shared_dirs)
 
         # Ensure state directory exists
-        self._state_file.parent.mkdir(parents=True, exist_ok=True)
+        self._registry.db_path.parent.mkdir(parents=True, exist_ok=True)
 
         logger.debug(f"WorktreeManager initialized: repo={self._repo_path}, worktrees={self._worktree_dir}")
 
@@ -197,6 +491,21 @@ class WorktreeManager:
         """Get worktree parent directory."""
         return self._worktree_dir
 
+    @property
+    def pool(self) -> WorktreePool | None:
+        """Get the worktree pool, if enabled."""
+        return self._pool
+
+    def warm_pool(self) -> int:
+        """Fill the worktree pool up to its size.
+
+        Returns:
+            Number of worktrees created (0 without a pool)
+        """
+        if self._pool is None:
+            return 0
+        return self._pool.warm()
+
     def _branch_name(self, task_id: str) -> str:
         """Get branch name for a task."""
         return f"{self.BRANCH_PREFIX}{task_id}"
@@ -205,55 +514,11 @@ class WorktreeManager:
         """Get worktree path for a task."""
         return self._worktree_dir / task_id
 
-    def _load_state_unlocked(self) -> dict[str, ActiveWorktree]:
-        """Load state without acquiring lock. Caller must hold _state_lock."""
-        if not self._state_file.exists():
-            return {}
-
-        try:
-            with open(self._state_file) as f:
-                data = json.load(f)
-
-            return {
-                k: ActiveWorktree.from_dict(v)
-                for k, v in data.get("worktrees", {}).items()
-            }
-        except Exception as e:
-            logger.warning(f"Failed to load worktree state: {e}")
-            return {}
-
-    def _save_state_unlocked(self, worktrees: dict[str, ActiveWorktree]) -> None:
-        """Save state without acquiring lock. Caller must hold _state_lock."""
-        data = {
-            "worktrees": {k: v.to_dict() for k, v in worktrees.items()},
-            "updated_at": datetime.now(timezone.utc).isoformat(),
-        }
-
-        # Write atomically
-        temp_path = self._state_file.with_suffix(".json.tmp")
-        try:
-            with open(temp_path, "w") as f:
-                json.dump(data, f, indent=2)
-            temp_path.replace(self._state_file)
-        except Exception as e:
-            if temp_path.exists():
-                temp_path.unlink()
-            raise WorktreeError(f"Failed to save state: {e}") from e
-
-    def _load_state(self) -> dict[str, ActiveWorktree]:
-        """Load active worktree state from file. Thread-safe."""
-        with self._state_lock:
-            return self._load_state_unlocked()
-
-    def _save_state(self, worktrees: dict[str, ActiveWorktree]) -> None:
-        """Save active worktree state to file. Thread-safe."""
-        with self._state_lock:
-            self._save_state_unlocked(worktrees)
-
     def create(
         self,
         task_id: str,
         base_ref: str = "HEAD",
+        hints: Sequence[str] | None = None,
     ) -> Path:
         """Create a new worktree for a task.
 
@@ -263,6 +528,8 @@ class WorktreeManager:
         Args:
             task_id: Unique task identifier
             base_ref: Git reference to base the branch on (default: HEAD)
+            hints: Text mentioning the paths the task will touch; with
+                ``sparse_checkout`` only those directories are checked out
 
         Returns:
             Absolute path to the created worktree
@@ -277,44 +544,49 @@ class WorktreeManager:
         # Ensure worktree directory parent exists
         self._worktree_dir.mkdir(parents=True, exist_ok=True)
 
-        # Hold lock for the entire create-and-record operation
-        with self._state_lock:
-            # Check if already exists
-            state = self._load_state_unlocked()
-            if task_id in state:
-                raise WorktreeExistsError(task_id, str(state[task_id].path))
+        # Claim the task first, so a second process creating the same
+        # worktree fails here instead of in git
+        claim = ActiveWorktree(task_id=task_id, path=str(worktree_path), branch=branch, status="creating")
+        if not self._registry.add(claim):
+            existing = self._registry.get(task_id)
+            raise WorktreeExistsError(task_id, existing.path if existing else str(worktree_path))
 
-            try:
+        sparse_paths = None
+        if self._sparse_checkout and hints is not None:
+            sparse_paths = derive_sparse_paths(self._repo_path, hints)
+
+        try:
+            if self._pool is not None and sparse_paths is None:
+                # Switch a clean pooled worktree to the task branch
+                result_path = str(self._pool.acquire(branch, base_ref))
+                worktree_path = Path(result_path)
+            else:
                 # Create worktree with new branch
                 result_path = self._git.worktree_add(
                     path=str(worktree_path),
                     branch=branch,
                     create_branch=True,
                     base_ref=base_ref,
+                    sparse_paths=sparse_paths,
                 )
 
-                # Get current commit
-                worktree_git = GitTools(repo_path=worktree_path)
-                commit = worktree_git._run_git("rev-parse", "HEAD").strip()
+            if self._shared_dirs:
+                share_dependency_dirs(self._repo_path, result_path, self._shared_dirs)
 
-                # Record in state (reload to get any concurrent changes)
-                state = self._load_state_unlocked()
-                active = ActiveWorktree(
-                    task_id=task_id,
-                    path=result_path,
-                    branch=branch,
-                    commit=commit,
-                    status="created",
-                )
-
-                state[task_id] = active
-                self._save_state_unlocked(state)
+            # Get current commit
+            worktree_git = GitTools(repo_path=worktree_path)
+            commit = worktree_git._run_git("rev-parse", "HEAD").strip()
 
-                logger.info(f"WORKTREE_CREATE: {task_id} -> {result_path}")
-                return Path(result_path)
+        except GitCommandError as e:
+            self._registry.remove(task_id)
+            raise WorktreeError(f"Failed to create worktree for {task_id}: {e}") from e
+        except BaseException:
+            self._registry.remove(task_id)
+            raise
 
-            except GitCommandError as e:
-                raise WorktreeError(f"Failed to create worktree for {task_id}: {e}") from e
+        self._registry.update(task_id, path=result_path, commit=commit, status="created")
+        logger.info(f"WORKTREE_CREATE: {task_id} -> {result_path}")
+        return Path(result_path)
 
     def get(self, task_id: str) -> ActiveWorktree:
         """Get worktree info for a task.
@@ -328,12 +600,10 @@ class WorktreeManager:
         Raises:
             WorktreeNotFoundError: If worktree doesn't exist
         """
-        state = self._load_state()
-
-        if task_id not in state:
+        worktree = self._registry.get(task_id)
+        if worktree is None:
             raise WorktreeNotFoundError(task_id)
-
-        return state[task_id]
+        return worktree
 
     def list_active(self) -> list[ActiveWorktree]:
         """List all active worktrees.
@@ -341,10 +611,7 @@ class WorktreeManager:
         Returns:
             List of ActiveWorktree info, sorted by creation time
         """
-        state = self._load_state()
-        worktrees = list(state.values())
-        worktrees.sort(key=lambda w: w.created_at)
-        return worktrees
+        return self._registry.list()
 
     def update_status(self, task_id: str, status: str) -> ActiveWorktree:
         """Update worktree status.
@@ -359,17 +626,12 @@ class WorktreeManager:
         Raises:
             WorktreeNotFoundError: If worktree doesn't exist
         """
-        with self._state_lock:
-            state = self._load_state_unlocked()
-
-            if task_id not in state:
-                raise WorktreeNotFoundError(task_id)
-
-            state[task_id].status = status
-            self._save_state_unlocked(state)
+        worktree = self._registry.update_status(task_id, status)
+        if worktree is None:
+            raise WorktreeNotFoundError(task_id)
 
-            logger.info(f"WORKTREE_STATUS: {task_id} -> {status}")
-            return state[task_id]
+        logger.info(f"WORKTREE_STATUS: {task_id} -> {status}")
+        return worktree
 
     def execute_in_worktree(
         self,
@@ -434,20 +696,15 @@ class WorktreeManager:
             WorktreeNotFoundError: If worktree doesn't exist
             WorktreeError: If cleanup fails
         """
-        # Get worktree info under lock, then release for git operations
-        with self._state_lock:
-            state = self._load_state_unlocked()
-            if task_id not in state:
-                raise WorktreeNotFoundError(task_id)
-            worktree = state[task_id]
-
+        worktree = self.get(task_id)
         worktree_path = Path(worktree.path)
         branch = worktree.branch
 
         try:
-            # Remove worktree via git (without holding lock)
+            # Recycle or remove the worktree (without holding lock)
             if worktree_path.exists():
-                self._git.worktree_remove(str(worktree_path), force=force)
+                if self._pool is None or not self._pool.release(worktree_path, force=force):
+                    self._git.worktree_remove(str(worktree_path), force=force)
 
             # Delete the branch
             try:
@@ -456,12 +713,7 @@ class WorktreeManager:
                 # Branch might already be deleted or merged
                 pass
 
-            # Remove from state atomically
-            with self._state_lock:
-                state = self._load_state_unlocked()
-                if task_id in state:
-                    del state[task_id]
-                    self._save_state_unlocked(state)
+            self._registry.remove(task_id)
 
             logger.info(f"WORKTREE_CLEANUP: {task_id}")
             return True
@@ -480,16 +732,19 @@ class WorktreeManager:
         Returns:
             Number of worktrees removed
         """
-        state = self._load_state()
         removed = 0
 
-        for task_id in list(state.keys()):
+        for worktree in self._registry.list():
+            task_id = worktree.task_id
             try:
                 self.cleanup(task_id, force=force)
                 removed += 1
             except WorktreeError as e:
                 logger.warning(f"Failed to cleanup {task_id}: {e}")
 
+        if self._pool is not None:
+            self._pool.drain()
+
         # Prune any stale worktree metadata
         self._git.worktree_prune()
 
@@ -504,20 +759,15 @@ class WorktreeManager:
         Returns:
             List of pruned task IDs
         """
-        with self._state_lock:
-            state = self._load_state_unlocked()
-            pruned = []
-
-            for task_id, worktree in list(state.items()):
-                if not Path(worktree.path).exists():
-                    del state[task_id]
-                    pruned.append(task_id)
-                    logger.info(f"WORKTREE_PRUNE: {task_id} (directory missing)")
-
-            if pruned:
-                self._save_state_unlocked(state)
-
-        # Also prune git's worktree metadata (outside lock)
+        pruned = []
+        for worktree in self._registry.list():
+            if worktree.status == "creating" or Path(worktree.path).exists():
+                continue
+            if self._registry.remove(worktree.task_id):
+                pruned.append(worktree.task_id)
+                logger.info(f"WORKTREE_PRUNE: {worktree.task_id} (directory missing)")
+
+        # Also prune git's worktree metadata
         self._git.worktree_prune()
 
         return pruned
@@ -525,7 +775,7 @@ class WorktreeManager:
     def sync_with_git(self) -> dict[str, str]:
         """Synchronize state with actual git worktrees.
 
-        Reconciles our state file with git's worktree list. Adds any
+        Reconciles the registry with git's worktree list. Adds any
         worktrees that exist but aren't tracked, removes any that are
         tracked but don't exist.
 
@@ -536,40 +786,39 @@ class WorktreeManager:
         git_worktrees = self._git.worktree_list()
         git_paths = {w.path: w for w in git_worktrees}
 
-        # Reconcile under lock
-        with self._state_lock:
-            state = self._load_state_unlocked()
-            changes = {}
-
-            # Remove tracked worktrees that don't exist
-            for task_id, worktree in list(state.items()):
-                if worktree.path not in git_paths:
-                    del state[task_id]
-                    changes[task_id] = "removed"
-
-            # Add git worktrees that match our branch prefix but aren't tracked
-            for path, git_info in git_paths.items():
-                if git_info.is_main:
-                    continue  # Skip main worktree
-
-                branch = git_info.branch
-                if not branch.startswith(self.BRANCH_PREFIX):
-                    continue  # Not a ralph worktree
-
-                task_id = branch[len(self.BRANCH_PREFIX):]
-                if task_id not in state:
-                    state[task_id] = ActiveWorktree(
-                        task_id=task_id,
-                        path=path,
-                        branch=branch,
-                        commit=git_info.commit,
-                        status="unknown",
-                    )
+        changes = {}
+        tracked = set()
+
+        # Remove tracked worktrees that don't exist (skipping ones being created)
+        for worktree in self._registry.list():
+            tracked.add(worktree.task_id)
+            if worktree.path not in git_paths and worktree.status != "creating":
+                if self._registry.remove(worktree.task_id):
+                    changes[worktree.task_id] = "removed"
+
+        # Add git worktrees that match our branch prefix but aren't tracked
+        for path, git_info in git_paths.items():
+            if git_info.is_main:
+                continue  # Skip main worktree
+
+            branch = git_info.branch
+            if not branch.startswith(self.BRANCH_PREFIX):
+                continue  # Not a ralph worktree
+
+            task_id = branch[len(self.BRANCH_PREFIX):]
+            if task_id not in tracked:
+                added = self._registry.add(ActiveWorktree(
+                    task_id=task_id,
+                    path=path,
+                    branch=branch,
+                    commit=git_info.commit,
+                    status="unknown",
+                ))
+                if added:
                     changes[task_id] = "added"
 
-            if changes:
-                self._save_state_unlocked(state)
-                logger.info(f"WORKTREE_SYNC: {len(changes)} changes")
+        if changes:
+            logger.info(f"WORKTREE_SYNC: {len(changes)} changes")
 
         return changes
 
@@ -577,16 +826,18 @@ class WorktreeManager:
         """Get worktree statistics.
 
         Returns:
-            Dict with counts and status breakdown
+            Dict with counts and status breakdown, plus pool occupancy
+            and hit counters under "pool" when pooling is enabled
         """
-        state = self._load_state()
-
-        status_counts: dict[str, int] = {}
-        for worktree in state.values():
-            status_counts[worktree.status] = status_counts.get(worktree.status, 0) + 1
+        status_counts = self._registry.counts()
 
-        return {
-            "total": len(state),
+        stats: dict[str, Any] = {
+            "total": sum(status_counts.values()),
             "by_status": status_counts,
             "worktree_dir": str(self._worktree_dir),
+            "sparse_checkout": self._sparse_checkout,
+            "shared_dirs": list(self._shared_dirs),
         }
+        if self._pool is not None:
+            stats["pool"] = self._pool.stats()
+        return stats
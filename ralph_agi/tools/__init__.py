@@ -39,6 +39,11 @@ from ralph_agi.tools.executor import (
     ToolExecutor,
     ToolResult,
 )
+from ralph_agi.tools.dispatch import (
+    ToolAccess,
+    ToolDispatcher,
+    classify_tool,
+)
 from ralph_agi.tools.filesystem import (
     BinaryFileError,
     FileInfo,
@@ -96,6 +101,10 @@ __all__ = [
     "ToolExecutionError",
     "ToolExecutor",
     "ToolResult",
+    # Dispatch
+    "ToolAccess",
+    "ToolDispatcher",
+    "classify_tool",
     # File System (Sprint 6)
     "BinaryFileError",
     "FileInfo",
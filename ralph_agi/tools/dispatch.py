@@ -0,0 +1,213 @@
+"""Concurrency-aware dispatch of tool calls from a single LLM turn.
+
+When the model asks for several tools at once, most of them are reads
+(read_file, list_directory, git_status) that don't depend on each other.
+ToolDispatcher runs those concurrently while keeping the ordering
+guarantees the model expects from sequential execution:
+
+- Reads run concurrently with other reads, bounded by a semaphore.
+- A write waits for every earlier call touching an overlapping path,
+  and later calls touching that path wait for the write.
+- Tools with unknown or workspace-wide side effects (run_command,
+  git_commit, anything unclassified) act as barriers.
+
+Results are always returned in the order the calls were made.
+
+Usage:
+    from ralph_agi.tools.dispatch import ToolDispatcher
+
+    dispatcher = ToolDispatcher(max_concurrency=4)
+    results = await dispatcher.run(
+        [("read_file", {"path": "a.py"}), ("read_file", {"path": "b.py"})],
+        executor.execute,
+    )
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Optional, TypeVar
+
+R = TypeVar("R")
+
+# Tools that never modify the workspace
+READ_ONLY_TOOLS = frozenset({
+    "read_file",
+    "list_directory",
+    "git_status",
+    "git_diff",
+    "git_log",
+    "search_files",
+    "glob_files",
+})
+
+# Tools that modify a single file named by their "path" argument
+PATH_WRITE_TOOLS = frozenset({
+    "write_file",
+    "edit_file",
+    "create_file",
+    "insert_in_file",
+    "append_to_file",
+    "delete_file",
+})
+
+# Read-only tools that observe the whole workspace, not one path
+WORKSPACE_READ_TOOLS = frozenset({"git_status", "git_diff", "git_log"})
+
+
+@dataclass(frozen=True)
+class ToolAccess:
+    """How a tool call touches the workspace.
+
+    Attributes:
+        read_only: True if the call never modifies anything
+        path: Normalized path the call is confined to, or None for the
+            whole workspace
+    """
+
+    read_only: bool
+    path: Optional[str] = None
+
+    def conflicts_with(self, other: "ToolAccess") -> bool:
+        """Check whether two calls must not run concurrently."""
+        if self.read_only and other.read_only:
+            return False
+        if self.path is None or other.path is None:
+            return True
+        return _paths_overlap(self.path, other.path)
+
+
+def _normalize_path(path: Any) -> Optional[str]:
+    if not path or not isinstance(path, str):
+        return None
+    normalized = os.path.normpath(path)
+    if normalized in (".", os.sep):
+        return None  # Whole workspace
+    return normalized
+
+
+def _paths_overlap(a: str, b: str) -> bool:
+    if a == b:
+        return True
+    return a.startswith(b.rstrip(os.sep) + os.sep) or b.startswith(a.rstrip(os.sep) + os.sep)
+
+
+def classify_tool(name: str, arguments: Optional[dict[str, Any]] = None) -> ToolAccess:
+    """Classify a tool call as read-only or mutating, and by path.
+
+    Args:
+        name: Tool name
+        arguments: Tool arguments
+
+    Returns:
+        ToolAccess describing the call. Unknown tools are treated as
+        workspace-wide writes so they never run alongside anything.
+    """
+    arguments = arguments or {}
+    path = _normalize_path(arguments.get("path", arguments.get("file_path")))
+
+    if name in WORKSPACE_READ_TOOLS:
+        return ToolAccess(read_only=True)
+    if name in READ_ONLY_TOOLS:
+        return ToolAccess(read_only=True, path=path)
+    if name in PATH_WRITE_TOOLS and path is not None:
+        return ToolAccess(read_only=False, path=path)
+    return ToolAccess(read_only=False)
+
+
+class ToolDispatcher:
+    """Runs a batch of tool calls with read concurrency and write ordering.
+
+    Each call waits for the earlier calls it conflicts with (see
+    ToolAccess.conflicts_with) and then for a semaphore slot. With
+    ``max_concurrency=1`` execution is strictly sequential.
+
+    Attributes:
+        max_concurrency: Maximum calls running at once
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 4
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        classifier: Callable[[str, dict[str, Any]], ToolAccess] = classify_tool,
+    ):
+        """Initialize dispatcher.
+
+        Args:
+            max_concurrency: Maximum calls running at once (default: 4)
+            classifier: Maps (tool name, arguments) to a ToolAccess
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        self._max_concurrency = max_concurrency
+        self._classifier = classifier
+
+    @property
+    def max_concurrency(self) -> int:
+        """Get maximum concurrent calls."""
+        return self._max_concurrency
+
+    def plan(self, calls: list[tuple[str, dict[str, Any]]]) -> list[list[int]]:
+        """Compute which earlier calls each call must wait for.
+
+        Args:
+            calls: List of (tool_name, arguments) tuples
+
+        Returns:
+            For each call, the indices of earlier calls it depends on
+        """
+        accesses = [self._classifier(name, args or {}) for name, args in calls]
+        if self._max_concurrency == 1:
+            return [[i - 1] if i else [] for i in range(len(calls))]
+
+        return [
+            [j for j in range(i) if accesses[i].conflicts_with(accesses[j])]
+            for i in range(len(calls))
+        ]
+
+    async def run(
+        self,
+        calls: list[tuple[str, dict[str, Any]]],
+        execute: Callable[[str, dict[str, Any]], Awaitable[R]],
+        started: Optional[dict[int, "asyncio.Future[R]"]] = None,
+    ) -> list[R | BaseException]:
+        """Execute calls and return their results in call order.
+
+        A call that raises does not stop the calls after it; its
+        exception is returned in its slot instead.
+
+        Args:
+            calls: List of (tool_name, arguments) tuples
+            execute: Coroutine function running one call
+            started: Calls already running, by index (e.g. reads started
+                while the response was still streaming). They are awaited
+                instead of executed again, and later conflicting calls
+                wait for them as usual.
+
+        Returns:
+            Results (or exceptions) in the same order as ``calls``
+        """
+        if not calls:
+            return []
+
+        started = started or {}
+        waits_on = self.plan(calls)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+        tasks: list[asyncio.Future] = []
+
+        async def run_one(index: int) -> R:
+            predecessors = [tasks[j] for j in waits_on[index]]
+            if predecessors:
+                await asyncio.gather(*predecessors, return_exceptions=True)
+            name, args = calls[index]
+            async with semaphore:
+                return await execute(name, args)
+
+        for index in range(len(calls)):
+            tasks.append(started.get(index) or asyncio.ensure_future(run_one(index)))
+
+        return await asyncio.gather(*tasks, return_exceptions=True)
@@ -13,7 +13,7 @@ import tempfile
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterator
+from typing import Callable, Iterator
 
 logger = logging.getLogger(__name__)
 
@@ -155,6 +155,7 @@ class FileSystemTools:
         allowed_roots: list[Path] | None = None,
         max_file_size: int = DEFAULT_MAX_FILE_SIZE,
         follow_symlinks: bool = True,
+        on_missing: Callable[[Path], bool] | None = None,
     ):
         """Initialize file system tools.
 
@@ -163,6 +164,8 @@ class FileSystemTools:
                           If None, uses current working directory.
             max_file_size: Maximum file size to read in bytes
             follow_symlinks: Whether to follow symbolic links
+            on_missing: Called with a validated path that doesn't exist,
+                before it is used (e.g. to widen a sparse checkout)
         """
         if allowed_roots is None:
             allowed_roots = [Path.cwd()]
@@ -171,6 +174,7 @@ class FileSystemTools:
         self._allowed_roots = [root.resolve() for root in allowed_roots]
         self._max_file_size = max_file_size
         self._follow_symlinks = follow_symlinks
+        self._on_missing = on_missing
 
         logger.debug(
             f"FileSystemTools initialized with roots: {self._allowed_roots}"
@@ -219,6 +223,9 @@ class FileSystemTools:
                 f"Path resolves outside allowed roots: {self._allowed_roots}",
             )
 
+        if self._on_missing is not None and not resolved.exists():
+            self._on_missing(resolved)
+
         return resolved
 
     def _is_within_roots(self, path: Path) -> bool:
@@ -13,7 +13,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Sequence
 
-from ralph_agi.tools.shell import ShellTools
+from ralph_agi.tools.shell import CommandResult, ShellTools
 
 logger = logging.getLogger(__name__)
 
@@ -199,6 +199,10 @@ class GitTools:
         # Get diff
         diff = git.diff()
         print(diff)
+
+        # Async variants (status_async, add_async, commit_async,
+        # diff_async) run git without blocking the event loop
+        status = await git.status_async()
     """
 
     def __init__(
@@ -243,6 +247,27 @@ class GitTools:
 
         return result.stdout
 
+    async def _run_git_async(self, *args: str, check: bool = True) -> str:
+        """Run a git command without blocking the event loop.
+
+        Args:
+            *args: Git command arguments
+            check: Whether to raise on failure
+
+        Returns:
+            Command stdout
+
+        Raises:
+            GitCommandError: If command fails and check=True
+        """
+        cmd = "git " + " ".join(args)
+        result = await self._shell.execute_async(cmd, cwd=self._repo_path)
+
+        if check and not result.success:
+            raise GitCommandError(cmd, result.stderr, result.exit_code)
+
+        return result.stdout
+
     def is_repo(self) -> bool:
         """Check if path is a git repository.
 
@@ -264,6 +289,15 @@ class GitTools:
         if not self.is_repo():
             raise NotARepositoryError(str(self._repo_path))
 
+    async def _ensure_repo_async(self) -> None:
+        """Async variant of _ensure_repo."""
+        result = await self._shell.execute_async(
+            "git rev-parse --git-dir",
+            cwd=self._repo_path,
+        )
+        if not result.success:
+            raise NotARepositoryError(str(self._repo_path))
+
     def validate_workflow(
         self,
         workflow: str,
@@ -322,6 +356,31 @@ class GitTools:
         # Get status with porcelain format (machine-readable)
         status_output = self._run_git("status", "--porcelain=v1", "-b")
 
+        return self._parse_status(branch, status_output)
+
+    async def status_async(self) -> GitStatus:
+        """Get repository status without blocking the event loop.
+
+        Returns:
+            GitStatus with branch and file states
+
+        Raises:
+            NotARepositoryError: If not a repository
+        """
+        await self._ensure_repo_async()
+
+        branch = (await self._run_git_async("branch", "--show-current")).strip()
+        if not branch:
+            branch = (await self._run_git_async("rev-parse", "--short", "HEAD")).strip()
+            branch = f"HEAD detached at {branch}"
+
+        status_output = await self._run_git_async("status", "--porcelain=v1", "-b")
+
+        return self._parse_status(branch, status_output)
+
+    @staticmethod
+    def _parse_status(branch: str, status_output: str) -> GitStatus:
+        """Parse `git status --porcelain=v1 -b` output into a GitStatus."""
         staged = []
         modified = []
         untracked = []
@@ -403,6 +462,30 @@ class GitTools:
         logger.info(f"GIT_ADD: {files}")
         return True
 
+    async def add_async(self, files: Sequence[str] | str = ".") -> bool:
+        """Stage files for commit without blocking the event loop.
+
+        Args:
+            files: File paths to stage, or "." for all changes
+
+        Returns:
+            True if successful
+
+        Raises:
+            NotARepositoryError: If not a repository
+            GitCommandError: If staging fails
+        """
+        await self._ensure_repo_async()
+
+        if isinstance(files, str):
+            files = [files]
+
+        file_args = " ".join(f'"{f}"' for f in files)
+        await self._run_git_async("add", file_args)
+
+        logger.info(f"GIT_ADD: {files}")
+        return True
+
     def reset(self, files: Sequence[str] | str | None = None) -> bool:
         """Unstage files.
 
@@ -452,7 +535,48 @@ class GitTools:
             logger.warning("GIT_COMMIT: Nothing staged to commit")
             return None
 
-        # Build commit command
+        result = self._shell.execute(
+            self._commit_command(message, allow_empty, add_all),
+            cwd=self._repo_path,
+        )
+
+        return self._parse_commit_result(result, message)
+
+    async def commit_async(
+        self,
+        message: str,
+        allow_empty: bool = False,
+        add_all: bool = False,
+    ) -> str | None:
+        """Create a commit without blocking the event loop.
+
+        Args:
+            message: Commit message
+            allow_empty: Allow commits with no changes
+            add_all: Stage all changes before committing (-a flag)
+
+        Returns:
+            Commit hash if successful, None if nothing to commit
+
+        Raises:
+            NotARepositoryError: If not a repository
+            GitCommandError: If commit fails
+        """
+        status = await self.status_async()
+        if not status.has_staged and not add_all and not allow_empty:
+            logger.warning("GIT_COMMIT: Nothing staged to commit")
+            return None
+
+        result = await self._shell.execute_async(
+            self._commit_command(message, allow_empty, add_all),
+            cwd=self._repo_path,
+        )
+
+        return self._parse_commit_result(result, message)
+
+    @staticmethod
+    def _commit_command(message: str, allow_empty: bool, add_all: bool) -> str:
+        """Build the shell command line for git commit."""
         args = ["commit"]
         if add_all:
             args.append("-a")
@@ -464,11 +588,16 @@ class GitTools:
         message = message.replace('"', '\\"')
         args.append(f'-m "{message}"')
 
-        result = self._shell.execute(
-            "git " + " ".join(args),
-            cwd=self._repo_path,
-        )
+        return "git " + " ".join(args)
+
+    @staticmethod
+    def _parse_commit_result(result: CommandResult, message: str) -> str | None:
+        """Extract the commit hash from git commit output.
 
+        Raises:
+            GitCommandError: If commit failed for a reason other than
+                there being nothing to commit
+        """
         if not result.success:
             if "nothing to commit" in result.stdout + result.stderr:
                 return None
@@ -574,6 +703,29 @@ class GitTools:
 
         return self._run_git(*args)
 
+    async def diff_async(self, staged: bool = False, file: str | None = None) -> str:
+        """Get diff of changes without blocking the event loop.
+
+        Args:
+            staged: If True, show staged changes (--cached)
+            file: Specific file to diff (optional)
+
+        Returns:
+            Diff output as string
+
+        Raises:
+            NotARepositoryError: If not a repository
+        """
+        await self._ensure_repo_async()
+
+        args = ["diff"]
+        if staged:
+            args.append("--cached")
+        if file:
+            args.append(f'"{file}"')
+
+        return await self._run_git_async(*args)
+
     def current_branch(self) -> str:
         """Get current branch name.
 
@@ -925,6 +1077,7 @@ class GitTools:
         branch: str,
         create_branch: bool = True,
         base_ref: str = "HEAD",
+        sparse_paths: Sequence[str] | None = None,
     ) -> str:
         """Create new worktree at path for branch.
 
@@ -933,6 +1086,8 @@ class GitTools:
             branch: Branch name to checkout
             create_branch: If True, create branch if it doesn't exist
             base_ref: Base reference for new branch (default: HEAD)
+            sparse_paths: If given, check out only these directories (plus
+                root files) as a cone-mode sparse checkout
 
         Returns:
             Absolute path to created worktree
@@ -959,6 +1114,9 @@ class GitTools:
 
         # Build command
         args = ["worktree", "add"]
+        if sparse_paths is not None:
+            # Check out after the sparse patterns are in place
+            args.append("--no-checkout")
 
         if create_branch:
             # Check if branch already exists
@@ -979,7 +1137,15 @@ class GitTools:
             args.append(branch)
 
         self._run_git(*args)
-        logger.info(f"GIT_WORKTREE_ADD: {abs_path} -> {branch}")
+
+        if sparse_paths is not None:
+            worktree_git = GitTools(repo_path=abs_path)
+            cone = " ".join(f'"{p}"' for p in sparse_paths)
+            worktree_git._run_git("sparse-checkout", "set", "--cone", "--", cone)
+            worktree_git._run_git("checkout", "-q", branch)
+            logger.info(f"GIT_WORKTREE_ADD: {abs_path} -> {branch} (sparse: {len(sparse_paths)} dirs)")
+        else:
+            logger.info(f"GIT_WORKTREE_ADD: {abs_path} -> {branch}")
 
         return str(abs_path)
 
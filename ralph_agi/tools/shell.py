@@ -2,19 +2,26 @@
 
 Provides secure shell command execution with timeout handling,
 output capture, and configurable safety constraints.
+
+Both a blocking API (execute) for CLI callers and an asyncio-native
+one (execute_async) for agent code running inside an event loop are
+provided. They share validation and return the same CommandResult.
 """
 
 from __future__ import annotations
 
+import asyncio
+import codecs
 import logging
 import os
 import shlex
+import signal
 import subprocess
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Sequence
+from typing import Callable, Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +133,9 @@ class ShellTools:
         # Execute with custom environment
         result = shell.execute("echo $MY_VAR", env={"MY_VAR": "hello"})
 
+        # From async code, without blocking the event loop
+        result = await shell.execute_async("pytest", on_output=print_chunk)
+
     Security:
         - Commands executed via subprocess (no shell injection via variables)
         - Configurable timeout prevents runaway processes
@@ -139,6 +149,12 @@ class ShellTools:
     # Maximum timeout allowed
     MAX_TIMEOUT = 3600.0  # 1 hour
 
+    # Seconds to wait after SIGTERM before SIGKILL on async timeout
+    KILL_GRACE_PERIOD = 2.0
+
+    # Bytes read per chunk when streaming async output
+    STREAM_CHUNK_SIZE = 65536
+
     # Default blocked commands (dangerous operations)
     DEFAULT_BLOCKED_COMMANDS = frozenset({
         "rm -rf /",
@@ -327,6 +343,153 @@ class ShellTools:
                 timestamp=timestamp,
             )
 
+    async def execute_async(
+        self,
+        command: str,
+        cwd: str | Path | None = None,
+        timeout: float | None = None,
+        env: dict[str, str] | None = None,
+        shell: bool = True,
+        on_output: Callable[[str, str], None] | None = None,
+    ) -> CommandResult:
+        """Execute a shell command without blocking the event loop.
+
+        Behaves like execute(), but runs the process with
+        asyncio.create_subprocess_exec. The command runs in its own
+        process group so that on timeout (or cancellation) the whole
+        tree - including children spawned by the shell - is terminated.
+
+        Args:
+            command: Shell command to execute
+            cwd: Working directory (default: default_cwd or current)
+            timeout: Max execution time in seconds (default: default_timeout)
+            env: Additional environment variables to set
+            shell: Whether to execute through /bin/sh (default: True)
+            on_output: Optional callback receiving ("stdout" | "stderr", text)
+                chunks as they are produced
+
+        Returns:
+            CommandResult with exit code, output, and timing. On timeout,
+            the output captured so far is included.
+
+        Raises:
+            CommandNotAllowedError: If command is blocked
+        """
+        self._validate_command(command)
+        work_dir = self._resolve_cwd(cwd)
+        timeout = timeout if timeout is not None else self._default_timeout
+        timeout = min(timeout, self.MAX_TIMEOUT)
+        process_env = self._build_env(env)
+
+        start_time = time.time()
+        timestamp = datetime.now(timezone.utc)
+
+        logger.info(f"SHELL_EXEC: {command[:100]}{'...' if len(command) > 100 else ''}")
+
+        def make_result(exit_code: int, stdout: str, stderr: str, timed_out: bool = False) -> CommandResult:
+            return CommandResult(
+                command=command,
+                exit_code=exit_code,
+                stdout=stdout,
+                stderr=stderr,
+                duration_ms=int((time.time() - start_time) * 1000),
+                timed_out=timed_out,
+                cwd=str(work_dir) if work_dir else None,
+                timestamp=timestamp,
+            )
+
+        try:
+            args = ["/bin/sh", "-c", command] if shell else shlex.split(command)
+            process = await asyncio.create_subprocess_exec(
+                *args,
+                cwd=work_dir,
+                env=process_env,
+                stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,
+            )
+        except FileNotFoundError as e:
+            return make_result(127, "", str(e))
+        except PermissionError as e:
+            return make_result(126, "", str(e))
+        except Exception as e:
+            logger.error(f"SHELL_ERROR: {command[:50]} - {e}")
+            return make_result(-1, "", f"Execution error: {e}")
+
+        stdout_parts: list[str] = []
+        stderr_parts: list[str] = []
+
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(
+                    self._read_stream(process.stdout, "stdout", stdout_parts, on_output),
+                    self._read_stream(process.stderr, "stderr", stderr_parts, on_output),
+                    process.wait(),
+                ),
+                timeout=timeout,
+            )
+        except asyncio.TimeoutError:
+            await self._kill_process_group(process)
+            logger.warning(f"SHELL_TIMEOUT: {command[:50]} after {timeout}s")
+            return make_result(-1, "".join(stdout_parts), "".join(stderr_parts), timed_out=True)
+        except asyncio.CancelledError:
+            await self._kill_process_group(process)
+            raise
+
+        cmd_result = make_result(
+            process.returncode, "".join(stdout_parts), "".join(stderr_parts)
+        )
+        self._log_result(cmd_result)
+        return cmd_result
+
+    async def _read_stream(
+        self,
+        stream: asyncio.StreamReader | None,
+        name: str,
+        parts: list[str],
+        on_output: Callable[[str, str], None] | None,
+    ) -> None:
+        """Read a process stream to EOF, decoding incrementally."""
+        if stream is None:
+            return
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        while True:
+            chunk = await stream.read(self.STREAM_CHUNK_SIZE)
+            text = decoder.decode(chunk, final=not chunk)
+            if text:
+                parts.append(text)
+                if on_output is not None:
+                    try:
+                        on_output(name, text)
+                    except Exception as e:
+                        logger.warning(f"SHELL_OUTPUT_CALLBACK_ERROR: {e}")
+            if not chunk:
+                return
+
+    async def _kill_process_group(self, process: asyncio.subprocess.Process) -> None:
+        """Terminate a process and its group: SIGTERM, then SIGKILL."""
+        if process.returncode is not None:
+            return
+
+        def signal_group(sig: int) -> None:
+            try:
+                if hasattr(os, "killpg"):
+                    os.killpg(process.pid, sig)
+                else:
+                    process.kill()
+            except (ProcessLookupError, PermissionError):
+                pass
+
+        signal_group(signal.SIGTERM)
+        try:
+            await asyncio.wait_for(process.wait(), timeout=self.KILL_GRACE_PERIOD)
+        except asyncio.TimeoutError:
+            pass
+        # Children may outlive the shell; make sure nothing survives
+        signal_group(getattr(signal, "SIGKILL", signal.SIGTERM))
+        await process.wait()
+
     def execute_script(
         self,
         script: str,
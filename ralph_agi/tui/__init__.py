@@ -8,7 +8,10 @@ from ralph_agi.tui.app import RalphTUI
 from ralph_agi.tui.events import (
     Event,
     EventBus,
+    EventBusStats,
     EventType,
+    HandlerStats,
+    OverflowPolicy,
     emit_loop_started,
     emit_loop_stopped,
     emit_iteration_started,
@@ -29,7 +32,10 @@ __all__ = [
     "RalphTUI",
     "Event",
     "EventBus",
+    "EventBusStats",
     "EventType",
+    "HandlerStats",
+    "OverflowPolicy",
     "emit_loop_started",
     "emit_loop_stopped",
     "emit_iteration_started",
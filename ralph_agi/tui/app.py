@@ -139,15 +139,16 @@ class RalphTUI(App[None]):
         yield ProgressFooter()
         yield Footer()
 
-    def on_mount(self) -> None:
+    async def on_mount(self) -> None:
         """Handle app mount - initialize display."""
         if self.demo_mode:
             self._load_demo_data()
         else:
             self._initialize_from_prd()
 
-        # Subscribe to events from RalphLoop
+        # Subscribe to events from RalphLoop and dispatch them on the app's loop
         self._subscribe_to_events()
+        await EventBus.get_instance().start()
 
         # Start time refresh timer
         self.set_interval(1.0, self._refresh_time)
@@ -1,13 +1,18 @@
 """Event system for TUI integration with RalphLoop.
 
 Provides an async event bus for real-time communication between
-the RalphLoop execution engine and the TUI display.
+the RalphLoop execution engine and the TUI display. Events may be
+emitted from any thread (e.g. ParallelExecutor workers); they are
+queued in a bounded buffer and dispatched on the bus's event loop.
 """
 
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass, field
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Optional, TypeVar
@@ -36,6 +41,11 @@ class EventType(Enum):
     TASK_COMPLETED = "task_completed"
     TASK_FAILED = "task_failed"
 
+    # Task queue file changes
+    TASK_ADDED = "task_added"
+    TASK_UPDATED = "task_updated"
+    TASK_REMOVED = "task_removed"
+
     # Agent events
     AGENT_THINKING = "agent_thinking"
     AGENT_ACTION = "agent_action"
@@ -81,22 +91,231 @@ EventHandler = Callable[[Event], None]
 AsyncEventHandler = Callable[[Event], "asyncio.Future[None]"]
 
 
+class OverflowPolicy(Enum):
+    """What emit() does when the event queue is full."""
+
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest queued event
+    DROP_NEWEST = "drop_newest"  # Discard the event being emitted
+    BLOCK = "block"  # Wait for room (off the bus loop only), then drop newest
+
+
+# High-frequency events where only the latest state matters. Events of
+# these types share one queue slot per key until dispatched.
+COALESCED_EVENT_TYPES = frozenset({
+    EventType.TOKENS_USED,
+    EventType.COST_UPDATED,
+    EventType.METRICS_UPDATED,
+    EventType.PROGRESS_UPDATED,
+})
+
+# Coalesced events whose data are deltas, summed instead of replaced
+_ADDITIVE_EVENT_TYPES = frozenset({EventType.TOKENS_USED})
+
+
+def _coalesce_key(event: Event) -> Optional[tuple[Any, ...]]:
+    """Queue slot key for a coalesced event, or None if it is not coalesced."""
+    if event.type not in COALESCED_EVENT_TYPES:
+        return None
+    return (event.type, event.data.get("task_id"), event.data.get("task_name"))
+
+
+def _merge(queued: Event, new: Event) -> Event:
+    """Combine a queued coalesced event with a newer one for the same key."""
+    if new.type not in _ADDITIVE_EVENT_TYPES:
+        return new
+    data = dict(new.data)
+    for name, value in queued.data.items():
+        if isinstance(value, (int, float)) and isinstance(data.get(name), (int, float)):
+            data[name] = value + data[name]
+    return Event(type=new.type, timestamp=new.timestamp, data=data)
+
+
+@dataclass
+class HandlerStats:
+    """Dispatch timing for one event handler.
+
+    Attributes:
+        calls: Number of events dispatched to the handler.
+        errors: Number of calls that raised.
+        total_seconds: Total time spent in the handler.
+        max_seconds: Slowest single call.
+    """
+
+    calls: int = 0
+    errors: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        """Average time per call."""
+        return self.total_seconds / self.calls if self.calls else 0.0
+
+
+@dataclass
+class EventBusStats:
+    """Counters for an EventBus.
+
+    Attributes:
+        emitted: Events passed to emit().
+        dispatched: Events delivered to handlers.
+        coalesced: Events folded into an already queued event.
+        dropped: Events lost to queue overflow.
+        queue_depth: Events currently waiting.
+        handlers: Dispatch timing by handler name.
+    """
+
+    emitted: int = 0
+    dispatched: int = 0
+    coalesced: int = 0
+    dropped: int = 0
+    queue_depth: int = 0
+    handlers: dict[str, HandlerStats] = field(default_factory=dict)
+
+
+class _EventQueue:
+    """Bounded, thread-safe FIFO where coalesced events share a slot per key.
+
+    A coalesced event keeps the queue position of the first undelivered
+    event for its key and the value of the latest one.
+    """
+
+    def __init__(self, maxsize: int, overflow: OverflowPolicy, block_timeout: float, coalesce: bool = True):
+        self._maxsize = maxsize
+        self._coalesce = coalesce
+        self._overflow = overflow
+        self._block_timeout = block_timeout
+        # Entries are [event, key] lists so a coalesced slot can be updated in place
+        self._entries: deque[list[Any]] = deque()
+        self._slots: dict[tuple[Any, ...], list[Any]] = {}
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+        self.received = 0
+        self.coalesced = 0
+        self.dropped = 0
+
+    def put(self, event: Event, can_block: bool = False) -> bool:
+        """Queue an event.
+
+        Args:
+            event: Event to queue.
+            can_block: Whether the caller may wait for room (BLOCK policy).
+
+        Returns:
+            False if the event was dropped.
+        """
+        key = _coalesce_key(event) if self._coalesce else None
+        with self._lock:
+            self.received += 1
+            if key is not None and key in self._slots:
+                slot = self._slots[key]
+                slot[0] = _merge(slot[0], event)
+                self.coalesced += 1
+                return True
+
+            if len(self._entries) >= self._maxsize:
+                if self._overflow == OverflowPolicy.DROP_OLDEST:
+                    self._pop()
+                    self.dropped += 1
+                elif self._overflow == OverflowPolicy.BLOCK and can_block:
+                    self._not_full.wait_for(
+                        lambda: len(self._entries) < self._maxsize, timeout=self._block_timeout
+                    )
+                if len(self._entries) >= self._maxsize:
+                    self.dropped += 1
+                    return False
+
+            entry = [event, key]
+            self._entries.append(entry)
+            if key is not None:
+                self._slots[key] = entry
+            return True
+
+    def get_nowait(self) -> Event:
+        """Remove and return the next event.
+
+        Raises:
+            asyncio.QueueEmpty: If no event is queued.
+        """
+        with self._lock:
+            if not self._entries:
+                raise asyncio.QueueEmpty()
+            event = self._pop()
+            self._not_full.notify_all()
+            return event
+
+    def drain(self) -> list[Event]:
+        """Remove and return all queued events in order."""
+        with self._lock:
+            events = [entry[0] for entry in self._entries]
+            self._entries.clear()
+            self._slots.clear()
+            self._not_full.notify_all()
+            return events
+
+    def empty(self) -> bool:
+        return not self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _pop(self) -> Event:
+        event, key = self._entries.popleft()
+        if key is not None:
+            del self._slots[key]
+        return event
+
+
 class EventBus:
     """Async event bus for TUI-RalphLoop communication.
 
+    emit() may be called from any thread; events are queued and
+    dispatched on the loop that called start(). The queue is bounded
+    (see OverflowPolicy), and high-frequency events (metrics, tokens,
+    cost, progress) are coalesced so a burst between two dispatch ticks
+    costs handlers one call per key.
+
     Supports both sync and async handlers. Handlers are called
     in order of registration.
     """
 
+    DEFAULT_MAX_QUEUE_SIZE = 10_000
+    # Minimum time between dispatch ticks, so bursts coalesce
+    DEFAULT_TICK_INTERVAL = 0.02
+
     _instance: Optional[EventBus] = None
 
-    def __init__(self) -> None:
-        """Initialize the event bus."""
+    def __init__(
+        self,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+        overflow: OverflowPolicy | str = OverflowPolicy.DROP_OLDEST,
+        tick_interval: float = DEFAULT_TICK_INTERVAL,
+        block_timeout: float = 1.0,
+        coalesce: bool = True,
+    ) -> None:
+        """Initialize the event bus.
+
+        Args:
+            max_queue_size: Maximum queued events before overflow.
+            overflow: Overflow policy (default: drop the oldest event).
+            tick_interval: Minimum seconds between dispatch ticks.
+            block_timeout: Longest a BLOCK emit waits for room.
+            coalesce: Coalesce COALESCED_EVENT_TYPES per key.
+        """
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1")
         self._handlers: dict[EventType, list[EventHandler | AsyncEventHandler]] = {}
         self._all_handlers: list[EventHandler | AsyncEventHandler] = []
-        self._queue: asyncio.Queue[Event] = asyncio.Queue()
+        self._queue = _EventQueue(max_queue_size, OverflowPolicy(overflow), block_timeout, coalesce)
+        self._tick_interval = tick_interval
         self._running = False
         self._task: Optional[asyncio.Task[None]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._wake_pending = False
+        self._wake_lock = threading.Lock()
+        self._dispatched = 0
+        self._handler_stats: dict[str, HandlerStats] = {}
 
     @classmethod
     def get_instance(cls) -> EventBus:
@@ -166,13 +385,20 @@ class EventBus:
     def emit(self, event: Event) -> None:
         """Emit an event (sync version - queues for async processing).
 
+        Safe to call from any thread.
+
         Args:
             event: The event to emit.
         """
-        try:
-            self._queue.put_nowait(event)
-        except asyncio.QueueFull:
-            logger.warning(f"Event queue full, dropping event: {event.type}")
+        on_loop_thread = self._on_loop_thread()
+        dropped_before = self._queue.dropped
+        if not self._queue.put(event, can_block=self._running and not on_loop_thread):
+            if dropped_before == 0:
+                logger.warning(f"Event queue full, dropping event: {event.type}")
+            return
+        if self._queue.dropped and dropped_before == 0:
+            logger.warning("Event queue full, dropping oldest events")
+        self._wake(on_loop_thread)
 
     async def emit_async(self, event: Event) -> None:
         """Emit an event and wait for handlers (async version).
@@ -182,6 +408,17 @@ class EventBus:
         """
         await self._dispatch(event)
 
+    def stats(self) -> EventBusStats:
+        """Get queue counters and per-handler dispatch timing."""
+        return EventBusStats(
+            emitted=self._queue.received,
+            dispatched=self._dispatched,
+            coalesced=self._queue.coalesced,
+            dropped=self._queue.dropped,
+            queue_depth=len(self._queue),
+            handlers={name: replace(s) for name, s in self._handler_stats.items()},
+        )
+
     async def _dispatch(self, event: Event) -> None:
         """Dispatch event to all registered handlers.
 
@@ -192,30 +429,82 @@ class EventBus:
         if event.type in self._handlers:
             handlers.extend(self._handlers[event.type])
 
+        self._dispatched += 1
         for handler in handlers:
+            stats = self._stats_for(handler)
+            start = time.perf_counter()
             try:
                 result = handler(event)
                 if asyncio.iscoroutine(result):
                     await result
             except Exception as e:
+                stats.errors += 1
                 logger.error(f"Error in event handler: {e}")
+            finally:
+                elapsed = time.perf_counter() - start
+                stats.calls += 1
+                stats.total_seconds += elapsed
+                stats.max_seconds = max(stats.max_seconds, elapsed)
+
+    def _stats_for(self, handler: EventHandler | AsyncEventHandler) -> HandlerStats:
+        name = getattr(handler, "__qualname__", None) or repr(handler)
+        stats = self._handler_stats.get(name)
+        if stats is None:
+            stats = self._handler_stats[name] = HandlerStats()
+        return stats
 
     async def start(self) -> None:
-        """Start the event processing loop."""
+        """Start the event processing loop on the running event loop."""
         if self._running:
             return
 
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
         self._running = True
         self._task = asyncio.create_task(self._process_events())
+        if not self._queue.empty():
+            self._wakeup.set()
+
+    def _on_loop_thread(self) -> bool:
+        if self._loop is None:
+            return False
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def _wake(self, on_loop_thread: bool) -> None:
+        """Wake the dispatcher, at most once per tick."""
+        loop, wakeup = self._loop, self._wakeup
+        if not self._running or loop is None or wakeup is None:
+            return
+        with self._wake_lock:
+            if self._wake_pending:
+                return
+            self._wake_pending = True
+        if on_loop_thread:
+            wakeup.set()
+            return
+        try:
+            loop.call_soon_threadsafe(wakeup.set)
+        except RuntimeError:
+            pass  # Loop closed
 
     async def _process_events(self) -> None:
-        """Process events from the queue."""
+        """Dispatch queued events once per tick."""
+        assert self._wakeup is not None and self._loop is not None
         while self._running:
             try:
-                event = await asyncio.wait_for(self._queue.get(), timeout=0.1)
-                await self._dispatch(event)
-            except asyncio.TimeoutError:
-                continue
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                with self._wake_lock:
+                    self._wake_pending = False
+                tick_start = self._loop.time()
+                for event in self._queue.drain():
+                    await self._dispatch(event)
+                remaining = self._tick_interval - (self._loop.time() - tick_start)
+                if remaining > 0:
+                    await asyncio.sleep(remaining)
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -227,6 +516,9 @@ class EventBus:
         if self._task:
             self._task.cancel()
             self._task = None
+        self._loop = None
+        self._wakeup = None
+        self._wake_pending = False
 
 
 # Convenience functions for emitting common events
@@ -0,0 +1,143 @@
+"""Tests for the task routes."""
+
+from __future__ import annotations
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ralph_agi.api.app import create_app
+from ralph_agi.api.dependencies import get_task_queue, reset_dependencies
+from ralph_agi.tasks.queue import TaskArtifact, TaskOutput
+
+
+@pytest.fixture
+def client(tmp_path):
+    reset_dependencies()
+    with TestClient(create_app(tmp_path)) as client:
+        yield client
+    reset_dependencies()
+
+
+def _task_with_artifacts(tmp_path, *artifacts: TaskArtifact) -> str:
+    queue = get_task_queue()
+    task = queue.add("Write the docs")
+    task.output = TaskOutput(artifacts=list(artifacts))
+    queue._save_task(task)
+    return task.id
+
+
+class TestArtifactContent:
+    """Tests for loading artifact content on request."""
+
+    def test_reads_content_from_the_worktree(self, client, tmp_path):
+        (tmp_path / "notes.md").write_text("# Notes\n")
+        task_id = _task_with_artifacts(tmp_path, TaskArtifact(
+            path="notes.md", absolute_path=str(tmp_path / "notes.md"), change_type="added",
+        ))
+
+        response = client.get(f"/api/tasks/{task_id}/artifacts/content", params={"path": "notes.md"})
+
+        assert response.status_code == 200
+        assert response.text == "# Notes\n"
+
+    def test_only_serves_listed_artifacts(self, client, tmp_path):
+        (tmp_path / "secret.txt").write_text("no\n")
+        task_id = _task_with_artifacts(tmp_path)
+
+        response = client.get(f"/api/tasks/{task_id}/artifacts/content", params={"path": "secret.txt"})
+
+        assert response.status_code == 404
+
+    def test_binary_and_missing_files(self, client, tmp_path):
+        (tmp_path / "image.bin").write_bytes(b"\xff\xfe\x00")
+        task_id = _task_with_artifacts(
+            tmp_path,
+            TaskArtifact(path="image.bin", absolute_path=str(tmp_path / "image.bin")),
+            TaskArtifact(path="gone.txt", absolute_path=str(tmp_path / "gone.txt")),
+        )
+        url = f"/api/tasks/{task_id}/artifacts/content"
+
+        assert client.get(url, params={"path": "image.bin"}).status_code == 415
+        assert client.get(url, params={"path": "gone.txt"}).status_code == 404
+        assert client.get("/api/tasks/nope/artifacts/content", params={"path": "x"}).status_code == 404
+
+
+class TestArtifactBlobs:
+    """Tests for streaming stored artifact blobs."""
+
+    def test_streams_blob_with_etag(self, client, tmp_path):
+        digest = get_task_queue().blobs.put(b"print('hi')\n" * 100)
+        task_id = _task_with_artifacts(tmp_path, TaskArtifact(path="app.py", blob=digest))
+        url = f"/api/tasks/{task_id}/artifacts/content"
+
+        response = client.get(url, params={"path": "app.py"}, headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert response.text == "print('hi')\n" * 100
+        assert response.headers["etag"] == f'"{digest}"'
+        assert response.headers["content-type"].startswith("text/plain")
+
+        cached = client.get(
+            url, params={"path": "app.py"},
+            headers={"Accept-Encoding": "identity", "If-None-Match": f'"{digest}"'},
+        )
+        assert cached.status_code == 304
+
+    def test_compressed_blob_is_sent_gzip_encoded(self, client, tmp_path):
+        digest = get_task_queue().blobs.put(b"x = 1\n" * 1000)
+        task_id = _task_with_artifacts(tmp_path, TaskArtifact(path="x.py", blob=digest))
+
+        response = client.get(
+            f"/api/tasks/{task_id}/artifacts/content",
+            params={"path": "x.py"}, headers={"Accept-Encoding": "gzip"},
+        )
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["etag"] == f'"{digest}-gzip"'
+        assert response.text == "x = 1\n" * 1000  # Decoded by the client
+
+    def test_binary_blob_is_octet_stream(self, client, tmp_path):
+        digest = get_task_queue().blobs.put(b"\x89PNG\x00\x01" * 10)
+        task_id = _task_with_artifacts(tmp_path, TaskArtifact(path="logo.png", blob=digest))
+
+        response = client.get(f"/api/tasks/{task_id}/artifacts/content", params={"path": "logo.png"})
+
+        assert response.headers["content-type"] == "application/octet-stream"
+
+
+class TestTaskLogs:
+    """Tests for reading and tailing task execution logs."""
+
+    def test_logs_since_offset(self, client):
+        queue = get_task_queue()
+        task = queue.add("Long task")
+        log = queue.task_log(task.id)
+        log.append("info", "one")
+        log.append("info", "two")
+
+        first = client.get(f"/api/tasks/{task.id}/logs").json()
+        log.append("warn", "three")
+        second = client.get(f"/api/tasks/{task.id}/logs", params={"since": first["offset"]}).json()
+
+        assert [e["message"] for e in first["entries"]] == ["one", "two"]
+        assert [e["message"] for e in second["entries"]] == ["three"]
+        assert second["offset"] == second["end"]
+        assert second["complete"] is False
+        assert client.get("/api/tasks/nope/logs").status_code == 404
+
+    def test_websocket_tails_from_offset_until_task_finishes(self, client):
+        queue = get_task_queue()
+        task = queue.add("Long task")
+        log = queue.task_log(task.id)
+        log.append("info", "already read")
+        since = log.read().offset
+        log.append("info", "new")
+        queue.update_status(task.id, "complete")
+
+        with client.websocket_connect(f"/ws/tasks/{task.id}/logs?since={since}") as ws:
+            chunk = ws.receive_json()
+            done = ws.receive_json()
+
+        assert chunk["type"] == "task_logs"
+        assert [e["message"] for e in chunk["entries"]] == ["new"]
+        assert done == {"type": "task_logs_complete", "task_id": task.id, "offset": chunk["offset"]}
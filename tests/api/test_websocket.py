@@ -0,0 +1,231 @@
+"""Tests for WebSocket fan-out."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+from ralph_agi.api.websocket import (
+    SLOW_CLIENT_CLOSE_CODE,
+    ClientConnection,
+    ConnectionManager,
+    Subscription,
+)
+from ralph_agi.tui.events import Event, EventBus, EventType
+
+
+class FakeWebSocket:
+    """WebSocket stand-in whose sends can be held open."""
+
+    def __init__(self):
+        self.sent: list[dict] = []
+        self.closed_with: int | None = None
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def accept(self) -> None:
+        pass
+
+    async def send_text(self, text: str) -> None:
+        await self.gate.wait()
+        self.sent.append(json.loads(text))
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_with = code
+
+
+def _message(event_type: EventType, **data) -> dict:
+    return {"type": event_type.value, "timestamp": "t", "data": data}
+
+
+async def _flush() -> None:
+    for _ in range(20):
+        await asyncio.sleep(0)
+
+
+class TestSubscription:
+    """Tests for topic matching."""
+
+    def test_empty_subscription_matches_everything(self):
+        assert Subscription().matches("tool_called", "t1")
+
+    def test_parse_comma_separated(self):
+        sub = Subscription.parse("task_completed, tool_called", "t1")
+
+        assert sub.event_types == {"task_completed", "tool_called"}
+        assert sub.matches("tool_called", "t1")
+        assert not sub.matches("tool_called", "t2")
+        assert not sub.matches("log_message")
+
+    def test_untargeted_messages_reach_task_subscribers(self):
+        assert Subscription.parse(task_ids=["t1"]).matches("metrics_updated", None)
+
+
+class TestConnectionManager:
+    """Tests for per-client queues, coalescing and slow clients."""
+
+    async def test_slow_client_does_not_block_others(self):
+        manager = ConnectionManager()
+        slow, fast = FakeWebSocket(), FakeWebSocket()
+        slow.gate.clear()
+        await manager.connect(slow)
+        await manager.connect(fast)
+
+        for i in range(3):
+            await manager.broadcast(_message(EventType.TOOL_CALLED, n=i))
+        await _flush()
+
+        assert [m["data"]["n"] for m in fast.sent] == [0, 1, 2]
+        assert slow.sent == []
+
+        slow.gate.set()
+        await _flush()
+        assert [m["data"]["n"] for m in slow.sent] == [0, 1, 2]
+
+    async def test_stale_metrics_are_coalesced_for_slow_client(self):
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        ws.gate.clear()
+        client = await manager.connect(ws)
+
+        await manager.broadcast(_message(EventType.TOOL_CALLED, n=0))
+        await _flush()  # Sender is now stuck on the first message
+        for i in range(10):
+            await manager.broadcast(_message(EventType.METRICS_UPDATED, iteration=i))
+        await manager.broadcast(_message(EventType.TASK_COMPLETED, task_id="t1"))
+
+        ws.gate.set()
+        await _flush()
+
+        assert [m["type"] for m in ws.sent] == ["tool_called", "metrics_updated", "task_completed"]
+        assert ws.sent[1]["data"]["iteration"] == 9
+        assert client.stats.coalesced == 9
+
+    async def test_full_queue_drops_stale_metrics_first(self):
+        manager = ConnectionManager(max_queue=2)
+        ws = FakeWebSocket()
+        ws.gate.clear()
+        client = await manager.connect(ws)
+        await manager.broadcast(_message(EventType.TOOL_CALLED, n=0))
+        await _flush()
+
+        await manager.broadcast(_message(EventType.PROGRESS_UPDATED, task_name="a", progress=1))
+        await manager.broadcast(_message(EventType.TOOL_CALLED, n=1))
+        await manager.broadcast(_message(EventType.TOOL_CALLED, n=2))
+
+        assert client.stats.dropped == 1
+        assert not client.closed
+
+    async def test_client_that_stays_behind_is_disconnected(self):
+        manager = ConnectionManager(max_queue=2)
+        ws = FakeWebSocket()
+        ws.gate.clear()
+        await manager.connect(ws)
+
+        for i in range(4):
+            await manager.broadcast(_message(EventType.TOOL_CALLED, n=i))
+        await _flush()
+
+        assert ws.closed_with == SLOW_CLIENT_CLOSE_CODE
+        assert ws not in manager.active_connections
+
+    async def test_send_timeout_disconnects(self):
+        manager = ConnectionManager(send_timeout=0.01)
+        ws = FakeWebSocket()
+        ws.gate.clear()
+        await manager.connect(ws)
+
+        await manager.broadcast(_message(EventType.TOOL_CALLED, n=0))
+        await asyncio.sleep(0.05)
+
+        assert ws.closed_with == SLOW_CLIENT_CLOSE_CODE
+        assert manager.active_connections == set()
+
+    async def test_topic_subscriptions_filter_messages(self):
+        manager = ConnectionManager()
+        everything, one_task = FakeWebSocket(), FakeWebSocket()
+        await manager.connect(everything)
+        await manager.connect(one_task, Subscription.parse(["task_completed"], ["t1"]))
+
+        await manager.broadcast(_message(EventType.TASK_COMPLETED, task_id="t1"))
+        await manager.broadcast(_message(EventType.TASK_COMPLETED, task_id="t2"))
+        await manager.broadcast(_message(EventType.LOG_MESSAGE, message="hi"))
+        await _flush()
+
+        assert len(everything.sent) == 3
+        assert [m["data"]["task_id"] for m in one_task.sent] == ["t1"]
+
+        manager.subscribe(one_task, Subscription())
+        await manager.broadcast(_message(EventType.LOG_MESSAGE, message="now"))
+        await _flush()
+        assert one_task.sent[-1]["data"]["message"] == "now"
+
+    async def test_attach_forwards_bus_events_once(self):
+        manager = ConnectionManager()
+        bus = EventBus()
+        ws = FakeWebSocket()
+        await manager.connect(ws)
+        await manager.connect(FakeWebSocket())
+        manager.attach(bus)
+        manager.attach(bus)
+
+        await bus.emit_async(Event(type=EventType.TASK_STARTED, data={"task_id": "t1"}))
+        await _flush()
+
+        assert [m["type"] for m in ws.sent] == ["task_started"]
+
+    async def test_disconnect_stops_sender(self):
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        client: ClientConnection = await manager.connect(ws)
+
+        await manager.disconnect(ws)
+        await manager.broadcast(_message(EventType.TOOL_CALLED, n=0))
+        await _flush()
+
+        assert client.closed
+        assert ws.sent == []
+
+
+class TestWebSocketEndpoint:
+    """Tests for the /ws endpoint."""
+
+    def test_ping_and_topic_subscription(self, tmp_path):
+        from fastapi.testclient import TestClient
+
+        from ralph_agi.api.app import create_app, manager
+
+        with TestClient(create_app(tmp_path)) as client:
+            with client.websocket_connect("/ws?events=task_completed&tasks=t1") as ws:
+                ws.send_text(json.dumps({"type": "ping"}))
+                assert ws.receive_json() == {"type": "pong"}
+
+                (client_conn,) = manager._clients.values()
+                assert client_conn.subscription == Subscription.parse("task_completed", "t1")
+
+                ws.send_text(json.dumps({"type": "subscribe", "events": ["log_message"]}))
+                ws.send_text(json.dumps({"type": "ping"}))
+                assert ws.receive_json() == {"type": "pong"}
+                assert client_conn.subscription.event_types == {"log_message"}
+
+        assert manager.active_connections == set()
+
+    def test_task_file_changes_are_published(self, tmp_path):
+        from fastapi.testclient import TestClient
+
+        from ralph_agi.api.app import create_app
+        from ralph_agi.api.dependencies import reset_dependencies
+        from ralph_agi.tasks.queue import TaskQueue
+
+        reset_dependencies()
+        try:
+            with TestClient(create_app(tmp_path)) as client:
+                with client.websocket_connect("/ws?events=task_added,task_updated") as ws:
+                    # Another process adds a task
+                    TaskQueue(project_root=tmp_path).add("Fix the thing", task_id="t1")
+                    message = ws.receive_json()
+        finally:
+            reset_dependencies()
+
+        assert message["type"] == "task_added"
+        assert message["data"] == {"task_id": "t1", "status": "pending"}
@@ -68,6 +68,11 @@ class TestRalphConfigDefaults:
         config = RalphConfig()
         assert config.memory_embedding_model == "all-MiniLM-L6-v2"
 
+    def test_default_memory_fsync(self):
+        """Test default memory_fsync fsyncs every frame."""
+        config = RalphConfig()
+        assert config.memory_fsync == "always"
+
     def test_default_hooks_enabled(self):
         """Test default hooks_enabled is True."""
         config = RalphConfig()
@@ -194,6 +199,26 @@ class TestRalphConfigValidation:
         with pytest.raises(ConfigValidationError, match="completion_promise"):
             RalphConfig(completion_promise="")
 
+    def test_invalid_memory_fsync_raises(self):
+        """Test that an unknown memory_fsync policy raises error."""
+        with pytest.raises(ConfigValidationError, match="memory_fsync"):
+            RalphConfig(memory_fsync="never")
+
+    def test_negative_llm_context_window_tokens_raises(self):
+        """Test that a negative llm_context_window_tokens raises error."""
+        with pytest.raises(ConfigValidationError, match="llm_context_window_tokens"):
+            RalphConfig(llm_context_window_tokens=-1)
+
+    def test_negative_memory_context_tokens_raises(self):
+        """Test that a negative memory context budget raises error."""
+        with pytest.raises(ConfigValidationError, match="memory_context_tokens"):
+            RalphConfig(memory_context_tokens=-1)
+
+    def test_invalid_memory_batch_size_raises(self):
+        """Test that memory_batch_size < 1 raises error."""
+        with pytest.raises(ConfigValidationError, match="memory_batch_size"):
+            RalphConfig(memory_batch_size=0)
+
 
 class TestLoadConfig:
     """Tests for load_config function."""
@@ -274,6 +299,21 @@ memory:
         config = load_config(config_file)
         assert config.memory_embedding_model == "all-mpnet-base-v2"
 
+    def test_load_memory_fsync_config(self, tmp_path):
+        """Test loading JSONL backup durability settings from YAML."""
+        config_file = tmp_path / "fsync.yaml"
+        config_file.write_text("""
+memory:
+  fsync: batch
+  batch_size: 128
+  batch_interval: 0.2
+""")
+
+        config = load_config(config_file)
+        assert config.memory_fsync == "batch"
+        assert config.memory_batch_size == 128
+        assert config.memory_batch_interval == 0.2
+
     def test_load_memory_defaults_when_missing(self, tmp_path):
         """Test that memory defaults are used when not in config."""
         config_file = tmp_path / "no_memory.yaml"
@@ -569,6 +609,91 @@ llm:
         assert config.llm_critic_enabled is False
         assert config.llm_max_tokens == 4096  # default
 
+    def test_load_prompt_caching_config(self, tmp_path):
+        """Test prompt caching defaults off and can be enabled from YAML."""
+        assert RalphConfig().llm_prompt_caching is False
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+llm:
+  prompt_caching: true
+""")
+
+        config = load_config(config_file)
+
+        assert config.llm_prompt_caching is True
+
+    def test_load_streaming_config(self, tmp_path):
+        """Test Builder streaming defaults off and can be enabled from YAML."""
+        assert RalphConfig().llm_streaming is False
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+llm:
+  streaming: true
+""")
+
+        assert load_config(config_file).llm_streaming is True
+
+    def test_load_rate_limit_config(self, tmp_path):
+        """Test loading shared LLM rate limits from YAML."""
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+llm:
+  requests_per_minute: 50
+  tokens_per_minute: 40000
+  max_concurrent_requests: 4
+  rate_state_path: .ralph/llm-rate.json
+""")
+
+        config = load_config(config_file)
+
+        assert config.llm_requests_per_minute == 50
+        assert config.llm_tokens_per_minute == 40000
+        assert config.llm_max_concurrent_requests == 4
+        assert config.llm_rate_state_path == ".ralph/llm-rate.json"
+        assert RalphConfig().llm_requests_per_minute == 0
+
+    def test_negative_rate_limit_raises(self):
+        """Test that negative rate limits raise error."""
+        with pytest.raises(ConfigValidationError, match="llm_tokens_per_minute"):
+            RalphConfig(llm_tokens_per_minute=-5)
+
+    def test_load_replay_config(self, tmp_path):
+        """Test loading LLM record/replay settings from YAML."""
+        assert RalphConfig().llm_replay_mode is None
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+llm:
+  replay_mode: replay
+  replay_path: .ralph/session.jsonl
+""")
+
+        config = load_config(config_file)
+
+        assert config.llm_replay_mode == "replay"
+        assert config.llm_replay_path == ".ralph/session.jsonl"
+
+    def test_invalid_replay_config_raises(self):
+        """Test that replay mode is validated and needs a transcript path."""
+        with pytest.raises(ConfigValidationError, match="llm_replay_mode"):
+            RalphConfig(llm_replay_mode="rewind", llm_replay_path="s.jsonl")
+        with pytest.raises(ConfigValidationError, match="llm_replay_path"):
+            RalphConfig(llm_replay_mode="record")
+
+    def test_load_context_window_config(self, tmp_path):
+        """Test loading the Builder context window budget from YAML."""
+        assert RalphConfig().llm_context_window_tokens == 60000
+
+        config_file = tmp_path / "config.yaml"
+        config_file.write_text("""
+llm:
+  context_window_tokens: 20000
+""")
+
+        assert load_config(config_file).llm_context_window_tokens == 20000
+
     def test_save_and_load_llm_config_roundtrip(self, tmp_path):
         """Test save and load roundtrip for LLM config."""
         config_file = tmp_path / "config.yaml"
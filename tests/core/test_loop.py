@@ -127,6 +127,63 @@ class TestRalphLoopExecution:
         assert loop.iteration < 100
 
 
+class TestProgressEvents:
+    """Tests for the on_event progress hook."""
+
+    def test_iteration_and_token_events(self):
+        events = []
+        loop = RalphLoop(max_iterations=2, on_event=lambda name, data: events.append((name, data)))
+        loop._execute_iteration = lambda: IterationResult(
+            success=True, task_id="t1", tokens_used=100, input_tokens=80, output_tokens=20
+        )
+
+        loop.run(handle_signals=False)
+
+        assert [name for name, _ in events] == [
+            "iteration_started", "tokens", "iteration_completed",
+        ] * 2
+        tokens = events[4][1]
+        assert tokens["iteration"] == 2
+        assert tokens["input_tokens"] == 160
+        assert tokens["output_tokens"] == 40
+        assert events[5][1]["task_id"] == "t1"
+        assert events[5][1]["success"] is True
+        assert events[5][1]["memory_context_tokens_used"] == 0
+        assert events[5][1]["memory_context_tokens_saved"] == 0
+
+    def test_failed_iteration_reported(self):
+        events = []
+        loop = RalphLoop(
+            max_iterations=1, max_retries=1, on_event=lambda name, data: events.append((name, data)),
+        )
+        loop._execute_iteration = lambda: IterationResult(success=False)
+
+        with pytest.raises(MaxRetriesExceeded):
+            loop.run(handle_signals=False)
+
+        assert events[-1][0] == "iteration_completed"
+        assert events[-1][1]["success"] is False
+
+    def test_tool_events(self):
+        events = []
+        loop = RalphLoop(max_iterations=1, on_event=lambda name, data: events.append((name, data)))
+
+        loop._on_tool("read_file", True, 0.0123)
+
+        assert events == [
+            ("tool", {"iteration": 1, "tool": "read_file", "success": True, "duration_seconds": 0.012}),
+        ]
+
+    def test_failing_hook_does_not_stop_loop(self):
+        def hook(name, data):
+            raise RuntimeError("pipe closed")
+
+        loop = RalphLoop(max_iterations=3, on_event=hook)
+
+        assert loop.run(handle_signals=False) is False
+        assert loop.iteration == 3
+
+
 class TestRalphLoopLogging:
     """Tests for RalphLoop logging functionality."""
 
@@ -525,6 +582,24 @@ class TestMemoryIntegration:
         # Should have been called twice (once per iteration)
         assert mock_store.append.call_count == 2
 
+    def test_run_flushes_memory_store(self):
+        """Test that buffered memory is flushed when the loop exits."""
+        mock_store = MagicMock()
+        loop = RalphLoop(max_iterations=1, memory_store=mock_store)
+        loop.run(handle_signals=False)
+
+        mock_store.flush.assert_called_once()
+        loop.close()
+
+    def test_checkpoint_flushes_memory_store(self, tmp_path):
+        """Test that saving a checkpoint flushes buffered memory first."""
+        mock_store = MagicMock()
+        loop = RalphLoop(memory_store=mock_store)
+        loop.save_checkpoint(str(tmp_path / "checkpoint.json"))
+
+        mock_store.flush.assert_called_once()
+        loop.close()
+
     def test_close_closes_memory_store(self):
         """Test that close() closes the memory store."""
         mock_store = MagicMock()
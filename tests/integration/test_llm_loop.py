@@ -93,6 +93,22 @@ class TestToolExecutorAdapter:
 
         assert "Unknown tool" in result
 
+    @pytest.mark.asyncio
+    async def test_on_tool_reports_calls(self, tmp_path: Path) -> None:
+        """Test the on_tool callback sees each call and its outcome."""
+        (tmp_path / "test.txt").write_text("hello")
+        calls = []
+        adapter = ToolExecutorAdapter(
+            work_dir=tmp_path, on_tool=lambda name, ok, seconds: calls.append((name, ok)),
+        )
+
+        await adapter.execute("read_file", {"path": str(tmp_path / "test.txt")})
+        await adapter.execute("unknown_tool", {})
+        with pytest.raises(Exception):
+            await adapter.execute("read_file", {"path": str(tmp_path / "missing.txt")})
+
+        assert calls == [("read_file", True), ("unknown_tool", False), ("read_file", False)]
+
 
 # =============================================================================
 # IterationResult Tests
@@ -391,6 +407,48 @@ class TestCreateLLMClient:
             client = RalphLoop._create_llm_client("openrouter", "claude-3-opus")
             MockClient.assert_called_once_with(model="claude-3-opus")
 
+    def test_create_client_with_governor(self) -> None:
+        """Test that a rate governor is passed through to the client."""
+        governor = MagicMock()
+        with patch("ralph_agi.llm.openrouter.OpenRouterClient") as MockClient:
+            RalphLoop._create_llm_client("openrouter", "claude-3-opus", governor=governor)
+            MockClient.assert_called_once_with(model="claude-3-opus", governor=governor)
+
+    def test_create_replay_client(self, tmp_path) -> None:
+        """Test replay mode serves a transcript without a provider client."""
+        from ralph_agi.llm.replay import ReplayLLMClient
+
+        path = str(tmp_path / "session.jsonl")
+        with patch("ralph_agi.llm.anthropic.AnthropicClient") as MockClient:
+            client = RalphLoop._create_llm_client(
+                "anthropic", "claude-3-opus", replay_mode="replay", replay_path=path
+            )
+            MockClient.assert_not_called()
+        assert isinstance(client, ReplayLLMClient)
+        assert client.mode == "replay"
+        assert client.model == "claude-3-opus"
+
+    def test_create_recording_client(self, tmp_path) -> None:
+        """Test record mode wraps the provider client."""
+        path = str(tmp_path / "session.jsonl")
+        with patch("ralph_agi.llm.openai.OpenAIClient") as MockClient:
+            client = RalphLoop._create_llm_client(
+                "openai", "gpt-4o", replay_mode="record", replay_path=path
+            )
+        assert client.mode == "record"
+        assert client._client is MockClient.return_value
+
+    def test_rate_governor_shared_from_config(self) -> None:
+        """Test that rate limits in config yield one shared governor."""
+        config = RalphConfig(llm_requests_per_minute=40, llm_max_concurrent_requests=2)
+
+        governor = RalphLoop._create_rate_governor(config)
+
+        assert governor is RalphLoop._create_rate_governor(config)
+        assert governor.limits.requests_per_minute == 40
+        assert governor.limits.max_concurrent == 2
+        assert RalphLoop._create_rate_governor(RalphConfig()) is None
+
     def test_unknown_provider_raises(self) -> None:
         """Test unknown provider raises ValueError."""
         with pytest.raises(ValueError, match="Unknown LLM provider"):
@@ -447,6 +505,37 @@ class TestBuildContext:
         assert "Recent Context" in context
         assert "Previous iteration" in context
 
+    def test_build_memory_context_ranks_by_task(self) -> None:
+        """Test memory context prefers task-relevant frames and tracks savings."""
+        from ralph_agi.memory.store import MemoryFrame
+
+        relevant = MemoryFrame(
+            id="auth",
+            content="Learned: the OAuth callback must validate the state parameter",
+            frame_type="learning",
+            timestamp="2026-01-01T00:00:00+00:00",
+        )
+        noise = [
+            MemoryFrame(
+                id=f"n{i}",
+                content=f"Reformatted docs page {i} " + "lorem ipsum " * 100,
+                frame_type="iteration_result",
+                timestamp=f"2026-01-02T00:{i:02d}:00+00:00",
+            )
+            for i in range(10)
+        ]
+        mock_memory = MagicMock()
+        mock_memory.search_hybrid.return_value = []
+        mock_memory.get_by_session.return_value = list(reversed(noise))
+        mock_memory.get_recent.return_value = [*reversed(noise), relevant]
+
+        loop = RalphLoop(max_iterations=5, memory_store=mock_memory, memory_context_tokens=300)
+        context = loop._build_memory_context("Validate OAuth callback state")
+
+        assert context.splitlines()[1].startswith("- [learning] Learned: the OAuth callback")
+        assert len(context) // 4 + 1 <= 300
+        assert loop.memory_context_tokens_saved > 0
+
 
 # =============================================================================
 # End-to-End Flow Tests
@@ -623,7 +712,9 @@ class TestTokenTracking:
             status=OrchestratorStatus.SUCCESS,
             task={"id": "T1"},
             builder_result=builder,
-            token_usage=TokenUsage(builder_input=700, builder_output=300),
+            token_usage=TokenUsage(
+                builder_input=640, builder_output=200, critic_input=120, critic_output=40
+            ),
         )
 
         mock_orch = MagicMock()
@@ -639,8 +730,10 @@ class TestTokenTracking:
 
         result = await loop._execute_iteration_async()
 
-        # Tokens should be in the result
+        # Tokens should be in the result, split as reported
         assert result.tokens_used == 1000
+        assert result.input_tokens == 760
+        assert result.output_tokens == 240
 
 
 # =============================================================================
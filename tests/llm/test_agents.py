@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from dataclasses import dataclass
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock
@@ -17,7 +18,15 @@ from ralph_agi.llm.agents import (
     CriticVerdict,
     ToolExecutionRecord,
 )
-from ralph_agi.llm.client import LLMResponse, StopReason, ToolCall
+from ralph_agi.llm.client import (
+    LLMResponse,
+    RateLimitError,
+    StopReason,
+    StreamEvent,
+    StreamEventType,
+    ToolCall,
+)
+from ralph_agi.llm.retry import RetryPolicy
 
 
 # =============================================================================
@@ -316,6 +325,40 @@ class TestBuilderAgentExecute:
         assert len(result.tool_calls) == 1
         assert result.tool_calls[0].success is False
 
+    @pytest.mark.asyncio
+    async def test_parallel_reads_preserve_result_order(
+        self,
+        mock_client: MagicMock,
+        sample_task: dict[str, Any],
+    ) -> None:
+        """Test concurrent tool calls keep tool_result order."""
+        tool_calls = [
+            ToolCall(id=f"tc_{i}", name="read_file", arguments={"path": f"f{i}.py"})
+            for i in range(4)
+        ]
+        mock_client.complete.side_effect = [
+            LLMResponse(content="", stop_reason=StopReason.TOOL_USE, tool_calls=tool_calls),
+            LLMResponse(content="<task_complete>DONE</task_complete>", stop_reason=StopReason.END_TURN),
+        ]
+
+        class SlowExecutor:
+            async def execute(self, tool_name, arguments=None):
+                # Later calls finish first
+                await asyncio.sleep(0.05 * (4 - int(arguments["path"][1])))
+                return f"contents of {arguments['path']}"
+
+        agent = BuilderAgent(mock_client, tool_executor=SlowExecutor())
+        result = await agent.execute(sample_task)
+
+        tool_message = mock_client.complete.call_args_list[1].kwargs["messages"][2]
+        assert [b["tool_use_id"] for b in tool_message["content"]] == [
+            "tc_0", "tc_1", "tc_2", "tc_3",
+        ]
+        assert tool_message["content"][0]["content"] == "contents of f0.py"
+        assert [r.arguments["path"] for r in result.tool_calls] == [
+            "f0.py", "f1.py", "f2.py", "f3.py",
+        ]
+
     @pytest.mark.asyncio
     async def test_passes_context_and_memory(
         self,
@@ -358,6 +401,290 @@ class TestBuilderAgentExecute:
         assert result.status == AgentStatus.ERROR
         assert "API error" in result.error
 
+    @pytest.mark.asyncio
+    async def test_rate_limit_retries_single_call(
+        self,
+        mock_client: MagicMock,
+        mock_tool_executor: MagicMock,
+        sample_task: dict[str, Any],
+    ) -> None:
+        """Test that a rate-limited call is retried without losing progress."""
+        tool_response = LLMResponse(
+            content="",
+            tool_calls=[ToolCall(id="t1", name="write_file", arguments={"path": "a.txt"})],
+            stop_reason=StopReason.TOOL_USE,
+            usage={"input_tokens": 100, "output_tokens": 10},
+        )
+        done_response = LLMResponse(
+            content="<task_complete>DONE</task_complete>",
+            stop_reason=StopReason.END_TURN,
+            usage={"input_tokens": 200, "output_tokens": 10},
+        )
+        mock_client.complete.side_effect = [
+            tool_response,
+            RateLimitError("Rate limited", retry_after=0.001),
+            RateLimitError("Rate limited"),
+            done_response,
+        ]
+        mock_tool_executor.execute.return_value = "Wrote a.txt"
+        sample_task["acceptance_criteria"] = []
+
+        agent = BuilderAgent(
+            mock_client,
+            mock_tool_executor,
+            retry_policy=RetryPolicy(max_retries=2, base_delay=0.001),
+        )
+        result = await agent.execute(sample_task)
+
+        assert result.status == AgentStatus.COMPLETED
+        assert result.rate_limit_retries == 2
+        assert result.iterations == 2
+        assert result.files_changed == ["a.txt"]
+        assert mock_tool_executor.execute.call_count == 1
+        assert result.total_tokens == 320
+        # The retried call resent the conversation including the tool result
+        retried = mock_client.complete.call_args_list[-1].kwargs["messages"]
+        assert retried[-1]["content"][0]["tool_use_id"] == "t1"
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_exhausted_keeps_progress(
+        self,
+        mock_client: MagicMock,
+        mock_tool_executor: MagicMock,
+        sample_task: dict[str, Any],
+    ) -> None:
+        """Test that exhausting call retries returns RATE_LIMITED with progress."""
+        mock_client.complete.side_effect = [
+            LLMResponse(
+                content="",
+                tool_calls=[ToolCall(id="t1", name="edit_file", arguments={"path": "b.py"})],
+                stop_reason=StopReason.TOOL_USE,
+            ),
+            *[RateLimitError("Rate limited")] * 3,
+        ]
+        mock_tool_executor.execute.return_value = "Edited b.py"
+
+        agent = BuilderAgent(
+            mock_client,
+            mock_tool_executor,
+            retry_policy=RetryPolicy(max_retries=2, base_delay=0.001),
+        )
+        result = await agent.execute(sample_task)
+
+        assert result.status == AgentStatus.RATE_LIMITED
+        assert result.rate_limit_retries == 2
+        assert result.iterations == 2
+        assert result.files_changed == ["b.py"]
+        assert len(result.tool_calls) == 1
+        assert "Rate limited" in result.error
+
+    @pytest.mark.asyncio
+    async def test_context_window_bounds_prompt_size(
+        self,
+        mock_tool_executor: MagicMock,
+        sample_task: dict[str, Any],
+    ) -> None:
+        """Test that long tool loops stop growing the prompt once over budget."""
+        from ralph_agi.llm.context_window import message_tokens
+
+        prompt_sizes: list[int] = []
+
+        async def complete(messages, **kwargs):
+            prompt_sizes.append(sum(message_tokens(m) for m in messages))
+            i = len(prompt_sizes)
+            return LLMResponse(
+                content="",
+                tool_calls=[ToolCall(id=f"t{i}", name="read_file", arguments={"path": f"m{i}.py"})],
+                stop_reason=StopReason.TOOL_USE,
+                usage={"input_tokens": prompt_sizes[-1], "output_tokens": 10},
+            )
+
+        client = MagicMock()
+        client.complete = complete
+        mock_tool_executor.execute.return_value = "x = compute()\n" * 400
+
+        agent = BuilderAgent(
+            client, mock_tool_executor, max_iterations=30, context_window_tokens=8000
+        )
+        result = await agent.execute(sample_task)
+
+        assert result.status == AgentStatus.MAX_ITERATIONS
+        assert max(prompt_sizes) <= 8000 + 2000  # At most one result over budget
+        assert result.peak_prompt_tokens == max(prompt_sizes)
+        assert result.context_tokens_saved > 0
+
+    @pytest.mark.asyncio
+    async def test_context_window_disabled(
+        self,
+        mock_client: MagicMock,
+        mock_tool_executor: MagicMock,
+        sample_task: dict[str, Any],
+    ) -> None:
+        """Test that context_window_tokens=0 sends the full history."""
+        mock_client.complete.return_value = LLMResponse(
+            content="",
+            tool_calls=[ToolCall(id="t1", name="read_file", arguments={"path": "a.py"})],
+            stop_reason=StopReason.TOOL_USE,
+        )
+        mock_tool_executor.execute.return_value = "x = 1\n" * 5000
+
+        agent = BuilderAgent(
+            mock_client, mock_tool_executor, max_iterations=3, context_window_tokens=0
+        )
+        result = await agent.execute(sample_task)
+
+        sent = mock_client.complete.call_args.kwargs["messages"]
+        assert sent[2]["content"][0]["content"] == "x = 1\n" * 5000
+        assert result.context_tokens_saved == 0
+
+
+class ScriptedStreamClient:
+    """Streams scripted turns of text, tool calls and pauses."""
+
+    def __init__(self, turns: list[list[tuple[str, Any]]]):
+        self.turns = turns
+        self.calls = 0
+        self.log: list[str] = []
+
+    async def complete(self, messages, **kwargs):
+        raise AssertionError("streaming client should not use complete()")
+
+    async def stream_complete(self, messages, **kwargs):
+        turn = self.turns[min(self.calls, len(self.turns) - 1)]
+        self.calls += 1
+        text, tool_calls = [], []
+        for kind, value in turn:
+            if kind == "text":
+                text.append(value)
+                yield StreamEvent(StreamEventType.TEXT, text=value)
+            elif kind == "tool":
+                tool_calls.append(value)
+                yield StreamEvent(StreamEventType.TOOL_CALL, tool_call=value)
+            elif kind == "sleep":
+                await asyncio.sleep(value)
+            elif kind == "raise":
+                raise value
+        self.log.append("done")
+        yield StreamEvent(StreamEventType.DONE, response=LLMResponse(
+            content="".join(text),
+            tool_calls=tool_calls,
+            stop_reason=StopReason.TOOL_USE if tool_calls else StopReason.END_TURN,
+            usage={"input_tokens": 100, "output_tokens": 20},
+        ))
+
+
+class RecordingExecutor:
+    def __init__(self, log: list[str]):
+        self.log = log
+
+    async def execute(self, tool_name: str, arguments: dict[str, Any]) -> str:
+        self.log.append(f"{tool_name}:{arguments.get('path', '')}")
+        return f"contents of {arguments.get('path')}"
+
+
+def _read(call_id: str, path: str) -> ToolCall:
+    return ToolCall(id=call_id, name="read_file", arguments={"path": path})
+
+
+DONE_TURN = [("text", "<task_complete>DONE</task_complete>")]
+
+
+class TestBuilderAgentStreaming:
+    """Tests for streamed Builder calls with early tool dispatch."""
+
+    @pytest.mark.asyncio
+    async def test_reads_start_before_response_completes(self) -> None:
+        client = ScriptedStreamClient([
+            [("tool", _read("t1", "a.py")), ("sleep", 0.02), ("tool", _read("t2", "b.py")), ("sleep", 0.02)],
+            DONE_TURN,
+        ])
+        executor = RecordingExecutor(client.log)
+
+        agent = BuilderAgent(client, executor, streaming=True)
+        result = await agent.execute({"title": "Read"})
+
+        assert result.status == AgentStatus.COMPLETED
+        # Both reads ran while the first response was still streaming
+        assert client.log[:3] == ["read_file:a.py", "read_file:b.py", "done"]
+        assert result.early_tool_calls == 2
+        assert [r.result for r in result.tool_calls] == ["contents of a.py", "contents of b.py"]
+
+    @pytest.mark.asyncio
+    async def test_calls_after_first_write_wait_for_response(self) -> None:
+        client = ScriptedStreamClient([
+            [
+                ("tool", _read("t1", "a.py")),
+                ("tool", ToolCall(id="t2", name="edit_file", arguments={"path": "a.py"})),
+                ("tool", _read("t3", "a.py")),
+                ("sleep", 0.01),
+            ],
+            DONE_TURN,
+        ])
+        executor = RecordingExecutor(client.log)
+
+        agent = BuilderAgent(client, executor, streaming=True)
+        result = await agent.execute({"title": "Edit"})
+
+        assert client.log[:4] == ["read_file:a.py", "done", "edit_file:a.py", "read_file:a.py"]
+        assert result.early_tool_calls == 1
+        assert result.files_changed == ["a.py"]
+
+    @pytest.mark.asyncio
+    async def test_sequential_dispatch_does_not_start_early(self) -> None:
+        client = ScriptedStreamClient([[("tool", _read("t1", "a.py")), ("sleep", 0.01)], DONE_TURN])
+        executor = RecordingExecutor(client.log)
+
+        agent = BuilderAgent(client, executor, streaming=True, max_parallel_tools=1)
+        result = await agent.execute({"title": "Read"})
+
+        assert client.log[:2] == ["done", "read_file:a.py"]
+        assert result.early_tool_calls == 0
+
+    @pytest.mark.asyncio
+    async def test_thinking_streamed_line_by_line(self) -> None:
+        client = ScriptedStreamClient([
+            [("text", "First I will "), ("text", "read a.py\nThen "), ("text", "edit it")],
+            DONE_TURN,
+        ])
+        thoughts: list[str] = []
+
+        agent = BuilderAgent(client, streaming=True, on_thinking=thoughts.append)
+        await agent.execute({"title": "Think"})
+
+        assert thoughts[:2] == ["First I will read a.py", "Then edit it"]
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_stream_retried(self) -> None:
+        client = ScriptedStreamClient([
+            [("tool", _read("t1", "a.py")), ("raise", RateLimitError("429", retry_after=0.001))],
+            DONE_TURN,
+        ])
+        executor = RecordingExecutor(client.log)
+
+        agent = BuilderAgent(
+            client, executor, streaming=True, retry_policy=RetryPolicy(base_delay=0.001)
+        )
+        result = await agent.execute({"title": "Retry"})
+
+        assert result.status == AgentStatus.COMPLETED
+        assert result.rate_limit_retries == 1
+        # The read from the aborted response is not recorded as a tool call
+        assert result.tool_calls == []
+
+    @pytest.mark.asyncio
+    async def test_streaming_ignored_without_stream_complete(self) -> None:
+        client = MagicMock(spec=["complete"])
+        client.complete = AsyncMock(return_value=LLMResponse(
+            content="<task_complete>DONE</task_complete>", stop_reason=StopReason.END_TURN
+        ))
+        thoughts: list[str] = []
+
+        agent = BuilderAgent(client, streaming=True, on_thinking=thoughts.append)
+        result = await agent.execute({"title": "Blocking"})
+
+        assert result.status == AgentStatus.COMPLETED
+        assert thoughts == ["<task_complete>DONE</task_complete>"]
+
 
 class TestBuilderAgentBuildAssistantMessage:
     """Tests for _build_assistant_message method."""
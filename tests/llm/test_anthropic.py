@@ -527,3 +527,395 @@ class TestComplete:
 
             call_kwargs = mock_client.messages.create.call_args[1]
             assert call_kwargs["stop_sequences"] == ["STOP", "END"]
+
+
+class MockCacheUsage(MockUsage):
+    """Mock for Anthropic usage with prompt cache fields."""
+
+    def __init__(self, input_tokens: int, output_tokens: int, read: int, write: int):
+        super().__init__(input_tokens, output_tokens)
+        self.cache_read_input_tokens = read
+        self.cache_creation_input_tokens = write
+
+
+class FakeCachingMessages:
+    """Local stand-in for ``messages.create`` that models prompt caching.
+
+    The prompt is the sequence tools -> system -> message blocks. A
+    cache_control breakpoint stores the prefix ending at it; a later
+    request reads the longest stored prefix that ends at one of its own
+    breakpoints. Tokens are approximated as JSON length / 4.
+    """
+
+    def __init__(self, responses: list[MockResponse]):
+        self._responses = list(responses)
+        self._cache: set[str] = set()
+        self.requests: list[dict[str, Any]] = []
+
+    @staticmethod
+    def _blocks(kwargs: dict[str, Any]) -> list[tuple[dict[str, Any], bool]]:
+        def strip(block: dict[str, Any]) -> dict[str, Any]:
+            return {k: v for k, v in block.items() if k != "cache_control"}
+
+        blocks = [(strip(t), "cache_control" in t) for t in kwargs.get("tools", [])]
+        system = kwargs.get("system")
+        if isinstance(system, str):
+            blocks.append(({"type": "text", "text": system}, False))
+        elif system:
+            blocks.extend((strip(b), "cache_control" in b) for b in system)
+        for message in kwargs["messages"]:
+            content = message["content"]
+            if isinstance(content, str):
+                content = [{"type": "text", "text": content}]
+            blocks.extend(
+                ({"role": message["role"], **strip(b)}, "cache_control" in b) for b in content
+            )
+        return blocks
+
+    async def create(self, **kwargs: Any) -> MockResponse:
+        import hashlib
+        import json
+
+        self.requests.append(kwargs)
+        blocks = self._blocks(kwargs)
+        sizes = [len(json.dumps(b, sort_keys=True)) // 4 for b, _ in blocks]
+        digest = hashlib.sha1()
+        keys = []
+        for block, _ in blocks:
+            digest.update(json.dumps(block, sort_keys=True).encode())
+            keys.append(digest.hexdigest())
+
+        marked = [i + 1 for i, (_, m) in enumerate(blocks) if m]
+        read_end = max((end for end in marked if keys[end - 1] in self._cache), default=0)
+        write_end = max(marked, default=0)
+        self._cache.update(keys[end - 1] for end in marked)
+
+        read = sum(sizes[:read_end])
+        write = sum(sizes[read_end:write_end])
+        uncached = sum(sizes[max(read_end, write_end):])
+
+        response = self._responses.pop(0)
+        response.usage = MockCacheUsage(uncached, response.usage.output_tokens, read, write)
+        return response
+
+
+def cache_breakpoints(kwargs: dict[str, Any]) -> int:
+    return sum(marked for _, marked in FakeCachingMessages._blocks(kwargs))
+
+
+class TestPromptCaching:
+    """Tests for prompt-cache-aware request layout."""
+
+    def _client(self, mock_anthropic_module, responses) -> tuple[AnthropicClient, FakeCachingMessages]:
+        fake = FakeCachingMessages(responses)
+        mock_client = MagicMock()
+        mock_client.messages.create = fake.create
+        mock_anthropic_module.AsyncAnthropic.return_value = mock_client
+        return AnthropicClient(api_key="sk-ant-test", prompt_caching=True), fake
+
+    def test_disabled_by_default(self) -> None:
+        client = AnthropicClient()
+        kwargs = client._build_request(
+            [{"role": "user", "content": "Hi"}], "System", None, 100, 0.0
+        )
+
+        assert kwargs["system"] == "System"
+        assert kwargs["messages"] == [{"role": "user", "content": "Hi"}]
+
+    def test_request_layout(self) -> None:
+        client = AnthropicClient(prompt_caching=True)
+        tools = [
+            Tool(name="read_file", description="Read", input_schema={}),
+            Tool(name="write_file", description="Write", input_schema={}),
+        ]
+        messages = [
+            {"role": "user", "content": "Task"},
+            {"role": "assistant", "content": [{"type": "tool_use", "id": "t1", "name": "read_file", "input": {}}]},
+            {"role": "user", "content": [{"type": "tool_result", "tool_use_id": "t1", "content": "data"}]},
+        ]
+
+        kwargs = client._build_request(messages, "System", tools, 100, 0.0)
+
+        assert kwargs["system"] == [
+            {"type": "text", "text": "System", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert "cache_control" not in kwargs["tools"][0]
+        assert kwargs["tools"][1]["cache_control"] == {"type": "ephemeral"}
+        sent = kwargs["messages"]
+        assert sent[0]["content"][0]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in sent[1]["content"][0]
+        assert sent[2]["content"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert cache_breakpoints(kwargs) == 4
+        # Caller's history is left untouched
+        assert messages[0]["content"] == "Task"
+        assert "cache_control" not in messages[2]["content"][0]
+
+    def test_empty_message_not_marked(self) -> None:
+        client = AnthropicClient(prompt_caching=True)
+        kwargs = client._build_request([{"role": "user", "content": ""}], None, None, 100, 0.0)
+
+        assert kwargs["messages"] == [{"role": "user", "content": ""}]
+
+    def test_parse_cache_usage(self) -> None:
+        client = AnthropicClient()
+        response = MockResponse(content=[MockTextBlock("ok")], stop_reason="end_turn",
+                                input_tokens=10, output_tokens=5)
+        response.usage = MockCacheUsage(10, 5, read=900, write=100)
+
+        result = client._parse_response(response)
+
+        assert result.cache_read_tokens == 900
+        assert result.cache_write_tokens == 100
+        assert result.total_tokens == 15
+
+    def test_parse_usage_without_cache_fields(self) -> None:
+        client = AnthropicClient()
+        response = MockResponse(content=[MockTextBlock("ok")], stop_reason="end_turn",
+                                input_tokens=10, output_tokens=5)
+
+        result = client._parse_response(response)
+
+        assert result.cache_read_tokens == 0
+        assert result.cache_write_tokens == 0
+
+    @pytest.mark.asyncio
+    async def test_builder_loop_reads_prefix_from_cache(self, mock_anthropic_module) -> None:
+        from ralph_agi.llm.agents import BuilderAgent
+
+        steps = 8
+        responses = [
+            MockResponse(
+                content=[MockToolUseBlock(f"t{i}", "read_file", {"path": f"src/mod_{i}.py"})],
+                stop_reason="tool_use",
+                input_tokens=0,
+                output_tokens=20,
+            )
+            for i in range(steps)
+        ]
+        responses.append(MockResponse(
+            content=[MockTextBlock("<task_complete>DONE</task_complete>")],
+            stop_reason="end_turn",
+            input_tokens=0,
+            output_tokens=10,
+        ))
+
+        class Executor:
+            async def execute(self, tool_name, arguments=None):
+                return "x = 1\n" * 200
+
+        tools = [
+            Tool(name="read_file", description="Read a file " * 50, input_schema={"type": "object"}),
+        ]
+        with patch.dict(sys.modules, {"anthropic": mock_anthropic_module}):
+            client, fake = self._client(mock_anthropic_module, responses)
+            builder = BuilderAgent(client, Executor(), max_iterations=steps + 1)
+            result = await builder.execute({"title": "Refactor", "description": "Refactor modules"}, tools)
+
+        assert result.is_complete
+        assert all(cache_breakpoints(r) <= 4 for r in fake.requests)
+        # Every call after the first reuses the previous prefix
+        prompt = result.input_tokens + result.cache_read_tokens + result.cache_write_tokens
+        assert result.cache_read_tokens / prompt > 0.7
+        assert result.input_tokens == 0
+
+
+class TestRateGovernorIntegration:
+    """Tests for consulting a RateGovernor around calls."""
+
+    @pytest.mark.asyncio
+    async def test_usage_reported_to_governor(self, mock_anthropic_module) -> None:
+        from ralph_agi.llm.rate_limit import RateGovernor, RateLimits
+
+        governor = RateGovernor(RateLimits(requests_per_minute=10, tokens_per_minute=10_000))
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(return_value=MockResponse(
+            content=[MockTextBlock("ok")], stop_reason="end_turn",
+            input_tokens=1200, output_tokens=300,
+        ))
+        mock_anthropic_module.AsyncAnthropic.return_value = mock_client
+
+        with patch.dict(sys.modules, {"anthropic": mock_anthropic_module}):
+            client = AnthropicClient(api_key="sk-ant-test", model="claude-x", governor=governor)
+            await client.complete([{"role": "user", "content": "Hi"}])
+
+        bucket = governor.snapshot()["anthropic:claude-x"]
+        assert bucket["requests"] == pytest.approx(9, abs=0.01)
+        assert bucket["tokens"] == pytest.approx(10_000 - 1500, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_cache_writes_charged_to_governor(self, mock_anthropic_module) -> None:
+        from ralph_agi.llm.rate_limit import RateGovernor, RateLimits
+
+        governor = RateGovernor(RateLimits(tokens_per_minute=10_000))
+        response = MockResponse(
+            content=[MockTextBlock("ok")], stop_reason="end_turn",
+            input_tokens=200, output_tokens=300,
+        )
+        response.usage.cache_creation_input_tokens = 1000
+        response.usage.cache_read_input_tokens = 4000
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(return_value=response)
+        mock_anthropic_module.AsyncAnthropic.return_value = mock_client
+
+        with patch.dict(sys.modules, {"anthropic": mock_anthropic_module}):
+            client = AnthropicClient(api_key="sk-ant-test", model="claude-x", governor=governor)
+            await client.complete([{"role": "user", "content": "Hi"}])
+
+        bucket = governor.snapshot()["anthropic:claude-x"]
+        assert bucket["tokens"] == pytest.approx(10_000 - 1500, abs=1)
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_pauses_governor(self, mock_anthropic_module) -> None:
+        from ralph_agi.llm.rate_limit import RateGovernor, RateLimits
+
+        governor = RateGovernor(RateLimits(requests_per_minute=10))
+        error = mock_anthropic_module.RateLimitError("Too many requests")
+        error.response = MagicMock()
+        error.response.headers = {"retry-after": "20"}
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(side_effect=error)
+        mock_anthropic_module.AsyncAnthropic.return_value = mock_client
+
+        with patch.dict(sys.modules, {"anthropic": mock_anthropic_module}):
+            client = AnthropicClient(api_key="sk-ant-test", model="claude-x", governor=governor)
+            with pytest.raises(RateLimitError):
+                await client.complete([{"role": "user", "content": "Hi"}])
+
+        reservation, wait = governor.try_acquire("anthropic", "claude-x", 1)
+        assert reservation is None
+        assert wait == pytest.approx(20, abs=1)
+
+
+def _stream(*events: Any):
+    """Async iterator over raw stream events."""
+
+    async def gen():
+        for event in events:
+            yield event
+
+    return gen()
+
+
+def _ns(**kwargs: Any) -> Any:
+    from types import SimpleNamespace
+
+    return SimpleNamespace(**kwargs)
+
+
+def _tool_use_events(index: int, tool_id: str, name: str, json_parts: list[str]) -> list[Any]:
+    return [
+        _ns(type="content_block_start", index=index,
+            content_block=_ns(type="tool_use", id=tool_id, name=name)),
+        *(
+            _ns(type="content_block_delta", index=index,
+                delta=_ns(type="input_json_delta", partial_json=part))
+            for part in json_parts
+        ),
+        _ns(type="content_block_stop", index=index),
+    ]
+
+
+class TestStreamComplete:
+    """Tests for streaming completions with tool calls."""
+
+    @pytest.mark.asyncio
+    async def test_streams_text_and_tool_calls(self, mock_anthropic_module) -> None:
+        from ralph_agi.llm.client import StreamEventType
+
+        events = [
+            _ns(type="message_start", message=_ns(
+                model="claude-x",
+                usage=_ns(input_tokens=900, output_tokens=1, cache_read_input_tokens=4000),
+            )),
+            _ns(type="content_block_start", index=0, content_block=_ns(type="text", text="")),
+            _ns(type="content_block_delta", index=0, delta=_ns(type="text_delta", text="Reading ")),
+            _ns(type="content_block_delta", index=0, delta=_ns(type="text_delta", text="both files")),
+            _ns(type="content_block_stop", index=0),
+            *_tool_use_events(1, "t1", "read_file", ['{"pa', 'th": "a.py"}']),
+            *_tool_use_events(2, "t2", "read_file", ['{"path": "b.py"}']),
+            _ns(type="message_delta", delta=_ns(stop_reason="tool_use"), usage=_ns(output_tokens=75)),
+            _ns(type="message_stop"),
+        ]
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(return_value=_stream(*events))
+        mock_anthropic_module.AsyncAnthropic.return_value = mock_client
+
+        with patch.dict(sys.modules, {"anthropic": mock_anthropic_module}):
+            client = AnthropicClient(api_key="sk-ant-test")
+            received = [e async for e in client.stream_complete([{"role": "user", "content": "Go"}])]
+
+        assert mock_client.messages.create.call_args.kwargs["stream"] is True
+        assert [e.type for e in received] == [
+            StreamEventType.TEXT,
+            StreamEventType.TEXT,
+            StreamEventType.TOOL_CALL,
+            StreamEventType.TOOL_CALL,
+            StreamEventType.DONE,
+        ]
+        assert received[2].tool_call.arguments == {"path": "a.py"}
+        response = received[-1].response
+        assert response.content == "Reading both files"
+        assert [tc.id for tc in response.tool_calls] == ["t1", "t2"]
+        assert response.stop_reason == StopReason.TOOL_USE
+        assert response.input_tokens == 900
+        assert response.output_tokens == 75
+        assert response.cache_read_tokens == 4000
+        assert response.model == "claude-x"
+
+    @pytest.mark.asyncio
+    async def test_tool_call_yielded_before_stream_ends(self, mock_anthropic_module) -> None:
+        from ralph_agi.llm.client import StreamEventType
+
+        consumed: list[str] = []
+
+        async def slow_stream():
+            for event in _tool_use_events(0, "t1", "read_file", ['{"path": "a.py"}']):
+                consumed.append(event.type)
+                yield event
+            consumed.append("text")
+            yield _ns(type="content_block_delta", index=1, delta=_ns(type="text_delta", text="more"))
+
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(return_value=slow_stream())
+        mock_anthropic_module.AsyncAnthropic.return_value = mock_client
+
+        with patch.dict(sys.modules, {"anthropic": mock_anthropic_module}):
+            client = AnthropicClient(api_key="sk-ant-test")
+            async for event in client.stream_complete([{"role": "user", "content": "Go"}]):
+                if event.type == StreamEventType.TOOL_CALL:
+                    assert "text" not in consumed
+                    break
+
+    @pytest.mark.asyncio
+    async def test_empty_and_malformed_tool_input(self, mock_anthropic_module) -> None:
+        events = [
+            *_tool_use_events(0, "t1", "git_status", []),
+            *_tool_use_events(1, "t2", "read_file", ['{"path": ']),
+        ]
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(return_value=_stream(*events))
+        mock_anthropic_module.AsyncAnthropic.return_value = mock_client
+
+        with patch.dict(sys.modules, {"anthropic": mock_anthropic_module}):
+            client = AnthropicClient(api_key="sk-ant-test")
+            received = [e async for e in client.stream_complete([{"role": "user", "content": "Go"}])]
+
+        response = received[-1].response
+        assert [tc.arguments for tc in response.tool_calls] == [{}, {}]
+
+    @pytest.mark.asyncio
+    async def test_stream_errors_are_mapped(self, mock_anthropic_module) -> None:
+        error = mock_anthropic_module.RateLimitError("Too many requests")
+        error.response = MagicMock()
+        error.response.headers = {"retry-after": "3"}
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(side_effect=error)
+        mock_anthropic_module.AsyncAnthropic.return_value = mock_client
+
+        with patch.dict(sys.modules, {"anthropic": mock_anthropic_module}):
+            client = AnthropicClient(api_key="sk-ant-test")
+            with pytest.raises(RateLimitError) as exc_info:
+                async for _ in client.stream_complete([{"role": "user", "content": "Go"}]):
+                    pass
+
+        assert exc_info.value.retry_after == 3.0
@@ -0,0 +1,122 @@
+"""Tests for the rolling Builder conversation window."""
+
+from __future__ import annotations
+
+import copy
+from typing import Any
+
+import pytest
+
+from ralph_agi.llm.context_window import ConversationWindow, message_tokens
+
+
+def tool_round(call_id: str, name: str, arguments: dict[str, Any], result: str) -> list[dict[str, Any]]:
+    """Assistant tool_use message plus the user tool_result message."""
+    return [
+        {
+            "role": "assistant",
+            "content": [{"type": "tool_use", "id": call_id, "name": name, "input": arguments}],
+        },
+        {
+            "role": "user",
+            "content": [{"type": "tool_result", "tool_use_id": call_id, "content": result, "is_error": False}],
+        },
+    ]
+
+
+def file_body(lines: int) -> str:
+    return "\n".join(f"line {i} = compute(value_{i})" for i in range(lines))
+
+
+def result_content(messages: list[dict[str, Any]], call_id: str) -> str:
+    for message in messages:
+        if isinstance(message["content"], list):
+            for block in message["content"]:
+                if block.get("tool_use_id") == call_id:
+                    return block["content"]
+    raise KeyError(call_id)
+
+
+class TestConversationWindow:
+    """Tests for ConversationWindow.fit."""
+
+    def test_under_budget_unchanged(self):
+        messages = [{"role": "user", "content": "Task"}, *tool_round("t1", "read_file", {"path": "a.py"}, "x = 1")]
+        window = ConversationWindow(max_tokens=10_000)
+
+        assert window.fit(messages) == messages
+        assert window.last_stats.tokens_saved == 0
+
+    def test_superseded_read_elided_first(self):
+        messages = [{"role": "user", "content": "Task"}]
+        messages += tool_round("t1", "read_file", {"path": "src/app.py"}, file_body(400))
+        messages += tool_round("t2", "read_file", {"path": "src/other.py"}, file_body(400))
+        messages += tool_round("t3", "edit_file", {"path": "src/app.py"}, "Edited src/app.py")
+        for i in range(3):
+            messages += tool_round(f"r{i}", "list_directory", {"path": f"d{i}"}, "a\nb")
+        full = sum(message_tokens(m) for m in messages)
+        window = ConversationWindow(max_tokens=full - 1, keep_turns=3)
+
+        sent = window.fit(messages)
+
+        stub = result_content(sent, "t1")
+        assert stub.startswith("[read_file src/app.py, 400 lines, superseded by later edit_file")
+        assert result_content(sent, "t2") == file_body(400)  # Target reached after t1
+        assert window.last_stats.newly_elided == 1
+        assert window.last_stats.prompt_tokens < full
+
+    def test_recent_turns_kept_verbatim(self):
+        messages = [{"role": "user", "content": "Task"}]
+        for i in range(5):
+            messages += tool_round(f"t{i}", "read_file", {"path": f"m{i}.py"}, file_body(300))
+        window = ConversationWindow(max_tokens=100, keep_turns=2)
+
+        sent = window.fit(messages)
+
+        assert [result_content(sent, f"t{i}").startswith("[read_file") for i in range(5)] == [
+            True, True, True, False, False
+        ]
+        assert sent[0] == messages[0]
+
+    def test_command_stub_keeps_last_line(self):
+        output = "\n".join(f"test_{i} PASSED" for i in range(200)) + "\n200 passed in 3.1s\n"
+        messages = [{"role": "user", "content": "Task"}]
+        messages += tool_round("t1", "run_command", {"command": "pytest -q"}, output)
+        messages += tool_round("t2", "list_directory", {"path": "."}, "a")
+        window = ConversationWindow(max_tokens=50, keep_turns=1)
+
+        stub = result_content(window.fit(messages), "t1")
+
+        assert stub.startswith("[run_command pytest -q, 202 lines, last line: '200 passed in 3.1s'")
+
+    def test_elision_is_sticky_and_input_not_mutated(self):
+        messages = [{"role": "user", "content": "Task"}]
+        for i in range(4):
+            messages += tool_round(f"t{i}", "read_file", {"path": f"m{i}.py"}, file_body(300))
+        original = copy.deepcopy(messages)
+        window = ConversationWindow(max_tokens=6000, keep_turns=1)
+
+        first = window.fit(messages)
+        assert window.elided_count > 0
+        messages += tool_round("t9", "list_directory", {"path": "."}, "a")
+        second = window.fit(messages)
+
+        assert messages[: len(original)] == original
+        assert second[: len(first)] == first  # Stable prefix for prompt caching
+        assert window.last_stats.newly_elided == 0
+
+    def test_small_results_not_stubbed(self):
+        messages = [{"role": "user", "content": "Task " * 400}]
+        for i in range(4):
+            messages += tool_round(f"t{i}", "git_status", {}, "clean")
+        window = ConversationWindow(max_tokens=100, keep_turns=0)
+
+        assert window.fit(messages) == messages
+        assert window.elided_count == 0
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"max_tokens": 0}, {"keep_turns": -1}, {"target_ratio": 0}, {"target_ratio": 1.5}]
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            ConversationWindow(**kwargs)
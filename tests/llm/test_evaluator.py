@@ -2,15 +2,18 @@
 
 from __future__ import annotations
 
+import subprocess
 from pathlib import Path
 
 import pytest
 
 from ralph_agi.llm.evaluator import (
+    CriteriaEvaluator,
     CriterionResult,
     EvaluationResult,
     check_file_content,
     check_line_count,
+    classify_criterion,
     evaluate_acceptance_criteria,
     evaluate_criterion,
     extract_command,
@@ -293,6 +296,144 @@ class TestEvaluateAcceptanceCriteria:
         assert result.manual_count == 1
 
 
+class TestEvaluationTimings:
+    """Tests for timing information."""
+
+    def test_criterion_duration_recorded(self):
+        """Test command criteria report their run time."""
+        result = evaluate_criterion("Running 'sleep 0.05' passes")
+        assert result.duration_ms >= 50
+
+    def test_total_duration_recorded(self):
+        """Test evaluation reports wall-clock duration."""
+        result = evaluate_acceptance_criteria(["Running 'sleep 0.05' passes"])
+        assert result.duration_ms >= 50
+
+
+class TestClassifyCriterion:
+    """Tests for classify_criterion."""
+
+    def test_methods(self):
+        assert classify_criterion("Running 'ls' passes") == ("command", ("ls",))
+        assert classify_criterion("a.py contains at least 3 lines")[0] == "line_count"
+        assert classify_criterion("a.py exists") == ("file_check", ("a.py", None))
+        assert classify_criterion("It is nice") == ("manual", ())
+
+
+class TestCriteriaEvaluator:
+    """Tests for concurrent, cached evaluation."""
+
+    def test_commands_run_in_order(self, tmp_path: Path):
+        """Test a command can read what an earlier command produced."""
+        evaluator = CriteriaEvaluator(work_dir=tmp_path, max_workers=4)
+        criteria = [
+            'Running "sleep 0.5 && mkdir -p dist && echo ok > dist/out.txt" passes',
+            'Running "cat dist/out.txt" passes',
+        ]
+
+        result = evaluator.evaluate(criteria)
+
+        assert result.passed is True
+        assert [r.criterion for r in result.results] == criteria
+
+    def test_unchanged_passes_are_reused(self, tmp_path: Path):
+        """Test passing criteria are not re-run when inputs are unchanged."""
+        work = tmp_path / "work"
+        work.mkdir()
+        (work / "app.py").write_text("print('hi')\n")
+        evaluator = CriteriaEvaluator(work_dir=work)
+        criteria = [
+            "Running 'echo run >> ../runs.log' passes",
+            "app.py contains 'hi'",
+        ]
+
+        first = evaluator.evaluate(criteria)
+        second = evaluator.evaluate(criteria)
+
+        assert first.cached_count == 0
+        assert second.cached_count == 2
+        assert all(r.duration_ms == 0 for r in second.results)
+        assert (tmp_path / "runs.log").read_text().count("run") == 1
+
+    def test_changed_file_invalidates(self, tmp_path: Path):
+        """Test a check is re-run when the file it reads changes."""
+        target = tmp_path / "app.py"
+        target.write_text("hello\n")
+        evaluator = CriteriaEvaluator(work_dir=tmp_path)
+
+        assert evaluator.evaluate(["app.py contains 'hello'"]).passed is True
+
+        target.write_text("goodbye\n")
+        result = evaluator.evaluate(["app.py contains 'hello'"])
+
+        assert result.passed is False
+        assert result.cached_count == 0
+
+    def test_workspace_change_reruns_commands(self, tmp_path: Path):
+        """Test commands re-run when any workspace file changes."""
+        evaluator = CriteriaEvaluator(work_dir=tmp_path)
+        criteria = ["Running 'test -f flag.txt' passes"]
+
+        (tmp_path / "flag.txt").write_text("")
+        assert evaluator.evaluate(criteria).passed is True
+
+        (tmp_path / "flag.txt").unlink()
+        assert evaluator.evaluate(criteria).passed is False
+
+    def test_command_outputs_do_not_defeat_cache(self, tmp_path: Path):
+        """Test files written by a passing command don't force a re-run."""
+        evaluator = CriteriaEvaluator(work_dir=tmp_path)
+        criteria = ["Running 'date +%N > stamp.txt' passes"]
+
+        evaluator.evaluate(criteria)
+        assert evaluator.evaluate(criteria).cached_count == 1
+
+    def test_git_work_tree_signature(self, tmp_path: Path):
+        """Test a git work tree is tracked through git, skipping ignored files."""
+        if subprocess.run(["git", "init", "-q", str(tmp_path)]).returncode != 0:
+            pytest.skip("git not available")
+        (tmp_path / ".gitignore").write_text("build/\n")
+        (tmp_path / "app.py").write_text("print('hi')\n")
+        subprocess.run(["git", "add", "."], cwd=tmp_path, check=True)
+        (tmp_path / "build").mkdir()
+        (tmp_path / "build" / "out.bin").write_bytes(b"x")
+        evaluator = CriteriaEvaluator(work_dir=tmp_path)
+        criteria = ["Running 'true' passes"]
+
+        evaluator.evaluate(criteria)
+        (tmp_path / "build" / "out.bin").write_bytes(b"changed")
+        assert evaluator.evaluate(criteria).cached_count == 1
+
+        (tmp_path / "app.py").write_text("print('bye')\n")
+        assert evaluator.evaluate(criteria).cached_count == 0
+
+        (tmp_path / "notes.txt").write_text("untracked")
+        assert evaluator.evaluate(criteria).cached_count == 0
+        assert evaluator.evaluate(criteria).cached_count == 1
+
+    def test_failures_are_always_rerun(self, tmp_path: Path):
+        """Test failed criteria are not cached."""
+        work = tmp_path / "work"
+        work.mkdir()
+        evaluator = CriteriaEvaluator(work_dir=work)
+        criteria = ["Running 'test -f ../outside.txt' passes"]
+
+        assert evaluator.evaluate(criteria).passed is False
+        (tmp_path / "outside.txt").write_text("")
+        assert evaluator.evaluate(criteria).passed is True
+
+    def test_fail_fast_keeps_order(self, tmp_path: Path):
+        """Test fail_fast stops at the first failure in criteria order."""
+        evaluator = CriteriaEvaluator(work_dir=tmp_path)
+        result = evaluator.evaluate(
+            ["Running 'true' passes", "Running 'false' passes", "Running 'true' passes"],
+            fail_fast=True,
+        )
+
+        assert result.passed is False
+        assert len(result.results) == 2
+
+
 def test_criterion_mentions_keyword():
     """Test the criterion_mentions_keyword function."""
     assert criterion_mentions_keyword("The code should be clean and efficient", "clean") is True
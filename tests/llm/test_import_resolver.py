@@ -0,0 +1,105 @@
+"""Tests for the import resolver."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from ralph_agi.llm.import_resolver import ImportResolver, get_import_resolver
+
+
+@pytest.fixture
+def resolver():
+    return ImportResolver()
+
+
+class TestImportResolver:
+    """Tests for in-process resolution."""
+
+    def test_stdlib_and_builtin(self, resolver, tmp_path: Path):
+        assert resolver.resolve("os", tmp_path) is True
+        assert resolver.resolve("sys", tmp_path) is True
+        assert resolver.resolve("json", tmp_path) is True
+
+    def test_missing_module(self, resolver, tmp_path: Path):
+        assert resolver.resolve("definitely_not_a_module_xyz", tmp_path) is False
+
+    def test_sibling_module_resolves_from_directory(self, resolver, tmp_path: Path):
+        (tmp_path / "helpers.py").write_text("X = 1\n")
+
+        assert resolver.resolve("helpers", tmp_path) is True
+        assert resolver.resolve("helpers", tmp_path / "elsewhere") is False
+
+    def test_does_not_import_module(self, resolver, tmp_path: Path):
+        (tmp_path / "side_effect_mod.py").write_text("raise SystemExit('executed')\n")
+
+        assert resolver.resolve("side_effect_mod", tmp_path) is True
+        assert "side_effect_mod" not in sys.modules
+
+    def test_cache_hits(self, resolver, tmp_path: Path):
+        resolver.missing(["os", "json"], tmp_path)
+        resolver.missing(["os", "json"], tmp_path)
+
+        assert resolver.misses == 2
+        assert resolver.hits == 2
+
+    def test_new_module_invalidates_negative_result(self, resolver, tmp_path: Path):
+        assert resolver.resolve("late_module", tmp_path) is False
+
+        (tmp_path / "late_module.py").write_text("")
+        # Ensure the directory mtime differs even on coarse filesystems
+        stat = os.stat(tmp_path)
+        os.utime(tmp_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        assert resolver.resolve("late_module", tmp_path) is True
+
+    def test_missing_returns_sorted_names(self, resolver, tmp_path: Path):
+        missing = resolver.missing(["zz_missing_mod", "os", "aa_missing_mod"], tmp_path)
+
+        assert missing == ["aa_missing_mod", "zz_missing_mod"]
+
+    def test_search_path_starts_with_directory(self, resolver, tmp_path: Path):
+        assert resolver.search_path(tmp_path)[0] == str(tmp_path)
+
+    def test_default_resolver_is_shared(self):
+        assert get_import_resolver() is get_import_resolver()
+
+
+class TestIsolatedResolver:
+    """Tests for the worker subprocess path."""
+
+    @pytest.fixture
+    def isolated(self):
+        resolver = ImportResolver(isolated=True)
+        yield resolver
+        resolver.close()
+
+    def test_resolves_in_worker(self, isolated, tmp_path: Path):
+        (tmp_path / "helpers.py").write_text("")
+
+        assert isolated.isolated is True
+        assert isolated.missing(["os", "helpers", "nope_xyz_mod"], tmp_path) == ["nope_xyz_mod"]
+
+    def test_worker_is_reused(self, isolated, tmp_path: Path):
+        isolated.resolve("os", tmp_path)
+        worker = isolated._worker
+        isolated.resolve("json", tmp_path)
+
+        assert isolated._worker is worker
+
+    def test_worker_restarts_after_exit(self, isolated, tmp_path: Path):
+        isolated.resolve("os", tmp_path)
+        isolated._worker.kill()
+        isolated._worker.wait()
+
+        assert isolated.resolve("json", tmp_path) is True
+
+    def test_other_interpreter_is_isolated(self, tmp_path: Path):
+        link = tmp_path / "python"
+        link.symlink_to(sys.executable)
+        # realpath resolves the symlink back to the same interpreter
+        assert ImportResolver(interpreter=str(link)).isolated is False
+        assert ImportResolver(interpreter="/nonexistent/python").isolated is True
@@ -706,3 +706,91 @@ class TestComplete:
 
             call_args = mock_create.call_args[1]
             assert call_args["stop"] == ["END", "STOP"]
+
+
+def _chunk(content: str | None = None, tool_calls: list | None = None,
+           finish_reason: str | None = None, usage: Any = None) -> Any:
+    from types import SimpleNamespace
+
+    choices = []
+    if content is not None or tool_calls is not None or finish_reason is not None:
+        choices = [SimpleNamespace(
+            delta=SimpleNamespace(content=content, tool_calls=tool_calls),
+            finish_reason=finish_reason,
+        )]
+    return SimpleNamespace(choices=choices, usage=usage, model="gpt-4o-2024")
+
+
+def _tool_delta(index: int, id: str | None = None, name: str | None = None,
+                arguments: str | None = None) -> Any:
+    from types import SimpleNamespace
+
+    return SimpleNamespace(
+        index=index, id=id, function=SimpleNamespace(name=name, arguments=arguments)
+    )
+
+
+class TestStreamComplete:
+    """Tests for streaming completions with tool calls."""
+
+    @pytest.mark.asyncio
+    async def test_streams_text_and_tool_calls(self, mock_openai_module: Any) -> None:
+        from types import SimpleNamespace
+
+        from ralph_agi.llm.client import StreamEventType
+
+        chunks = [
+            _chunk(content="Checking"),
+            _chunk(tool_calls=[_tool_delta(0, "c1", "read_file", '{"path":')]),
+            _chunk(tool_calls=[_tool_delta(0, arguments=' "a.py"}')]),
+            _chunk(tool_calls=[_tool_delta(1, "c2", "edit_file", '{"path": "a.py"}')]),
+            _chunk(finish_reason="tool_calls"),
+            _chunk(usage=SimpleNamespace(prompt_tokens=500, completion_tokens=40)),
+        ]
+        order: list[str] = []
+
+        async def stream():
+            for index, chunk in enumerate(chunks):
+                order.append(f"chunk{index}")
+                yield chunk
+
+        with patch.dict(sys.modules, {"openai": mock_openai_module}):
+            from ralph_agi.llm.openai import OpenAIClient
+
+            mock_create = AsyncMock(return_value=stream())
+            mock_openai_module.AsyncOpenAI.return_value.chat.completions.create = mock_create
+            client = OpenAIClient(api_key="sk-test")
+
+            received = []
+            async for event in client.stream_complete([{"role": "user", "content": "Hi"}]):
+                received.append(event)
+                order.append(event.type.value)
+
+        call_args = mock_create.call_args[1]
+        assert call_args["stream"] is True
+        assert call_args["stream_options"] == {"include_usage": True}
+        # The first call is yielded as soon as the second one starts
+        assert order.index("tool_call") == order.index("chunk3") + 1
+        tool_events = [e for e in received if e.type == StreamEventType.TOOL_CALL]
+        assert [e.tool_call.arguments for e in tool_events] == [{"path": "a.py"}, {"path": "a.py"}]
+        response = received[-1].response
+        assert received[-1].type == StreamEventType.DONE
+        assert response.content == "Checking"
+        assert [tc.name for tc in response.tool_calls] == ["read_file", "edit_file"]
+        assert response.stop_reason == StopReason.TOOL_USE
+        assert response.input_tokens == 500
+        assert response.output_tokens == 40
+
+    @pytest.mark.asyncio
+    async def test_stream_errors_are_mapped(self, mock_openai_module: Any) -> None:
+        with patch.dict(sys.modules, {"openai": mock_openai_module}):
+            from ralph_agi.llm.openai import OpenAIClient
+
+            mock_openai_module.AsyncOpenAI.return_value.chat.completions.create = AsyncMock(
+                side_effect=mock_openai_module.AuthenticationError("bad key")
+            )
+            client = OpenAIClient(api_key="sk-test")
+
+            with pytest.raises(AuthenticationError):
+                async for _ in client.stream_complete([{"role": "user", "content": "Hi"}]):
+                    pass
@@ -60,6 +60,8 @@ def completed_builder_result(sample_task: dict[str, Any]) -> BuilderResult:
         task=sample_task,
         iterations=3,
         total_tokens=500,
+        input_tokens=380,
+        output_tokens=120,
         files_changed=["/src/form.py"],
     )
 
@@ -118,10 +120,40 @@ class TestTokenUsage:
     def test_add_builder_usage(self) -> None:
         """Test adding Builder token usage."""
         usage = TokenUsage()
-        usage.add_builder_usage(1000)
+        usage.add_builder_usage(700, 300)
+        usage.add_builder_usage(100, 50)
 
-        assert usage.builder_input == 700  # 70%
-        assert usage.builder_output == 300  # 30%
+        assert usage.builder_input == 800
+        assert usage.builder_output == 350
+
+    def test_cache_hit_ratio(self) -> None:
+        """Test cache hit ratio over Builder prompt tokens."""
+        usage = TokenUsage(builder_input=100)
+        usage.add_builder_cache_usage(read=800, write=100)
+
+        assert usage.builder_cache_read == 800
+        assert usage.builder_cache_write == 100
+        assert usage.cache_hit_ratio == pytest.approx(0.8)
+        assert TokenUsage().cache_hit_ratio == 0.0
+
+    def test_add_builder_window_usage(self) -> None:
+        """Test per-call prompt tracking from Builder results."""
+        usage = TokenUsage()
+        usage.add_builder_window_usage(BuilderResult(
+            status=AgentStatus.COMPLETED,
+            task={},
+            iterations=4,
+            input_tokens=1000,
+            cache_read_tokens=3000,
+            peak_prompt_tokens=1500,
+            context_tokens_saved=2500,
+        ))
+
+        assert usage.builder_calls == 4
+        assert usage.builder_prompt_per_call == 1000
+        assert usage.builder_peak_prompt == 1500
+        assert usage.builder_context_saved == 2500
+        assert TokenUsage().builder_prompt_per_call == 0.0
 
     def test_add_critic_usage(self) -> None:
         """Test adding Critic token usage."""
@@ -385,47 +417,65 @@ class TestOrchestratorExecuteTask:
         mock_critic.review.assert_not_called()
 
     @pytest.mark.asyncio
-    async def test_rate_limit_retry(
+    async def test_builder_not_rerun_on_rate_limit(
         self,
         mock_builder: MagicMock,
         sample_task: dict[str, Any],
-        completed_builder_result: BuilderResult,
     ) -> None:
-        """Test rate limit retry with eventual success."""
-        # First call fails, second succeeds
-        mock_builder.execute.side_effect = [
-            RateLimitError("Rate limited", retry_after=0.01),
-            completed_builder_result,
-        ]
+        """Test that a Builder raising RateLimitError is not re-run."""
+        mock_builder.execute.side_effect = RateLimitError("Rate limited")
 
         orchestrator = LLMOrchestrator(
             mock_builder,
-            base_retry_delay=0.01,  # Fast for testing
+            max_rate_limit_retries=2,
+            base_retry_delay=0.01,
         )
         result = await orchestrator.execute_task(sample_task)
 
-        assert result.status == OrchestratorStatus.COMPLETED_NO_REVIEW
-        assert result.rate_limit_retries == 1
-        assert mock_builder.execute.call_count == 2
+        assert result.status == OrchestratorStatus.ERROR
+        assert mock_builder.execute.call_count == 1
 
     @pytest.mark.asyncio
-    async def test_rate_limit_exhausted(
+    async def test_builder_call_retries_reported(
         self,
         mock_builder: MagicMock,
         sample_task: dict[str, Any],
+        completed_builder_result: BuilderResult,
     ) -> None:
-        """Test rate limit retries exhausted."""
-        mock_builder.execute.side_effect = RateLimitError("Rate limited")
+        """Test that call-level Builder retries don't re-run the Builder."""
+        completed_builder_result.rate_limit_retries = 2
+        mock_builder.execute.return_value = completed_builder_result
 
-        orchestrator = LLMOrchestrator(
-            mock_builder,
-            max_rate_limit_retries=2,
-            base_retry_delay=0.01,
+        orchestrator = LLMOrchestrator(mock_builder)
+        result = await orchestrator.execute_task(sample_task)
+
+        assert result.status == OrchestratorStatus.COMPLETED_NO_REVIEW
+        assert result.rate_limit_retries == 2
+        assert mock_builder.execute.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_builder_rate_limited(
+        self,
+        mock_builder: MagicMock,
+        sample_task: dict[str, Any],
+    ) -> None:
+        """Test that an exhausted Builder maps to MAX_RETRIES with its progress."""
+        mock_builder.execute.return_value = BuilderResult(
+            status=AgentStatus.RATE_LIMITED,
+            task=sample_task,
+            iterations=4,
+            files_changed=["a.py"],
+            rate_limit_retries=3,
+            error="Rate limited",
         )
+
+        orchestrator = LLMOrchestrator(mock_builder)
         result = await orchestrator.execute_task(sample_task)
 
         assert result.status == OrchestratorStatus.MAX_RETRIES
-        assert mock_builder.execute.call_count == 3  # Initial + 2 retries
+        assert result.files_changed == ["a.py"]
+        assert result.rate_limit_retries == 3
+        assert mock_builder.execute.call_count == 1
 
     @pytest.mark.asyncio
     async def test_token_usage_tracking(
@@ -444,9 +494,9 @@ class TestOrchestratorExecuteTask:
         result = await orchestrator.execute_task(sample_task)
 
         assert result.token_usage.total > 0
-        # Builder: 500 tokens (70% input, 30% output)
-        assert result.token_usage.builder_input == 350
-        assert result.token_usage.builder_output == 150
+        # Builder: reported input/output tokens, not an estimated split
+        assert result.token_usage.builder_input == 380
+        assert result.token_usage.builder_output == 120
         # Critic: 200 tokens (80% input, 20% output)
         assert result.token_usage.critic_input == 160
         assert result.token_usage.critic_output == 40
@@ -0,0 +1,240 @@
+"""Tests for the shared LLM rate governor."""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+import threading
+
+import pytest
+
+from ralph_agi.llm.client import RateLimitError
+from ralph_agi.llm.rate_limit import (
+    RateGovernor,
+    RateLimits,
+    governed_call,
+    shared_governor,
+)
+
+
+class FakeClock:
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _grant_count(state_path: str, attempts: int) -> int:
+    governor = RateGovernor(RateLimits(requests_per_minute=20), state_path=state_path)
+    return sum(governor.try_acquire("anthropic", "m", 1)[0] is not None for _ in range(attempts))
+
+
+class TestRateGovernor:
+    """Tests for token buckets, concurrency and pauses."""
+
+    def test_unlimited_grants_immediately(self):
+        governor = RateGovernor()
+
+        reservation, wait = governor.try_acquire("anthropic", "m", 10_000)
+
+        assert reservation is not None and wait == 0.0
+        governor.release(reservation, actual_tokens=10_000)
+        assert governor.snapshot() == {}
+
+    def test_requests_per_minute(self):
+        clock = FakeClock()
+        governor = RateGovernor(RateLimits(requests_per_minute=2), clock=clock)
+
+        assert governor.try_acquire("anthropic", "m", 1)[0] is not None
+        assert governor.try_acquire("anthropic", "m", 1)[0] is not None
+        reservation, wait = governor.try_acquire("anthropic", "m", 1)
+
+        assert reservation is None
+        assert wait == pytest.approx(30.0)
+        clock.now += 30
+        assert governor.try_acquire("anthropic", "m", 1)[0] is not None
+
+    def test_buckets_are_per_model(self):
+        governor = RateGovernor(RateLimits(requests_per_minute=1), clock=FakeClock())
+
+        assert governor.try_acquire("anthropic", "a", 1)[0] is not None
+        assert governor.try_acquire("anthropic", "b", 1)[0] is not None
+        assert governor.try_acquire("anthropic", "a", 1)[0] is None
+
+    def test_overrides(self):
+        governor = RateGovernor(
+            RateLimits(requests_per_minute=1),
+            overrides={"openai": RateLimits(), "anthropic:big": RateLimits(requests_per_minute=5)},
+        )
+
+        assert governor.limits_for("openai", "gpt-4o").unlimited
+        assert governor.limits_for("anthropic", "big").requests_per_minute == 5
+        assert governor.limits_for("anthropic", "small").requests_per_minute == 1
+
+    def test_actual_usage_settles_estimate(self):
+        clock = FakeClock()
+        governor = RateGovernor(RateLimits(tokens_per_minute=1000), clock=clock)
+
+        reservation, _ = governor.try_acquire("anthropic", "m", 100)
+        governor.release(reservation, actual_tokens=700)
+
+        assert governor.snapshot()["anthropic:m"]["tokens"] == pytest.approx(300)
+        reservation, wait = governor.try_acquire("anthropic", "m", 500)
+        assert reservation is None
+        assert wait == pytest.approx(12.0)  # 200 tokens at 1000/min
+
+    def test_failed_call_refunds_estimate(self):
+        governor = RateGovernor(RateLimits(tokens_per_minute=1000), clock=FakeClock())
+
+        reservation, _ = governor.try_acquire("anthropic", "m", 400)
+        governor.release(reservation)
+
+        assert governor.snapshot()["anthropic:m"]["tokens"] == pytest.approx(1000)
+
+    def test_oversized_call_waits_for_full_bucket(self):
+        clock = FakeClock()
+        governor = RateGovernor(RateLimits(tokens_per_minute=1000), clock=clock)
+
+        first, _ = governor.try_acquire("anthropic", "m", 5000)
+
+        assert first is not None
+        assert governor.try_acquire("anthropic", "m", 5000)[1] == pytest.approx(300.0)
+
+    def test_rate_limit_pauses_all_callers(self):
+        clock = FakeClock()
+        governor = RateGovernor(RateLimits(requests_per_minute=100), clock=clock)
+
+        reservation, _ = governor.try_acquire("anthropic", "m", 1)
+        governor.release(reservation, retry_after=10.0, rate_limited=True)
+
+        assert governor.try_acquire("anthropic", "m", 1) == (None, pytest.approx(10.0))
+        clock.now += 10
+        assert governor.try_acquire("anthropic", "m", 1)[0] is not None
+
+    def test_max_concurrent(self):
+        governor = RateGovernor(RateLimits(max_concurrent=2))
+
+        first, _ = governor.try_acquire("anthropic", "m", 1)
+        second, _ = governor.try_acquire("anthropic", "m", 1)
+
+        assert governor.try_acquire("anthropic", "m", 1)[0] is None
+        governor.release(first, actual_tokens=1)
+        assert governor.try_acquire("anthropic", "m", 1)[0] is not None
+        assert second.slot != first.slot
+
+    def test_slots_of_dead_processes_are_reclaimed(self, tmp_path):
+        state = tmp_path / "rate.json"
+        governor = RateGovernor(RateLimits(max_concurrent=1), state_path=state)
+        assert governor.try_acquire("anthropic", "m", 1)[0] is not None
+
+        proc = multiprocessing.get_context("fork").Process(target=os._exit, args=(0,))
+        proc.start()
+        proc.join()
+        snapshot = governor.snapshot()
+        slot = next(iter(snapshot["anthropic:m"]["slots"]))
+        snapshot["anthropic:m"]["slots"][slot][0] = proc.pid
+        state.write_text(json.dumps(snapshot))
+
+        assert governor.try_acquire("anthropic", "m", 1)[0] is not None
+
+    def test_state_file_shared_between_instances(self, tmp_path):
+        state = tmp_path / "rate.json"
+        first = RateGovernor(RateLimits(requests_per_minute=3), state_path=state)
+        second = RateGovernor(RateLimits(requests_per_minute=3), state_path=state)
+
+        granted = [g.try_acquire("anthropic", "m", 1)[0] is not None for g in (first, second) * 3]
+
+        assert granted.count(True) == 3
+
+    def test_state_file_shared_between_processes(self, tmp_path):
+        state = str(tmp_path / "rate.json")
+        with multiprocessing.get_context("fork").Pool(4) as pool:
+            counts = pool.starmap(_grant_count, [(state, 15)] * 4)
+
+        assert sum(counts) == 20
+
+    def test_corrupt_state_file_resets(self, tmp_path):
+        state = tmp_path / "rate.json"
+        state.write_text("{not json")
+        governor = RateGovernor(RateLimits(requests_per_minute=1), state_path=state)
+
+        assert governor.try_acquire("anthropic", "m", 1)[0] is not None
+
+    @pytest.mark.asyncio
+    async def test_acquire_waits(self):
+        governor = RateGovernor(RateLimits(requests_per_minute=600))
+        for _ in range(600):
+            governor.try_acquire("anthropic", "m", 1)
+
+        reservation = await governor.acquire("anthropic", "m", 1)
+
+        assert reservation.waited > 0.05
+
+
+class TestGovernedCall:
+    """Tests for the governed_call context manager."""
+
+    @pytest.mark.asyncio
+    async def test_records_usage(self):
+        governor = RateGovernor(RateLimits(tokens_per_minute=1000), clock=FakeClock())
+
+        async with governed_call(governor, "openai", "m", 100) as call:
+            call.record(250)
+
+        assert governor.snapshot()["openai:m"]["tokens"] == pytest.approx(750)
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_error_pauses_bucket(self):
+        clock = FakeClock()
+        governor = RateGovernor(RateLimits(requests_per_minute=100), clock=clock)
+
+        with pytest.raises(RateLimitError):
+            async with governed_call(governor, "openai", "m", 1):
+                raise RateLimitError("429", retry_after=3.0)
+
+        assert governor.snapshot()["openai:m"]["paused_until"] == pytest.approx(clock.now + 3.0)
+
+    @pytest.mark.asyncio
+    async def test_state_file_io_runs_off_the_event_loop(self, tmp_path):
+        governor = RateGovernor(
+            RateLimits(tokens_per_minute=1000), state_path=tmp_path / "rate.json", clock=FakeClock(),
+        )
+        loop_thread = threading.get_ident()
+        threads = []
+        state = governor._state
+
+        def recording_state():
+            threads.append(threading.get_ident())
+            return state()
+
+        governor._state = recording_state
+
+        async with governed_call(governor, "openai", "m", 100) as call:
+            call.record(250)
+
+        assert len(threads) == 2
+        assert loop_thread not in threads
+        governor._state = state
+        assert governor.snapshot()["openai:m"]["tokens"] == pytest.approx(750)
+
+    @pytest.mark.asyncio
+    async def test_without_governor(self):
+        async with governed_call(None, "openai", "m", 1) as call:
+            call.record(5)
+
+        assert call.tokens == 5
+
+
+class TestSharedGovernor:
+    """Tests for the process-wide governor registry."""
+
+    def test_same_settings_share_instance(self, tmp_path):
+        limits = RateLimits(requests_per_minute=7)
+
+        assert shared_governor(limits) is shared_governor(RateLimits(requests_per_minute=7))
+        assert shared_governor(limits, tmp_path / "a.json") is not shared_governor(limits)
+
+    def test_unlimited_returns_none(self):
+        assert shared_governor(RateLimits()) is None
@@ -0,0 +1,184 @@
+"""Tests for the record/replay LLM client."""
+
+from __future__ import annotations
+
+import json
+import time
+
+import pytest
+
+from ralph_agi.llm.client import LLMResponse, StopReason, StreamEventType, Tool, ToolCall
+from ralph_agi.llm.replay import ReplayLLMClient, ReplayMiss
+
+
+class ScriptedClient:
+    """Returns canned responses in order and records what it was asked."""
+
+    model = "scripted-1"
+
+    def __init__(self, responses: list[LLMResponse]):
+        self.responses = list(responses)
+        self.requests: list[dict] = []
+
+    async def complete(self, messages, **kwargs) -> LLMResponse:
+        self.requests.append({"messages": messages, **kwargs})
+        return self.responses.pop(0)
+
+
+TOOLS = [Tool(name="read_file", description="Read a file", input_schema={"type": "object"})]
+
+
+def _tool_response() -> LLMResponse:
+    return LLMResponse(
+        content="Reading the module.",
+        stop_reason=StopReason.TOOL_USE,
+        tool_calls=[ToolCall(id="t1", name="read_file", arguments={"path": "a.py"})],
+        usage={"input_tokens": 120, "output_tokens": 30},
+        model="scripted-1",
+    )
+
+
+def _done_response() -> LLMResponse:
+    return LLMResponse(
+        content="<task_complete>DONE</task_complete>",
+        stop_reason=StopReason.END_TURN,
+        usage={"output_tokens": 5},
+    )
+
+
+def _conversation(task: str, turns: int = 0) -> list[dict]:
+    messages = [{"role": "user", "content": task}]
+    for i in range(turns):
+        messages.append({"role": "assistant", "content": f"turn {i}"})
+        messages.append({"role": "user", "content": f"result {i}"})
+    return messages
+
+
+async def _record(path, task: str = "Implement feature X") -> None:
+    recorder = ReplayLLMClient(path, mode="record", client=ScriptedClient([_tool_response(), _done_response()]))
+    await recorder.complete(_conversation(task), system="You are a builder.", tools=TOOLS)
+    await recorder.complete(_conversation(task, 1), system="You are a builder.", tools=TOOLS)
+
+
+class TestReplayLLMClient:
+    """Tests for recording, matching and replaying."""
+
+    async def test_record_then_replay_round_trip(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        await _record(path)
+
+        player = ReplayLLMClient(path)
+        first = await player.complete(_conversation("Implement feature X"), system="You are a builder.", tools=TOOLS)
+        second = await player.complete(_conversation("Implement feature X", 1), system="You are a builder.", tools=TOOLS)
+
+        assert first.stop_reason == StopReason.TOOL_USE
+        assert first.tool_calls == [ToolCall(id="t1", name="read_file", arguments={"path": "a.py"})]
+        assert first.usage == {"input_tokens": 120, "output_tokens": 30}
+        assert first.model == "scripted-1"
+        assert second.content == "<task_complete>DONE</task_complete>"
+        assert (player.calls, player.exact_hits, player.turn_hits) == (2, 2, 0)
+
+    async def test_recording_appends_whole_lines(self, tmp_path):
+        path = tmp_path / "nested" / "session.jsonl"
+        await _record(path)
+        await _record(path, task="Implement feature Y")
+
+        lines = path.read_text().splitlines()
+
+        assert len(lines) == 4
+        assert [json.loads(line)["turn"] for line in lines] == [0, 1, 0, 1]
+
+    async def test_volatile_details_are_scrubbed(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        recorder = ReplayLLMClient(path, mode="record", client=ScriptedClient([_done_response()]))
+        await recorder.complete([{
+            "role": "user",
+            "content": "Run at 2026-01-02T03:04:05Z on commit 3f9a2b7c took 1.25s",
+        }])
+
+        player = ReplayLLMClient(path)
+        response = await player.complete([{
+            "role": "user",
+            "content": "Run at 2026-03-09T10:11:12Z on commit 81bd0e4f took 0.4s",
+        }])
+
+        assert response.content == "<task_complete>DONE</task_complete>"
+        assert player.exact_hits == 1
+
+    async def test_falls_back_to_conversation_turn(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        await _record(path)
+
+        player = ReplayLLMClient(path)
+        messages = _conversation("Implement feature X", 1)
+        messages[-1]["content"] = "a tool result that differs from the recording"
+        response = await player.complete(messages, system="You are a builder.", tools=TOOLS)
+
+        assert response.content == "<task_complete>DONE</task_complete>"
+        assert (player.exact_hits, player.turn_hits) == (0, 1)
+
+    async def test_unknown_request_raises_replay_miss(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        await _record(path)
+
+        player = ReplayLLMClient(path)
+
+        with pytest.raises(ReplayMiss, match="No recorded response"):
+            await player.complete(_conversation("Something else entirely"))
+
+    async def test_missing_transcript_raises_replay_miss(self, tmp_path):
+        player = ReplayLLMClient(tmp_path / "absent.jsonl")
+
+        with pytest.raises(ReplayMiss, match="not found"):
+            await player.complete(_conversation("task"))
+
+    async def test_repeated_requests_replay_in_order(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        responses = [LLMResponse(content=f"answer {i}", stop_reason=StopReason.END_TURN) for i in range(2)]
+        recorder = ReplayLLMClient(path, mode="record", client=ScriptedClient(responses))
+        for _ in range(2):
+            await recorder.complete(_conversation("same"))
+
+        player = ReplayLLMClient(path)
+        contents = [(await player.complete(_conversation("same"))).content for _ in range(3)]
+
+        assert contents == ["answer 0", "answer 1", "answer 1"]
+
+    async def test_stream_replay_synthesizes_events(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        await _record(path)
+
+        player = ReplayLLMClient(path)
+        events = [
+            event async for event in player.stream_complete(
+                _conversation("Implement feature X"), system="You are a builder.", tools=TOOLS
+            )
+        ]
+
+        assert [e.type for e in events] == [
+            StreamEventType.TEXT, StreamEventType.TOOL_CALL, StreamEventType.DONE,
+        ]
+        assert events[1].tool_call.name == "read_file"
+        assert events[2].response.stop_reason == StopReason.TOOL_USE
+
+    async def test_latency_scale_replays_recorded_latency(self, tmp_path):
+        path = tmp_path / "session.jsonl"
+        path.write_text(json.dumps({
+            "key": "k", "conversation": "c", "turn": 0, "latency": 0.2,
+            "response": {"content": "slow"},
+        }) + "\n")
+        player = ReplayLLMClient(path, latency_scale=0.25)
+        key, _, _ = player.request_keys(_conversation("task"))
+        path.write_text(path.read_text().replace('"k"', f'"{key}"'))
+
+        start = time.perf_counter()
+        response = await player.complete(_conversation("task"))
+
+        assert response.content == "slow"
+        assert time.perf_counter() - start >= 0.05
+
+    def test_record_mode_requires_client(self, tmp_path):
+        with pytest.raises(ValueError, match="record mode"):
+            ReplayLLMClient(tmp_path / "s.jsonl", mode="record")
+        with pytest.raises(ValueError, match="mode must be"):
+            ReplayLLMClient(tmp_path / "s.jsonl", mode="rewind")
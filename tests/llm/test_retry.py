@@ -0,0 +1,42 @@
+"""Tests for the rate-limit retry policy."""
+
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from ralph_agi.llm.retry import RetryPolicy
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy.delay."""
+
+    def test_exponential_without_jitter(self):
+        policy = RetryPolicy(base_delay=2.0, max_delay=10.0, jitter=0)
+
+        assert [policy.delay(a) for a in range(4)] == [2.0, 4.0, 8.0, 10.0]
+
+    def test_jitter_stays_within_bounds(self):
+        policy = RetryPolicy(base_delay=4.0, jitter=0.5)
+        rng = random.Random(1)
+
+        delays = [policy.delay(0, rng=rng) for _ in range(200)]
+
+        assert all(2.0 <= d <= 4.0 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_retry_after_is_floor(self):
+        policy = RetryPolicy(base_delay=100.0, jitter=0.5)
+        rng = random.Random(2)
+
+        delays = [policy.delay(3, retry_after=1.5, rng=rng) for _ in range(200)]
+
+        assert all(1.5 <= d <= 2.25 for d in delays)
+
+    @pytest.mark.parametrize(
+        "kwargs", [{"max_retries": -1}, {"base_delay": -1}, {"jitter": 1.5}]
+    )
+    def test_invalid_arguments(self, kwargs):
+        with pytest.raises(ValueError):
+            RetryPolicy(**kwargs)
@@ -6,10 +6,12 @@ from pathlib import Path
 
 import pytest
 
+from ralph_agi.llm.import_resolver import ImportResolver
 from ralph_agi.llm.verification import (
     VerificationResult,
     verify_files,
     verify_python_file,
+    verify_python_imports,
     verify_python_syntax,
 )
 
@@ -93,6 +95,42 @@ class TestVerifyPythonFile:
         assert "Syntax" in errors[0]
 
 
+class TestVerifyPythonImports:
+    """Tests for verify_python_imports function."""
+
+    def test_resolvable_imports_pass(self, tmp_path: Path):
+        """Test stdlib and sibling imports pass."""
+        (tmp_path / "sibling.py").write_text("")
+        file_path = tmp_path / "main.py"
+        file_path.write_text("import os\nfrom sibling import x\nfrom . import rel\n")
+
+        valid, error = verify_python_imports(file_path)
+
+        assert valid is True
+        assert error is None
+
+    def test_missing_import_fails(self, tmp_path: Path):
+        """Test unknown module is reported."""
+        file_path = tmp_path / "main.py"
+        file_path.write_text("import os\nimport not_a_real_module_xyz\n")
+
+        valid, error = verify_python_imports(file_path)
+
+        assert valid is False
+        assert "not_a_real_module_xyz" in error
+
+    def test_uses_given_resolver(self, tmp_path: Path):
+        """Test a custom resolver is consulted."""
+        file_path = tmp_path / "main.py"
+        file_path.write_text("import anything\n")
+        resolver = ImportResolver()
+        resolver.missing = lambda modules, directory: []
+
+        valid, _ = verify_python_imports(file_path, resolver=resolver)
+
+        assert valid is True
+
+
 class TestVerifyFiles:
     """Tests for verify_files function."""
 
@@ -0,0 +1,201 @@
+"""Tests for the token-budgeted memory context builder."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import pytest
+
+from ralph_agi.memory.context import (
+    CONTEXT_HEADER,
+    MemoryContextBuilder,
+    frame_importance,
+)
+from ralph_agi.memory.store import MemoryFrame
+
+
+def make_frame(
+    frame_id: str,
+    content: str,
+    frame_type: str = "iteration_result",
+    minute: int = 0,
+    session_id: Optional[str] = "s1",
+    score: Optional[float] = None,
+    metadata: Optional[dict] = None,
+) -> MemoryFrame:
+    return MemoryFrame(
+        id=frame_id,
+        content=content,
+        frame_type=frame_type,
+        metadata=metadata or {},
+        timestamp=f"2026-01-10T10:{minute:02d}:00+00:00",
+        session_id=session_id,
+        score=score,
+    )
+
+
+class FakeStore:
+    """Minimal MemoryStore stand-in serving fixed frames."""
+
+    def __init__(self, frames: list[MemoryFrame], hybrid: Optional[list[MemoryFrame]] = None):
+        self.frames = sorted(frames, key=lambda f: f.timestamp, reverse=True)
+        self.hybrid = hybrid or []
+
+    def search_hybrid(self, query: str, limit: int = 10) -> list[MemoryFrame]:
+        return self.hybrid[:limit]
+
+    def get_by_session(self, session_id: str, limit: int = 100) -> list[MemoryFrame]:
+        return [f for f in self.frames if f.session_id == session_id][:limit]
+
+    def get_recent(self, n: int = 10) -> list[MemoryFrame]:
+        return self.frames[:n]
+
+
+class TestFrameImportance:
+    """Tests for importance scoring."""
+
+    def test_metadata_importance_wins(self):
+        frame = make_frame("1", "x", frame_type="success", metadata={"importance": 9})
+        assert frame_importance(frame) == 9
+
+    def test_observation_type(self):
+        assert frame_importance(make_frame("1", "x", frame_type="error")) == 10
+        assert frame_importance(make_frame("1", "x", frame_type="context")) == 3
+
+    def test_unknown_type_defaults(self):
+        assert frame_importance(make_frame("1", "x", frame_type="custom")) == 5
+
+
+class TestMemoryContextBuilder:
+    """Tests for ranking, deduplication and packing."""
+
+    def test_empty_store(self):
+        context = MemoryContextBuilder(FakeStore([])).build("Add login form", session_id="s1")
+
+        assert context.text == ""
+        assert context.frames == []
+        assert context.tokens_saved == 0
+
+    def test_relevant_frame_ranks_above_recent(self):
+        frames = [
+            make_frame("old", "Fixed the OAuth login redirect bug in auth/login.py", minute=1),
+            *[make_frame(f"n{i}", f"Updated README section {i}", minute=10 + i) for i in range(8)],
+        ]
+        context = MemoryContextBuilder(FakeStore(frames)).build(
+            "Fix login redirect after OAuth callback", session_id="s1"
+        )
+
+        assert context.frames[0].id == "old"
+
+    def test_hybrid_scores_count_as_relevance(self):
+        semantic = make_frame("sem", "Sign-in flow notes", minute=0, score=12.0)
+        frames = [semantic, *[make_frame(f"n{i}", f"Bumped version {i}.0", minute=5 + i) for i in range(5)]]
+        context = MemoryContextBuilder(FakeStore(frames, hybrid=[semantic])).build(
+            "Authentication rework", session_id="s1"
+        )
+
+        assert context.frames[0].id == "sem"
+
+    def test_importance_breaks_ties(self):
+        frames = [
+            make_frame("ctx", "Database schema note", frame_type="context", minute=1),
+            make_frame("err", "Database schema note!", frame_type="error", minute=1,
+                       session_id="s2"),
+        ]
+        builder = MemoryContextBuilder(FakeStore(frames), duplicate_threshold=1.1)
+        context = builder.build("database schema", session_id="s1")
+
+        assert [f.id for f in context.frames] == ["err", "ctx"]
+
+    def test_near_duplicates_dropped(self):
+        frames = [
+            make_frame(str(i), f"Iteration {i} completed: ran pytest, 42 tests passed", minute=i)
+            for i in range(6)
+        ]
+        context = MemoryContextBuilder(FakeStore(frames)).build("run tests", session_id="s1")
+
+        assert len(context.frames) == 1
+        assert context.frames[0].id == "5"  # Most recent copy kept
+        assert context.duplicates_dropped == 5
+
+    def test_respects_token_budget(self):
+        frames = [
+            make_frame(str(i), f"Frame {i} about module_{i}: " + "detail " * 200, minute=i)
+            for i in range(20)
+        ]
+        context = MemoryContextBuilder(FakeStore(frames), max_tokens=400).build(
+            "module details", session_id="s1"
+        )
+
+        assert 0 < context.token_count <= 400
+        assert context.candidate_count == 20
+        assert context.tokens_saved == context.baseline_tokens - context.token_count
+        assert context.trimmed_count >= 1
+        assert context.text.startswith(CONTEXT_HEADER)
+
+    def test_irrelevant_frames_below_min_score_skipped(self):
+        topics = ["alpha", "bravo", "charlie", "delta", "echo", "foxtrot", "golf", "hotel"]
+        frames = [
+            make_frame(topic, f"Renamed the {topic} fixture", minute=i)
+            for i, topic in enumerate(topics)
+        ]
+        builder = MemoryContextBuilder(FakeStore(frames), max_tokens=2000)
+        context = builder.build("Fix login redirect after OAuth callback", session_id="s1")
+
+        # Only the newest few pass on recency alone, despite the spare budget
+        assert [f.id for f in context.frames] == ["hotel", "golf", "foxtrot"]
+
+        builder.min_score = 1.0
+        assert builder.build("Fix login redirect", session_id="s1").text == ""
+
+    def test_savings_measured_against_old_policy(self):
+        frames = [make_frame(str(i), "detail " * 100, minute=i) for i in range(8)]
+        frames.append(make_frame("other", "Unrelated note", minute=30, session_id="s9"))
+        builder = MemoryContextBuilder(FakeStore(frames), max_tokens=100)
+
+        context = builder.build("details", session_id="s1")
+        # Five session frames of 200 chars each, plus header and bullets
+        assert context.baseline_tokens == (len(CONTEXT_HEADER) + 5 * 206) // 4 + 1
+        assert context.tokens_saved == context.baseline_tokens - context.token_count > 0
+
+        # Without session frames the old policy sent nothing
+        context = builder.build("unrelated note", session_id="s2")
+        assert context.baseline_tokens == 0
+        assert context.tokens_saved == -context.token_count < 0
+
+    def test_long_frame_trimmed(self):
+        frames = [make_frame("1", "word " * 1000)]
+        context = MemoryContextBuilder(FakeStore(frames), max_frame_tokens=50).build(
+            "word", session_id="s1"
+        )
+
+        line = context.text.splitlines()[1]
+        assert line.endswith("...")
+        assert len(line) <= 50 * 4
+
+    def test_frames_from_other_sessions_are_candidates(self):
+        frames = [make_frame("other", "Learned: retry flaky network tests", session_id="s9")]
+        context = MemoryContextBuilder(FakeStore(frames)).build(
+            "flaky network tests", session_id="s1"
+        )
+
+        assert [f.id for f in context.frames] == ["other"]
+
+    def test_failing_source_is_skipped(self):
+        store = FakeStore([make_frame("1", "Session note")])
+
+        def broken(*args, **kwargs):
+            raise RuntimeError("memvid down")
+
+        store.search_hybrid = broken
+        context = MemoryContextBuilder(store).build("note", session_id="s1")
+
+        assert [f.id for f in context.frames] == ["1"]
+
+    @pytest.mark.parametrize("budget", [0, 5])
+    def test_tiny_budget_yields_nothing(self, budget):
+        store = FakeStore([make_frame("1", "Session note")])
+        context = MemoryContextBuilder(store, max_tokens=budget).build("note", session_id="s1")
+
+        assert context.text == ""
+        assert context.candidate_count == 1
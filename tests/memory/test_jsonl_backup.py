@@ -11,6 +11,8 @@ Tests cover:
 
 import json
 import tempfile
+import threading
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -305,6 +307,198 @@ class TestJSONLBackupStoreCount:
         assert store.count() == 5
 
 
+class TestJSONLBackupStoreFilters:
+    """Tests for session, date and type filters."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = JSONLBackupStore(tmp_path / "test.jsonl")
+        for i in range(10):
+            store.append({
+                "id": str(i),
+                "content": f"Frame {i} {'error' if i % 2 else 'ok'}",
+                "frame_type": "error" if i % 2 else "result",
+                "session_id": f"s{i % 2}",
+                "timestamp": f"2026-01-{i + 1:02d}T10:00:00+00:00",
+            })
+        return store
+
+    def test_session_filter(self, store):
+        results = store.search("*", session_id="s1", limit=10)
+        assert [r["id"] for r in results] == ["9", "7", "5", "3", "1"]
+
+    def test_date_range(self, store):
+        results = store.search("*", start_date="2026-01-03", end_date="2026-01-05", limit=10)
+        assert [r["id"] for r in results] == ["4", "3", "2"]
+
+    def test_filters_combine_with_query(self, store):
+        results = store.search("frame 3", frame_type="error", limit=10)
+        assert [r["id"] for r in results] == ["3"]
+
+    def test_filters_without_index(self, tmp_path, store):
+        plain = JSONLBackupStore(store.backup_path, use_index=False)
+
+        assert [r["id"] for r in plain.search("*", session_id="s0", limit=2)] == ["8", "6"]
+        assert plain.count() == 10
+
+    def test_non_ascii_query(self, tmp_path):
+        store = JSONLBackupStore(tmp_path / "test.jsonl")
+        store.append({"id": "1", "content": "Caf\u00e9 \"quoted\""})
+
+        assert len(store.search("café")) == 1
+        assert len(store.search('"quoted"')) == 1
+
+
+class TestJSONLBackupStoreDurability:
+    """Tests for the fsync policies and buffered writer."""
+
+    def test_invalid_policy_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="fsync"):
+            JSONLBackupStore(tmp_path / "test.jsonl", fsync="sometimes")
+
+    def test_invalid_batch_size_raises(self, tmp_path):
+        with pytest.raises(ValueError, match="batch_size"):
+            JSONLBackupStore(tmp_path / "test.jsonl", fsync="batch", batch_size=0)
+
+    def test_always_fsyncs_every_frame(self, tmp_path):
+        store = JSONLBackupStore(tmp_path / "test.jsonl")
+
+        with patch("ralph_agi.memory.jsonl_backup.os.fsync") as fsync:
+            for i in range(3):
+                store.append({"id": str(i), "content": "x"})
+
+        assert fsync.call_count == 3
+        store.close()
+
+    def test_os_policy_never_fsyncs_until_flush(self, tmp_path):
+        path = tmp_path / "test.jsonl"
+        store = JSONLBackupStore(path, fsync="os")
+
+        with patch("ralph_agi.memory.jsonl_backup.os.fsync") as fsync:
+            for i in range(3):
+                store.append({"id": str(i), "content": "x"})
+            # Written immediately, just not synced
+            assert len(path.read_text().splitlines()) == 3
+            assert fsync.call_count == 0
+
+            assert store.flush() is True
+            assert fsync.call_count == 1
+            store.flush()
+            assert fsync.call_count == 1
+        store.close()
+
+    def test_batch_buffers_until_size(self, tmp_path):
+        path = tmp_path / "test.jsonl"
+        store = JSONLBackupStore(path, fsync="batch", batch_size=4, batch_interval=60)
+
+        with patch("ralph_agi.memory.jsonl_backup.os.fsync") as fsync:
+            for i in range(3):
+                store.append({"id": str(i), "content": "x"})
+            assert not path.exists()
+            assert store.pending_count == 3
+
+            store.append({"id": "3", "content": "x"})
+            assert fsync.call_count == 1
+
+        assert [json.loads(line)["id"] for line in path.read_text().splitlines()] == [
+            "0", "1", "2", "3"
+        ]
+        assert store.pending_count == 0
+        store.close()
+
+    def test_batch_flushes_after_interval(self, tmp_path):
+        path = tmp_path / "test.jsonl"
+        store = JSONLBackupStore(path, fsync="batch", batch_size=100, batch_interval=0.01)
+
+        store.append({"id": "1", "content": "x"})
+
+        deadline = time.monotonic() + 5
+        while store.pending_count and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert store.pending_count == 0
+        assert len(path.read_text().splitlines()) == 1
+        store.close()
+
+    def test_reads_see_buffered_frames(self, tmp_path):
+        store = JSONLBackupStore(tmp_path / "test.jsonl", fsync="batch", batch_interval=60)
+        for i in range(3):
+            store.append({"id": str(i), "content": f"Frame {i}", "frame_type": "result"})
+
+        assert store.count() == 3
+        assert [r["id"] for r in store.get_recent(2)] == ["2", "1"]
+        assert len(store.search("*", frame_type="result")) == 3
+        store.close()
+
+    def test_close_flushes_and_store_stays_usable(self, tmp_path):
+        path = tmp_path / "test.jsonl"
+        store = JSONLBackupStore(path, fsync="batch", batch_interval=60)
+        store.append({"id": "1", "content": "x"})
+
+        store.close()
+        assert len(path.read_text().splitlines()) == 1
+
+        store.append({"id": "2", "content": "x"})
+        store.close()
+        assert len(path.read_text().splitlines()) == 2
+
+    def test_failed_flush_keeps_frames_pending(self, tmp_path):
+        path = tmp_path / "test.jsonl"
+        store = JSONLBackupStore(path, fsync="batch", batch_interval=60)
+        store.append({"id": "1", "content": "x"})
+
+        with patch.object(store, "_open_locked", side_effect=OSError("disk full")):
+            assert store.flush() is False
+        assert store.pending_count == 1
+
+        store.append({"id": "2", "content": "x"})
+        assert store.flush() is True
+        assert [json.loads(line)["id"] for line in path.read_text().splitlines()] == ["1", "2"]
+        store.close()
+
+    def test_reopens_after_file_replaced(self, tmp_path):
+        path = tmp_path / "test.jsonl"
+        store = JSONLBackupStore(path, fsync="os")
+        store.append({"id": "1", "content": "x"})
+
+        path.unlink()
+        store.append({"id": "2", "content": "x"})
+
+        assert [json.loads(line)["id"] for line in path.read_text().splitlines()] == ["2"]
+        store.close()
+
+    def test_batched_writes_are_indexed(self, tmp_path):
+        path = tmp_path / "test.jsonl"
+        store = JSONLBackupStore(path, fsync="batch", batch_size=5, batch_interval=60)
+        for i in range(12):
+            store.append({"id": str(i), "content": "x", "session_id": f"s{i % 3}"})
+        store.close()
+
+        reopened = JSONLBackupStore(path)
+        assert reopened.count() == 12
+        assert [r["id"] for r in reopened.search("*", session_id="s1", limit=10)] == [
+            "10", "7", "4", "1"
+        ]
+
+    def test_concurrent_batched_appends(self, tmp_path):
+        path = tmp_path / "test.jsonl"
+        store = JSONLBackupStore(path, fsync="batch", batch_size=16, batch_interval=0.005)
+
+        def writer(n):
+            for i in range(50):
+                store.append({"id": f"{n}-{i}", "content": "x"})
+
+        threads = [threading.Thread(target=writer, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        store.close()
+
+        ids = [json.loads(line)["id"] for line in path.read_text().splitlines()]
+        assert len(ids) == 200
+        assert len(set(ids)) == 200
+
+
 class TestJSONLBackupStoreCorruptLineHandling:
     """Tests for handling corrupt/malformed lines."""
 
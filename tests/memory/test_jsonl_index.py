@@ -0,0 +1,167 @@
+"""Tests for the JSONL sidecar offset index."""
+
+from __future__ import annotations
+
+import io
+import json
+import math
+
+import pytest
+
+from ralph_agi.memory.jsonl_backup import JSONLBackupStore
+from ralph_agi.memory.jsonl_index import (
+    INDEX_HEADER,
+    JSONLIndex,
+    date_bounds,
+    iter_lines,
+    iter_lines_reverse,
+    parse_timestamp,
+)
+import ralph_agi.memory.jsonl_index as jsonl_index
+
+
+def _frame(i: int, frame_type: str = "note", session: str | None = None, day: int = 1) -> dict:
+    return {
+        "id": str(i),
+        "content": f"Frame {i}",
+        "frame_type": frame_type,
+        "session_id": session,
+        "timestamp": f"2026-01-{day:02d}T12:00:00+00:00",
+    }
+
+
+class TestLineReaders:
+    """Tests for forward and reverse line iteration."""
+
+    @pytest.fixture(autouse=True)
+    def small_blocks(self, monkeypatch):
+        # Exercise lines spanning block boundaries
+        monkeypatch.setattr(jsonl_index, "_BLOCK_SIZE", 7)
+
+    def test_reverse_yields_offsets_newest_first(self):
+        data = b"alpha\nbe\ngamma-long-line\n"
+        lines = list(iter_lines_reverse(io.BytesIO(data)))
+
+        assert lines == [(9, b"gamma-long-line\n"), (6, b"be\n"), (0, b"alpha\n")]
+
+    def test_reverse_skips_unterminated_tail(self):
+        data = b"one\ntwo\npartial"
+        assert [l for _, l in iter_lines_reverse(io.BytesIO(data))] == [b"two\n", b"one\n"]
+
+    def test_reverse_empty_and_partial_only(self):
+        assert list(iter_lines_reverse(io.BytesIO(b""))) == []
+        assert list(iter_lines_reverse(io.BytesIO(b"no newline"))) == []
+
+    def test_forward_range(self):
+        data = b"aaaa\nbbbbbbbbbb\ncc\npartial"
+        lines = list(iter_lines(io.BytesIO(data), 5, len(data)))
+
+        assert lines == [(5, b"bbbbbbbbbb\n"), (16, b"cc\n")]
+
+
+class TestTimestamps:
+    """Tests for timestamp helpers."""
+
+    def test_parse(self):
+        assert parse_timestamp("1970-01-01T00:00:10+00:00") == 10
+        assert parse_timestamp("1970-01-01T00:00:10") == 10
+        assert parse_timestamp("") == -math.inf
+        assert parse_timestamp("garbage") == -math.inf
+
+    def test_end_date_covers_whole_day(self):
+        start, end = date_bounds("2026-01-02", "2026-01-02")
+
+        assert start == parse_timestamp("2026-01-02T00:00:00")
+        assert end == parse_timestamp("2026-01-02T23:59:59")
+
+
+class TestJSONLIndex:
+    """Tests for index maintenance through JSONLBackupStore."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = JSONLBackupStore(tmp_path / "memory.jsonl")
+        for i in range(6):
+            store.append(_frame(i, "error" if i % 2 else "note", f"s{i % 3}", day=i + 1))
+        return store
+
+    def test_index_file_written_on_append(self, store):
+        index_path = store.backup_path.with_name("memory.jsonl.idx")
+        content = index_path.read_bytes()
+
+        assert content.startswith(INDEX_HEADER)
+        assert content.count(b"\n") == 7
+
+    def test_positions_point_at_lines(self, store):
+        index = JSONLIndex(store.backup_path)
+        assert index.refresh() is True
+
+        with open(store.backup_path, "rb") as f:
+            ids = []
+            for offset, length in index.positions(frame_type="error"):
+                f.seek(offset)
+                ids.append(json.loads(f.read(length))["id"])
+
+        assert ids == ["5", "3", "1"]
+
+    def test_session_and_type_intersection(self, store):
+        index = JSONLIndex(store.backup_path)
+        index.refresh()
+
+        assert len(list(index.positions(frame_type="error", session_id="s1"))) == 1
+
+    def test_picks_up_unindexed_tail(self, store):
+        # A line written without going through the store
+        with open(store.backup_path, "a") as f:
+            f.write(json.dumps(_frame(99, "note")) + "\n")
+
+        assert store.count() == 7
+        assert store.search("*", frame_type="note", limit=1)[0]["id"] == "99"
+
+    def test_next_append_backfills_index_file(self, store, tmp_path):
+        with open(store.backup_path, "a") as f:
+            f.write(json.dumps(_frame(99, "note")) + "\n")
+        store.count()  # Indexes the tail in memory only
+        store.append(_frame(100, "note"))
+
+        fresh = JSONLIndex(store.backup_path)
+        fresh.refresh()
+        assert len(fresh) == 8
+        assert fresh._file_covered == store.backup_path.stat().st_size
+
+    def test_missing_index_is_rebuilt(self, store):
+        store.backup_path.with_name("memory.jsonl.idx").unlink()
+
+        fresh = JSONLBackupStore(store.backup_path)
+        assert fresh.count() == 6
+        assert store.backup_path.with_name("memory.jsonl.idx").exists()
+
+    def test_corrupt_index_is_rebuilt(self, store):
+        store.backup_path.with_name("memory.jsonl.idx").write_bytes(INDEX_HEADER + b"junk\n")
+
+        fresh = JSONLBackupStore(store.backup_path)
+        assert len(fresh.search("*", frame_type="note", limit=10)) == 3
+
+    def test_truncated_data_is_reindexed(self, store):
+        store.count()
+        store.backup_path.write_text(json.dumps(_frame(1, "note")) + "\n")
+
+        assert store.count() == 1
+
+    def test_other_instance_sees_appends(self, store):
+        other = JSONLBackupStore(store.backup_path)
+        assert other.count() == 6
+
+        store.append(_frame(7, "note"))
+        assert other.count() == 7
+
+    def test_partial_index_line_dropped_by_writer(self, store):
+        index_path = store.backup_path.with_name("memory.jsonl.idx")
+        with open(index_path, "ab") as f:
+            f.write(b"12345\t")  # Crashed mid-write
+
+        store.append(_frame(7, "note"))
+
+        fresh = JSONLIndex(store.backup_path)
+        assert fresh.refresh() is True
+        assert len(fresh) == 7
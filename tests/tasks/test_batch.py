@@ -1,6 +1,8 @@
 """Tests for batch processing."""
 
 import json
+import multiprocessing
+import subprocess
 import tempfile
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -14,6 +16,7 @@ from ralph_agi.tasks.batch import (
     BatchProgress,
     WorkerProgress,
     WorkerStatus,
+    _run_worker,
     format_batch_progress,
 )
 
@@ -42,6 +45,7 @@ class TestBatchConfig:
         assert config.progress_dir is None
         assert config.cleanup_on_complete is True
         assert config.cleanup_on_failure is False
+        assert config.worktree_pool_size == 0
 
     def test_custom_values(self):
         """Test custom configuration values."""
@@ -223,6 +227,27 @@ class TestFormatBatchProgress:
         assert "done in 10 iterations" in output  # Completed output
         assert "Out of memory" in output  # Failed error
 
+    def test_format_shows_live_counters(self):
+        """Test running workers show tool calls and tokens."""
+        progress = BatchProgress(
+            batch_id="abc",
+            total_tasks=1,
+            workers={
+                "w1": WorkerProgress(
+                    "task-1", "w1",
+                    status=WorkerStatus.RUNNING,
+                    iteration=2,
+                    tool_calls=7,
+                    input_tokens=1400,
+                    output_tokens=600,
+                ),
+            },
+        )
+        output = format_batch_progress(progress)
+
+        assert "(iteration 2/100, 7 tool calls, 2,000 tokens)" in output
+        assert "Tokens: 2,000" in output
+
 
 class TestBatchExecutorInit:
     """Tests for BatchExecutor initialization."""
@@ -262,6 +287,64 @@ class TestBatchExecutorInit:
         assert executor._batch_config.parallel_limit == 5
 
 
+class TestBatchExecutorPool:
+    """Tests for starting workers from the worktree pool."""
+
+    @pytest.fixture
+    def executor(self, tmp_path):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        for args in (
+            ["init", "-q", "-b", "main"],
+            ["config", "user.email", "test@example.com"],
+            ["config", "user.name", "Test"],
+        ):
+            subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+        (repo / "PRD.json").write_text('{"project": {"name": "Test"}, "features": []}')
+        subprocess.run(["git", "add", "."], cwd=repo, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-q", "-m", "init"], cwd=repo, check=True, capture_output=True)
+        (tmp_path / "config.yaml").write_text("max_iterations: 10")
+
+        executor = BatchExecutor(
+            prd_path=repo / "PRD.json",
+            config_path=tmp_path / "config.yaml",
+            batch_config=BatchConfig(worktree_base=tmp_path / "trees", worktree_pool_size=1),
+        )
+        executor._batch_progress = BatchProgress(batch_id="b1", total_tasks=1)
+        executor._batch_progress.workers["b1-task-1"] = WorkerProgress(
+            task_id="task-1", worker_id="b1-task-1", status=WorkerStatus.PENDING,
+        )
+        executor._open_pool(task_count=1)
+        yield executor
+        executor._pool.drain()
+
+    def test_worker_gets_pooled_worktree(self, executor):
+        with patch("ralph_agi.tasks.batch.multiprocessing.Process") as process_class:
+            executor._start_worker("task-1", "b1", max_iterations=5)
+
+        args = process_class.call_args.kwargs["args"]
+        worktree_path, worktree_ready = Path(args[4]), args[8]
+        assert worktree_ready is True
+        assert executor._pool.owns(worktree_path)
+        assert executor._pool.stats()["hits"] == 1
+
+    def test_completed_worker_is_recycled(self, executor):
+        with patch("ralph_agi.tasks.batch.multiprocessing.Process"):
+            executor._start_worker("task-1", "b1", max_iterations=5)
+        progress = executor._batch_progress.workers["b1-task-1"]
+        progress.status = WorkerStatus.COMPLETED
+
+        executor._recycle_worktree("b1-task-1")
+
+        assert executor._pool.stats()["idle"] == 1
+        assert executor._pool.stats()["recycled"] == 1
+        branches = subprocess.run(
+            ["git", "branch", "--list", progress.branch_name],
+            cwd=executor._repo_path, capture_output=True, text=True,
+        ).stdout
+        assert branches.strip() == ""
+
+
 class TestBatchExecutorProgress:
     """Tests for BatchExecutor progress tracking."""
 
@@ -376,3 +459,108 @@ class TestCLIBatchArgs:
         args = parser.parse_args(["run", "--batch", "--prd", "test.json"])
 
         assert args.parallel_limit == 3
+
+
+def _send_events(conn, events):
+    """Child process: send progress events, then exit."""
+    for event, data in events:
+        conn.send(("b1-task-1", event, data))
+    conn.close()
+
+
+class TestBatchProgressChannel:
+    """Tests for live worker progress over pipes."""
+
+    @pytest.fixture
+    def executor(self, tmp_path):
+        executor = BatchExecutor(
+            prd_path=tmp_path / "PRD.json",
+            config_path=tmp_path / "config.yaml",
+            batch_config=BatchConfig(progress_dir=tmp_path / "progress"),
+        )
+        executor._progress_dir.mkdir()
+        executor._batch_progress = BatchProgress(batch_id="b1", total_tasks=1)
+        executor._batch_progress.workers["b1-task-1"] = WorkerProgress(
+            task_id="task-1", worker_id="b1-task-1", status=WorkerStatus.RUNNING,
+        )
+        return executor
+
+    def _start(self, executor, events):
+        reader, writer = multiprocessing.Pipe(duplex=False)
+        process = multiprocessing.Process(target=_send_events, args=(writer, events))
+        process.start()
+        writer.close()
+        executor._workers["b1-task-1"] = process
+        executor._channels["b1-task-1"] = reader
+        return process
+
+    def test_events_update_progress(self, executor):
+        process = self._start(executor, [
+            ("iteration_started", {"iteration": 1}),
+            ("tool", {"iteration": 1, "tool": "read_file", "success": True}),
+            ("tool", {"iteration": 1, "tool": "write_file", "success": True}),
+            ("tokens", {"iteration": 1, "input_tokens": 700, "output_tokens": 300}),
+            ("iteration_started", {"iteration": 2}),
+        ])
+        process.join(timeout=30)
+
+        executor._update_progress(timeout=5)
+
+        progress = executor._batch_progress.workers["b1-task-1"]
+        assert progress.iteration == 2
+        assert progress.tool_calls == 2
+        assert progress.last_tool == "write_file"
+        assert executor._batch_progress.total_tokens == 1000
+        assert "b1-task-1" not in executor._channels  # Closed at EOF
+
+    def test_final_status_comes_from_channel(self, executor):
+        done = WorkerProgress("task-1", "b1-task-1", status=WorkerStatus.COMPLETED, iteration=3)
+        process = self._start(executor, [("status", done.to_dict())])
+        process.join(timeout=30)
+
+        executor._finish_worker("b1-task-1", process.exitcode)
+
+        assert executor._batch_progress.workers["b1-task-1"].status == WorkerStatus.COMPLETED
+
+    def test_crashed_worker_recovers_from_file(self, executor):
+        snapshot = WorkerProgress("task-1", "b1-task-1", status=WorkerStatus.COMPLETED, output="done")
+        (executor._progress_dir / "b1-task-1.progress.json").write_text(json.dumps(snapshot.to_dict()))
+        process = self._start(executor, [("tool", {"iteration": 1, "tool": "run_command"})])
+        process.join(timeout=30)
+
+        executor._finish_worker("b1-task-1", process.exitcode)
+
+        progress = executor._batch_progress.workers["b1-task-1"]
+        assert progress.status == WorkerStatus.COMPLETED
+        assert progress.output == "done"
+        assert progress.tool_calls == 1
+
+    def test_silent_exit_marks_failed(self, executor):
+        process = self._start(executor, [])
+        process.join(timeout=30)
+
+        executor._finish_worker("b1-task-1", process.exitcode)
+
+        progress = executor._batch_progress.workers["b1-task-1"]
+        assert progress.status == WorkerStatus.FAILED
+        assert "without reporting" in progress.error
+
+    def test_worker_reports_status_over_channel(self, tmp_path):
+        reader, writer = multiprocessing.Pipe(duplex=False)
+
+        _run_worker(
+            "task-1", "b1-task-1", str(tmp_path / "missing" / "PRD.json"),
+            str(tmp_path / "config.yaml"), str(tmp_path / "wt"), "ralph/batch-task-1",
+            str(tmp_path), 5, channel=writer,
+        )
+
+        events = []
+        while reader.poll():
+            try:
+                events.append(reader.recv())
+            except EOFError:
+                break
+        statuses = [data["status"] for _, event, data in events if event == "status"]
+        assert statuses == ["starting", "failed"]
+        # The snapshot file is still written for crash recovery
+        assert json.loads((tmp_path / "b1-task-1.progress.json").read_text())["status"] == "failed"
@@ -0,0 +1,85 @@
+"""Tests for the content-addressed artifact blob store."""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+
+import pytest
+
+from ralph_agi.tasks.blobs import BlobNotFoundError, BlobStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BlobStore(tmp_path / "blobs")
+
+
+class TestBlobStore:
+    """Tests for storing, deduplicating and reading blobs."""
+
+    def test_put_returns_sha256_and_round_trips(self, store):
+        data = b"def main():\n    pass\n" * 200
+
+        digest = store.put(data)
+
+        assert digest == hashlib.sha256(data).hexdigest()
+        assert store.read(digest) == data
+        assert store.is_compressed(digest)
+        assert (store.root / digest[:2] / f"{digest}.gz").exists()
+
+    def test_incompressible_content_is_stored_raw(self, store):
+        data = os.urandom(4096)
+
+        digest = store.put(data)
+
+        assert not store.is_compressed(digest)
+        assert store.read(digest) == data
+
+    def test_put_file_matches_put_and_deduplicates(self, store, tmp_path):
+        source = tmp_path / "big.txt"
+        source.write_bytes(b"line of text\n" * 20_000)
+
+        digest = store.put_file(source)
+
+        assert digest == store.put(source.read_bytes())
+        assert len([p for p in store.root.rglob("*") if p.is_file()]) == 1
+        assert b"".join(store.iter_chunks(digest)) == source.read_bytes()
+
+    def test_raw_chunks_are_the_stored_gzip_data(self, store):
+        digest = store.put(b"abc" * 1000)
+
+        assert gzip.decompress(b"".join(store.iter_chunks(digest, raw=True))) == b"abc" * 1000
+
+    def test_compression_can_be_disabled(self, tmp_path):
+        store = BlobStore(tmp_path, compress=False)
+
+        assert not store.is_compressed(store.put(b"abc" * 1000))
+
+    def test_missing_or_malformed_digest(self, store):
+        with pytest.raises(BlobNotFoundError):
+            store.read("0" * 64)
+        with pytest.raises(BlobNotFoundError):
+            store.open("../../etc/passwd")
+        assert not store.exists("not-a-digest")
+
+    def test_prune_keeps_referenced_and_recent_blobs(self, store):
+        kept = store.put(b"kept")
+        dropped = store.put(b"dropped")
+
+        assert store.prune([kept]) == 0  # Both are newer than min_age
+        assert store.prune([kept], min_age=0) == 1
+        assert store.exists(kept)
+        assert not store.exists(dropped)
+
+    def test_storing_existing_blob_again_protects_it_from_prune(self, store, tmp_path):
+        digest = store.put(b"reused " * 100)
+        source = tmp_path / "reused.txt"
+        source.write_bytes(b"reused " * 100)
+        path = store.root / digest[:2] / f"{digest}.gz"
+        for put in (lambda: store.put(b"reused " * 100), lambda: store.put_file(source)):
+            os.utime(path, (0, 0))
+
+            assert put() == digest
+            assert store.prune([], min_age=3600) == 0
@@ -0,0 +1,165 @@
+"""Tests for worktree change detection."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from ralph_agi.tasks.blobs import BlobStore
+from ralph_agi.tasks.changes import ChangeTracker, ChangeType
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "config", "user.email", "test@example.com")
+    _git(tmp_path, "config", "user.name", "Test")
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "app.py").write_text("print('hi')\n")
+    (tmp_path / "README.md").write_text("# Project\n")
+    (tmp_path / ".gitignore").write_text("*.log\n")
+    _git(tmp_path, "add", ".")
+    _git(tmp_path, "commit", "-q", "-m", "initial")
+    return tmp_path
+
+
+def _summary(tracker: ChangeTracker) -> dict[str, tuple[str, int | None]]:
+    return {c.path: (c.change_type.value, c.size) for c in tracker.changes()}
+
+
+class TestGitChangeTracker:
+    """Tests for change detection in git worktrees."""
+
+    def test_reports_added_modified_and_deleted(self, repo):
+        tracker = ChangeTracker(repo)
+        tracker.snapshot()
+
+        (repo / "src" / "app.py").write_text("print('hello')\n")
+        (repo / "src" / "new.py").write_text("x = 1\n")
+        (repo / "README.md").unlink()
+        (repo / "debug.log").write_text("ignored\n")
+
+        assert tracker.uses_git
+        assert _summary(tracker) == {
+            "README.md": ("deleted", None),
+            "src/app.py": ("modified", 15),
+            "src/new.py": ("added", 6),
+        }
+
+    def test_includes_changes_the_task_committed(self, repo):
+        tracker = ChangeTracker(repo)
+        tracker.snapshot()
+
+        (repo / "src" / "committed.py").write_text("y = 2\n")
+        _git(repo, "add", ".")
+        _git(repo, "commit", "-q", "-m", "task work")
+
+        assert _summary(tracker) == {"src/committed.py": ("added", 6)}
+
+    def test_combines_commits_with_later_working_tree_edits(self, repo):
+        tracker = ChangeTracker(repo)
+        tracker.snapshot()
+
+        (repo / "src" / "committed.py").write_text("y = 2\n")
+        (repo / "README.md").unlink()
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-q", "-m", "task work")
+        (repo / "src" / "committed.py").write_text("y = 3  # edited after commit\n")
+        (repo / "README.md").write_text("# Recreated\n")
+        (repo / "src" / "app.py").unlink()
+        (repo / "staged.py").write_text("s = 1\n")
+        _git(repo, "add", "staged.py")
+
+        assert _summary(tracker) == {
+            "README.md": ("modified", 12),
+            "src/app.py": ("deleted", None),
+            "src/committed.py": ("added", 29),
+            "staged.py": ("added", 6),
+        }
+
+    def test_ignores_files_dirty_before_snapshot_unless_touched(self, repo):
+        (repo / "scratch.txt").write_text("already here\n")
+        (repo / "README.md").write_text("# Edited before\n")
+        tracker = ChangeTracker(repo)
+        tracker.snapshot()
+
+        assert tracker.changes() == []
+
+        (repo / "README.md").write_text("# Edited again by the task\n")
+
+        assert [c.path for c in tracker.changes()] == ["README.md"]
+
+    def test_paths_are_relative_to_a_subdirectory_root(self, repo):
+        tracker = ChangeTracker(repo / "src")
+        tracker.snapshot()
+
+        (repo / "src" / "app.py").write_text("changed\n")
+        (repo / "src" / "extra.py").write_text("z\n")
+        (repo / "README.md").write_text("outside\n")
+
+        assert set(_summary(tracker)) == {"app.py", "extra.py"}
+
+    def test_contents_are_loaded_on_request(self, repo):
+        tracker = ChangeTracker(repo)
+        tracker.snapshot()
+        (repo / "notes.md").write_text("hello\n")
+        (repo / "blob.bin").write_bytes(b"\xff\xfe\x00")
+
+        changes = {c.path: c for c in tracker.changes()}
+        artifact = changes["notes.md"].to_artifact()
+
+        assert artifact.content is None
+        assert artifact.change_type == "added"
+        assert artifact.file_type == "md"
+        assert changes["notes.md"].read_text() == "hello\n"
+        assert changes["notes.md"].read_text(max_bytes=3) is None
+        assert changes["blob.bin"].read_text() is None
+
+    def test_artifact_contents_can_be_stored_as_blobs(self, repo, tmp_path):
+        store = BlobStore(tmp_path / "blobs")
+        tracker = ChangeTracker(repo)
+        tracker.snapshot()
+        (repo / "notes.md").write_text("hello\n")
+        (repo / "README.md").unlink()
+
+        artifacts = {c.path: c.to_artifact(blobs=store) for c in tracker.changes()}
+
+        assert store.read(artifacts["notes.md"].blob) == b"hello\n"
+        assert artifacts["README.md"].blob is None
+
+
+class TestScanChangeTracker:
+    """Tests for the mtime/inode fallback outside git."""
+
+    def test_reports_added_modified_and_deleted(self, tmp_path):
+        (tmp_path / "keep.txt").write_text("same\n")
+        (tmp_path / "edit.txt").write_text("before\n")
+        (tmp_path / "gone.txt").write_text("bye\n")
+        (tmp_path / "node_modules").mkdir()
+        tracker = ChangeTracker(tmp_path)
+        tracker.snapshot()
+
+        (tmp_path / "edit.txt").write_text("after, longer\n")
+        (tmp_path / "gone.txt").unlink()
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "new.txt").write_text("new\n")
+        (tmp_path / "node_modules" / "dep.js").write_text("skipped\n")
+
+        assert not tracker.uses_git
+        assert _summary(tracker) == {
+            "edit.txt": ("modified", 14),
+            "gone.txt": ("deleted", None),
+            "sub/new.txt": ("added", 4),
+        }
+        deleted = next(c for c in tracker.changes() if c.change_type == ChangeType.DELETED)
+        assert deleted.to_artifact().absolute_path is None
+
+    def test_changes_requires_snapshot(self, tmp_path):
+        with pytest.raises(RuntimeError, match="snapshot"):
+            ChangeTracker(tmp_path).changes()
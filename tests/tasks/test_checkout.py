@@ -0,0 +1,177 @@
+"""Tests for sparse worktree checkouts and shared dependency directories."""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from ralph_agi.tasks.checkout import (
+    SparseCheckout,
+    derive_sparse_paths,
+    share_dependency_dirs,
+    task_hints,
+)
+from ralph_agi.tasks.queue import QueuedTask
+from ralph_agi.tasks.worktree import WorktreeManager
+from ralph_agi.tools.filesystem import FileSystemTools
+from ralph_agi.tools.git import GitTools
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    repo = tmp_path / "repo"
+    for path in ("src/api/users.py", "src/web/app.js", "docs/guide.md", "tools/lint.sh"):
+        (repo / path).parent.mkdir(parents=True, exist_ok=True)
+        (repo / path).write_text(f"# {path}\n")
+    (repo / "README.md").write_text("# Project\n")
+    (repo / ".gitignore").write_text("node_modules/\n")
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "initial")
+    return repo
+
+
+@pytest.fixture
+def sparse_tree(repo, tmp_path):
+    path = tmp_path / "wt"
+    GitTools(repo_path=repo).worktree_add(str(path), "ralph/t1", sparse_paths=["src/api"])
+    return path
+
+
+class TestDeriveSparsePaths:
+    """Tests for mapping task text to checkout directories."""
+
+    def test_maps_paths_to_tracked_directories(self, repo):
+        hints = [
+            "Add pagination to src/api/users.py and src/api/new_module.py.",
+            "Document it in ./docs/",
+            "Nothing else (see https://example.com/x)",
+        ]
+
+        assert derive_sparse_paths(repo, hints) == ["docs", "src/api"]
+
+    def test_nested_directories_collapse(self, repo):
+        assert derive_sparse_paths(repo, ["src/api/users.py", "src"]) == ["src"]
+
+    def test_outside_git_is_empty(self, tmp_path):
+        assert derive_sparse_paths(tmp_path, ["src/api/users.py"]) == []
+
+    def test_task_hints_include_metadata_paths(self):
+        task = QueuedTask(
+            id="t1",
+            description="Fix login",
+            acceptance_criteria=["Tests pass in tests/auth"],
+            metadata={"paths": ["src/auth"]},
+        )
+
+        assert task_hints(task) == ["Fix login", "Tests pass in tests/auth", "src/auth"]
+
+
+class TestSparseCheckout:
+    """Tests for sparse worktrees and widening them on demand."""
+
+    def test_worktree_add_checks_out_cone_only(self, repo, sparse_tree):
+        assert (sparse_tree / "README.md").exists()
+        assert (sparse_tree / "src/api/users.py").exists()
+        assert not (sparse_tree / "src/web").exists()
+        assert not (sparse_tree / "docs").exists()
+        assert _git(sparse_tree, "status", "--porcelain") == ""
+        assert _git(sparse_tree, "rev-parse", "--abbrev-ref", "HEAD") == "ralph/t1"
+        # The main checkout stays complete
+        assert not SparseCheckout(repo).is_enabled()
+        assert (repo / "docs/guide.md").exists()
+
+    def test_ensure_widens_for_missing_directory(self, sparse_tree):
+        sparse = SparseCheckout(sparse_tree)
+
+        assert sparse.is_enabled()
+        assert sparse.ensure(sparse_tree / "docs" / "guide.md") is True
+        assert (sparse_tree / "docs/guide.md").exists()
+        assert sparse.cone() == ["docs", "src/api"]
+        assert sparse.widened == 1
+
+    def test_ensure_ignores_checked_out_and_untracked_paths(self, sparse_tree):
+        sparse = SparseCheckout(sparse_tree)
+
+        assert sparse.ensure("src/api/new_file.py") is False
+        assert sparse.ensure("src/new_file.py") is False  # Parent of the cone
+        assert sparse.ensure("brand-new/file.py") is False
+        assert sparse.widened == 0
+
+    def test_file_tools_widen_on_read(self, sparse_tree):
+        sparse = SparseCheckout(sparse_tree)
+        fs = FileSystemTools(allowed_roots=[sparse_tree], on_missing=sparse.ensure)
+
+        assert fs.read_file(sparse_tree / "tools" / "lint.sh") == "# tools/lint.sh\n"
+
+    def test_manager_creates_sparse_worktree_from_hints(self, repo, tmp_path):
+        manager = WorktreeManager(
+            repo_path=repo, worktree_dir=tmp_path / "trees", sparse_checkout=True,
+        )
+
+        path = manager.create("t1", hints=["Restyle src/web/app.js"])
+
+        assert (path / "src/web/app.js").exists()
+        assert not (path / "src/api").exists()
+        assert manager.stats()["sparse_checkout"] is True
+
+
+class TestShareDependencyDirs:
+    """Tests for copying dependency directories into worktrees."""
+
+    @pytest.fixture
+    def deps(self, repo):
+        modules = repo / "node_modules" / "left-pad"
+        modules.mkdir(parents=True)
+        (modules / "index.js").write_text("module.exports = 1\n")
+        (modules / "link.js").symlink_to("index.js")
+        return repo
+
+    def test_hardlink_shares_inodes(self, deps, tmp_path):
+        dest = tmp_path / "dest"
+        dest.mkdir()
+
+        shared = share_dependency_dirs(deps, dest, ["node_modules"], mode="hardlink")
+
+        src_file = deps / "node_modules/left-pad/index.js"
+        dst_file = dest / "node_modules/left-pad/index.js"
+        assert [(s.path, s.method, s.files) for s in shared] == [("node_modules", "hardlink", 1)]
+        assert dst_file.stat().st_ino == src_file.stat().st_ino
+        assert (dest / "node_modules/left-pad/link.js").is_symlink()
+
+    def test_copy_makes_independent_files(self, deps, tmp_path):
+        dest = tmp_path / "dest"
+        dest.mkdir()
+
+        share_dependency_dirs(deps, dest, ["node_modules"], mode="copy")
+        (dest / "node_modules/left-pad/index.js").write_text("changed\n")
+
+        assert (deps / "node_modules/left-pad/index.js").read_text() == "module.exports = 1\n"
+
+    def test_auto_falls_back_from_reflink(self, deps, tmp_path):
+        dest = tmp_path / "dest"
+        dest.mkdir()
+
+        shared = share_dependency_dirs(deps, dest, ["node_modules"])
+
+        assert shared[0].method in ("reflink", "hardlink", "copy")
+        assert (dest / "node_modules/left-pad/index.js").read_text() == "module.exports = 1\n"
+
+    def test_skips_missing_and_existing_dirs(self, deps, tmp_path):
+        dest = tmp_path / "dest"
+        (dest / "node_modules").mkdir(parents=True)
+
+        assert share_dependency_dirs(deps, dest, ["node_modules", ".venv"]) == []
+
+    def test_unknown_mode(self, deps, tmp_path):
+        with pytest.raises(ValueError):
+            share_dependency_dirs(deps, tmp_path, ["node_modules"], mode="symlink")
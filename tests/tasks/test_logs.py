@@ -0,0 +1,108 @@
+"""Tests for the per-task execution log stream."""
+
+from __future__ import annotations
+
+import asyncio
+
+from ralph_agi.tasks.logs import TaskLog
+
+
+def _messages(chunk) -> list[str]:
+    return [entry.message for entry in chunk.entries]
+
+
+class TestTaskLog:
+    """Tests for appending, reading from offsets and rotation."""
+
+    def test_read_resumes_from_offset(self, tmp_path):
+        log = TaskLog(tmp_path, "t1")
+        log.append("info", "first")
+        log.append("warn", "second")
+
+        chunk = log.read()
+        log.append("error", "third")
+        resumed = log.read(since=chunk.offset)
+
+        assert _messages(chunk) == ["first", "second"]
+        assert chunk.entries[1].level == "warn"
+        assert _messages(resumed) == ["third"]
+        assert resumed.caught_up
+        assert log.read(since=resumed.offset).entries == []
+
+    def test_limit_and_partial_lines(self, tmp_path):
+        log = TaskLog(tmp_path, "t1")
+        for i in range(5):
+            log.append("info", f"m{i}")
+        with open(log.path, "ab") as f:
+            f.write(b'{"level": "info", "mess')  # Writer mid-line
+
+        first = log.read(limit=2)
+        rest = log.read(since=first.offset)
+
+        assert _messages(first) == ["m0", "m1"]
+        assert _messages(rest) == ["m2", "m3", "m4"]
+        assert not rest.caught_up
+
+    def test_rotation_keeps_offsets_and_prunes_old_segments(self, tmp_path):
+        log = TaskLog(tmp_path, "t1", max_bytes=200, max_segments=2)
+        offsets = []
+        for i in range(20):
+            log.append("info", f"message {i:02d}")
+            offsets.append(log.read().end)
+
+        segments = sorted(p.name for p in tmp_path.glob("t1.*.jsonl.gz"))
+        everything = log.read()
+
+        assert len(segments) == 2
+        assert everything.start > 0  # Oldest segments were dropped
+        assert _messages(everything)[-1] == "message 19"
+        assert _messages(log.read(since=offsets[15])) == ["message 16", "message 17", "message 18", "message 19"]
+
+    def test_reopened_log_continues(self, tmp_path):
+        log = TaskLog(tmp_path, "t1", max_bytes=120)
+        for i in range(6):
+            log.append("info", f"run one {i}")
+        log.close()
+        end = log.read().end
+
+        reopened = TaskLog(tmp_path, "t1", max_bytes=120)
+        reopened.append("info", "run two")
+
+        assert _messages(reopened.read(since=end)) == ["run two"]
+
+    def test_tail(self, tmp_path):
+        log = TaskLog(tmp_path, "t1")
+        for i in range(10):
+            log.append("info", f"m{i}")
+
+        assert [e.message for e in log.tail(3)] == ["m7", "m8", "m9"]
+        assert TaskLog(tmp_path, "missing").tail() == []
+
+    async def test_follow_yields_new_entries_until_stopped(self, tmp_path):
+        log = TaskLog(tmp_path, "t1")
+        log.append("info", "before")
+        done = False
+        received: list[str] = []
+
+        async def follow() -> None:
+            async for chunk in log.follow(poll_interval=0.01, stop=lambda: done):
+                received.extend(_messages(chunk))
+
+        follower = asyncio.create_task(follow())
+        await asyncio.sleep(0.05)
+        log.append("info", "during")
+        await asyncio.sleep(0.05)
+        log.append("info", "last")
+        done = True
+        await asyncio.wait_for(follower, 1.0)
+
+        assert received == ["before", "during", "last"]
+
+    def test_delete(self, tmp_path):
+        log = TaskLog(tmp_path, "t1", max_bytes=100)
+        for i in range(5):
+            log.append("info", f"message {i}")
+
+        log.delete()
+
+        assert list(tmp_path.iterdir()) == []
@@ -6,6 +6,7 @@ Tests the parallel execution system using worktrees.
 from __future__ import annotations
 
 import asyncio
+import time
 import pytest
 from datetime import datetime, timezone
 from pathlib import Path
@@ -16,9 +17,10 @@ from ralph_agi.tasks.parallel import (
     TaskResult,
     ExecutionProgress,
     ExecutionState,
+    ReadySet,
     create_executor,
 )
-from ralph_agi.tasks.queue import TaskQueue, QueuedTask, TaskStatus, TaskPriority
+from ralph_agi.tasks.queue import TaskQueue, QueuedTask, TaskPriority
 
 
 class TestTaskResult:
@@ -169,47 +171,47 @@ class TestParallelExecutor:
         assert task1 in ready
         assert task2 in ready
 
-    def test_get_ready_tasks_respects_dependencies(self, executor):
+    def test_get_ready_tasks_respects_dependencies(self, executor, tmp_path):
         """Test _get_ready_tasks respects dependencies."""
-        task1 = QueuedTask(id="task-1", description="Task 1")
-        task2 = QueuedTask(id="task-2", description="Task 2", dependencies=["task-1"])
-
-        executor._mock_queue.list.return_value = [task1, task2]
+        queue = TaskQueue(project_root=tmp_path)
+        queue.add("Task 1", task_id="task-1")
+        queue.add("Task 2", task_id="task-2", dependencies=["task-1"])
+        queue.update_status("task-2", "ready")
+        executor._queue = queue
 
         # task-1 is pending, so task-2 should be blocked
-        def mock_get(task_id):
-            if task_id == "task-1":
-                return QueuedTask(id="task-1", description="Task 1", status=TaskStatus.PENDING)
-            raise Exception("Not found")
-
-        executor._mock_queue.get = mock_get
-        executor._queue = executor._mock_queue
-
         ready = executor._get_ready_tasks()
 
-        assert len(ready) == 1
-        assert task1 in ready
-        assert task2 not in ready
+        assert ready == []
 
-    def test_get_ready_tasks_allows_completed_dependencies(self, executor):
+    def test_get_ready_tasks_allows_completed_dependencies(self, executor, tmp_path):
         """Test _get_ready_tasks allows tasks with completed dependencies."""
-        task1 = QueuedTask(id="task-1", description="Task 1")
-        task2 = QueuedTask(id="task-2", description="Task 2", dependencies=["task-1"])
-
-        executor._mock_queue.list.return_value = [task1, task2]
+        queue = TaskQueue(project_root=tmp_path)
+        queue.add("Task 1", task_id="task-1")
+        queue.add("Task 2", task_id="task-2", dependencies=["task-1"])
+        queue.add("Task 3", task_id="task-3", dependencies=["task-1"])
+        queue.update_status("task-1", "complete")
+        queue.update_status("task-2", "ready")
+        queue.update_status("task-3", "ready")
+        executor._queue = queue
+
+        # task-1 is complete, so task-2 and task-3 should be ready
+        ready = executor._get_ready_tasks()
 
-        # task-1 is complete, so task-2 should be ready
-        def mock_get(task_id):
-            if task_id == "task-1":
-                return QueuedTask(id="task-1", description="Task 1", status=TaskStatus.COMPLETE)
-            raise Exception("Not found")
+        assert [t.id for t in ready] == ["task-2", "task-3"]
 
-        executor._mock_queue.get = mock_get
-        executor._queue = executor._mock_queue
+    def test_get_ready_tasks_allows_pending_merge_and_missing(self, executor, tmp_path):
+        """Test pending_merge and missing dependencies count as satisfied."""
+        queue = TaskQueue(project_root=tmp_path)
+        queue.add("Task 1", task_id="task-1")
+        queue.add("Task 2", task_id="task-2", dependencies=["task-1", "gone"])
+        queue.update_status("task-1", "pending_merge")
+        queue.update_status("task-2", "ready")
+        executor._queue = queue
 
         ready = executor._get_ready_tasks()
 
-        assert len(ready) == 2
+        assert [t.id for t in ready] == ["task-2"]
 
 
 class TestParallelExecutorCallbacks:
@@ -251,6 +253,147 @@ class TestParallelExecutorCallbacks:
         assert executor_with_callbacks._on_progress is not None
 
 
+class TestReadySet:
+    """Tests for the dependency-aware ReadySet."""
+
+    @pytest.fixture
+    def queue(self, tmp_path):
+        return TaskQueue(project_root=tmp_path)
+
+    def test_rebuild_only_includes_unblocked_ready_tasks(self, queue):
+        queue.add("Base", task_id="base")
+        queue.add("Child", task_id="child", dependencies=["base"])
+        queue.add("Solo", task_id="solo")
+        queue.update_status("child", "ready")
+        queue.update_status("solo", "ready")
+
+        ready = ReadySet(queue)
+        ready.rebuild()
+
+        assert "solo" in ready
+        assert "child" not in ready
+
+    def test_update_unblocks_dependents(self, queue):
+        queue.add("Base", task_id="base")
+        queue.add("Child", task_id="child", dependencies=["base"])
+        queue.update_status("child", "ready")
+
+        ready = ReadySet(queue)
+        ready.rebuild()
+        assert len(ready) == 0
+
+        base = queue.update_status("base", "pending_merge")
+
+        assert ready.update(base) is True
+        assert "child" in ready
+
+    def test_update_removes_no_longer_ready(self, queue):
+        queue.add("Solo", task_id="solo")
+        task = queue.update_status("solo", "ready")
+
+        ready = ReadySet(queue)
+        ready.rebuild()
+        assert "solo" in ready
+
+        task = queue.update_status("solo", "cancelled")
+        assert ready.update(task) is False
+        assert "solo" not in ready
+
+    def test_take_orders_by_priority_and_respects_limit(self, queue):
+        queue.add("Low", task_id="low", priority="P3")
+        queue.add("High", task_id="high", priority="P0")
+        queue.add("Mid", task_id="mid", priority="P1")
+        for task_id in ("low", "high", "mid"):
+            queue.update_status(task_id, "ready")
+
+        ready = ReadySet(queue)
+        ready.rebuild()
+
+        taken = ready.take(2, exclude={"high"})
+
+        assert [t.id for t in taken] == ["mid", "low"]
+        assert [t.id for t in ready.take(5)] == ["high"]
+        assert ready.take(5) == []
+
+
+class TestEventDrivenDispatch:
+    """Tests that the dispatcher reacts to events instead of polling."""
+
+    @pytest.fixture
+    def executor(self, tmp_path):
+        with patch('ralph_agi.tasks.parallel.WorktreeManager') as mock_wt_class:
+            mock_wt = MagicMock()
+            mock_wt.create.side_effect = lambda task_id: tmp_path / task_id
+            mock_wt.execute_in_worktree.side_effect = lambda task_id, fn: fn(tmp_path / task_id)
+            mock_wt_class.return_value = mock_wt
+
+            started: list[str] = []
+            executor = ParallelExecutor(
+                project_root=tmp_path,
+                max_concurrent=1,
+                on_task_start=lambda t: started.append(t.id),
+                rescan_interval=30.0,
+            )
+            executor._started = started
+            return executor
+
+    def test_dependent_dispatched_on_completion(self, executor):
+        queue = executor._queue
+        queue.add("First", task_id="first")
+        queue.add("Second", task_id="second", dependencies=["first"])
+        queue.update_status("first", "ready")
+        queue.update_status("second", "ready")
+
+        loop = asyncio.new_event_loop()
+        try:
+            results = loop.run_until_complete(
+                asyncio.wait_for(executor.run(), timeout=5.0)
+            )
+        finally:
+            loop.close()
+
+        # Well under the rescan interval: woken by completion, not a timer
+        assert executor._started == ["first", "second"]
+        assert [r.task_id for r in results] == ["first", "second"]
+        assert all(r.success for r in results)
+
+    def test_task_written_by_another_process_is_dispatched(self, executor, tmp_path):
+        executor._queue.add("First", task_id="first")
+        executor._queue.update_status("first", "ready")
+
+        def callback(task, worktree_path):
+            if task.id == "first":
+                # Another process approves a task while this one runs
+                other = TaskQueue(project_root=tmp_path)
+                other.add("Second", task_id="second")
+                other.update_status("second", "ready")
+                for _ in range(100):
+                    if "second" in executor._ready:
+                        break
+                    time.sleep(0.02)
+            return TaskResult(task_id=task.id, success=True)
+
+        executor._task_callback = callback
+
+        loop = asyncio.new_event_loop()
+        try:
+            results = loop.run_until_complete(
+                asyncio.wait_for(executor.run(), timeout=5.0)
+            )
+        finally:
+            loop.close()
+
+        # Without the watcher the run would end before the 30s rescan
+        assert [r.task_id for r in results] == ["first", "second"]
+
+    def test_notify_ignored_when_idle(self, executor):
+        task = executor._queue.add("Task", task_id="t1")
+
+        executor.notify_task_changed(task)
+
+        assert len(executor._ready) == 0
+
+
 class TestCreateExecutor:
     """Tests for create_executor factory function."""
 
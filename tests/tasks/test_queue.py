@@ -6,6 +6,7 @@ Tests the file-based task queue for autonomous processing.
 from __future__ import annotations
 
 import pytest
+import yaml
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -18,6 +19,9 @@ from ralph_agi.tasks.queue import (
     TaskNotFoundError,
     TaskValidationError,
     generate_task_id,
+    TaskIndex,
+    TaskArtifact,
+    TaskOutput,
 )
 
 
@@ -405,3 +409,203 @@ class TestTaskQueueCallbacks:
 
         assert len(updated_tasks) == 1
         assert updated_tasks[0].status == TaskStatus.RUNNING
+
+
+class TestTaskIndex:
+    """Tests for the in-memory TaskIndex."""
+
+    def _task(self, task_id, priority=TaskPriority.P2, status=TaskStatus.PENDING, deps=None, ts=0):
+        return QueuedTask(
+            id=task_id,
+            description=task_id,
+            priority=priority,
+            status=status,
+            dependencies=deps or [],
+            created_at=datetime(2026, 1, 1, 0, 0, ts, tzinfo=timezone.utc),
+        )
+
+    def test_iter_sorted_by_priority_then_created(self):
+        index = TaskIndex()
+        index.put(self._task("c", TaskPriority.P2, ts=1))
+        index.put(self._task("a", TaskPriority.P2, ts=0))
+        index.put(self._task("b", TaskPriority.P0, ts=5))
+
+        ids = [t.id for t in index.iter_sorted([TaskStatus.PENDING])]
+
+        assert ids == ["b", "a", "c"]
+
+    def test_iter_sorted_merges_statuses_and_filters_priority(self):
+        index = TaskIndex()
+        index.put(self._task("p1", TaskPriority.P1, TaskStatus.PENDING))
+        index.put(self._task("r1", TaskPriority.P1, TaskStatus.READY, ts=1))
+        index.put(self._task("r2", TaskPriority.P3, TaskStatus.READY))
+
+        statuses = [TaskStatus.PENDING, TaskStatus.READY]
+        assert [t.id for t in index.iter_sorted(statuses)] == ["p1", "r1", "r2"]
+        assert [t.id for t in index.iter_sorted(statuses, TaskPriority.P3)] == ["r2"]
+
+    def test_put_moves_between_status_buckets(self):
+        index = TaskIndex()
+        index.put(self._task("a"))
+        index.put(self._task("a", status=TaskStatus.RUNNING))
+
+        assert index.count(TaskStatus.PENDING) == 0
+        assert index.count(TaskStatus.RUNNING) == 1
+        assert len(index) == 1
+
+    def test_dependents_and_removal(self):
+        index = TaskIndex()
+        index.put(self._task("a"))
+        index.put(self._task("b", deps=["a"]))
+        index.put(self._task("c", deps=["a"]))
+
+        assert index.dependents("a") == {"b", "c"}
+
+        index.remove("b")
+        assert index.dependents("a") == {"c"}
+
+    def test_dependencies_met(self):
+        index = TaskIndex()
+        index.put(self._task("a", status=TaskStatus.PENDING_MERGE))
+        task = self._task("b", deps=["a", "missing"])
+
+        assert index.dependencies_met(task) is False
+        assert index.dependencies_met(
+            task, [TaskStatus.COMPLETE, TaskStatus.PENDING_MERGE], missing_ok=True
+        ) is True
+
+
+class TestTaskQueueIndexing:
+    """Tests for TaskQueue index invalidation and storage backends."""
+
+    def test_sees_external_file_edits(self, tmp_path):
+        queue = TaskQueue(project_root=tmp_path)
+        task = queue.add("Task 1")
+
+        path = queue.tasks_dir / f"{task.id}.yaml"
+        data = yaml.safe_load(path.read_text())
+        data["status"] = "ready"
+        path.write_text(yaml.dump(data))
+
+        assert queue.get(task.id).status == TaskStatus.READY
+        assert queue.stats()["ready"] == 1
+
+    def test_sees_tasks_added_by_other_instance(self, tmp_path):
+        queue = TaskQueue(project_root=tmp_path)
+        queue.list()
+
+        other = TaskQueue(project_root=tmp_path)
+        task = other.add("From elsewhere")
+
+        assert [t.id for t in queue.list()] == [task.id]
+
+    def test_sees_external_delete(self, tmp_path):
+        queue = TaskQueue(project_root=tmp_path)
+        task = queue.add("Task 1")
+        queue.list()
+
+        (queue.tasks_dir / f"{task.id}.yaml").unlink()
+
+        with pytest.raises(TaskNotFoundError):
+            queue.get(task.id)
+
+    def test_returned_tasks_are_copies(self, tmp_path):
+        queue = TaskQueue(project_root=tmp_path)
+        task = queue.add("Task 1")
+
+        fetched = queue.get(task.id)
+        fetched.status = TaskStatus.RUNNING
+
+        assert queue.get(task.id).status == TaskStatus.PENDING
+        assert queue.stats()["running"] == 0
+
+    def test_dependents(self, tmp_path):
+        queue = TaskQueue(project_root=tmp_path)
+        queue.add("Base", task_id="base")
+        queue.add("Child", task_id="child", dependencies=["base"])
+
+        assert [t.id for t in queue.dependents("base")] == ["child"]
+
+    def test_next_refreshes_once(self, tmp_path):
+        queue = TaskQueue(project_root=tmp_path)
+        queue.add("Base", task_id="t0")
+        for i in range(1, 20):
+            queue.add(f"Step {i}", task_id=f"t{i}", dependencies=[f"t{i - 1}"])
+        calls = []
+        changes = queue._storage.changes
+        queue._storage.changes = lambda: calls.append(1) or changes()
+
+        assert queue.next().id == "t0"
+        assert len(calls) == 1
+
+    def test_sqlite_backend(self, tmp_path):
+        queue = TaskQueue(project_root=tmp_path, storage="sqlite")
+        task1 = queue.add("Task 1", priority="P1")
+        task2 = queue.add("Task 2", dependencies=[task1.id])
+        queue.update_status(task1.id, "complete")
+
+        assert queue.next().id == task2.id
+        assert queue.stats()["complete"] == 1
+        # YAML kept as an export format
+        assert (queue.tasks_dir / f"{task2.id}.yaml").exists()
+        assert (tmp_path / ".ralph" / "tasks.db").exists()
+
+        reopened = TaskQueue(project_root=tmp_path, storage="sqlite")
+        assert reopened.get(task1.id).status == TaskStatus.COMPLETE
+
+
+class TestTaskQueueArtifactBlobs:
+    """Tests for keeping artifact contents out of task records."""
+
+    def _complete_with_artifact(self, queue: TaskQueue, content: str) -> QueuedTask:
+        task = queue.add("Write docs")
+        task.output = TaskOutput(artifacts=[TaskArtifact(path="docs.md", content=content)])
+        queue._save_task(task)
+        return task
+
+    def test_inline_content_is_moved_to_blob_store(self, tmp_path):
+        queue = TaskQueue(project_root=tmp_path)
+        task = self._complete_with_artifact(queue, "# Docs\n" * 100)
+
+        record = yaml.safe_load((queue.tasks_dir / f"{task.id}.yaml").read_text())
+        artifact = record["output"]["artifacts"][0]
+
+        assert "content" not in artifact
+        assert queue.blobs.read(artifact["blob"]).decode() == "# Docs\n" * 100
+        assert queue.get(task.id).output.artifacts[0].blob == artifact["blob"]
+
+    def test_identical_contents_are_stored_once(self, tmp_path):
+        queue = TaskQueue(project_root=tmp_path)
+        first = self._complete_with_artifact(queue, "same\n")
+        second = self._complete_with_artifact(queue, "same\n")
+
+        blob_files = [p for p in (tmp_path / ".ralph" / "blobs").rglob("*") if p.is_file()]
+
+        assert first.output.artifacts[0].blob == second.output.artifacts[0].blob
+        assert len(blob_files) == 1
+
+    def test_clear_prunes_unreferenced_blobs(self, tmp_path):
+        queue = TaskQueue(project_root=tmp_path)
+        done = self._complete_with_artifact(queue, "done\n")
+        kept = self._complete_with_artifact(queue, "kept\n")
+        queue.update_status(done.id, "complete")
+
+        queue.clear()
+
+        assert queue.prune_blobs(min_age=0) == 1
+        assert not queue.blobs.exists(done.output.artifacts[0].blob)
+        assert queue.blobs.exists(kept.output.artifacts[0].blob)
+
+
+class TestTaskQueueLogs:
+    """Tests for per-task execution logs owned by the queue."""
+
+    def test_removing_a_task_deletes_its_log(self, tmp_path):
+        queue = TaskQueue(project_root=tmp_path)
+        task = queue.add("Task with logs")
+        queue.task_log(task.id).append("info", "hello")
+
+        assert queue.task_log(task.id).read().entries
+        queue.remove(task.id)
+
+        assert list(queue.logs_dir.iterdir()) == []
@@ -0,0 +1,134 @@
+"""Tests for the process-safe worktree registry."""
+
+from __future__ import annotations
+
+import json
+import multiprocessing
+import os
+
+import pytest
+
+from ralph_agi.tasks.registry import ActiveWorktree, RegistryError, WorktreeRegistry
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = WorktreeRegistry.for_repo(tmp_path)
+    yield registry
+    registry.close()
+
+
+def _worktree(task_id: str, status: str = "created") -> ActiveWorktree:
+    return ActiveWorktree(task_id, f"/trees/{task_id}", f"ralph/{task_id}", status=status)
+
+
+def _bump(db_path: str, worker: int, rounds: int) -> None:
+    """Child process: register one worktree and update it repeatedly."""
+    registry = WorktreeRegistry(db_path)
+    registry.add(_worktree(f"task-{worker}"))
+    for i in range(rounds):
+        registry.update(f"task-{worker}", commit=str(i + 1), status="running")
+    registry.close()
+
+
+class TestWorktreeRegistry:
+    """Tests for WorktreeRegistry."""
+
+    def test_add_and_get(self, registry, tmp_path):
+        assert registry.add(_worktree("t1")) is True
+
+        found = registry.get("t1")
+        assert found.path == "/trees/t1"
+        assert found.branch == "ralph/t1"
+        assert found.created_at.tzinfo is not None
+        assert registry.db_path == tmp_path / ".ralph" / "worktrees.db"
+        assert registry.get("missing") is None
+
+    def test_add_existing_task(self, registry):
+        registry.add(_worktree("t1"))
+
+        assert registry.add(_worktree("t1", status="running")) is False
+        assert registry.get("t1").status == "created"
+        assert registry.add(_worktree("t1", status="running"), replace=True) is True
+        assert registry.get("t1").status == "running"
+
+    def test_update_single_record(self, registry):
+        registry.add(_worktree("t1"))
+        registry.add(_worktree("t2"))
+
+        updated = registry.update("t1", commit="abc123", status="ready_to_merge")
+
+        assert updated.commit == "abc123"
+        assert updated.status == "ready_to_merge"
+        assert registry.get("t2").status == "created"
+        assert registry.update_status("missing", "error") is None
+
+    def test_update_unknown_field(self, registry):
+        registry.add(_worktree("t1"))
+
+        with pytest.raises(ValueError):
+            registry.update("t1", created_at="2020-01-01")
+
+    def test_remove_list_and_counts(self, registry):
+        for task_id, status in (("t1", "running"), ("t2", "running"), ("t3", "error")):
+            registry.add(_worktree(task_id, status))
+
+        assert registry.remove("t2") is True
+        assert registry.remove("t2") is False
+        assert [w.task_id for w in registry.list()] == ["t1", "t3"]
+        assert registry.counts() == {"running": 1, "error": 1}
+
+    def test_imports_legacy_state_file(self, tmp_path):
+        legacy = tmp_path / ".ralph" / "worktrees.json"
+        legacy.parent.mkdir()
+        legacy.write_text(json.dumps({
+            "worktrees": {"old": _worktree("old", "running").to_dict()},
+        }))
+
+        registry = WorktreeRegistry.for_repo(tmp_path)
+
+        assert registry.get("old").status == "running"
+        assert not legacy.exists()
+        assert legacy.with_suffix(".json.migrated").exists()
+        registry.close()
+
+    def test_unreadable_database(self, tmp_path):
+        db = tmp_path / "worktrees.db"
+        db.write_text("not a database" * 100)
+
+        with pytest.raises(RegistryError):
+            WorktreeRegistry(db).list()
+
+    def test_concurrent_processes_lose_no_updates(self, tmp_path):
+        db_path = str(tmp_path / "worktrees.db")
+        ctx = multiprocessing.get_context("spawn")
+        workers = [ctx.Process(target=_bump, args=(db_path, i, 25)) for i in range(4)]
+        for p in workers:
+            p.start()
+        for p in workers:
+            p.join(timeout=60)
+            assert p.exitcode == 0
+
+        registry = WorktreeRegistry(db_path)
+        assert sorted((w.task_id, w.commit) for w in registry.list()) == [
+            (f"task-{i}", "25") for i in range(4)
+        ]
+        registry.close()
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="needs fork()")
+    def test_forked_child_opens_own_connection(self, registry):
+        registry.add(_worktree("parent"))
+
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - child
+            try:
+                registry.update_status("parent", "running")
+                registry.add(_worktree("child"))
+                os._exit(0)
+            except BaseException:
+                os._exit(1)
+        _, status = os.waitpid(pid, 0)
+
+        assert os.waitstatus_to_exitcode(status) == 0
+        assert registry.get("parent").status == "running"
+        assert registry.get("child") is not None
@@ -0,0 +1,309 @@
+"""Tests for task queue storage backends."""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from ralph_agi.tasks.storage import (
+    SQLiteTaskStorage,
+    StorageChanges,
+    StorageError,
+    YamlTaskStorage,
+    create_storage,
+    dump_task_yaml,
+)
+
+
+def _record(task_id: str, status: str = "pending", priority: str = "P2") -> dict:
+    return {
+        "id": task_id,
+        "description": f"Task {task_id}",
+        "priority": priority,
+        "status": status,
+    }
+
+
+class TestStorageChanges:
+    """Tests for StorageChanges."""
+
+    def test_empty_is_falsy(self):
+        assert not StorageChanges()
+
+    def test_full_is_truthy(self):
+        assert StorageChanges(full=True)
+
+
+class TestYamlTaskStorage:
+    """Tests for the YAML file backend."""
+
+    @pytest.fixture
+    def storage(self, tmp_path):
+        return YamlTaskStorage(tmp_path / "tasks")
+
+    def test_write_and_read(self, storage):
+        storage.write("t1", _record("t1"))
+
+        assert storage.exists("t1")
+        assert storage.read("t1")["description"] == "Task t1"
+        assert (storage.tasks_dir / "t1.yaml").exists()
+
+    def test_first_changes_is_full_snapshot(self, storage):
+        dump_task_yaml(storage.path_for("t1"), _record("t1"))
+        dump_task_yaml(storage.path_for("t2"), _record("t2"))
+
+        changes = storage.changes()
+
+        assert changes.full is True
+        assert set(changes.updated) == {"t1", "t2"}
+
+    def test_own_writes_not_reported(self, storage):
+        storage.changes()
+        storage.write("t1", _record("t1"))
+
+        assert not storage.changes()
+
+    def test_unchanged_files_not_reparsed(self, storage):
+        storage.write("t1", _record("t1"))
+        storage.changes()
+
+        assert not storage.changes()
+
+    def test_external_edit_detected(self, storage):
+        storage.write("t1", _record("t1"))
+        storage.changes()
+
+        path = storage.path_for("t1")
+        path.write_text(yaml.dump(_record("t1", status="ready")))
+
+        changes = storage.changes()
+
+        assert changes.full is False
+        assert changes.updated["t1"]["status"] == "ready"
+
+    def test_unchanged_directory_skips_scan(self, storage):
+        storage.write("t1", _record("t1"))
+        # Backdate the directory so its mtime is clearly older than the scan
+        os.utime(storage.tasks_dir, (1_000_000, 1_000_000))
+        storage.changes()
+
+        with patch("ralph_agi.tasks.storage.os.scandir", wraps=os.scandir) as scandir:
+            assert not storage.changes()
+            storage.path_for("t1").unlink()
+            changes = storage.changes()
+
+        assert scandir.call_count == 1
+        assert changes.removed == {"t1"}
+
+    def test_in_place_edit_found_by_periodic_scan(self, storage):
+        storage.write("t1", _record("t1"))
+        os.utime(storage.tasks_dir, (1_000_000, 1_000_000))
+        storage.changes()
+
+        with open(storage.path_for("t1"), "w") as f:
+            f.write(yaml.dump(_record("t1", status="ready")))
+        os.utime(storage.tasks_dir, (1_000_000, 1_000_000))
+        assert not storage.changes()  # Directory unchanged: trusted for now
+
+        storage.FULL_SCAN_INTERVAL = 0
+        assert storage.changes().updated["t1"]["status"] == "ready"
+
+    def test_external_delete_detected(self, storage):
+        storage.write("t1", _record("t1"))
+        storage.changes()
+
+        storage.path_for("t1").unlink()
+
+        changes = storage.changes()
+
+        assert changes.removed == {"t1"}
+
+    def test_ignores_temp_and_invalid_files(self, storage):
+        (storage.tasks_dir / "t1.yaml.tmp").write_text(yaml.dump(_record("t1")))
+        (storage.tasks_dir / "broken.yaml").write_text("- not a task\n")
+
+        changes = storage.changes()
+
+        assert changes.updated == {}
+
+    def test_delete(self, storage):
+        storage.write("t1", _record("t1"))
+
+        assert storage.delete("t1") is True
+        assert storage.delete("t1") is False
+        assert not storage.exists("t1")
+
+
+class TestSQLiteTaskStorage:
+    """Tests for the SQLite backend."""
+
+    @pytest.fixture
+    def storage(self, tmp_path):
+        storage = SQLiteTaskStorage(tmp_path / "tasks")
+        yield storage
+        storage.close()
+
+    def test_db_next_to_tasks_dir(self, storage, tmp_path):
+        assert storage.db_path == tmp_path / "tasks.db"
+
+    def test_write_and_read(self, storage):
+        storage.write("t1", _record("t1"))
+
+        assert storage.exists("t1")
+        assert storage.read("t1")["status"] == "pending"
+
+    def test_exports_yaml(self, storage, tmp_path):
+        storage.write("t1", _record("t1"))
+
+        data = yaml.safe_load((tmp_path / "tasks" / "t1.yaml").read_text())
+        assert data["id"] == "t1"
+
+        storage.delete("t1")
+        assert not (tmp_path / "tasks" / "t1.yaml").exists()
+
+    def test_no_export(self, tmp_path):
+        storage = SQLiteTaskStorage(tmp_path / "tasks", export_yaml=False)
+        storage.write("t1", _record("t1"))
+
+        assert not (tmp_path / "tasks" / "t1.yaml").exists()
+        storage.close()
+
+    def test_imports_existing_yaml(self, tmp_path):
+        tasks_dir = tmp_path / "tasks"
+        tasks_dir.mkdir()
+        dump_task_yaml(tasks_dir / "t1.yaml", _record("t1"))
+
+        storage = SQLiteTaskStorage(tasks_dir)
+
+        assert storage.read("t1")["id"] == "t1"
+        storage.close()
+
+    def test_uses_wal_journal(self, storage):
+        conn = sqlite3.connect(str(storage.db_path))
+        mode = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        conn.close()
+
+        assert mode == "wal"
+
+    def test_changes_only_after_external_commit(self, storage, tmp_path):
+        storage.write("t1", _record("t1"))
+
+        assert storage.changes().full is True
+        assert not storage.changes()
+
+        storage.write("t2", _record("t2"))
+        assert not storage.changes()
+
+        other = SQLiteTaskStorage(tmp_path / "tasks")
+        other.write("t3", _record("t3"))
+        other.close()
+
+        changes = storage.changes()
+        assert changes.full is False
+        assert set(changes.updated) == {"t3"}
+        assert not storage.changes()
+
+    def test_external_delete_reported_incrementally(self, storage, tmp_path):
+        storage.write("t1", _record("t1"))
+        storage.write("t2", _record("t2"))
+        storage.changes()
+
+        other = SQLiteTaskStorage(tmp_path / "tasks")
+        other.delete("t1")
+        other.write("t2", _record("t2", status="complete"))
+        other.close()
+
+        changes = storage.changes()
+        assert changes.full is False
+        assert changes.removed == {"t1"}
+        assert changes.updated["t2"]["status"] == "complete"
+
+    def test_adds_seq_to_existing_database(self, tmp_path):
+        db_path = tmp_path / "tasks.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute(
+            "CREATE TABLE tasks (id TEXT PRIMARY KEY, status TEXT NOT NULL,"
+            " priority TEXT NOT NULL, record TEXT NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO tasks VALUES (?, ?, ?, ?)",
+            ("t1", "pending", "P2", '{"id": "t1"}'),
+        )
+        conn.commit()
+        conn.close()
+
+        storage = SQLiteTaskStorage(tmp_path / "tasks")
+        assert set(storage.changes().updated) == {"t1"}
+
+        storage.write("t2", _record("t2"))
+        other = SQLiteTaskStorage(tmp_path / "tasks")
+        assert set(other.changes().updated) == {"t1", "t2"}
+        other.close()
+        storage.close()
+
+    def test_locked_database_raises_storage_error(self, storage):
+        storage.write("t1", _record("t1"))
+        storage._conn.execute("PRAGMA busy_timeout = 0")
+        other = sqlite3.connect(str(storage.db_path), isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+
+        try:
+            with pytest.raises(StorageError, match="locked"):
+                storage.write("t2", _record("t2"))
+            with pytest.raises(StorageError, match="locked"):
+                storage.delete("t1")
+        finally:
+            other.execute("ROLLBACK")
+            other.close()
+
+        assert storage.delete("t1") is True
+
+    def test_reopened_instance_sees_own_writes(self, storage):
+        watcher = storage.reopen()
+        watcher.changes()
+
+        storage.write("t1", _record("t1"))
+
+        assert watcher.db_path == storage.db_path
+        assert set(watcher.changes().updated) == {"t1"}
+        watcher.close()
+
+    def test_export_rewrites_all(self, tmp_path):
+        storage = SQLiteTaskStorage(tmp_path / "tasks", export_yaml=False)
+        storage.write("t1", _record("t1"))
+        storage.write("t2", _record("t2"))
+
+        assert storage.export() == 2
+        assert (tmp_path / "tasks" / "t2.yaml").exists()
+        storage.close()
+
+
+class TestCreateStorage:
+    """Tests for create_storage factory."""
+
+    def test_default_is_yaml(self, tmp_path):
+        assert isinstance(create_storage(None, tmp_path), YamlTaskStorage)
+
+    def test_sqlite(self, tmp_path):
+        storage = create_storage("sqlite", tmp_path / "tasks")
+        assert isinstance(storage, SQLiteTaskStorage)
+        storage.close()
+
+    def test_passthrough_instance(self, tmp_path):
+        storage = YamlTaskStorage(tmp_path)
+        assert create_storage(storage, tmp_path) is storage
+
+    def test_unknown_backend(self, tmp_path):
+        with pytest.raises(ValueError):
+            create_storage("redis", tmp_path)
+
+    def test_storage_error_on_failed_write(self, tmp_path):
+        storage = YamlTaskStorage(tmp_path / "tasks")
+        storage.tasks_dir.rmdir()
+
+        with pytest.raises(StorageError):
+            storage.write("t1", _record("t1"))
@@ -0,0 +1,263 @@
+"""Tests for the task directory watcher."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+
+import pytest
+
+from ralph_agi.tasks.queue import TaskQueue
+from ralph_agi.tasks.storage import StorageChanges, TaskStorage, dump_task_yaml
+from ralph_agi.tasks.watcher import (
+    StorageWatcher,
+    TaskEventType,
+    TaskWatcher,
+    inotify_available,
+)
+
+BACKENDS = [
+    "polling",
+    pytest.param(
+        "inotify",
+        marks=pytest.mark.skipif(not inotify_available(), reason="inotify is Linux-only"),
+    ),
+]
+
+
+def _write(tasks_dir, task_id: str, status: str = "pending") -> None:
+    dump_task_yaml(
+        tasks_dir / f"{task_id}.yaml",
+        {"id": task_id, "description": f"Task {task_id}", "status": status},
+    )
+
+
+def _kinds(events) -> list[tuple[str, str]]:
+    return [(event.type.value, event.task_id) for event in events]
+
+
+@pytest.fixture(params=BACKENDS)
+def make_watcher(request, tmp_path):
+    watchers = []
+
+    def make(**kwargs) -> TaskWatcher:
+        kwargs.setdefault("debounce", 0.05)
+        kwargs.setdefault("poll_interval", 0.05)
+        watcher = TaskWatcher(tmp_path, backend=request.param, **kwargs)
+        watchers.append(watcher)
+        return watcher
+
+    yield make
+    for watcher in watchers:
+        watcher.close()
+
+
+class TestTaskWatcher:
+    """Tests for change detection, debouncing and the three APIs."""
+
+    def test_added_updated_removed(self, tmp_path, make_watcher):
+        _write(tmp_path, "existing")
+        watcher = make_watcher()
+
+        _write(tmp_path, "new")
+        added = watcher.poll(timeout=2.0)
+        _write(tmp_path, "existing", status="ready")
+        updated = watcher.poll(timeout=2.0)
+        (tmp_path / "new.yaml").unlink()
+        removed = watcher.poll(timeout=2.0)
+
+        assert _kinds(added) == [("added", "new")]
+        assert added[0].task.description == "Task new"
+        assert _kinds(updated) == [("updated", "existing")]
+        assert updated[0].task.status.value == "ready"
+        assert _kinds(removed) == [("removed", "new")]
+        assert removed[0].task is None
+
+    def test_burst_of_writes_is_one_event_per_task(self, tmp_path, make_watcher):
+        watcher = make_watcher(debounce=0.2, max_delay=2.0)
+
+        for status in ("pending", "ready", "running"):
+            _write(tmp_path, "t1", status=status)
+        _write(tmp_path, "t2")
+
+        events = watcher.poll(timeout=3.0)
+
+        assert _kinds(events) == [("added", "t1"), ("added", "t2")]
+        assert events[0].task.status.value == "running"
+
+    def test_temp_files_and_invalid_yaml_are_ignored(self, tmp_path, make_watcher):
+        watcher = make_watcher()
+
+        (tmp_path / "t1.yaml.tmp").write_text("id: t1\n")
+        (tmp_path / "broken.yaml").write_text("not: [valid")
+        assert watcher.poll(timeout=0.5) == []
+
+        _write(tmp_path, "broken")
+        assert _kinds(watcher.poll(timeout=2.0)) == [("added", "broken")]
+
+    def test_close_unblocks_poll(self, make_watcher):
+        watcher = make_watcher(poll_interval=0.1)
+        result = []
+        thread = threading.Thread(target=lambda: result.append(watcher.poll()))
+        thread.start()
+
+        watcher.close()
+        thread.join(timeout=2.0)
+
+        assert not thread.is_alive()
+        assert result == [[]]
+
+    def test_start_calls_back_on_thread(self, tmp_path, make_watcher):
+        watcher = make_watcher()
+        seen = []
+        done = threading.Event()
+
+        def callback(event):
+            seen.append(event.task_id)
+            done.set()
+
+        watcher.start(callback)
+        _write(tmp_path, "t1")
+
+        assert done.wait(timeout=3.0)
+        watcher.close()
+        assert seen == ["t1"]
+
+    async def test_async_iterator(self, tmp_path, make_watcher):
+        watcher = make_watcher()
+
+        async def collect():
+            events = []
+            async for event in watcher:
+                events.append(event)
+                if len(events) == 2:
+                    return events
+
+        collector = asyncio.create_task(collect())
+        await asyncio.sleep(0.1)
+        _write(tmp_path, "t1")
+        await asyncio.sleep(0.3)
+        (tmp_path / "t1.yaml").unlink()
+
+        events = await asyncio.wait_for(collector, timeout=3.0)
+        assert [event.type for event in events] == [TaskEventType.ADDED, TaskEventType.REMOVED]
+
+
+class TestStorageWatcher:
+    """Tests for watching a non-YAML storage backend."""
+
+    def test_sqlite_changes_are_reported(self, tmp_path):
+        queue = TaskQueue(project_root=tmp_path, storage="sqlite")
+        other = TaskQueue(project_root=tmp_path, storage="sqlite")
+        queue.add("Existing", task_id="existing")
+
+        with queue.watcher(poll_interval=0.05) as watcher:
+            assert isinstance(watcher, StorageWatcher)
+            assert watcher.poll(timeout=0.1) == []
+
+            other.add("Fix the thing", task_id="t1")
+            added = watcher.poll(timeout=2.0)
+            other.update_status("t1", "ready")
+            updated = watcher.poll(timeout=2.0)
+            queue.remove("existing")
+            removed = watcher.poll(timeout=2.0)
+
+        assert _kinds(added) == [("added", "t1")]
+        assert _kinds(updated) == [("updated", "t1")]
+        assert updated[0].task.status.value == "ready"
+        assert _kinds(removed) == [("removed", "existing")]
+
+    async def test_async_iterator(self, tmp_path):
+        queue = TaskQueue(project_root=tmp_path, storage="sqlite")
+
+        with queue.watcher(poll_interval=0.05) as watcher:
+            async def first_event():
+                async for event in watcher:
+                    return event
+
+            waiter = asyncio.create_task(first_event())
+            await asyncio.sleep(0.1)
+            TaskQueue(project_root=tmp_path, storage="sqlite").add("Fix", task_id="t1")
+            event = await asyncio.wait_for(waiter, timeout=3.0)
+
+        assert (event.type, event.task_id) == (TaskEventType.ADDED, "t1")
+
+    def test_close_unblocks_poll(self, tmp_path):
+        watcher = TaskQueue(project_root=tmp_path, storage="sqlite").watcher(poll_interval=0.05)
+        threading.Timer(0.1, watcher.close).start()
+
+        assert watcher.poll() == []
+        assert watcher.closed
+
+
+    def test_storage_without_reopen_is_rejected(self, tmp_path):
+        class MemoryStorage(TaskStorage):
+            name = "memory"
+
+            def read(self, task_id):
+                return None
+
+            def write(self, task_id, record):
+                pass
+
+            def delete(self, task_id):
+                return False
+
+            def exists(self, task_id):
+                return False
+
+            def changes(self):
+                return StorageChanges()
+
+        queue = TaskQueue(project_root=tmp_path, storage=MemoryStorage())
+
+        with pytest.raises(NotImplementedError, match="memory"):
+            queue.watcher()
+
+
+class TestQueueWatch:
+    """Tests for the TaskQueue watch entry points."""
+
+    def test_watch_reports_new_tasks_and_stops(self, tmp_path):
+        queue = TaskQueue(project_root=tmp_path)
+        other = TaskQueue(project_root=tmp_path)
+        stop = threading.Event()
+        added, events = [], []
+
+        def on_event(event):
+            events.append(event.type)
+            if event.type == TaskEventType.UPDATED:
+                stop.set()
+
+        thread = threading.Thread(
+            target=queue.watch,
+            kwargs={"callback": added.append, "poll_interval": 0.05, "stop": stop, "on_event": on_event},
+        )
+        thread.start()
+        try:
+            # Wait for the watcher's initial snapshot
+            threading.Event().wait(0.2)
+            other.add("Fix the thing", task_id="t1")
+            threading.Event().wait(0.3)
+            other.update_status("t1", "ready")
+            thread.join(timeout=3.0)
+        finally:
+            stop.set()
+            thread.join(timeout=3.0)
+
+        assert [task.id for task in added] == ["t1"]
+        assert events == [TaskEventType.ADDED, TaskEventType.UPDATED]
+
+    async def test_events(self, tmp_path):
+        queue = TaskQueue(project_root=tmp_path)
+
+        async def first_event():
+            async for event in queue.events(debounce=0.05):
+                return event
+
+        waiter = asyncio.create_task(first_event())
+        await asyncio.sleep(0.1)
+        TaskQueue(project_root=tmp_path).add("Fix the thing", task_id="t1")
+
+        event = await asyncio.wait_for(waiter, timeout=3.0)
+        assert (event.type, event.task_id) == (TaskEventType.ADDED, "t1")
@@ -6,6 +6,7 @@ Tests the worktree management for parallel task execution.
 from __future__ import annotations
 
 import json
+import subprocess
 import pytest
 from datetime import datetime, timezone
 from pathlib import Path
@@ -13,11 +14,13 @@ from unittest.mock import MagicMock, patch
 
 from ralph_agi.tasks.worktree import (
     WorktreeManager,
+    WorktreePool,
     ActiveWorktree,
     WorktreeError,
     WorktreeExistsError,
     WorktreeNotFoundError,
 )
+from ralph_agi.tasks.registry import WorktreeRegistry
 from ralph_agi.tools.git import GitTools, GitCommandError, WorktreeInfo
 
 
@@ -150,15 +153,14 @@ class TestWorktreeManager:
 
         manager.create("test-task")
 
-        # Check state file
-        state_file = tmp_path / ".ralph/worktrees.json"
-        assert state_file.exists()
-
-        with open(state_file) as f:
-            state = json.load(f)
+        # Check the registry, as another process would see it
+        registry = WorktreeRegistry.for_repo(tmp_path)
+        assert (tmp_path / ".ralph/worktrees.db").exists()
 
-        assert "test-task" in state["worktrees"]
-        assert state["worktrees"]["test-task"]["branch"] == "ralph/test-task"
+        worktree = registry.get("test-task")
+        assert worktree.branch == "ralph/test-task"
+        assert worktree.commit == "abc123"
+        assert worktree.status == "created"
 
     @patch('ralph_agi.tasks.worktree.GitTools')
     def test_create_raises_if_exists(self, mock_git_class, manager, mock_git, tmp_path):
@@ -445,3 +447,131 @@ class TestWorktreeManagerExecute:
 
         worktree = manager.get("test-task")
         assert worktree.status == "error"
+
+
+def _git(repo: Path, *args: str) -> str:
+    result = subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+    return result.stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A real repository with one commit."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "config", "user.email", "test@example.com")
+    _git(repo, "config", "user.name", "Test")
+    (repo / "README.md").write_text("# Project\n")
+    (repo / ".gitignore").write_text("*.log\n")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "initial")
+    return repo
+
+
+class TestWorktreePool:
+    """Tests for WorktreePool against a real repository."""
+
+    @pytest.fixture
+    def pool(self, repo, tmp_path):
+        pool = WorktreePool(GitTools(repo_path=repo), tmp_path / "pool", size=2)
+        yield pool
+        pool.drain()
+
+    def test_warm_creates_detached_worktrees(self, pool, repo):
+        assert pool.warm() == 2
+        assert pool.warm() == 0
+
+        detached = [w for w in GitTools(repo_path=repo).worktree_list() if w.is_detached]
+        assert len(detached) == 2
+        assert pool.stats()["idle"] == 2
+
+    def test_acquire_reuses_idle_worktree(self, pool):
+        pool.warm(count=1)
+        idle_path = pool._idle[0].path
+
+        path = pool.acquire("ralph/task-a")
+
+        assert path == idle_path
+        assert _git(path, "rev-parse", "--abbrev-ref", "HEAD") == "ralph/task-a"
+        assert pool.stats()["hits"] == 1
+        assert pool.stats()["in_use"] == 1
+
+    def test_acquire_creates_worktree_when_pool_empty(self, pool):
+        path = pool.acquire("ralph/task-a")
+
+        assert pool.owns(path)
+        assert _git(path, "rev-parse", "--abbrev-ref", "HEAD") == "ralph/task-a"
+        assert pool.stats()["misses"] == 1
+
+    def test_release_recycles_with_clean(self, pool, repo):
+        path = pool.acquire("ralph/task-a")
+        (path / "new.txt").write_text("untracked\n")
+        (path / "debug.log").write_text("ignored\n")
+        (path / "README.md").write_text("changed\n")
+
+        assert pool.release(path, force=True)
+
+        assert not (path / "new.txt").exists()
+        assert not (path / "debug.log").exists()
+        assert (path / "README.md").read_text() == "# Project\n"
+        assert _git(path, "status", "--porcelain") == ""
+        # Detached, so the task branch can be deleted
+        _git(repo, "branch", "-D", "ralph/task-a")
+        assert pool.stats()["recycled"] == 1
+        assert pool.acquire("ralph/task-b") == path
+
+    def test_release_rejects_dirty_worktree(self, pool):
+        path = pool.acquire("ralph/task-a")
+        (path / "README.md").write_text("changed\n")
+
+        with pytest.raises(WorktreeError):
+            pool.release(path)
+
+    def test_release_ignores_foreign_path(self, pool, tmp_path):
+        assert pool.release(tmp_path / "elsewhere") is False
+
+    def test_release_beyond_size_removes_worktree(self, repo, tmp_path):
+        pool = WorktreePool(GitTools(repo_path=repo), tmp_path / "pool", size=1)
+        first = pool.acquire("ralph/task-a")
+        second = pool.acquire("ralph/task-b")
+
+        pool.release(first)
+        pool.release(second)
+
+        assert first.exists()
+        assert not second.exists()
+        assert pool.stats()["idle"] == 1
+        assert pool.stats()["discarded"] == 1
+        pool.drain()
+
+    def test_expired_worktrees_are_removed(self, repo, tmp_path):
+        pool = WorktreePool(GitTools(repo_path=repo), tmp_path / "pool", size=2, max_age=0)
+        pool.warm(count=1)
+        idle_path = pool._idle[0].path
+
+        path = pool.acquire("ralph/task-a")
+
+        assert path != idle_path
+        assert not idle_path.exists()
+        assert pool.stats()["discarded"] == 1
+
+    def test_drain_removes_idle_worktrees(self, pool, repo):
+        pool.warm()
+
+        assert pool.drain() == 2
+        assert not any(w.is_detached for w in GitTools(repo_path=repo).worktree_list())
+
+    def test_manager_create_and_cleanup_use_pool(self, repo, tmp_path):
+        manager = WorktreeManager(repo_path=repo, worktree_dir=tmp_path / "worktrees", pool_size=1)
+        manager.warm_pool()
+
+        path = manager.create("task-a")
+        manager.cleanup("task-a")
+
+        stats = manager.stats()["pool"]
+        assert stats["hits"] == 1
+        assert stats["recycled"] == 1
+        assert path.exists()
+        manager.cleanup_all()
+        assert not path.exists()
@@ -0,0 +1,186 @@
+"""Tests for concurrency-aware tool dispatch."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from ralph_agi.tools.dispatch import (
+    ToolAccess,
+    ToolDispatcher,
+    classify_tool,
+)
+
+
+class TestClassifyTool:
+    """Tests for classify_tool."""
+
+    def test_read_tools_are_read_only(self):
+        assert classify_tool("read_file", {"path": "a.py"}) == ToolAccess(True, "a.py")
+        assert classify_tool("list_directory", {"path": "src/"}) == ToolAccess(True, "src")
+
+    def test_git_status_reads_whole_workspace(self):
+        assert classify_tool("git_status", {}) == ToolAccess(read_only=True, path=None)
+
+    def test_path_writes(self):
+        access = classify_tool("edit_file", {"path": "./src/a.py"})
+        assert access == ToolAccess(read_only=False, path="src/a.py")
+
+    def test_commands_and_unknown_tools_are_barriers(self):
+        assert classify_tool("run_command", {"command": "ls"}) == ToolAccess(False, None)
+        assert classify_tool("mystery_tool", {"path": "a"}) == ToolAccess(False, None)
+
+    def test_write_without_path_is_barrier(self):
+        assert classify_tool("write_file", {}) == ToolAccess(False, None)
+
+
+class TestToolAccess:
+    """Tests for ToolAccess conflict detection."""
+
+    def test_reads_never_conflict(self):
+        assert not ToolAccess(True, "a").conflicts_with(ToolAccess(True, None))
+
+    def test_write_conflicts_with_same_or_nested_path(self):
+        write = ToolAccess(False, "src/a.py")
+        assert write.conflicts_with(ToolAccess(True, "src/a.py"))
+        assert write.conflicts_with(ToolAccess(True, "src"))
+        assert not write.conflicts_with(ToolAccess(True, "src/ab.py"))
+        assert not write.conflicts_with(ToolAccess(False, "docs/a.md"))
+
+    def test_workspace_access_conflicts_with_writes(self):
+        assert ToolAccess(True, None).conflicts_with(ToolAccess(False, "a"))
+
+
+class TestToolDispatcherPlan:
+    """Tests for dependency planning."""
+
+    def test_independent_reads_have_no_dependencies(self):
+        dispatcher = ToolDispatcher()
+        plan = dispatcher.plan([
+            ("read_file", {"path": "a"}),
+            ("read_file", {"path": "b"}),
+            ("git_status", {}),
+        ])
+        assert plan == [[], [], []]
+
+    def test_read_after_write_waits(self):
+        dispatcher = ToolDispatcher()
+        plan = dispatcher.plan([
+            ("write_file", {"path": "a"}),
+            ("read_file", {"path": "a"}),
+            ("read_file", {"path": "b"}),
+            ("run_command", {"command": "pytest"}),
+        ])
+        assert plan == [[], [0], [], [0, 1, 2]]
+
+    def test_sequential_when_concurrency_is_one(self):
+        dispatcher = ToolDispatcher(max_concurrency=1)
+        plan = dispatcher.plan([("read_file", {"path": "a"}), ("read_file", {"path": "b"})])
+        assert plan == [[], [0]]
+
+    def test_rejects_zero_concurrency(self):
+        with pytest.raises(ValueError):
+            ToolDispatcher(max_concurrency=0)
+
+
+class TestToolDispatcherRun:
+    """Tests for concurrent execution."""
+
+    @pytest.mark.asyncio
+    async def test_reads_overlap_and_results_keep_order(self):
+        async def execute(name, args):
+            await asyncio.sleep(0.1)
+            return args["path"]
+
+        dispatcher = ToolDispatcher(max_concurrency=4)
+        calls = [("read_file", {"path": p}) for p in ("a", "b", "c", "d")]
+
+        start = time.perf_counter()
+        results = await dispatcher.run(calls, execute)
+        elapsed = time.perf_counter() - start
+
+        assert results == ["a", "b", "c", "d"]
+        assert elapsed < 0.3  # Sequential would take 0.4s
+
+    @pytest.mark.asyncio
+    async def test_semaphore_bounds_concurrency(self):
+        running = 0
+        peak = 0
+
+        async def execute(name, args):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return name
+
+        dispatcher = ToolDispatcher(max_concurrency=2)
+        await dispatcher.run([("read_file", {"path": str(i)}) for i in range(6)], execute)
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_writes_to_same_path_are_serialized(self):
+        log: list[str] = []
+
+        async def execute(name, args):
+            log.append(f"start {args['content']}")
+            await asyncio.sleep(0.01)
+            log.append(f"end {args['content']}")
+
+        dispatcher = ToolDispatcher()
+        await dispatcher.run([
+            ("write_file", {"path": "a", "content": "1"}),
+            ("edit_file", {"path": "a", "content": "2"}),
+        ], execute)
+
+        assert log == ["start 1", "end 1", "start 2", "end 2"]
+
+    @pytest.mark.asyncio
+    async def test_exception_returned_in_slot(self):
+        async def execute(name, args):
+            if args["path"] == "bad":
+                raise FileNotFoundError("bad")
+            return args["path"]
+
+        dispatcher = ToolDispatcher()
+        results = await dispatcher.run([
+            ("read_file", {"path": "bad"}),
+            ("read_file", {"path": "good"}),
+        ], execute)
+
+        assert isinstance(results[0], FileNotFoundError)
+        assert results[1] == "good"
+
+    @pytest.mark.asyncio
+    async def test_empty_batch(self):
+        async def execute(name, args):
+            raise AssertionError("not called")
+
+        assert await ToolDispatcher().run([], execute) == []
+
+    @pytest.mark.asyncio
+    async def test_started_calls_are_awaited_not_rerun(self):
+        log = []
+
+        async def execute(name, args):
+            log.append(f"run {args['path']}")
+            return args["path"]
+
+        async def already_running():
+            await asyncio.sleep(0.01)
+            log.append("early a")
+            return "a (early)"
+
+        early = asyncio.ensure_future(already_running())
+        results = await ToolDispatcher().run([
+            ("read_file", {"path": "a"}),
+            ("write_file", {"path": "a", "content": "x"}),
+        ], execute, started={0: early})
+
+        assert results == ["a (early)", "a"]
+        # The write still waits for the read that was started early
+        assert log == ["early a", "run a"]
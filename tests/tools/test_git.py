@@ -333,6 +333,49 @@ class TestCommit:
         assert commit_hash is not None
 
 
+class TestAsyncOperations:
+    """Tests for async git variants."""
+
+    @pytest.mark.asyncio
+    async def test_status_async_matches_sync(self, git_repo_with_commits: Path) -> None:
+        (git_repo_with_commits / "README.md").write_text("changed\n")
+        (git_repo_with_commits / "new.txt").write_text("new\n")
+        git = GitTools(repo_path=git_repo_with_commits)
+
+        assert await git.status_async() == git.status()
+
+    @pytest.mark.asyncio
+    async def test_add_and_commit_async(self, git_repo_with_commits: Path) -> None:
+        (git_repo_with_commits / "new.txt").write_text("new\n")
+        git = GitTools(repo_path=git_repo_with_commits)
+
+        await git.add_async("new.txt")
+        commit_hash = await git.commit_async("Add new file")
+
+        assert commit_hash is not None
+        assert git.log(limit=1)[0].subject == "Add new file"
+
+    @pytest.mark.asyncio
+    async def test_commit_async_nothing_staged(self, git_repo_with_commits: Path) -> None:
+        git = GitTools(repo_path=git_repo_with_commits)
+
+        assert await git.commit_async("Empty") is None
+
+    @pytest.mark.asyncio
+    async def test_diff_async(self, git_repo_with_commits: Path) -> None:
+        (git_repo_with_commits / "README.md").write_text("changed\n")
+        git = GitTools(repo_path=git_repo_with_commits)
+
+        assert "+changed" in await git.diff_async()
+
+    @pytest.mark.asyncio
+    async def test_status_async_not_a_repo(self, tmp_path: Path) -> None:
+        git = GitTools(repo_path=tmp_path)
+
+        with pytest.raises(NotARepositoryError):
+            await git.status_async()
+
+
 class TestLog:
     """Tests for log method."""
 
@@ -271,6 +271,108 @@ class TestExecuteWithTimeout:
         assert result.success is True
 
 
+class TestExecuteAsync:
+    """Tests for the asyncio execution path."""
+
+    @pytest.mark.asyncio
+    async def test_echo(self) -> None:
+        """Test async execution returns the same result contract."""
+        shell = ShellTools()
+        result = await shell.execute_async("echo hello")
+
+        assert isinstance(result, CommandResult)
+        assert result.success is True
+        assert result.stdout.strip() == "hello"
+        assert result.command == "echo hello"
+
+    @pytest.mark.asyncio
+    async def test_exit_code_and_stderr(self) -> None:
+        """Test failing command captures exit code and stderr."""
+        shell = ShellTools()
+        result = await shell.execute_async("echo oops >&2; exit 3")
+
+        assert result.exit_code == 3
+        assert result.stderr.strip() == "oops"
+
+    @pytest.mark.asyncio
+    async def test_without_shell(self, tmp_path: Path) -> None:
+        """Test shell=False execs argv directly."""
+        shell = ShellTools()
+        result = await shell.execute_async("pwd", cwd=tmp_path, shell=False)
+
+        assert result.stdout.strip() == str(tmp_path.resolve())
+
+    @pytest.mark.asyncio
+    async def test_command_not_found_without_shell(self) -> None:
+        """Test missing executable maps to exit code 127."""
+        shell = ShellTools()
+        result = await shell.execute_async("definitely_not_a_cmd_xyz", shell=False)
+
+        assert result.exit_code == 127
+
+    @pytest.mark.asyncio
+    async def test_streams_output(self) -> None:
+        """Test output chunks are delivered as they are produced."""
+        shell = ShellTools()
+        chunks: list[tuple[str, str]] = []
+
+        result = await shell.execute_async(
+            "echo one; echo two >&2",
+            on_output=lambda stream, text: chunks.append((stream, text)),
+        )
+
+        assert "".join(t for s, t in chunks if s == "stdout") == result.stdout
+        assert "".join(t for s, t in chunks if s == "stderr") == result.stderr
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process_group(self, tmp_path: Path) -> None:
+        """Test timeout terminates children spawned by the shell."""
+        shell = ShellTools()
+        marker = tmp_path / "survived"
+
+        start = time.time()
+        result = await shell.execute_async(
+            f"echo started; (sleep 1; touch {marker}) & wait",
+            timeout=0.3,
+        )
+
+        assert result.timed_out is True
+        assert result.success is False
+        assert "started" in result.stdout
+        assert time.time() - start < 1.0
+
+        time.sleep(1.2)
+        assert not marker.exists()
+
+    @pytest.mark.asyncio
+    async def test_does_not_block_event_loop(self) -> None:
+        """Test other coroutines run while a command executes."""
+        import asyncio
+
+        shell = ShellTools()
+        ticks = 0
+
+        async def ticker() -> None:
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await shell.execute_async("sleep 0.3")
+        task.cancel()
+
+        assert ticks >= 10
+
+    @pytest.mark.asyncio
+    async def test_blocked_command(self) -> None:
+        """Test security policy applies to async execution."""
+        shell = ShellTools(blocked_commands=["rm"])
+
+        with pytest.raises(CommandNotAllowedError):
+            await shell.execute_async("rm file.txt")
+
+
 class TestExecuteWithEnv:
     """Tests for environment variable handling."""
 
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import threading
 import pytest
 from datetime import datetime
 from unittest.mock import MagicMock, AsyncMock
@@ -11,6 +12,8 @@ from ralph_agi.tui.events import (
     Event,
     EventBus,
     EventType,
+    OverflowPolicy,
+    _EventQueue,
     emit_loop_started,
     emit_loop_stopped,
     emit_iteration_started,
@@ -208,6 +211,144 @@ class TestEventBus:
         assert bus._running is False
 
 
+class TestEventBusDelivery:
+    """Tests for cross-thread emit, bounded queueing and coalescing."""
+
+    @pytest.fixture(autouse=True)
+    def reset_bus(self):
+        EventBus.reset()
+        yield
+        EventBus.reset()
+
+    async def _settle(self, bus: EventBus) -> None:
+        for _ in range(50):
+            await asyncio.sleep(0.01)
+            if bus.stats().queue_depth == 0:
+                await asyncio.sleep(0.01)
+                return
+
+    async def test_emit_from_threads_dispatches_on_loop(self):
+        bus = EventBus(tick_interval=0)
+        seen: list[tuple[int, int]] = []
+        bus.subscribe(
+            EventType.TOOL_CALLED,
+            lambda e: seen.append((e.data["n"], threading.get_ident())),
+        )
+        await bus.start()
+
+        threads = [
+            threading.Thread(target=lambda i=i: bus.emit(Event(type=EventType.TOOL_CALLED, data={"n": i})))
+            for i in range(20)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        await self._settle(bus)
+        bus.stop()
+
+        assert sorted(n for n, _ in seen) == list(range(20))
+        assert {ident for _, ident in seen} == {threading.get_ident()}
+
+    async def test_events_emitted_before_start_are_delivered(self):
+        bus = EventBus()
+        handler = MagicMock()
+        bus.subscribe(EventType.LOOP_STARTED, handler)
+        bus.emit(Event(type=EventType.LOOP_STARTED))
+
+        await bus.start()
+        await self._settle(bus)
+        bus.stop()
+
+        handler.assert_called_once()
+
+    def test_drop_oldest_keeps_newest_events(self):
+        bus = EventBus(max_queue_size=3)
+        for i in range(5):
+            bus.emit(Event(type=EventType.LOG_MESSAGE, data={"n": i}))
+
+        assert [bus._queue.get_nowait().data["n"] for _ in range(3)] == [2, 3, 4]
+        assert bus.stats().dropped == 2
+
+    def test_drop_newest_keeps_oldest_events(self):
+        bus = EventBus(max_queue_size=3, overflow="drop_newest")
+        for i in range(5):
+            bus.emit(Event(type=EventType.LOG_MESSAGE, data={"n": i}))
+
+        assert [bus._queue.get_nowait().data["n"] for _ in range(3)] == [0, 1, 2]
+        assert bus.stats().dropped == 2
+
+    def test_block_waits_for_room(self):
+        queue = _EventQueue(1, OverflowPolicy.BLOCK, block_timeout=5.0)
+        queue.put(Event(type=EventType.LOG_MESSAGE, data={"n": 0}))
+        accepted: list[bool] = []
+
+        producer = threading.Thread(
+            target=lambda: accepted.append(
+                queue.put(Event(type=EventType.LOG_MESSAGE, data={"n": 1}), can_block=True)
+            )
+        )
+        producer.start()
+        producer.join(0.05)
+        assert producer.is_alive()
+
+        assert queue.get_nowait().data["n"] == 0
+        producer.join(5)
+
+        assert accepted == [True]
+        assert queue.get_nowait().data["n"] == 1
+
+    def test_metrics_are_coalesced_in_place(self):
+        bus = EventBus()
+        bus.emit(Event(type=EventType.METRICS_UPDATED, data={"iteration": 1}))
+        bus.emit(Event(type=EventType.LOG_MESSAGE, data={"message": "between"}))
+        for i in range(2, 50):
+            bus.emit(Event(type=EventType.METRICS_UPDATED, data={"iteration": i}))
+
+        events = bus._queue.drain()
+
+        assert [e.type for e in events] == [EventType.METRICS_UPDATED, EventType.LOG_MESSAGE]
+        assert events[0].data["iteration"] == 49
+        assert bus.stats().coalesced == 48
+
+    def test_progress_is_coalesced_per_task(self):
+        bus = EventBus()
+        for progress in (10.0, 20.0):
+            for name in ("a", "b"):
+                bus.emit(Event(
+                    type=EventType.PROGRESS_UPDATED,
+                    data={"task_name": name, "progress": progress},
+                ))
+
+        events = bus._queue.drain()
+
+        assert [(e.data["task_name"], e.data["progress"]) for e in events] == [("a", 20.0), ("b", 20.0)]
+
+    def test_token_deltas_are_summed(self):
+        bus = EventBus()
+        for _ in range(3):
+            bus.emit(Event(type=EventType.TOKENS_USED, data={"prompt_tokens": 100, "completion_tokens": 10}))
+
+        (event,) = bus._queue.drain()
+
+        assert event.data == {"prompt_tokens": 300, "completion_tokens": 30}
+
+    async def test_handler_stats(self):
+        bus = EventBus()
+
+        def failing(event):
+            raise ValueError("boom")
+
+        bus.subscribe(EventType.LOOP_STARTED, failing)
+        for _ in range(3):
+            await bus.emit_async(Event(type=EventType.LOOP_STARTED))
+
+        stats = bus.stats()
+        handler = stats.handlers[failing.__qualname__]
+        assert (stats.dispatched, handler.calls, handler.errors) == (3, 3, 3)
+        assert handler.max_seconds >= handler.mean_seconds > 0
+
+
 class TestConvenienceFunctions:
     """Tests for convenience emit functions."""
 
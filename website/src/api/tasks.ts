@@ -63,6 +63,22 @@ export async function deleteTask(taskId: string): Promise<void> {
   await apiClient.delete(`/api/tasks/${taskId}`);
 }
 
+/**
+ * Fetch the content of a file a task created or modified.
+ * Returns null for binary files.
+ */
+export async function getArtifactContent(
+  taskId: string,
+  path: string
+): Promise<string | null> {
+  const response = await apiClient.get<string>(
+    `/api/tasks/${taskId}/artifacts/content`,
+    { params: { path }, responseType: "text" }
+  );
+  const contentType = String(response.headers["content-type"] || "");
+  return contentType.startsWith("text/") ? response.data : null;
+}
+
 /**
  * Get queue statistics
  */
@@ -149,7 +149,11 @@ export function TaskDetailDrawer({
                 <FileOutput className="h-4 w-4" />
                 Execution Results
               </h4>
-              <TaskResults output={task.output} worktreePath={task.worktree_path} />
+              <TaskResults
+                taskId={task.id}
+                output={task.output}
+                worktreePath={task.worktree_path}
+              />
             </div>
           )}
 
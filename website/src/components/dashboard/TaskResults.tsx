@@ -2,7 +2,7 @@
  * TaskResults component - Displays task execution output, logs, and artifacts.
  */
 
-import { useState } from "react";
+import { useEffect, useState } from "react";
 import { Badge } from "@/components/ui/badge";
 import { Button } from "@/components/ui/button";
 import { ScrollArea } from "@/components/ui/scroll-area";
@@ -21,9 +21,11 @@ import {
   FileCode,
   File,
 } from "lucide-react";
+import { getArtifactContent } from "@/api/tasks";
 import type { TaskOutput, TaskArtifact, ExecutionLog } from "@/types/task";
 
 interface TaskResultsProps {
+  taskId?: string;
   output: TaskOutput | null;
   worktreePath?: string | null;
 }
@@ -185,10 +187,61 @@ function LogsTab({ logs }: { logs: ExecutionLog[] }) {
   );
 }
 
+const MAX_PREVIEW_BYTES = 1024 * 1024;
+
+function ArtifactContent({
+  taskId,
+  artifact,
+}: {
+  taskId?: string;
+  artifact: TaskArtifact;
+}) {
+  const [content, setContent] = useState<string | null>(artifact.content ?? null);
+  const [error, setError] = useState<string | null>(null);
+  const tooLarge = (artifact.size ?? 0) > MAX_PREVIEW_BYTES;
+
+  useEffect(() => {
+    if (artifact.content || !taskId || artifact.change_type === "deleted" || tooLarge) return;
+    let cancelled = false;
+    getArtifactContent(taskId, artifact.path)
+      .then(text => {
+        if (cancelled) return;
+        if (text === null) setError("Binary file");
+        else setContent(text);
+      })
+      .catch(err => !cancelled && setError(err.response?.data?.detail || "Could not load file"));
+    return () => {
+      cancelled = true;
+    };
+  }, [taskId, artifact.path, artifact.content, artifact.change_type, tooLarge]);
+
+  if (artifact.change_type === "deleted") {
+    return <p className="text-xs text-muted-foreground">File was deleted</p>;
+  }
+  if (tooLarge) {
+    return <p className="text-xs text-muted-foreground">File too large to preview</p>;
+  }
+  if (error) {
+    return <p className="text-xs text-muted-foreground">{error}</p>;
+  }
+  if (content === null) {
+    return <p className="text-xs text-muted-foreground">Loading...</p>;
+  }
+  return (
+    <ScrollArea className="h-[200px]">
+      <pre className="text-xs font-mono whitespace-pre-wrap bg-black/50 p-3 rounded">
+        {content}
+      </pre>
+    </ScrollArea>
+  );
+}
+
 function FilesTab({
+  taskId,
   artifacts,
   worktreePath,
 }: {
+  taskId?: string;
   artifacts: TaskArtifact[];
   worktreePath?: string | null;
 }) {
@@ -212,7 +265,7 @@ function FilesTab({
     <div className="space-y-3">
       <div className="flex items-center justify-between">
         <span className="text-sm text-muted-foreground">
-          {artifacts.length} file{artifacts.length !== 1 ? "s" : ""} created/modified
+          {artifacts.length} file{artifacts.length !== 1 ? "s" : ""} changed
         </span>
         {worktreePath && (
           <Button variant="outline" size="sm" asChild>
@@ -252,13 +305,9 @@ function FilesTab({
                   />
                 </div>
               </div>
-              {expandedFile === artifact.path && artifact.content && (
+              {expandedFile === artifact.path && (
                 <div className="border-t p-3">
-                  <ScrollArea className="h-[200px]">
-                    <pre className="text-xs font-mono whitespace-pre-wrap bg-black/50 p-3 rounded">
-                      {artifact.content}
-                    </pre>
-                  </ScrollArea>
+                  <ArtifactContent taskId={taskId} artifact={artifact} />
                 </div>
               )}
             </div>
@@ -269,7 +318,7 @@ function FilesTab({
   );
 }
 
-export function TaskResults({ output, worktreePath }: TaskResultsProps) {
+export function TaskResults({ taskId, output, worktreePath }: TaskResultsProps) {
   if (!output) {
     return (
       <div className="flex flex-col items-center justify-center py-8 text-center text-muted-foreground">
@@ -321,7 +370,11 @@ export function TaskResults({ output, worktreePath }: TaskResultsProps) {
         <LogsTab logs={output.logs || []} />
       </TabsContent>
       <TabsContent value="files" className="mt-4">
-        <FilesTab artifacts={output.artifacts || []} worktreePath={worktreePath} />
+        <FilesTab
+          taskId={taskId}
+          artifacts={output.artifacts || []}
+          worktreePath={worktreePath}
+        />
       </TabsContent>
     </Tabs>
   );
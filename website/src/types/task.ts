@@ -33,6 +33,8 @@ export interface TaskArtifact {
   file_type?: string;
   size?: number;
   content?: string;
+  change_type?: "added" | "modified" | "deleted";
+  blob?: string;
 }
 
 /**